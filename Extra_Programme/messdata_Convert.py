@@ -0,0 +1,144 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Umwandlung der VIFCON-Messdaten (csv) in das Spalten-Format (.vcol):
+- Durchsucht einen Messordner (measdata_*) oder einen Ordner mit mehreren Messordnern
+- Jede csv-Datei wird blockweise eingelesen und als <Gerät>.vcol neben die csv-Datei gelegt
+- Das Format und der Schreiber stammen aus VIFCON (vifcon/devices/messdaten.py)
+
+Aufruf (aus dem Hauptordner von VIFCON):
+python ./Extra_Programme/messdata_Convert.py -f measdata_2024-07-01_#01
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+## Eigene (VIFCON):
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from vifcon.devices.messdaten import Spalten_Datei, lese_spalten_datei
+
+# ++++++++++++++++++++++++++++
+# Funktionen:
+# ++++++++++++++++++++++++++++
+def konvertiere(datei_csv, block = 10000, ueberschreiben = False):
+    ''' Wandelt eine Messdaten-Datei in das Spalten-Format um.
+
+    Args:
+        datei_csv (str):        Pfad der csv-Datei
+        block (int):            Anzahl Zeilen pro Block (Chunk)
+        ueberschreiben (bool):  Vorhandene .vcol-Datei überschreiben
+    Return:
+        datei_vcol (str):       Pfad der Spalten-Datei (None - übersprungen)
+        anz (int):              Anzahl der umgewandelten Zeilen
+    '''
+    datei_vcol = f'{os.path.splitext(datei_csv)[0]}.vcol'
+    if os.path.exists(datei_vcol) and not ueberschreiben:
+        return None, 0
+
+    anz = 0
+    with open(datei_csv, encoding='utf-8') as f:
+        units  = f.readline()
+        header = f.readline()
+        if not units.startswith('#') or not header.startswith('time_abs'):
+            return None, 0
+        spalten = Spalten_Datei(datei_vcol, units + header)
+        zeilen = []
+        for zeile in f:
+            if zeile.strip() == '':
+                continue
+            zeilen.append(zeile)
+            if len(zeilen) == block:
+                spalten.anhaengen(zeilen)
+                anz += len(zeilen)
+                zeilen = []
+        if zeilen != []:
+            spalten.anhaengen(zeilen)
+            anz += len(zeilen)
+        spalten.datei.close()
+    return datei_vcol, anz
+
+def suche_csv(ordner):
+    ''' Sucht alle Messdaten-Dateien im Ordner und den Unterordnern.
+
+    Args:
+        ordner (str):   Messordner oder Ordner mit Messordnern
+    Return:
+        Liste der csv-Dateien
+    '''
+    dateien = []
+    for pfad, ordner_liste, datei_liste in os.walk(ordner):
+        for datei in sorted(datei_liste):
+            if datei.endswith('.csv'):
+                dateien.append(os.path.join(pfad, datei))
+    return dateien
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+if __name__ == "__main__":
+    parser = ArgumentParser(
+            prog="Messdata_Convert",
+            description="Conversion of the VIFCON measurement data (CSV) into the column format (.vcol).",
+        )
+    parser.add_argument(
+            "-f",
+            "--folder",
+            help="Measurement folder (measdata_*) or folder with several measurement folders [optional, default='.']",
+            default=".",
+        )
+    parser.add_argument(
+            "-b",
+            "--block",
+            help="Rows per compressed block [optional, default=10000]",
+            type=int,
+            default=10000,
+        )
+    parser.add_argument(
+            "-o",
+            "--overwrite",
+            help="Overwrite existing .vcol files [optional, default=False]",
+            action = 'store_true'
+        )
+    parser.add_argument(
+            "-c",
+            "--check",
+            help="Read the created files again and show the loading time [optional, default=False]",
+            action = 'store_true'
+        )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.folder):
+        print(f'Folder not found: {args.folder}')
+        sys.exit(1)
+
+    for datei_csv in suche_csv(args.folder):
+        start = time.perf_counter()
+        datei_vcol, anz = konvertiere(datei_csv, args.block, args.overwrite)
+        if datei_vcol == None:
+            print(f'Skip:    {datei_csv}')
+            continue
+        dauer = time.perf_counter() - start
+        groesse_csv  = os.path.getsize(datei_csv)
+        groesse_vcol = os.path.getsize(datei_vcol)
+        print(f'Convert: {datei_csv} -> {datei_vcol} - {anz} rows - {dauer:.2f} s - {groesse_vcol/1024:.1f} KiB ({100*groesse_vcol/max(groesse_csv, 1):.1f} % of CSV)')
+        if args.check:
+            start = time.perf_counter()
+            meta, daten = lese_spalten_datei(datei_vcol)
+            dauer = time.perf_counter() - start
+            print(f'Check:   {meta["device"]} - {len(daten["time_rel"])} rows, {len(meta["columns"])} columns - loaded in {dauer:.3f} s')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,219 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Schnelles Laden der VIFCON-Messdaten (csv) für messdata_Read.py und messdata_Read_ohne_VM.py:
+- Der Kopf (# Einheiten und Spalten-Namen) wird einmal gelesen
+- Die Werte werden blockweise (Chunks) mit dem Parser von NumPy (loadtxt) in typisierte Spalten (float64) gelesen
+- time_abs wird nicht als Spalte gelesen, nur das Datum der ersten Zeile wird gemerkt
+- Nicht-numerische Werte (z.B. True/False) und abgebrochene Zeilen werden wie im Spalten-Format umgewandelt (sonst NaN)
+- Das Ergebnis wird als <Gerät>.npz neben der csv-Datei gespeichert (Cache), ein erneutes Öffnen liest nur diese Datei
+- Ist die csv-Datei seit dem Cache gewachsen (laufende Messung), werden nur die neuen Zeilen gelesen
+- Passt der Anfang der csv-Datei (Hash über Kopf und erste Zeilen) nicht mehr zum Cache, wurde sie ersetzt und wird neu gelesen
+
+Aufruf zum Test (aus dem Hauptordner von VIFCON):
+python ./Extra_Programme/messdata_Laden.py -f "measdata_2024-07-01_#01/Eurotherm 1.csv"
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+import os
+import sys
+import json
+import hashlib
+import time
+from argparse import ArgumentParser
+
+import numpy as np
+
+## Eigene (VIFCON):
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from vifcon.devices.messdaten import wert_umwandeln
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+CACHE_VERSION   = 2
+BLOCK_BYTES     = 16 * 1024 * 1024          # Größe eines Blocks beim Lesen der csv-Datei
+KENNUNG_BYTES   = 64 * 1024                 # Anfang der csv-Datei (Kopf und erste Zeilen) für die Kennung
+
+
+def cache_pfad(datei):
+    ''' Pfad des Caches zur csv-Datei (ohne .csv im Namen, damit die Ordner-Suche ihn nicht findet). '''
+    return f'{os.path.splitext(datei)[0]}.npz'
+
+def kennung(datei, anzahl = KENNUNG_BYTES):
+    ''' Hash über den Anfang der csv-Datei (Kopf und erste Zeilen). Ändert er sich, wurde die Datei ersetzt
+    und nicht nur fortgeschrieben.
+
+    Args:
+        datei (str):        Pfad der csv-Datei
+        anzahl (int):       Anzahl der Bytes vom Anfang
+    Return:
+        Hash (str), Anzahl der gelesenen Bytes (int)
+    '''
+    with open(datei, 'rb') as f:
+        anfang = f.read(anzahl)
+    return hashlib.sha1(anfang).hexdigest(), len(anfang)
+
+def lese_kopf(f):
+    ''' Liest die Einheiten- und Header-Zeile.
+
+    Args:
+        f (file):           csv-Datei (binär geöffnet, am Anfang)
+    Return:
+        namen (list):       Spalten-Namen (ohne letztes leeres Feld)
+        units (list):       Einheiten (gleiche Länge wie namen)
+    '''
+    units  = f.readline().decode('utf-8').strip().lstrip('#').strip().split(',')
+    namen  = f.readline().decode('utf-8').strip().split(',')
+    ## Letztes Komma in der csv-Datei erzeugt einen leeren Eintrag:
+    while namen != [] and namen[-1] == '':
+        namen.pop()
+    units = (units + [''] * len(namen))[0:len(namen)]
+    return namen, units
+
+def block_umwandeln(zeilen, anz):
+    ''' Wandelt einen Block von Zeilen in eine Matrix (Zeilen x Spalten ohne time_abs).
+
+    Args:
+        zeilen (list):      csv-Zeilen (str)
+        anz (int):          Anzahl der Spalten ohne time_abs
+    Return:
+        np.ndarray (float64)
+    '''
+    try:
+        return np.loadtxt(zeilen, delimiter=',', usecols=range(1, anz + 1), dtype=np.float64, ndmin=2)
+    except ValueError:
+        ## Langsamer Weg nur für diesen Block (nicht-numerische Werte, fehlende Felder):
+        zeilen = [zeile for zeile in zeilen if zeile.strip() != '']
+        matrix = np.full((len(zeilen), anz), np.nan)
+        for i, zeile in enumerate(zeilen):
+            werte = zeile.rstrip('\r\n').split(',')[1:anz + 1]
+            for j, wert in enumerate(werte):
+                matrix[i, j] = wert_umwandeln(wert)
+        return matrix
+
+def lese_csv(datei, start = 0):
+    ''' Liest die csv-Datei blockweise ab einer Position.
+
+    Args:
+        datei (str):        Pfad der csv-Datei
+        start (int):        Byte-Position ab der gelesen wird (0 - nach dem Kopf)
+    Return:
+        meta (dict):        Spalten, Einheiten, Datum, gelesene Bytes (Ende der letzten vollständigen Zeile), rest (1 - letzte Zeile ohne Zeilenumbruch enthalten)
+        matrix (ndarray):   Spalten x Zeilen (float64), ohne time_abs
+    '''
+    bloecke = []
+    datum   = ''
+    with open(datei, 'rb') as f:
+        namen, units = lese_kopf(f)
+        anz = len(namen) - 1
+        position = max(start, f.tell())
+        f.seek(position)
+        rest = b''
+        while True:
+            daten = f.read(BLOCK_BYTES)
+            if daten == b'':
+                break
+            daten = rest + daten
+            ende  = daten.rfind(b'\n') + 1                  # Nur vollständige Zeilen, der Rest kommt in den nächsten Block
+            rest  = daten[ende:]
+            if ende == 0:
+                continue
+            position += ende
+            zeilen = daten[0:ende].decode('utf-8').splitlines()
+            if datum == '':
+                erste = [zeile for zeile in zeilen if zeile.strip() != '']
+                if erste != []:
+                    datum = erste[0].split(' ')[0]
+            bloecke.append(block_umwandeln(zeilen, anz))
+    ## Letzte Zeile ohne Zeilenumbruch (z.B. Absturz) wird gelesen, aber beim nächsten Mal erneut gelesen (position):
+    if rest.strip() != b'':
+        bloecke.append(block_umwandeln([rest.decode('utf-8', errors='replace')], anz))
+    if bloecke == []:   matrix = np.empty((anz, 0))
+    else:               matrix = np.ascontiguousarray(np.concatenate(bloecke).T)
+    meta = {'namen': namen, 'units': units, 'datum': datum, 'position': position, 'rest': int(rest.strip() != b'')}
+    return meta, matrix
+
+def lade_messdaten(datei, cache = True):
+    ''' Lädt eine Messdaten-Datei (aus dem Cache, wenn dieser zur csv-Datei passt).
+
+    Args:
+        datei (str):        Pfad der csv-Datei
+        cache (bool):       Cache lesen und schreiben
+    Return:
+        werte_dict (dict):  Spalten-Name: [Werte (np.ndarray float64), Einheit] - ohne time_abs
+        datum (str):        Datum der ersten Messung
+    '''
+    status = os.stat(datei)
+    meta, matrix = None, None
+    pfad = cache_pfad(datei)
+    ## Cache:
+    if cache and os.path.exists(pfad):
+        try:
+            with np.load(pfad, allow_pickle=False) as npz:
+                meta_cache = json.loads(str(npz['meta']))
+                if meta_cache['version'] == CACHE_VERSION:
+                    if meta_cache['groesse'] == status.st_size and meta_cache['mtime'] == status.st_mtime_ns:
+                        meta, matrix = meta_cache, npz['daten']
+                    elif meta_cache['groesse'] < status.st_size and kennung(datei, meta_cache['kennung'][1]) == tuple(meta_cache['kennung']):
+                        ### Laufende Messung (gleicher Anfang) - nur die neuen Zeilen lesen:
+                        meta_neu, matrix_neu = lese_csv(datei, meta_cache['position'])
+                        if meta_neu['namen'] == meta_cache['namen']:
+                            alt = npz['daten'][:, 0:npz['daten'].shape[1] - meta_cache['rest']]
+                            matrix = np.concatenate([alt, matrix_neu], axis=1)
+                            meta = meta_cache
+                            meta['position'] = meta_neu['position']
+                            meta['rest'] = meta_neu['rest']
+                            if meta['datum'] == '':
+                                meta['datum'] = meta_neu['datum']
+        except Exception as e:
+            print(f'Cache {pfad}: {e}')
+            meta, matrix = None, None
+    ## csv-Datei:
+    if meta == None:
+        meta, matrix = lese_csv(datei)
+    ## Cache schreiben (unkomprimiert, damit das Laden nur von der Festplatte abhängt):
+    if cache and not (meta.get('groesse') == status.st_size and meta.get('mtime') == status.st_mtime_ns):
+        meta.update({'version': CACHE_VERSION, 'groesse': status.st_size, 'mtime': status.st_mtime_ns, 'kennung': kennung(datei)})
+        try:
+            with open(pfad, 'wb') as f:
+                np.savez(f, daten=matrix, meta=np.array(json.dumps(meta)))
+        except OSError as e:
+            print(f'Cache {pfad}: {e}')
+
+    werte_dict = {}
+    for i, name in enumerate(meta['namen'][1:]):
+        werte_dict[name] = [matrix[i], meta['units'][i + 1]]
+    return werte_dict, meta['datum']
+
+# ++++++++++++++++++++++++++++
+# Test/Messung:
+# ++++++++++++++++++++++++++++
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "messdata_Laden", description = "Load a VIFCON measurement file (csv) and measure the loading time with and without cache.")
+    parser.add_argument("-f", "--file", help = "csv file", required = True)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    werte, datum = lade_messdaten(args.file, cache = False)
+    dauer_csv = time.perf_counter() - start
+    lade_messdaten(args.file)
+    start = time.perf_counter()
+    werte, datum = lade_messdaten(args.file)
+    dauer_cache = time.perf_counter() - start
+    zeilen = len(next(iter(werte.values()))[0]) if werte else 0
+    print(f'{args.file} ({datum}): {len(werte)} columns, {zeilen} rows')
+    print(f'csv: {dauer_csv*1000:.1f} ms, cache: {dauer_cache*1000:.1f} ms')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
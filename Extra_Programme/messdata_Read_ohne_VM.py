@@ -5,11 +5,14 @@
 import os
 import sys
 from argparse import ArgumentParser
-import math as m
 
 import pyqtgraph as pg
 import pyqtgraph.exporters
 
+## Schnelles Laden der csv-Dateien (NumPy, Cache):
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from messdata_Laden import lade_messdaten
+
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -251,10 +254,7 @@ class PlotWidget(QWidget):
         for n in data:
             ## x-Achsen-Werte:
             if n == 'time_rel':
-                x_str = data[n][0]
-                x = []
-                for wert in x_str:
-                    x.append(float(wert))
+                x = data[n][0]                 # np.ndarray (float64)
             ## y-Achsen: Label, Legende und Kurve:
             elif 'time' not in n:
                 for size in Achsen:
@@ -303,13 +303,7 @@ class PlotWidget(QWidget):
                 if achse_pos == 'links' and not label in label_left:        label_left += label
                 elif achse_pos == 'rechts'and not label in label_right:     label_right += label
                 ### Werte auslesen:
-                y_str = data[n][0]
-                y = []
-                for wert in y_str:
-                    try:
-                        y.append(float(wert))
-                    except:
-                        y.append(m.nan)
+                y = data[n][0]                 # np.ndarray (float64), nicht lesbare Werte sind NaN
                 ### Kurve erstellen:
                 color = COLORS[anzK]
                 pen_kurve = pg.mkPen(color, width=2)
@@ -637,37 +631,9 @@ class GUI(QMainWindow, Cursor):
             n.setStyleSheet(self.default)   
         button.setStyleSheet(self.aktiv)
         file = self.knopf_Pfad[button]
-        with open(file,'r',encoding='utf8') as fo:
-            lines = fo.readlines()  
-        
-        date = lines[2].split(' ')[0]
+        werte_dict, date = lade_messdaten(file)
         self.saveName = f'{file.replace(".csv", "").replace(" ", "_").replace("./Messdaten/","")}_{date}'
 
-        werte_dict = {}
-        for line in lines:
-            line = line.strip()
-            lzZ = line[-1]
-            if not lzZ == ',':  
-                line += ',' 
-            line = line[0:-1]
-            if 'datetime,s,' in line:
-                units = line
-                units_list = units.split(',')
-            elif 'time_abs,time_rel,' in line:
-                variables = line
-                variables_list = variables.split(',')
-                z = 0
-                for n in variables_list:
-                    werte_dict.update({n:[[], units_list[z]]})
-                    z += 1
-            else:
-                teil_zeile = line.split(',')
-                z = 0
-                for teil in teil_zeile:
-                    variable = variables_list[z]
-                    werte_dict[variable][0].append(teil)
-                    z += 1
-
         self.plot.update(f"{file.replace('.csv', '').replace('./Messdaten/','')} - {date}", werte_dict, self.plot, self.legend_achsen_Rechts_widget)
 
         ## Skalierungsbereiche freischalten:
@@ -748,7 +714,7 @@ class GUI(QMainWindow, Cursor):
                         faktor = 1
                         self.size_dict[n][1].setText('1')
                         print('Faktor konnte nicht in Float umgewandelt werden! Setze Faktor auf 1!')
-                    y_new = [a * faktor for a in self.plot.curve_dict[i][2]]
+                    y_new = self.plot.curve_dict[i][2] * faktor
                     i.setData(self.plot.curve_dict[i][1], y_new)
                     faktor_label = f'{n}x{faktor}'
                     if self.plot.curve_dict[i][3] == 'a1' and not faktor_label in y_label_L:
@@ -0,0 +1,134 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Durchsatz-Messung (Benchmark) des Multilog-Links mit einem lokalen Multilog-Ersatz:
+- VIFCON-Seite: die echte Multilog-Klasse (vifcon/devices/multilog.py) mit Test-Widgets (Daten-Dicts)
+- Multilog-Ersatz: Client, der die Trigger aller Geräte sendet und die Antworten mit dem Rahmen-Leser vollständig liest
+- Gemessen wird je Modus: Kodierung allein (µs pro Nachricht), Anfragen pro Sekunde über TCP, Bytes pro Nachricht
+- Modi: json (alt, ohne Rahmen), frame + json, frame + msgpack (wenn installiert), frame + struct
+
+Aufruf (aus dem Hauptordner von VIFCON):
+python ./Extra_Programme/multilog_Benchmark.py -g 4 -w 20 -n 2000
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+import os
+import sys
+import time
+import socket
+import random
+import threading
+from argparse import ArgumentParser
+
+## Eigene (VIFCON):
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from vifcon.devices.multilog import Multilog
+from vifcon.devices.multilog_frame import Multilog_Rahmen, Rahmen_Leser, msgpack
+
+# ++++++++++++++++++++++++++++
+# Test-Teile:
+# ++++++++++++++++++++++++++++
+class Test_Widget:
+    def __init__(self, werte):
+        ''' Widget-Ersatz mit einem Daten-Dict wie in den Geräte-Widgets (Time + Werte).
+
+        Args:
+            werte (int):        Anzahl der Werte
+        '''
+        self.data = {'Time': 0.0}
+        self.data.update({f'Wert_{n}': random.uniform(0, 1000) for n in range(werte)})
+
+def multilog_ersatz(port, trigger, anzahl, ergebnis):
+    ''' Multilog-Ersatz: sendet die Trigger und liest die Antworten (anzahl Mal).
+
+    Args:
+        port (int):         Port von VIFCON
+        trigger (list):     Trigger Wörter (eins pro Gerät)
+        anzahl (int):       Anzahl der Durchläufe
+        ergebnis (dict):    Ergebnis (Dauer, Bytes)
+    '''
+    while True:
+        try:
+            client = socket.create_connection(('127.0.0.1', port))
+            break
+        except ConnectionRefusedError:
+            time.sleep(0.01)
+    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    leser  = Rahmen_Leser()
+    bytes_ = 0
+    start  = time.perf_counter()
+    for n in range(anzahl):
+        client.sendall(''.join(trigger).encode('utf-8'))
+        gelesen = 0
+        while gelesen < len(trigger):
+            data = client.recv(65536)
+            bytes_  += len(data)
+            gelesen += len(leser.lesen(data))
+    ergebnis['dauer'] = time.perf_counter() - start
+    ergebnis['bytes'] = bytes_
+    client.close()
+
+def messen(port, modus, nutzlast, geraete, werte, anzahl):
+    ''' Misst einen Modus.
+
+    Return:
+        [Kodierung in µs, Nachrichten pro s, Bytes pro Nachricht]
+    '''
+    widgets = {f'Gerät_{n}': Test_Widget(werte) for n in range(geraete)}
+    trigger = {name: f'Trigger_{n}' for n, name in enumerate(widgets)}
+
+    ## Kodierung allein:
+    rahmen = Multilog_Rahmen(1, modus, nutzlast)
+    for name in widgets:
+        rahmen.schema(trigger[name], [name])
+    start = time.perf_counter()
+    for n in range(anzahl):
+        for name in widgets:
+            rahmen.kodieren(trigger[name], [widgets[name].data])
+    kodierung = (time.perf_counter() - start) / (anzahl * geraete) * 1e6
+
+    ## Über TCP mit dem Multilog-Ersatz:
+    ergebnis = {}
+    client = threading.Thread(target = multilog_ersatz, args = (port, list(trigger.values()), anzahl, ergebnis))
+    client.start()
+    link = Multilog(1, [port], [], lambda text: None, widgets, {}, trigger, {}, 10, 1, modus, nutzlast)
+    loop = threading.Thread(target = link.event_Loop)
+    loop.start()
+    client.join()
+    link.ende()
+    loop.join()
+    return [kodierung, anzahl * geraete / ergebnis['dauer'], ergebnis['bytes'] / (anzahl * geraete)]
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+if __name__ == "__main__":
+    parser = ArgumentParser(prog = "multilog_Benchmark", description = "Throughput of the VIFCON Multilog link with a local Multilog stand-in.")
+    parser.add_argument("-g", "--geraete", help = "devices (one trigger each) [default=4]", type = int, default = 4)
+    parser.add_argument("-w", "--werte", help = "values per device [default=20]", type = int, default = 20)
+    parser.add_argument("-n", "--anzahl", help = "requests per device and mode [default=2000]", type = int, default = 2000)
+    parser.add_argument("-p", "--port", help = "first TCP port [default=56100]", type = int, default = 56100)
+    args = parser.parse_args()
+
+    modi = [['json', 'json'], ['frame', 'json'], ['frame', 'struct']]
+    if not msgpack == None:
+        modi.insert(2, ['frame', 'msgpack'])
+
+    print(f'{args.geraete} devices x {args.werte} values, {args.anzahl} requests')
+    print(f'{"Mode":<16}{"Encode [µs]":>14}{"Messages/s":>14}{"Bytes/msg":>12}')
+    for n, (modus, nutzlast) in enumerate(modi):
+        kodierung, rate, groesse = messen(args.port + n, modus, nutzlast, args.geraete, args.werte, args.anzahl)
+        print(f'{modus + "/" + nutzlast:<16}{kodierung:>14.1f}{rate:>14.0f}{groesse:>12.0f}')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,322 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Offline-Simulation und Einstellung (Tuning) der VIFCON-PID-Regler:
+- Der PID-Regler von VIFCON (vifcon/devices/PID.py) regelt ein einfaches Modell der Regelstrecke
+- Strecken: thermisch (PT1 mit Totzeit, z.B. Eurotherm, TruHeat) und Achse (Geschwindigkeit mit Verzögerung -> Position)
+- Die Zeit ist eine Simulationszeit (PID_Bank.berechnen(jetzt=...)), die Simulation läuft daher schneller als Echtzeit
+- Ein Gitter aus kp, ki und kd wird auf mehrere Prozesse verteilt, jeder Prozess berechnet seinen Teil
+  wie der PID-Takt in einem Schritt (eine PID-Bank, alle Regler des Teils)
+- Kennwerte je Einstellung: Anstiegszeit (10-90 %), Überschwingen, Einschwingzeit (Band) und IAE
+- Optional wird eine Spalte einer Messung (measdata_*, csv oder vcol) als Störgröße abgespielt
+
+Die Parameter kp, ki und kd haben dieselbe Bedeutung wie in der Config (ki und kd bezogen auf die Sample-Zeit in ms).
+
+Aufruf (aus dem Hauptordner von VIFCON):
+python ./Extra_Programme/pid_Simulation.py -s thermisch --kp 0.5:5:10 --ki 0:0.001:11 --kd 0 -w 800
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+import os
+import sys
+import time
+import logging
+import itertools
+import multiprocessing
+from argparse import ArgumentParser
+import numpy as np
+
+## Eigene (VIFCON):
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from vifcon.devices.PID import PID
+from vifcon.devices.pid_bank import PID_Bank
+from vifcon.devices.messdaten import lese_spalten_datei
+
+# ++++++++++++++++++++++++++++
+# Regelstrecken:
+# ++++++++++++++++++++++++++++
+class Thermische_Strecke:
+    def __init__(self, anzahl, K, tau, totzeit, start, dt):
+        ''' PT1-Glied mit Totzeit (Ofen: Leistung in % -> Temperatur in °C).
+
+        Args:
+            anzahl (int):       Anzahl der parallel gerechneten Strecken
+            K (float):          Verstärkung in K pro % Leistung
+            tau (float):        Zeitkonstante in s
+            totzeit (float):    Totzeit in s
+            start (float):      Start- und Umgebungstemperatur in °C
+            dt (float):         Schrittweite der Simulation in s
+        '''
+        self.K      = K
+        self.tau    = tau
+        self.start  = start
+        self.dt     = dt
+        self.y      = np.full(anzahl, float(start))
+        ## Totzeit als Ringpuffer der Stellgröße:
+        self.puffer = np.zeros((max(int(round(totzeit / dt)), 1), anzahl))
+        self.pos    = 0
+
+    def schritt(self, u, stoerung):
+        ''' Ein Simulationsschritt.
+
+        Args:
+            u (ndarray):        Stellgröße (PID-Output)
+            stoerung (float):   Verschiebung der Umgebungstemperatur in K
+        Return:
+            y (ndarray):        Istwert
+        '''
+        u_alt = self.puffer[self.pos].copy()
+        self.puffer[self.pos] = u
+        self.pos = (self.pos + 1) % len(self.puffer)
+        self.y += self.dt / self.tau * (self.K * u_alt - (self.y - self.start - stoerung))
+        return self.y
+
+class Achsen_Strecke:
+    def __init__(self, anzahl, tau, start, dt):
+        ''' Achse: Geschwindigkeit (PID-Output) mit Verzögerung (PT1) -> Position (Integrator).
+
+        Args:
+            anzahl (int):       Anzahl der parallel gerechneten Strecken
+            tau (float):        Zeitkonstante des Antriebs in s
+            start (float):      Start-Position
+            dt (float):         Schrittweite der Simulation in s
+        '''
+        self.tau    = tau
+        self.dt     = dt
+        self.v      = np.zeros(anzahl)
+        self.y      = np.full(anzahl, float(start))
+
+    def schritt(self, u, stoerung):
+        ''' Ein Simulationsschritt.
+
+        Args:
+            u (ndarray):        Stellgröße (Soll-Geschwindigkeit in 1/s)
+            stoerung (float):   zusätzliche Geschwindigkeit in 1/s
+        Return:
+            y (ndarray):        Istwert (Position)
+        '''
+        self.v += self.dt / self.tau * (u - self.v)
+        self.y += self.dt * (self.v + stoerung)
+        return self.y
+
+# ++++++++++++++++++++++++++++
+# Funktionen:
+# ++++++++++++++++++++++++++++
+def gitter(text):
+    ''' Wandelt die Angabe eines Parameters in eine Werte-Liste.
+
+    Args:
+        text (str):     'a,b,c' (Liste) oder 'start:ende:anzahl' (gleichmäßig verteilt)
+    Return:
+        Liste der Werte
+    '''
+    if text.count(':') == 2:
+        start, ende, anz = text.split(':')
+        return [float(x) for x in np.linspace(float(start), float(ende), int(anz))]
+    return [float(x) for x in text.split(',')]
+
+def lese_stoerung(datei, spalte, skala = 1):
+    ''' Liest eine Spalte einer Messung als Störgröße ein (Abweichung zum ersten Wert).
+
+    Args:
+        datei (str):    Messdaten-Datei (csv oder vcol)
+        spalte (str):   Name der Spalte (Header der Messdaten)
+        skala (float):  Faktor für die Störung
+    Return:
+        zeit (ndarray):     time_rel in s
+        werte (ndarray):    Störgröße
+    '''
+    if datei.endswith('.vcol'):
+        meta, daten = lese_spalten_datei(datei)
+        zeit  = np.asarray(daten['time_rel'])
+        werte = np.asarray(daten[spalte])
+    else:
+        with open(datei, encoding='utf-8') as f:
+            units  = f.readline()
+            header = f.readline().strip().split(',')
+            if not units.startswith('#') or not header[0] == 'time_abs':
+                raise ValueError(f'{datei}: no VIFCON measurement file')
+            daten = np.genfromtxt(f, delimiter=',', usecols=(header.index('time_rel'), header.index(spalte)))
+        daten = daten[~np.isnan(daten).any(axis=1)]
+        zeit, werte = daten[:, 0], daten[:, 1]
+    zeit = zeit - zeit[0]
+    return zeit, skala * (werte - werte[0])
+
+def kennwerte(t, y, start, soll, band):
+    ''' Kennwerte der Sprungantwort aller Regler.
+
+    Args:
+        t (ndarray):        Zeitpunkte in s
+        y (ndarray):        Istwerte (Zeitpunkte x Regler)
+        start (float):      Startwert
+        soll (float):       Sollwert
+        band (float):       Toleranzband der Einschwingzeit in % der Sprunghöhe
+    Return:
+        Liste mit dict je Regler: anstieg, ueberschwingen, einschwingen (s, %, s - NaN: nicht erreicht), iae
+    '''
+    h = soll - start
+    r = (y - start) / h                                                 # normierte Sprungantwort
+    ergebnis = []
+    for n in range(y.shape[1]):
+        rn = r[:, n]
+        i10 = np.argmax(rn >= 0.1) if (rn >= 0.1).any() else None
+        i90 = np.argmax(rn >= 0.9) if (rn >= 0.9).any() else None
+        anstieg = t[i90] - t[i10] if not i10 == None and not i90 == None else np.nan
+        ausserhalb = np.nonzero(np.abs(rn - 1) > band / 100)[0]
+        if len(ausserhalb) == 0:                einschwingen = 0
+        elif ausserhalb[-1] == len(rn) - 1:     einschwingen = np.nan
+        else:                                   einschwingen = t[ausserhalb[-1] + 1]
+        ergebnis.append({
+            'anstieg':          anstieg,
+            'ueberschwingen':   max(0, 100 * (rn.max() - 1)),
+            'einschwingen':     einschwingen,
+            'iae':              float(np.sum(np.abs(soll - y[:-1, n]) * np.diff(t))),
+        })
+    return ergebnis
+
+def simulieren(auftrag):
+    ''' Simuliert einen Teil des Gitters (ein Prozess).
+
+    Args:
+        auftrag (tuple):    (Liste der Einstellungen (kp, ki, kd), Einstellungen der Simulation (dict))
+    Return:
+        Liste mit dict je Einstellung (Parameter und Kennwerte)
+    '''
+    tunings, e = auftrag
+    anzahl = len(tunings)
+    logging.disable(logging.WARNING)                                    # Infos der Regler-Erstellung unterdrücken
+
+    ## Regler (wie im PID-Takt gemeinsam in einer Bank):
+    bank = PID_Bank(anzahl)
+    regler = []
+    for n, (kp, ki, kd) in enumerate(tunings):
+        config = {'kp': kp, 'ki': ki, 'kd': kd, 'sample': e['sample'], 'sample_tolleranz': 0, 'debug_log_time': 0}
+        regler.append(PID(1, f'Sim_{n}', config, e['max'], e['min'], print, bank=bank))
+    indizes = [pid.index for pid in regler]
+    logging.disable(logging.NOTSET)
+
+    ## Strecke:
+    T_pid = e['sample'] / 1000
+    dt    = T_pid / e['unterschritte']
+    if e['strecke'] == 'thermisch':     strecke = Thermische_Strecke(anzahl, e['K'], e['tau'], e['totzeit'], e['start'], dt)
+    else:                               strecke = Achsen_Strecke(anzahl, e['tau'], e['start'], dt)
+
+    ## Störung:
+    schritte = int(round(e['dauer'] / T_pid))
+    t = np.arange(schritte + 1) * T_pid
+    if e['stoerung'] == None:   stoerung = np.zeros(len(t))
+    else:                       stoerung = np.interp(t, e['stoerung'][0], e['stoerung'][1])
+
+    ## Simulation (Simulationszeit statt Uhr):
+    y = np.empty((schritte + 1, anzahl))
+    y[0] = strecke.y
+    modus  = [False] * anzahl
+    rez_op = [-1] * anzahl
+    for k in range(schritte):
+        Output, timediff = bank.berechnen(indizes, y[k], [e['soll']] * anzahl, modus, rez_op, t[k])
+        for i in range(e['unterschritte']):
+            strecke.schritt(Output, stoerung[k])
+        y[k + 1] = strecke.y
+
+    ergebnis = kennwerte(t, y, e['start'], e['soll'], e['band'])
+    for n, (kp, ki, kd) in enumerate(tunings):
+        ergebnis[n].update({'kp': kp, 'ki': ki, 'kd': kd})
+    return ergebnis
+
+def sortierung(ergebnis):
+    ''' Sortier-Schlüssel: erst eingeschwungene Regler (Einschwingzeit), dann IAE. '''
+    return (np.isnan(ergebnis['einschwingen']), np.nan_to_num(ergebnis['einschwingen']), ergebnis['iae'])
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+if __name__ == "__main__":
+    parser = ArgumentParser(
+            prog="PID_Simulation",
+            description="Offline simulation of the VIFCON PID controller with plant models and parallel parameter sweep.",
+        )
+    parser.add_argument("-s", "--plant", help="Plant model: thermisch (PT1 with dead time) or achse (axis position) [optional, default='thermisch']", choices=['thermisch', 'achse'], default='thermisch')
+    parser.add_argument("--kp", help="kp values: list 'a,b,c' or range 'start:end:count' [optional, default='1']", default='1')
+    parser.add_argument("--ki", help="ki values (per ms sample time): list or range [optional, default='0']", default='0')
+    parser.add_argument("--kd", help="kd values (per ms sample time): list or range [optional, default='0']", default='0')
+    parser.add_argument("-w", "--setpoint", help="Set point of the step [optional, default=100]", type=float, default=100)
+    parser.add_argument("--start", help="Start value (and ambient temperature) [optional, default=20]", type=float, default=20)
+    parser.add_argument("-t", "--duration", help="Simulated time in s [optional, default=600]", type=float, default=600)
+    parser.add_argument("--sample", help="PID sample time in ms (config PID|sample) [optional, default=1000]", type=int, default=1000)
+    parser.add_argument("--substeps", help="Plant steps per PID sample [optional, default=10]", type=int, default=10)
+    parser.add_argument("--max", help="Maximum PID output [optional, default=100]", type=float, default=100)
+    parser.add_argument("--min", help="Minimum PID output [optional, default=0]", type=float, default=0)
+    parser.add_argument("-K", "--gain", help="Thermal plant: gain in K per output unit [optional, default=10]", type=float, default=10)
+    parser.add_argument("--tau", help="Time constant of the plant in s [optional, default=120]", type=float, default=120)
+    parser.add_argument("--deadtime", help="Thermal plant: dead time in s [optional, default=5]", type=float, default=5)
+    parser.add_argument("-b", "--band", help="Settling band in %% of the step height [optional, default=2]", type=float, default=2)
+    parser.add_argument("-d", "--disturbance", help="Measurement file (csv or vcol) replayed as disturbance [optional, default=None]", default=None)
+    parser.add_argument("-c", "--column", help="Column of the measurement file used as disturbance [optional, default=None]", default=None)
+    parser.add_argument("--scale", help="Scaling of the disturbance [optional, default=1]", type=float, default=1)
+    parser.add_argument("-j", "--processes", help="Number of processes [optional, default=CPU count]", type=int, default=os.cpu_count())
+    parser.add_argument("-n", "--top", help="Number of best settings shown [optional, default=10]", type=int, default=10)
+    parser.add_argument("-o", "--output", help="CSV file for all results [optional, default=None]", default=None)
+    args = parser.parse_args()
+
+    stoerung = None
+    if not args.disturbance == None:
+        if args.column == None:
+            print('The column of the disturbance is missing (-c)!')
+            sys.exit(1)
+        stoerung = lese_stoerung(args.disturbance, args.column, args.scale)
+
+    einstellung = {
+        'strecke':          args.plant,
+        'soll':             args.setpoint,
+        'start':            args.start,
+        'dauer':            args.duration,
+        'sample':           args.sample,
+        'unterschritte':    max(args.substeps, 1),
+        'max':              args.max,
+        'min':              args.min,
+        'K':                args.gain,
+        'tau':              args.tau,
+        'totzeit':          args.deadtime,
+        'band':             args.band,
+        'stoerung':         stoerung,
+    }
+
+    ## Gitter auf die Prozesse verteilen:
+    tunings  = list(itertools.product(gitter(args.kp), gitter(args.ki), gitter(args.kd)))
+    prozesse = max(1, min(args.processes, len(tunings)))
+    teile    = [(tunings[i::prozesse], einstellung) for i in range(prozesse)]
+    print(f'Simulate {len(tunings)} settings ({args.plant}, {args.duration} s) with {prozesse} processes ...')
+
+    start = time.perf_counter()
+    if prozesse == 1:
+        ergebnisse = simulieren(teile[0])
+    else:
+        with multiprocessing.Pool(prozesse) as pool:
+            ergebnisse = [e for teil in pool.map(simulieren, teile) for e in teil]
+    dauer = time.perf_counter() - start
+    ergebnisse.sort(key=sortierung)
+    print(f'Done in {dauer:.2f} s ({len(tunings) * args.duration / max(dauer, 1e-9):.0f}x real time)')
+
+    print(f'{"kp":>10} {"ki":>10} {"kd":>10} {"rise [s]":>10} {"overshoot [%]":>14} {"settling [s]":>13} {"IAE":>12}')
+    for e in ergebnisse[:args.top]:
+        print(f"{e['kp']:>10.4g} {e['ki']:>10.4g} {e['kd']:>10.4g} {e['anstieg']:>10.1f} {e['ueberschwingen']:>14.2f} {e['einschwingen']:>13.1f} {e['iae']:>12.1f}")
+
+    if not args.output == None:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write('kp,ki,kd,rise_s,overshoot_pct,settling_s,iae\n')
+            for e in ergebnisse:
+                f.write(f"{e['kp']},{e['ki']},{e['kd']},{e['anstieg']},{e['ueberschwingen']},{e['einschwingen']},{e['iae']}\n")
+        print(f'Results: {args.output}')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,89 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Test des Sampling-Schedulers:
+- Ein linearer Educrys-Antrieb wird auch ohne offenen Auftrag bei jedem Takt geschrieben,
+  damit die Grenz-Überwachung in der write-Funktion den Antrieb an den Endlagen stoppt.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import os
+import types
+
+import pytest
+
+pytest.importorskip('PyQt5')
+pytest.importorskip('serial')
+
+## Eigene:
+from vifcon.befehle import Befehls_Liste
+from vifcon.config_cache import lade_yaml
+from vifcon.config_schema import config_pruefen
+from vifcon.devices.educrysAntriebe import EducrysAntrieb
+from vifcon.scheduler import Scheduler
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+CONFIG  = os.path.join(os.path.dirname(__file__), '..', 'Template', 'config_temp_Educrys.yml')
+NAME    = 'Educrys-Antrieb_1'                       # Antriebs_Art: L
+
+
+class Signal:
+    ''' Ersatz für ein Qt-Signal: merkt sich die gesendeten Werte. '''
+    def __init__(self):
+        self.gesendet = []
+
+    def connect(self, funktion):
+        pass
+
+    def emit(self, *werte):
+        self.gesendet.append(werte)
+
+
+def antrieb_erstellen():
+    ''' Linearer Educrys-Antrieb im Test-Modus, der eine Position oberhalb der Obergrenze meldet. '''
+    config = config_pruefen(lade_yaml(CONFIG)).geprueft('devices', NAME)
+    device = EducrysAntrieb(0, config, CONFIG, {}, True, False, False, False, lambda *a: None, NAME)
+    device.init = True
+    device.read = lambda: {'IWs': device.oGs + 1}
+    device.gesendet = []
+    device.send_write = lambda Befehl, Wert, Antworts_String: device.gesendet.append((Befehl, Wert))
+    return device
+
+
+def test_educrys_linear_stopp_ohne_auftrag():
+    device = antrieb_erstellen()
+    assert device.Antriebs_wahl == 'L'
+
+    ## Widget ohne offenen Auftrag:
+    write_task = Befehls_Liste(0, NAME, {'Stopp': False, 'Sende Position': False, 'Sende Speed': False, 'Init': False, 'Start': False, 'Update Limit': False, 'PID': False, 'PID-Reset': False, 'Rezept Aktiv': False})
+    write_value = {'Position': 0, 'Speed': 0, 'Limits': [0, 0, 0, 0, 0, 0], 'PID-Sollwert': 0}
+    widget = types.SimpleNamespace(write_task = write_task, write_value = write_value, start_later = False)
+    sampler = types.SimpleNamespace(device_name = NAME, device = device, device_widget = widget, messTime = 0, signal_start = Signal(), signal_fertig = Signal(), auftrag = lambda: None)
+
+    ## Weckruf des Schedulers (nur Lesen fällig - messTime 0 - kein Auftrag):
+    scheduler = Scheduler(0)
+    scheduler.add_sampler(sampler)
+    assert scheduler.eintraege[NAME]['dauer_modus']
+    scheduler.takt()
+    assert len(sampler.signal_start.gesendet) == 1
+    lesen, schreiben, soll_zeit = sampler.signal_start.gesendet[0]
+    assert schreiben
+
+    ## Sampler: Befehls-Liste ruft die write-Funktion auf, die Grenz-Überwachung sendet den Stopp:
+    assert write_task.ausfuehren(device.write, write_value, schreiben)
+    assert ('2L', 0) in device.gesendet
+    assert device.Limit_stop and device.Limit_Stop_Text == 0
+
+
+def test_educrys_rotation_ohne_dauer_modus():
+    device = types.SimpleNamespace(Antriebs_wahl = 'R', PID = types.SimpleNamespace(sample_time = 1000))
+    sampler = types.SimpleNamespace(device_name = 'Educrys-Antrieb_2', device = device, messTime = 1, signal_fertig = Signal())
+    scheduler = Scheduler(0)
+    scheduler.add_sampler(sampler)
+    assert not scheduler.eintraege['Educrys-Antrieb_2']['dauer_modus']
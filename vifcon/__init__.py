@@ -1,5 +1,7 @@
-from ._version import get_versions
+def __getattr__(name):
+    # Version (git) erst bei Bedarf ermitteln, nicht bei jedem Import von vifcon (Programmstart):
+    if name == "__version__":
+        from ._version import get_versions
 
-
-__version__ = get_versions()["version"]
-del get_versions
+        return get_versions()["version"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
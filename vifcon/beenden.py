@@ -0,0 +1,137 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Koordinator für das Beenden von VIFCON (Controller.exit):
+- Wartet auf die Sampler (Fertig-Event) statt fester Verzögerungen und Warte-Schleifen
+- Die Sampler werden nach Port (Schnittstelle) gruppiert, jeder Sampler hat seine eigene Frist (timeout_exit)
+- Die Threads werden beendet (quit) und mit einer gemeinsamen Frist abgewartet (QThread.wait)
+- Jede Phase des Beendens wird gemessen und als Bericht in das Logging geschrieben
+
+Gemessen wird mit der monotonen Uhr (time.perf_counter).
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import time
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+
+class Beenden_Koordinator:
+    def __init__(self, sprache, timeout):
+        ''' Erstellung des Koordinators.
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+            timeout (float):    Frist pro Gerät bzw. Thread in s (time|timeout_exit)
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        self.sprache        = sprache
+        self.timeout        = timeout
+        self.start          = time.perf_counter()
+        self.phase_marke    = self.start
+        self.phasen         = []                                # Liste von [Phase, Dauer in s]
+        self.verspaetet     = []                                # Geräte bzw. Threads, deren Frist abgelaufen ist
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_BK_1 = ['Beenden - Phase',                                                                'Shutdown - Phase']
+        self.Log_Text_BK_2 = ['Beenden - Gesamtdauer:',                                                         'Shutdown - Total duration:']
+        self.Log_Text_BK_3 = ['ms',                                                                             'ms']
+        self.Log_Text_BK_4 = ['Beenden - Frist abgelaufen für',                                                 'Shutdown - Deadline expired for']
+        self.Log_Text_BK_5 = ['Beenden - Port',                                                                 'Shutdown - Port']
+        self.Log_Text_BK_6 = ['fertig nach',                                                                    'done after']
+        self.Log_Text_BK_7 = ['Beenden - Thread hat die Frist überschritten:',                                   'Shutdown - Thread exceeded the deadline:']
+
+    ##########################################
+    # Messung:
+    ##########################################
+    def phase(self, name):
+        ''' Beendet eine Phase des Beendens (Dauer seit der letzten Phase).
+
+        Args:
+            name (str):         Name der Phase
+        '''
+        jetzt = time.perf_counter()
+        self.phasen.append([name, jetzt - self.phase_marke])
+        self.phase_marke = jetzt
+
+    def rest(self, frist):
+        ''' Verbleibende Zeit bis zur Frist in s (nie negativ). '''
+        return max(0, frist - time.perf_counter())
+
+    ##########################################
+    # Warten:
+    ##########################################
+    def sampler_warten(self, port_sampler):
+        ''' Wartet auf das Fertig-Event aller Sampler. Die Sampler der Ports arbeiten in ihren Threads parallel,
+        daher startet die Frist jedes Samplers zum gleichen Zeitpunkt und die Wartezeit ist insgesamt durch den Timeout begrenzt.
+
+        Args:
+            port_sampler (dict):    Port: Liste der Sampler
+        Return:
+            Liste der Sampler, deren Frist abgelaufen ist
+        '''
+        start = time.perf_counter()
+        frist = start + self.timeout
+        zu_spaet = []
+        for port in port_sampler:
+            for sampler in port_sampler[port]:
+                if not sampler.fertig_event.wait(self.rest(frist)):
+                    zu_spaet.append(sampler)
+                    logger.warning(f'{self.Log_Text_BK_4[self.sprache]} {sampler.device_name} ({port})')
+            logger.debug(f'{self.Log_Text_BK_5[self.sprache]} {port} {self.Log_Text_BK_6[self.sprache]} {(time.perf_counter() - start)*1000:.1f} {self.Log_Text_BK_3[self.sprache]}')
+        self.verspaetet += [sampler.device_name for sampler in zu_spaet]
+        return zu_spaet
+
+    def threads_beenden(self, threads):
+        ''' Beendet die Event-Loops der Threads (quit) und wartet auf deren Ende (QThread.wait).
+
+        Args:
+            threads (list):     QThread-Objekte
+        Return:
+            True, wenn alle Threads innerhalb der Frist beendet wurden
+        '''
+        for thread in threads:
+            thread.quit()
+        frist = time.perf_counter() + self.timeout
+        alle  = True
+        for thread in threads:
+            if not thread.wait(int(self.rest(frist) * 1000)):
+                logger.warning(f'{self.Log_Text_BK_7[self.sprache]} {thread}')
+                self.verspaetet.append(str(thread))
+                alle = False
+        return alle
+
+    ##########################################
+    # Bericht:
+    ##########################################
+    def bericht(self):
+        ''' Schreibt die Zeiten der Phasen in das Logging. '''
+        ms = self.Log_Text_BK_3[self.sprache]
+        for name, dauer in self.phasen:
+            logger.info(f'{self.Log_Text_BK_1[self.sprache]} {name}: {dauer*1000:.1f} {ms}')
+        logger.info(f'{self.Log_Text_BK_2[self.sprache]} {(time.perf_counter() - self.start)*1000:.1f} {ms}')
+        if not self.verspaetet == []:
+            logger.warning(f'{self.Log_Text_BK_4[self.sprache]}: {", ".join(self.verspaetet)}')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,136 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Befehls-Schicht zwischen den Widgets und den Geräten:
+- Ersetzt das write_task-Dictionary eines Widgets (Schlüssel und Werte bleiben gleich)
+- Jeder Auftrag ist ein Eintrag, ein neuer Auftrag derselben Art ersetzt den noch nicht gesendeten (zusammenfassen)
+- Die write-Funktion des Gerätes wird nur aufgerufen, wenn ein Auftrag offen ist oder der Scheduler
+  das Schreiben anfordert (PID-Takt, Grenz-Überwachung, Pop-Up, Beenden)
+- Zählt neue und ersetzte Aufträge, übersprungene Aufrufe, die Warteschlangen-Tiefe und die Dauer der write-Funktion
+
+Die Werte der Aufträge stehen weiterhin in write_value des Widgets. Ein ersetzter Auftrag sendet somit
+immer den zuletzt eingetragenen Wert.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import time
+
+## Eigene:
+from .scheduler import ZUSTANDS_TASKS
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+
+class Befehls_Liste(dict):
+    def __init__(self, sprache, name, write_task):
+        ''' Erstellung der Befehls-Liste eines Gerätes.
+
+        Args:
+            sprache (int):          Sprache der GUI (Listenplatz)
+            name (str):             Geräte-Name
+            write_task (dict):      write_task-Dictionary des Widgets
+        '''
+        super().__init__(write_task)
+
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache    = sprache
+        self.name       = name
+
+        ## Statistik:
+        self.anz_Befehle        = 0             # Neue Aufträge
+        self.anz_Ersetzt        = 0             # Aufträge, die vor dem Senden durch einen neueren ersetzt wurden
+        self.anz_Aufrufe        = 0             # Aufrufe der write-Funktion
+        self.anz_Uebersprungen  = 0             # Takte ohne offenen Auftrag (kein Aufruf der write-Funktion)
+        self.tiefe_summe        = 0             # Summe der offenen Aufträge pro Takt
+        self.tiefe_max          = 0
+        self.dauer_summe        = 0             # Summe der Dauer der write-Funktion in s
+        self.dauer_max          = 0
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_BL_1 = ['Befehls-Liste',                                                                  'Command list']
+        self.Log_Text_BL_2 = ['Aufträge:',                                                                      'Commands:']
+        self.Log_Text_BL_3 = ['Ersetzt:',                                                                       'Superseded:']
+        self.Log_Text_BL_4 = ['Write-Aufrufe:',                                                                 'Write calls:']
+        self.Log_Text_BL_5 = ['Übersprungen:',                                                                  'Skipped:']
+        self.Log_Text_BL_6 = ['Tiefe Mittel/Max:',                                                              'Depth mean/max:']
+        self.Log_Text_BL_7 = ['Dauer Mittel/Max:',                                                              'Duration mean/max:']
+
+    ##########################################
+    # Aufträge:
+    ##########################################
+    def __setitem__(self, auftrag, wert):
+        ''' Trägt einen Auftrag ein bzw. ersetzt den noch offenen Auftrag derselben Art. '''
+        if wert == True and self.ist_auftrag(auftrag):
+            if self.get(auftrag, False):    self.anz_Ersetzt += 1
+            else:                           self.anz_Befehle += 1
+        super().__setitem__(auftrag, wert)
+
+    def ist_auftrag(self, auftrag):
+        ''' Return: True - Eintrag ist ein einmaliger Auftrag (kein Zustand und keine Initialisierung) '''
+        return not auftrag in ZUSTANDS_TASKS and not auftrag == 'Init'
+
+    def offen(self):
+        ''' Return: Liste der offenen Aufträge '''
+        return [auftrag for auftrag in self if self[auftrag] and self.ist_auftrag(auftrag)]
+
+    ##########################################
+    # Ausführung:
+    ##########################################
+    def ausfuehren(self, write, write_value, schreiben):
+        ''' Ruft die write-Funktion des Gerätes nur auf, wenn etwas zu senden ist.
+
+        Args:
+            write (Funktion):       write-Funktion des Gerätes
+            write_value (dict):     Werte der Aufträge (Widget)
+            schreiben (bool):       Scheduler fordert das Schreiben an (PID-Takt, Grenz-Überwachung, Beenden)
+        Return:
+            True - write-Funktion wurde aufgerufen
+        '''
+        tiefe = len(self.offen())
+        self.tiefe_summe += tiefe
+        self.tiefe_max    = max(self.tiefe_max, tiefe)
+        if not schreiben and tiefe == 0:
+            self.anz_Uebersprungen += 1
+            return False
+
+        start = time.perf_counter()
+        write(self, write_value)
+        dauer = time.perf_counter() - start
+        self.anz_Aufrufe += 1
+        self.dauer_summe += dauer
+        self.dauer_max    = max(self.dauer_max, dauer)
+        return True
+
+    ##########################################
+    # Statistik:
+    ##########################################
+    def log_statistik(self):
+        ''' Schreibt die Zähler der Befehls-Liste in das Logging. '''
+        takte  = self.anz_Aufrufe + self.anz_Uebersprungen
+        tiefe  = self.tiefe_summe / takte if takte > 0 else 0
+        mittel = self.dauer_summe / self.anz_Aufrufe if self.anz_Aufrufe > 0 else 0
+        logger.info(f'{self.Log_Text_BL_1[self.sprache]} {self.name} - {self.Log_Text_BL_2[self.sprache]} {self.anz_Befehle}, {self.Log_Text_BL_3[self.sprache]} {self.anz_Ersetzt}, {self.Log_Text_BL_4[self.sprache]} {self.anz_Aufrufe}, {self.Log_Text_BL_5[self.sprache]} {self.anz_Uebersprungen}, {self.Log_Text_BL_6[self.sprache]} {tiefe:.2f}/{self.tiefe_max}, {self.Log_Text_BL_7[self.sprache]} {1000*mittel:.1f}/{1000*self.dauer_max:.1f} ms')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
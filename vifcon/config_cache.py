@@ -0,0 +1,129 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Gemeinsamer Speicher (Cache) der eingelesenen YAML-Dateien (Config und Rezept-Dateien):
+- Eine Datei wird nur neu gelesen, wenn sich Änderungszeit oder Größe geändert haben oder die Datei als geändert gemeldet wurde
+- Geparst (yaml.safe_load) wird nur, wenn der Inhalt (SHA-256) noch nicht bekannt ist
+- Alle Widgets und PID-Regler erhalten denselben geparsten Baum - dieser darf nicht verändert werden!
+- Der Controller überwacht die Dateien (QFileSystemWatcher, unter Linux inotify) und lädt sie bei einer Änderung neu
+
+Das Neu-Einlesen der Rezepte bei zehn Geräten ist somit ein Parse-Vorgang statt zehn.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import threading
+import hashlib
+import os
+import yaml
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+
+class Config_Cache:
+    def __init__(self):
+        ''' Erstellung des Caches. '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        self.lock       = threading.RLock()
+        self.dateien    = {}                    # Pfad: {'stand': (mtime, Größe), 'hash', 'daten', 'geaendert'}
+        self.baeume     = {}                    # Hash: geparster Baum
+        ## Statistik:
+        self.anz_Treffer    = 0                 # Datei unverändert (kein Lesen)
+        self.anz_Hash       = 0                 # Datei gelesen, Inhalt bekannt (kein Parsen)
+        self.anz_Parse      = 0                 # Datei gelesen und geparst
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_CC_1 = ['Config-Cache - Unverändert:',                                                    'Config cache - Unchanged:']
+        self.Log_Text_CC_2 = ['Gleicher Inhalt:',                                                               'Same content:']
+        self.Log_Text_CC_3 = ['Geparst:',                                                                       'Parsed:']
+
+    ##########################################
+    # Laden:
+    ##########################################
+    def laden(self, pfad):
+        ''' Gibt den geparsten Inhalt einer YAML-Datei zurück.
+
+        Args:
+            pfad (str):         Pfad der Datei
+        Return:
+            daten:              geparster Baum (nicht verändern!)
+        '''
+        schluessel = os.path.abspath(pfad)
+        with self.lock:
+            info    = os.stat(schluessel)
+            stand   = (info.st_mtime_ns, info.st_size)
+            eintrag = self.dateien.get(schluessel)
+            if not eintrag == None and eintrag['stand'] == stand and not eintrag['geaendert']:
+                self.anz_Treffer += 1
+                return eintrag['daten']
+
+            with open(schluessel, 'rb') as f:
+                inhalt = f.read()
+            hash_wert = hashlib.sha256(inhalt).hexdigest()
+            if hash_wert in self.baeume:
+                self.anz_Hash += 1
+            else:
+                self.baeume[hash_wert] = yaml.safe_load(inhalt.decode('utf-8'))
+                self.anz_Parse += 1
+            self.dateien[schluessel] = {'stand': stand, 'hash': hash_wert, 'daten': self.baeume[hash_wert], 'geaendert': False}
+            ## Nicht mehr genutzte Bäume entfernen:
+            genutzt = [self.dateien[datei]['hash'] for datei in self.dateien]
+            for alt in [h for h in self.baeume if not h in genutzt]:
+                del self.baeume[alt]
+            return self.baeume[hash_wert]
+
+    def geaendert(self, pfad):
+        ''' Markiert eine Datei als geändert (Meldung der Datei-Überwachung).
+
+        Args:
+            pfad (str):         Pfad der Datei
+        '''
+        with self.lock:
+            eintrag = self.dateien.get(os.path.abspath(pfad))
+            if not eintrag == None:
+                eintrag['geaendert'] = True
+
+    def log_statistik(self, sprache):
+        ''' Schreibt die Zähler in das Logging.
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+        '''
+        logger.info(f'{self.Log_Text_CC_1[sprache]} {self.anz_Treffer}, {self.Log_Text_CC_2[sprache]} {self.anz_Hash}, {self.Log_Text_CC_3[sprache]} {self.anz_Parse}')
+
+
+# Cache des Programms:
+CACHE = Config_Cache()
+
+
+def lade_yaml(pfad):
+    ''' Ersatz für open + yaml.safe_load über den Cache des Programms.
+
+    Args:
+        pfad (str):         Pfad der Datei
+    Return:
+        geparster Baum (nicht verändern!)
+    '''
+    return CACHE.laden(pfad)
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,624 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Schema der Config-Datei (config.yml) und Prüfung in einem Durchlauf:
+- Das Schema beschreibt die Schlüssel mit Typ, Bereich und Default (Bool, Zahl, Wahl, Text, Dict, Pflicht)
+- Das Schema wird einmal in eine flache Liste (Pfad, Regel) übersetzt (kompilieren), für die Geräte einmal pro Geräte-Art
+- Die Prüfung (config_pruefen) liefert alle Werte (bzw. Defaults) und alle Meldungen auf einmal zurück
+- Korrekte Werte werden vereinheitlicht (Text-Zahlen mit Komma als Float, Auswahl in Großbuchstaben)
+- Zusätzlich werden die Grenzen (Minimum <= Maximum) und die Rezepte (Schritte, Rezept-Dateien) geprüft
+- Das Ergebnis wird für denselben geparsten Baum (Config-Cache) nicht neu berechnet
+
+Genutzt vom Controller (Start und Neu-Laden der Config) und von vifcon_main.py --check-config (ohne GUI).
+Die Geräte, Widgets und der PID-Regler erhalten die geprüfte Config (geprueft) und lesen die Schlüssel des Schemas ohne eigene Prüfung.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import copy
+
+## Eigene:
+from .config_cache import lade_yaml
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+FEHLT = object()                                        # Markierung für einen fehlenden Schlüssel
+
+##########################################
+# Regeln:
+##########################################
+class Regel:
+    def __init__(self, default, text, liste, pruefung, pflicht = False, umwandeln = None):
+        ''' Regel für einen Schlüssel der Config.
+
+        Args:
+            default:                Wert bei Fehler
+            text (str):             Mögliche Werte bzw. Typen für die Meldung
+            liste (bool):           True - Meldung mit Möglich sind (Werte), False - Möglich sind die Typen
+            pruefung (function):    Prüfung des Wertes (Rückgabe True = korrekt)
+            pflicht (bool):         Schlüssel muss vorhanden sein (kein Default)
+            umwandeln (function):   Vereinheitlichung eines korrekten Wertes (None - Wert bleibt)
+        '''
+        self.default    = default
+        self.text       = text
+        self.liste      = liste
+        self.pruefung   = pruefung
+        self.pflicht    = pflicht
+        self.umwandeln  = umwandeln
+
+def Bool(default):
+    ''' True/False oder 0/1. '''
+    return Regel(default, '[True, False]', True, lambda wert: type(wert) == bool or wert in [0, 1])
+
+def Zahl(default, minimum = None, ganz = False, groesser = False, text = False):
+    ''' Integer bzw. Integer/Float, optional mit Minimum (>= bzw. > bei groesser).
+
+    Args:
+        text (bool):    Auch Text als Zahl erlaubt, Komma als Dezimaltrennzeichen (z.B. '0,5' oder '1e-02')
+    '''
+    typen   = [int] if ganz else [int, float]
+    moeglich = 'Integer' if ganz else '[Integer, Float]'
+    if not minimum == None:
+        moeglich += f' (>{minimum})' if groesser else f' (>={minimum})'
+    def pruefung(wert):
+        if text and type(wert) == str:
+            try:    wert = float(wert.replace(',', '.'))
+            except: return False
+        if not type(wert) in typen:
+            return False
+        if minimum == None:
+            return True
+        return wert > minimum if groesser else wert >= minimum
+    def umwandeln(wert):
+        return float(wert.replace(',', '.')) if type(wert) == str else wert
+    return Regel(default, moeglich, False, pruefung, umwandeln = umwandeln if text else None)
+
+def Wahl(default, werte, gross = False):
+    ''' Einer der Werte (gross - Vergleich in Großbuchstaben). '''
+    def pruefung(wert):
+        if gross and type(wert) == str:
+            wert = wert.upper()
+        return wert in werte
+    def umwandeln(wert):
+        return wert.upper() if type(wert) == str else wert
+    return Regel(default, str(werte).replace("'", ''), True, pruefung, umwandeln = umwandeln if gross else None)
+
+def Text(default):
+    ''' String. '''
+    return Regel(default, '[str]', False, lambda wert: type(wert) == str)
+
+def Dict(default):
+    ''' Dictionary. '''
+    return Regel(default, '[dict]', False, lambda wert: type(wert) == dict)
+
+def Skalierung(groessen):
+    ''' Skalierungsfaktoren der Plots (fehlende Größen einer vorhandenen Angabe werden 0). '''
+    def pruefung(wert):
+        if not type(wert) == dict:
+            return False
+        return all(groesse in groessen and type(wert[groesse]) in [int, float] and wert[groesse] >= 0 for groesse in wert)
+    return Regel({groesse: 1 for groesse in groessen}, f'{groessen} - [Integer, Float] (>=0)', True, pruefung, umwandeln = lambda wert: {groesse: wert.get(groesse, 0) for groesse in groessen})
+
+def Pflicht(regel):
+    ''' Schlüssel muss vorhanden sein. '''
+    regel.pflicht = True
+    return regel
+
+##########################################
+# Schema:
+##########################################
+## Legende der Plots (Generator, Antrieb):
+LEGENDE = {
+    'legend_pos':               Wahl('SIDE', ['IN', 'OUT', 'SIDE'], gross = True),
+    'legend_anz':               Zahl(2, 1, ganz = True),
+    'side':                     Wahl('RL', ['L', 'R', 'RL'], gross = True),
+}
+## Übergeordnete Einstellungen:
+SCHEMA = {
+    'time': {
+        'dt-main':              Zahl(150, 0, ganz = True),
+        'timeout_exit':         Zahl(10, 0, text = True),
+        'rezept_aufloesung':    Zahl(0, 0),
+    },
+    'Function_Skip': {
+        'Multilog_Link':        Bool(False),
+        'Generell_GamePad':     Bool(False),
+        'writereadTime':        Bool(False),
+    },
+    'Multilog_extra': {
+        'timeout':              Zahl(10, 0, ganz = True),
+        'connection_error_case':Wahl(1, [1, 2]),
+        'framing':              Wahl('json', ['json', 'frame']),
+        'payload':              Wahl('json', ['json', 'msgpack', 'struct']),
+    },
+    'Nemo_extra': {
+        'register_map':         Bool(True),
+        'register_gap':         Zahl(32, 0, ganz = True),
+        'register_age':         Zahl(0.1, 0),
+    },
+    'Educrys_extra': {
+        'frame_share':          Bool(True),
+        'frame_age':            Zahl(0.5, 0),
+    },
+    'save': {
+        'config_save':          Bool(True),
+        'log_save':             Bool(True),
+        'plot_save':            Bool(True),
+        'GUI_save':             Bool(False),
+        'data_flush_rows':      Zahl(50, 1, ganz = True),
+        'data_flush_time':      Zahl(5, 0, groesser = True),
+        'data_fsync_time':      Zahl(60, 0),
+        'data_columnar':        Bool(False),
+        'journal_flush_rows':   Zahl(20, 1, ganz = True),
+        'journal_flush_time':   Zahl(1, 0, groesser = True),
+        'journal_jsonl':        Bool(False),
+    },
+    'GUI': {
+        'language':             Wahl('EN', ['DE', 'EN'], gross = True),
+        'GUI_Frame':            Bool(False),
+        'GUI_color_Widget':     Bool(False),
+        'plot_max_points':      Zahl(0, 0, ganz = True),
+        'max_fps':              Zahl(10, 0),
+    },
+    'consol_Logging': {
+        'level':                Wahl(30, [10, 20, 30, 40]),
+        'print':                Wahl(1, [1, 2, 3]),
+        'format':               Text('%(asctime)s %(levelname)s %(name)s - %(message)s'),
+    },
+    'Logging_extra': {
+        'rate_limit':           Bool(True),
+        'rate_time':            Zahl(10, 0, groesser = True),
+        'rate_count':           Zahl(3, 1, ganz = True),
+        'queue':                Bool(False),
+    },
+    'legend': {
+        'generator':            LEGENDE,
+        'antrieb':              LEGENDE,
+    },
+    'skalFak':                  Skalierung(['Pos', 'Win', 'Speed_1', 'Speed_2', 'WinSpeed', 'Temp', 'Op', 'Current', 'Voltage', 'Pow', 'Freq', 'Freq_2', 'PIDA', 'PIDG']),
+    'devices':                  Pflicht(Dict(None)),
+}
+### Abschnitte, die nicht im Schema stehen, aber genutzt werden (keine Meldung als unbekannt):
+ABSCHNITTE_FREI = ['logging']
+
+## Geräte - Gemeinsame Teile:
+GERAET = {
+    'skip':                     Bool(True),
+    'typ':                      Wahl('Generator', ['Generator', 'Antrieb', 'Monitoring']),
+    'start': {
+        'readTime':             Zahl(2, 0),
+        'init':                 Bool(False),
+    },
+    'multilog': {
+        'write_trigger':        Text(None),
+        'write_port':           Zahl(0, 0, ganz = True),
+    },
+}
+STEUERUNG = {
+    'ende':                     Bool(True),
+    'multilog': {
+        'read_trigger_ist':     Text(None),
+        'read_port_ist':        Zahl(0, 0, ganz = True),
+        'read_trigger_soll':    Text(None),
+        'read_port_soll':       Zahl(0, 0, ganz = True),
+    },
+    'PID': {
+        'PID_Aktiv':            Bool(False),
+        'Value_Origin':         Wahl('VV', ['VV', 'MM', 'VM', 'MV'], gross = True),
+        'kp':                   Zahl(0, text = True),
+        'ki':                   Zahl(0, text = True),
+        'kd':                   Zahl(0, text = True),
+        'sample':               Zahl(500, 0, ganz = True),
+        'sample_tolleranz':     Zahl(100, 0, ganz = True),
+        'debug_log_time':       Zahl(5, 0, ganz = True),
+        'start_ist':            Zahl(0, 0),
+        'start_soll':           Zahl(0, 0),
+        'Input_Limit_max':      Zahl(1),
+        'Input_Limit_min':      Zahl(0),
+        'Input_Error_option':   Wahl('error', ['error', 'max', 'min']),
+    },
+    'rezepte':                  Dict({'rezept_Default': {'n1': '10 ; 0 ; s'}}),
+}
+TEMPERATUR = {
+    'start': {
+        'PID_Write':            Bool(False),
+        'start_modus':          Wahl('Manuel', ['Auto', 'Manuel']),
+        'ramp_start_value':     Wahl('IST', ['IST', 'SOLL'], gross = True),
+    },
+    'PID': {
+        'umstell_wert':         Zahl(0, 0, text = True),
+    },
+    'defaults': {
+        'startTemp':            Zahl(0, 0, text = True),
+        'startPow':             Zahl(0, 0, text = True),
+    },
+    'GUI': {
+        'legend':               Text('IWT; IWOp'),
+    },
+    'limits': {
+        'maxTemp':              Zahl(1, 0),
+        'minTemp':              Zahl(0, 0),
+        'opMax':                Zahl(1, 0),
+        'opMin':                Zahl(0, 0),
+    },
+}
+GENERATOR = {
+    'start': {
+        'start_modus':          Wahl('P', ['P', 'I', 'U'], gross = True),
+    },
+    'PID': {
+        'umstell_wert_I':       Zahl(0, 0, text = True),
+        'umstell_wert_P':       Zahl(0, 0, text = True),
+        'umstell_wert_U':       Zahl(0, 0, text = True),
+    },
+    'limits': {
+        'maxI':                 Zahl(1, 0),
+        'minI':                 Zahl(0, 0),
+        'maxP':                 Zahl(1, 0),
+        'minP':                 Zahl(0, 0),
+        'maxU':                 Zahl(1, 0),
+        'minU':                 Zahl(0, 0),
+    },
+    'defaults': {
+        'startCurrent':         Zahl(0, 0, text = True),
+        'startPow':             Zahl(0, 0, text = True),
+        'startVoltage':         Zahl(0, 0, text = True),
+    },
+    'GUI': {
+        'legend':               Text('IWP; IWU; IWI'),
+    },
+}
+ANTRIEB = {
+    'PID': {
+        'umstell_wert':         Zahl(0, 0, text = True),
+    },
+    'GUI': {
+        'knopf_anzeige':        Bool(False),
+        'legend':               Text('IWv; IWs'),
+    },
+    'limits': {
+        'maxSpeed':             Zahl(1, 0, groesser = True),
+    },
+}
+LINEAR = {
+    'limits': {
+        'maxPos':               Zahl(1),
+        'minPos':               Zahl(0),
+    },
+}
+NEMO = {
+    'nemo-Version':             Wahl(1, [1, 2]),
+}
+PARAMETER = {
+    'parameter': {
+        'nKS_Aus':              Zahl(3, 0, ganz = True),
+    },
+}
+VORFAKTOR = {
+    'parameter': {
+        'Vorfaktor_Ist':        Zahl(1, 0, text = True),
+        'Vorfaktor_Soll':       Zahl(1, 0, text = True),
+    },
+}
+
+## Geräte-Arten (Auswahl über den Namen wie bei der Geräte-Erstellung im Controller):
+GERAETE_ARTEN = {
+    'Eurotherm':            [GERAET, STEUERUNG, TEMPERATUR, {'start': {'sicherheit': Bool(True), 'ramp_m_unit': Wahl('K/s', ['K/s', 'K/h', 'K/min'])}}],
+    'TruHeat':              [GERAET, STEUERUNG, GENERATOR, {'start': {'send_Delay': Zahl(20, 0, ganz = True), 'watchdog_Time': Zahl(5000, 0, ganz = True)}, 'serial-loop-read': Zahl(10, 1, ganz = True)}],
+    'Nemo-Generator':       [GERAET, STEUERUNG, GENERATOR, NEMO, PARAMETER, {'start': {'start_modus': Wahl('I', ['P', 'I', 'U'], gross = True), 'Auswahl': Wahl('I', ['PUI', 'I'], gross = True)}, 'nemo-Version': Wahl(2, [2])}],
+    'Educrys-Heizer':       [GERAET, STEUERUNG, TEMPERATUR, PARAMETER, {'serial-extra': {'serial-loop-read': Zahl(10, 1, ganz = True), 'rel_tol_write_ans': Zahl(1e-02, 0, text = True)}}],
+    'PI-Achse':             [GERAET, STEUERUNG, ANTRIEB, LINEAR, PARAMETER, {'start': {'mode': Wahl(1, [0, 1, 2])}, 'GUI': {'bewegung': Wahl('z', ['x', 'y', 'z']), 'piSymbol': Wahl('UN', ['LI', 'RE', 'UN', 'OB', 'VO', 'HI'], gross = True)},
+                                                                  'parameter': {'cpm': Zahl(29572, ganz = True), 'mvtime': Zahl(25, 0, ganz = True)}, 'defaults': {'startPos': Zahl(0, 0, text = True), 'startSpeed': Zahl(0, 0, text = True)},
+                                                                  'read_TT_log': Bool(False), 'serial-loop-read': Zahl(10, 1, ganz = True)}],
+    'Nemo-Achse-Linear':    [GERAET, STEUERUNG, ANTRIEB, LINEAR, NEMO, PARAMETER, VORFAKTOR, {'start': {'invert': Bool(False), 'invert_Pos': Bool(False), 'pos_control': Wahl('SIM', ['SIM', 'REAL'], gross = True), 'sicherheit': Wahl(0, [0, 1]), 'start_weg': Zahl(0)},
+                                                                        'defaults': {'startSpeed': Zahl(1, text = True)}}],
+    'Nemo-Achse-Rotation':  [GERAET, STEUERUNG, ANTRIEB, NEMO, PARAMETER, VORFAKTOR, {'start': {'invert': Bool(False), 'invert_winkel': Bool(False), 'kont_rot': Bool(False), 'winkel_control': Wahl('SIM', ['SIM', 'REAL'], gross = True), 'sicherheit': Wahl(0, [0, 1]), 'start_winkel': Zahl(0)},
+                                                                'limits': {'maxWinkel': Zahl(180), 'minWinkel': Zahl(0)}, 'defaults': {'startSpeed': Zahl(1, text = True)}, 'GUI': {'legend': Text('IWv; IWw')}, 'rezept_Loop': Zahl(0, 0, ganz = True)}],
+    'Educrys-Antrieb':      [GERAET, STEUERUNG, ANTRIEB, LINEAR, PARAMETER, {'start': {'sicherheit': Wahl(0, [0, 1]), 'start_weg': Zahl(0), 'write_SLP': Bool(False)}, 'Antriebs_Art': Wahl('F', ['L', 'R', 'F']), 'GUI': {'legend': Text('IWv')},
+                                                                  'defaults': {'startPos': Zahl(0, 0, text = True), 'startSpeed': Zahl(0, 0, text = True)}, 'rezept_Loop': Zahl(0, 0, ganz = True),
+                                                                  'serial-extra': {'serial-loop-read': Zahl(10, 1, ganz = True), 'rel_tol_write_ans': Zahl(1e-02, 0, text = True)}}],
+    'Nemo-Gase':            [GERAET, NEMO, PARAMETER],
+    'Educrys-Monitoring':   [GERAET, PARAMETER, {'serial-loop-read': Zahl(10, 1, ganz = True)}],
+}
+## Grenzen (Minimum, Maximum) der Geräte:
+GRENZEN = [('limits', 'minTemp', 'maxTemp'), ('limits', 'opMin', 'opMax'), ('limits', 'minI', 'maxI'), ('limits', 'minP', 'maxP'), ('limits', 'minU', 'maxU'),
+           ('limits', 'minPos', 'maxPos'), ('limits', 'minWinkel', 'maxWinkel'), ('PID', 'Input_Limit_min', 'Input_Limit_max')]
+## Rezept-Arten der Geräte:
+REZEPT_ARTEN = {'Eurotherm': ['s', 'r', 'er', 'op', 'opr'], 'Educrys-Heizer': ['s', 'r', 'op', 'opr']}
+REZEPT_ARTEN_STANDARD = ['s', 'r']
+REZEPT_ORDNER = 'vifcon/rezepte'
+
+##########################################
+# Kompilieren:
+##########################################
+def kompilieren(schema, pfad = ()):
+    ''' Übersetzt ein (verschachteltes) Schema in eine flache Liste.
+
+    Args:
+        schema (dict):      Schema (Schlüssel: Regel oder Schema)
+        pfad (tuple):       Pfad des Schemas
+    Return:
+        Liste von (Pfad, Regel)
+    '''
+    regeln = []
+    for schluessel in schema:
+        if isinstance(schema[schluessel], dict):
+            regeln += kompilieren(schema[schluessel], pfad + (schluessel,))
+        else:
+            regeln.append((pfad + (schluessel,), schema[schluessel]))
+    return regeln
+
+def zusammenfuegen(teile):
+    ''' Fügt mehrere (verschachtelte) Schemas zusammen (spätere Teile überschreiben frühere). '''
+    schema = {}
+    for teil in teile:
+        for schluessel in teil:
+            if isinstance(teil[schluessel], dict) and isinstance(schema.get(schluessel), dict):
+                schema[schluessel] = zusammenfuegen([schema[schluessel], teil[schluessel]])
+            else:
+                schema[schluessel] = teil[schluessel]
+    return schema
+
+REGELN          = kompilieren(SCHEMA)
+GERAETE_REGELN  = {art: kompilieren(zusammenfuegen(GERAETE_ARTEN[art])) for art in GERAETE_ARTEN}
+GERAETE_REGELN_STANDARD = kompilieren(GERAET)
+
+def geraete_art(device_name):
+    ''' Geräte-Art aus dem Namen (None - unbekannt). '''
+    for art in GERAETE_ARTEN:
+        if art in device_name:
+            return art
+    return None
+
+##########################################
+# Prüfung:
+##########################################
+def hole(baum, pfad):
+    ''' Wert im Baum (FEHLT - Schlüssel nicht vorhanden). '''
+    for schluessel in pfad:
+        if not isinstance(baum, dict) or not schluessel in baum:
+            return FEHLT
+        baum = baum[schluessel]
+    return baum
+
+class Config_Pruefung:
+    def __init__(self, config):
+        ''' Prüfung einer Config in einem Durchlauf.
+
+        Args:
+            config (dict):      geparste Config (wird nicht verändert)
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        self.config     = config
+        self.werte      = {}                    # Pfad (tuple): geprüfter Wert bzw. Default
+        self.meldungen  = []                    # Liste von [Art, Pfad, Regel bzw. Text, Wert]
+        self.baum       = None                  # Config mit den geprüften Werten (wird bei Bedarf erstellt)
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                  'Configuration error in element:']
+        self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                     'Possible values:']
+        self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                           'The following types are possible:']
+        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                          'Default is used:']
+        self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                'Error reading config during configuration:']
+        self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                                              '; Set to default:']
+        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                              'Incorrect input:']
+        self.Log_Text_CS_1      = ['Pflicht-Angabe fehlt in der Config:',                                               'Required entry missing in the config:']
+        self.Log_Text_CS_2      = ['Unbekannter Schlüssel in der Config (wird nicht genutzt):',                         'Unknown key in the config (not used):']
+        self.Log_Text_CS_3      = ['Minimum größer als Maximum:',                                                       'Minimum greater than maximum:']
+        self.Log_Text_CS_4      = ['Fehlerhafter Rezept-Schritt:',                                                      'Incorrect recipe step:']
+        self.Log_Text_CS_5      = ['Rezept-Datei kann nicht gelesen werden:',                                           'Recipe file cannot be read:']
+        self.Log_Text_CS_6      = ['Unbekannte Geräte-Art (Name):',                                                     'Unknown device type (name):']
+        self.Log_Text_CS_7      = ['Config-Prüfung:',                                                                   'Config check:']
+        self.Log_Text_CS_8      = ['Meldungen',                                                                         'messages']
+        ## Meldungs-Arten (Ausgabe von --check-config):
+        self.Art_Text           = {'Fehlt':     ['Fehlt',       'Missing'],
+                                   'Falsch':    ['Falsch',      'Incorrect'],
+                                   'Pflicht':   ['Pflicht',     'Required'],
+                                   'Unbekannt': ['Unbekannt',   'Unknown'],
+                                   'Art':       ['Art',         'Type'],
+                                   'Grenzen':   ['Grenzen',     'Limits'],
+                                   'Rezept':    ['Rezept',      'Recipe'],
+                                   'Datei':     ['Datei',       'File']}
+
+        #---------------------------------------
+        # Prüfung:
+        #---------------------------------------
+        self.regeln_pruefen(REGELN, ())
+        for abschnitt in config if isinstance(config, dict) else []:
+            if not abschnitt in SCHEMA and not abschnitt in ABSCHNITTE_FREI:
+                self.meldungen.append(['Unbekannt', (abschnitt,), None, None])
+        devices = self.werte[('devices',)]
+        for device_name in devices if isinstance(devices, dict) else []:
+            art = geraete_art(device_name)
+            if art == None:
+                self.meldungen.append(['Art', ('devices', device_name), None, None])
+            self.regeln_pruefen(GERAETE_REGELN[art] if not art == None else GERAETE_REGELN_STANDARD, ('devices', device_name))
+            self.grenzen_pruefen(('devices', device_name))
+            if not art == None and not art in ['Nemo-Gase', 'Educrys-Monitoring']:
+                self.rezepte_pruefen(('devices', device_name), REZEPT_ARTEN.get(art, REZEPT_ARTEN_STANDARD))
+
+    def regeln_pruefen(self, regeln, basis):
+        ''' Prüft eine kompilierte Regel-Liste.
+
+        Args:
+            regeln (list):      Liste von (Pfad, Regel)
+            basis (tuple):      Pfad, an dem die Regeln beginnen
+        '''
+        start = hole(self.config, basis)
+        for pfad, regel in regeln:
+            wert = hole(start, pfad)
+            if wert is FEHLT:
+                self.meldungen.append(['Pflicht' if regel.pflicht else 'Fehlt', basis + pfad, regel, None])
+                wert = regel.default
+            elif not regel.pruefung(wert):
+                self.meldungen.append(['Falsch', basis + pfad, regel, wert])
+                wert = regel.default
+            elif not regel.umwandeln == None:
+                wert = regel.umwandeln(wert)
+            self.werte[basis + pfad] = wert
+
+    def grenzen_pruefen(self, basis):
+        ''' Prüft, ob die Minima nicht größer als die Maxima sind. '''
+        for abschnitt, minimum, maximum in GRENZEN:
+            unten   = self.werte.get(basis + (abschnitt, minimum))
+            oben    = self.werte.get(basis + (abschnitt, maximum))
+            if not unten == None and not oben == None and unten > oben:
+                self.meldungen.append(['Grenzen', basis + (abschnitt,), f'{minimum} = {unten} > {maximum} = {oben}', None])
+
+    def rezepte_pruefen(self, basis, arten):
+        ''' Prüft die Schritte der Rezepte (Config und Rezept-Dateien).
+
+        Args:
+            basis (tuple):      Pfad des Gerätes
+            arten (list):       erlaubte Segment-Arten des Gerätes
+        '''
+        rezepte = self.werte[basis + ('rezepte',)]
+        for name in rezepte:
+            rezept = rezepte[name]
+            if isinstance(rezept, dict) and 'dat' in rezept:
+                try:
+                    rezept = lade_yaml(f'{REZEPT_ORDNER}/{rezept["dat"]}')
+                except Exception as e:
+                    self.meldungen.append(['Datei', basis + ('rezepte', name), f'{rezept["dat"]} ({e})', None])
+                    continue
+            if not isinstance(rezept, dict) or rezept == {}:
+                self.meldungen.append(['Rezept', basis + ('rezepte', name), str(rezept), None])
+                continue
+            for schritt in rezept:
+                if not self.schritt_korrekt(rezept[schritt], arten):
+                    self.meldungen.append(['Rezept', basis + ('rezepte', name, schritt), str(rezept[schritt]), None])
+
+    def schritt_korrekt(self, schritt, arten):
+        ''' Prüft einen Rezept-Schritt (Zeit ; Sollwert ; Art [; Steigung bzw. Extras]). '''
+        teile = str(schritt).split(';')
+        if len(teile) < 3 or not teile[2].strip() in arten:
+            return False
+        try:
+            zeit = float(teile[0].replace(',', '.'))
+            float(teile[1].replace(',', '.'))
+            if teile[2].strip() in ['r', 'opr']:
+                float(teile[3].replace(',', '.'))
+        except (ValueError, IndexError):
+            return False
+        return zeit >= 0
+
+    ##########################################
+    # Ergebnis:
+    ##########################################
+    def wert(self, *pfad):
+        ''' Geprüfter Wert (bzw. Default) eines Schlüssels. '''
+        return self.werte[pfad]
+
+    def fehlerhaft(self, *pfad):
+        ''' True, wenn der Wert eines Schlüssels falsch war (Default wurde eingesetzt). '''
+        return any(art == 'Falsch' and ort == pfad for art, ort, regel, wert in self.meldungen)
+
+    def geprueft(self, *pfad):
+        ''' Kopie der Config (bzw. eines Teils) mit den geprüften Werten.
+
+        Schlüssel des Schemas enthalten den geprüften Wert bzw. Default (auch wenn sie fehlen),
+        alle anderen Schlüssel bleiben wie in der Config.
+
+        Args:
+            pfad (str):         Schlüssel bis zum gewünschten Teil (z.B. 'devices', Gerätename)
+        Return:
+            dict (bzw. Wert)
+        Raises:
+            KeyError:           Teil ist nicht in der Config vorhanden
+        '''
+        if self.baum == None:
+            self.baum = copy.deepcopy(self.config) if isinstance(self.config, dict) else {}
+            for schluessel in sorted(self.werte, key = len):
+                teil = self.baum
+                for name in schluessel[:-1]:
+                    if not isinstance(teil.get(name), dict):
+                        teil[name] = {}
+                    teil = teil[name]
+                teil[schluessel[-1]] = copy.deepcopy(self.werte[schluessel])
+        teil = self.baum
+        for name in pfad:
+            if not isinstance(teil, dict) or not name in teil:
+                raise KeyError(name)
+            teil = teil[name]
+        return copy.deepcopy(teil)
+
+    def texte(self, sprache):
+        ''' Meldungen als Text (Liste von [Art, Text]).
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+        '''
+        texte = []
+        for art, pfad, regel, wert in self.meldungen:
+            name = '|'.join([str(teil) for teil in (pfad[1:] if pfad[0] == 'devices' and len(pfad) > 1 else pfad)])
+            if art == 'Fehlt':
+                texte.append([art, f'{self.Log_Pfad_conf_4[sprache]} {name} {self.Log_Pfad_conf_5[sprache]} {regel.default}'])
+            elif art == 'Falsch':
+                moeglich = self.Log_Pfad_conf_2[sprache] if regel.liste else self.Log_Pfad_conf_2_1[sprache]
+                texte.append([art, f'{self.Log_Pfad_conf_1[sprache]} {name} - {moeglich} {regel.text} - {self.Log_Pfad_conf_3[sprache]} {regel.default} - {self.Log_Pfad_conf_8[sprache]} {wert}'])
+            elif art == 'Pflicht':
+                texte.append([art, f'{self.Log_Text_CS_1[sprache]} {name}'])
+            elif art == 'Unbekannt':
+                texte.append([art, f'{self.Log_Text_CS_2[sprache]} {name}'])
+            elif art == 'Art':
+                texte.append([art, f'{self.Log_Text_CS_6[sprache]} {name}'])
+            elif art == 'Grenzen':
+                texte.append([art, f'{self.Log_Text_CS_3[sprache]} {name} - {regel}'])
+            elif art == 'Rezept':
+                texte.append([art, f'{self.Log_Text_CS_4[sprache]} {name} - {regel}'])
+            elif art == 'Datei':
+                texte.append([art, f'{self.Log_Text_CS_5[sprache]} {name} - {regel}'])
+        return texte
+
+    def fehler(self):
+        ''' Anzahl der Meldungen, die keine fehlenden Schlüssel mit Default sind. '''
+        return len([meldung for meldung in self.meldungen if not meldung[0] == 'Fehlt'])
+
+    def loggen(self, sprache):
+        ''' Schreibt alle Meldungen in das Logging.
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+        '''
+        for art, text in self.texte(sprache):
+            if art in ['Pflicht', 'Grenzen', 'Rezept', 'Datei']:  logger.error(text)
+            else:                                                   logger.warning(text)
+        logger.info(f'{self.Log_Text_CS_7[sprache]} {len(self.meldungen)} {self.Log_Text_CS_8[sprache]}')
+
+
+## Letzte Prüfung (derselbe geparste Baum aus dem Config-Cache wird nicht neu geprüft):
+LETZTE = [None, None]
+
+def config_pruefen(config):
+    ''' Prüft eine geparste Config (Ergebnis wird für denselben Baum wiederverwendet).
+
+    Args:
+        config (dict):      geparste Config
+    Return:
+        Config_Pruefung
+    '''
+    if not LETZTE[0] is config:
+        LETZTE[0], LETZTE[1] = config, Config_Pruefung(config)
+    return LETZTE[1]
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
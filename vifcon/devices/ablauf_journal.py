@@ -0,0 +1,211 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Journal für die Ablauf-Datei (Ablauf.txt):
+- Einträge (Knöpfe, Wert-Änderungen, Geräte-Antworten) werden aus jedem Thread ohne Lock an eine Warteschlange (deque) angehängt
+- Ein eigener Thread schreibt die Einträge gesammelt in die Datei
+- Geschrieben wird bei Erreichen einer Anzahl von Einträgen oder einer Zeit und beim Beenden der Anwendung
+- Der Zeitstempel wird beim Eintragen genommen, die Formatierung passiert erst im Schreib-Thread
+
+Optional (strukturiert): Zusätzlich die Datei Ablauf.jsonl mit einem JSON-Objekt pro Zeile:
+    {"t": Unix-Zeit in s, "zeit": Zeitstempel (wie Ablauf.txt), "geraet": Geräte-Name oder null, "text": Eintrag}
+Mit lese_journal kann die Datei nach Zeit und Gerät gefiltert werden.
+
+Die Sample-Threads (z.B. Eurotherm.write_read_answer) warten somit nicht mehr auf das Öffnen und Schreiben der Datei.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Algemein:
+import logging
+import threading
+import time
+import datetime
+import json
+from collections import deque
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+
+class Ablauf_Journal:
+    def __init__(self, sprache, datei, flush_zeilen = 20, flush_zeit = 1, strukturiert = False, geraete = []):
+        ''' Erstellung des Ablauf-Journals
+
+        Args:
+            sprache (int):          Sprache der GUI (Listenplatz)
+            datei (str):            Pfad der Ablauf-Datei (Ablauf.txt, bereits mit Kopf erstellt)
+            flush_zeilen (int):     Anzahl gepufferter Einträge ab der geschrieben wird
+            flush_zeit (float):     Maximale Zeit in s, die ein Eintrag im Puffer bleibt
+            strukturiert (bool):    True - Zusätzlich Ablauf.jsonl schreiben
+            geraete (list):         Geräte-Namen für die Zuordnung der Einträge (strukturiert)
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache        = sprache
+        self.datei          = datei
+        self.flush_zeilen   = flush_zeilen
+        self.flush_zeit     = flush_zeit
+        self.strukturiert   = strukturiert
+        self.geraete        = sorted(geraete, key=len, reverse=True)   # Längster Name zuerst (z.B. Nemo-Achse-Linear_1 vor Nemo-Achse)
+
+        ## Weitere:
+        self.puffer         = deque()                   # (Unix-Zeit, Text) - append/popleft sind thread-sicher
+        self.anz_Eintraege  = 0
+        self.anz_Flush      = 0
+        self.flush_max      = 0
+        self.done           = False
+
+        self.lock           = threading.Lock()          # Schutz der Dateien (Schreib-Thread <-> Beenden)
+        self.event          = threading.Event()         # Weckt den Schreib-Thread vorzeitig
+        self.thread         = threading.Thread(target=self.event_Loop, name='Ablauf_Journal', daemon=True)
+
+        ## Dateien (bleiben während der Messung offen):
+        self.f_text         = open(self.datei, 'a', encoding="utf-8")
+        self.f_json         = None
+        if self.strukturiert:
+            self.f_json     = open(f'{self.datei.rsplit(".", 1)[0]}.jsonl', 'a', encoding="utf-8")
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_AJ_1  = ['Ablauf-Journal - Einstellungen (Einträge, Flush-Zeit, JSON-Zeilen):',             'Event journal - Settings (entries, flush time, JSON lines):']
+        self.Log_Text_AJ_2  = ['Ablauf-Journal - Fehler beim Schreiben der Datei',                                 'Event journal - Error writing the file']
+        self.Log_Text_AJ_3  = ['Ablauf-Journal - Fehlergrund:',                                                    'Event journal - Reason for error:']
+        self.Log_Text_AJ_4  = ['Ablauf-Journal - Einträge:',                                                       'Event journal - Entries:']
+        self.Log_Text_AJ_5  = ['Anzahl Flush:',                                                                    'Number of flushes:']
+        self.Log_Text_AJ_6  = ['Max. Flush-Dauer:',                                                                'Max. flush duration:']
+        self.Log_Text_AJ_7  = ['ms',                                                                               'ms']
+
+        logger.info(f'{self.Log_Text_AJ_1[self.sprache]} {self.flush_zeilen}, {self.flush_zeit} s, {self.strukturiert}')
+        self.thread.start()
+
+    ##########################################
+    # Schnittstelle (alle Threads):
+    ##########################################
+    def eintragen(self, text):
+        ''' Hängt einen Eintrag an die Warteschlange an (kein Lock, keine Datei-Operation).
+
+        Args:
+            text (str):     Was zum Zeitpunkt passiert bzw. betätigt wurde
+        '''
+        self.puffer.append((time.time(), text))
+        if self.done:
+            self.flush()
+        elif len(self.puffer) >= self.flush_zeilen:
+            self.event.set()
+
+    ##########################################
+    # Schreib-Thread:
+    ##########################################
+    def event_Loop(self):
+        ''' Schreibt die Einträge zeit- oder mengengesteuert in die Dateien. '''
+        while not self.done:
+            self.event.wait(self.flush_zeit)
+            self.event.clear()
+            self.flush()
+
+    def geraet(self, text):
+        ''' Geräte-Name am Anfang des Eintrags (sonst None). '''
+        for name in self.geraete:
+            if text.startswith(name):
+                return name
+        return None
+
+    def flush(self):
+        ''' Schreibt alle Einträge der Warteschlange in die Dateien. '''
+        with self.lock:
+            eintraege = []
+            while self.puffer:
+                eintraege.append(self.puffer.popleft())
+            if eintraege == [] or self.f_text.closed:
+                return
+            start  = time.perf_counter()
+            zeilen = []
+            json_zeilen = []
+            for zeit, text in eintraege:
+                timestamp = datetime.datetime.fromtimestamp(zeit).astimezone().isoformat(timespec='milliseconds').replace('T', ' ')
+                zeilen.append(f'{timestamp} - {text}\n')
+                if self.strukturiert:
+                    json_zeilen.append(json.dumps({'t': round(zeit, 3), 'zeit': timestamp, 'geraet': self.geraet(text), 'text': text}, ensure_ascii=False) + '\n')
+            try:
+                self.f_text.write(''.join(zeilen))
+                self.f_text.flush()
+                if self.strukturiert:
+                    self.f_json.write(''.join(json_zeilen))
+                    self.f_json.flush()
+            except Exception as e:
+                logger.warning(f'{self.Log_Text_AJ_2[self.sprache]} {self.datei}')
+                logger.exception(self.Log_Text_AJ_3[self.sprache])
+            self.anz_Eintraege += len(eintraege)
+            self.anz_Flush += 1
+            self.flush_max = max(self.flush_max, time.perf_counter() - start)
+
+    ##########################################
+    # Beenden:
+    ##########################################
+    def ende(self):
+        ''' Beendet den Schreib-Thread und schreibt den Rest (Aufruf in Controller.exit).
+        Die Dateien bleiben offen, spätere Einträge werden sofort geschrieben. '''
+        self.done = True
+        self.event.set()
+        self.thread.join()
+        self.flush()
+        self.log_statistik()
+
+    def schliessen(self):
+        ''' Schreibt den Rest und schließt die Dateien. '''
+        self.flush()
+        with self.lock:
+            self.f_text.close()
+            if self.strukturiert:
+                self.f_json.close()
+
+    def log_statistik(self):
+        ''' Schreibt die Statistik in das Logging. '''
+        logger.info(f'{self.Log_Text_AJ_4[self.sprache]} {self.anz_Eintraege} - {self.Log_Text_AJ_5[self.sprache]} {self.anz_Flush} - {self.Log_Text_AJ_6[self.sprache]} {round(self.flush_max * 1000, 3)} {self.Log_Text_AJ_7[self.sprache]}')
+
+
+def lese_journal(datei, geraet = None, von = None, bis = None):
+    ''' Liest die strukturierte Ablauf-Datei (Ablauf.jsonl) und filtert nach Gerät und Zeit.
+
+    Args:
+        datei (str):        Pfad der Datei Ablauf.jsonl
+        geraet (str):       Nur Einträge dieses Gerätes (None - alle)
+        von (float):        Unix-Zeit in s ab der gelesen wird (None - Anfang)
+        bis (float):        Unix-Zeit in s bis zu der gelesen wird (None - Ende)
+    Return:
+        Liste von Dicts (t, zeit, geraet, text)
+    '''
+    eintraege = []
+    with open(datei, 'r', encoding="utf-8") as f:
+        for zeile in f:
+            try:
+                eintrag = json.loads(zeile)
+            except json.JSONDecodeError:
+                continue                                                # Abgebrochene letzte Zeile (z.B. Absturz)
+            if not geraet == None and not eintrag['geraet'] == geraet:
+                continue
+            if not von == None and eintrag['t'] < von:
+                continue
+            if not bis == None and eintrag['t'] > bis:
+                continue
+            eintraege.append(eintrag)
+    return eintraege
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -13,22 +13,19 @@ Educrys-Achse Gerät:
 # ++++++++++++++++++++++++++++
 ## GUI:
 from PyQt5.QtCore import (
-    pyqtSignal,
-    QThread,
-    QTimer,
     QObject
 )
 
 ## Allgemein:
 import logging
 from serial import Serial, SerialException
-import time
 import math as m
 # import threading
 import datetime
 
 ## Eigene:
 from .PID import PID
+from .serial_transaktion import transaktion
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -47,8 +44,6 @@ class SerialMock:
 
 
 class EducrysAntrieb(QObject):
-    signal_PID  = pyqtSignal(float, float, bool, float)
-
     def __init__(self, sprache, config, config_dat, com_dict, test, neustart, multilog_aktiv, Log_WriteReadTime, add_Ablauf_function, name="Educrys-Achse", typ = 'Antrieb'):
         """ Erstelle Nemo-Achse Lin Schnittstelle. Bereite Messwertaufnahme und Daten senden vor.
 
@@ -83,31 +78,25 @@ class EducrysAntrieb(QObject):
 
         ## Weitere:
         self.angezeigt = False
+        self.frame_poller = None                # Gemeinsamer Frame-Poller der Educrys-Anlage (vifcon_controller)
 
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
+        ''' Die Schlüssel aus config_schema.py kommen geprüft vom Controller (Default bei Fehler).
+        Hier wird nur noch folgendes kontrolliert:
+        1. Schlüssel außerhalb des Schemas mit Default-Vergabe!
+        2. Abhängigkeiten zwischen den Werten (z.B. Grenzen)!
         '''
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Einstellung für Log:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                                                                                                                      'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                                                                                                                         'Possible values:']
-        self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                                                                                                                               'The following types are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                                                                                                                              'Default is used:']
         self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                                                                                                    'Error reading config during configuration:']
         self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                                                                                                                                                  '; Set to default:']
         self.Log_Pfad_conf_5_1  = ['; Adressauswahlcode-Fehler -> Programm zu Ende!!!',                                                                                                                                     '; Address selection code error -> program ends!!!']
-        self.Log_Pfad_conf_5_2  = ['; PID-Modus Aus!!',                                                                                                                                                                     '; PID mode off!!']
         self.Log_Pfad_conf_5_3  = ['; Multilog-Link Aus!!',                                                                                                                                                                 '; Multilog-Link off!!']
         self.Log_Pfad_conf_5_4  = ['; Mercury-Model Fehler -> Programm zu Ende!!!',                                                                                                                                         '; Mercury model error -> program ended!!!']
         self.Log_Pfad_conf_6    = ['Fehlergrund:',                                                                                                                                                                          'Reason for error:']
-        self.Log_Pfad_conf_7    = ['Bitte vor Nutzung Korrigieren und Config Neu Einlesen!',                                                                                                                                'Please correct and re-read config before use!']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                                                                                                                                  'Incorrect input:']
-        self.Log_Pfad_conf_8_1  = ['Fehlerhafte Typ:',                                                                                                                                                                      'Incorrect type:']
         self.Log_Pfad_conf_9    = ['Die Obergrenze ist kleiner als die Untergrenze! Setze die Limits auf Default:',                                                                                                         'The upper limit is smaller than the lower limit! Set the limits to default:']
         self.Log_Pfad_conf_10   = ['zu',                                                                                                                                                                                    'to']
         self.Log_Pfad_conf_11   = ['Winkelgeschwindhigkeit',                                                                                                                                                                'Angular velocity']
@@ -120,37 +109,14 @@ class EducrysAntrieb(QObject):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Übergeordnet:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.Antriebs_wahl = self.config['Antriebs_Art']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} Antriebs_Art {self.Log_Pfad_conf_5[self.sprache]} F')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Antriebs_wahl = 'F'
+        self.Antriebs_wahl = self.config['Antriebs_Art']
          #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Zum Start:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.init           = self.config['start']['init']                            # Initialisierung
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|readTime {self.Log_Pfad_conf_5[self.sprache]} 2')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.messZeit = 2
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Ist                    = self.config['PID']["start_ist"] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_ist {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Ist = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Soll              = self.config['PID']["start_soll"]
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_soll {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Soll = 0
+        self.init           = self.config['start']['init']                            # Initialisierung
+        self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
+        self.Ist                    = self.config['PID']["start_ist"]
+        self.Soll              = self.config['PID']["start_soll"]
         #//////////////////////////////////////////////////////////////////////
         try: self.Start_Weg_write          = self.config['start']["write_SW"]
         except Exception as e: 
@@ -158,72 +124,24 @@ class EducrysAntrieb(QObject):
             logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
             self.Start_Weg_write = 0
         #//////////////////////////////////////////////////////////////////////
-        try: self.Start_WegLimit_write     = self.config['start']["write_SLP"]
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|write_SLP {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Start_WegLimit_write = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Start_Weg   = self.config['start']['start_weg']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|start_weg {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Start_Weg = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.save_mode = self.config['start']['sicherheit']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|sicherheit {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.save_mode = 0
+        self.Start_WegLimit_write     = self.config['start']["write_SLP"]
+        self.Start_Weg   = self.config['start']['start_weg']
+        self.save_mode = self.config['start']['sicherheit']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Parameter:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.nKS        = self.config['parameter']['nKS_Aus']                     # Nachkommerstellen
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} parameter|nKS_Aus {self.Log_Pfad_conf_5[self.sprache]} 3')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.nKS = 3
+        self.nKS        = self.config['parameter']['nKS_Aus']                     # Nachkommerstellen
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Limits:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.oGv = self.config["limits"]['maxSpeed']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxSpeed {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGv = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.oGs = self.config["limits"]['maxPos']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxPos {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGs = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGs = self.config["limits"]['minPos']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minPos {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGs = 0
+        self.oGv = self.config["limits"]['maxSpeed']
+        self.oGs = self.config["limits"]['maxPos']
+        self.uGs = self.config["limits"]['minPos']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### PID:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        error_PID = False
-        try: self.PID_Config             = self.config['PID']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID {self.Log_Pfad_conf_5_2[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            error_PID = True
-            self.PID_Config = {}
-            self.PID_Aktiv  = 0 
-        #//////////////////////////////////////////////////////////////////////
-        if not error_PID:
-            try: self.PID_Aktiv = self.config['PID']['PID_Aktiv']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|PID_Aktiv {self.Log_Pfad_conf_5[self.sprache]} False')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.PID_Aktiv = 0 
+        self.PID_Config             = self.config['PID']
+        self.PID_Aktiv              = self.config['PID']['PID_Aktiv']
         #//////////////////////////////////////////////////////////////////////
         try: self.unit_PIDIn             = self.config['PID']['Input_Size_unit']
         except Exception as e: 
@@ -231,29 +149,18 @@ class EducrysAntrieb(QObject):
             logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
             self.unit_PIDIn = 'mm'
         #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Option             = self.config['PID']['Value_Origin'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Value_Origin {self.Log_Pfad_conf_5[self.sprache]} VV')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Option = 'VV' 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Sample_Time        = self.config['PID']['sample']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|sample {self.Log_Pfad_conf_5[self.sprache]} 500')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Sample_Time = 500 
+        self.PID_Option             = self.config['PID']['Value_Origin']
+        self.PID_Sample_Time        = self.config['PID']['sample']
         #//////////////////////////////////////////////////////////////////////
-        try: self.M_device_ist           = self.config['multilog']['read_trigger_ist'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|read_trigger_ist {self.Log_Pfad_conf_5_3[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.M_device_ist           = self.config['multilog']['read_trigger_ist']
+        if self.M_device_ist == None:
+            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_ist {self.Log_Pfad_conf_5_3[self.sprache]}')
             self.M_device_ist = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
-        try: self.M_device_soll          = self.config['multilog']['read_trigger_soll'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|read_trigger_soll {self.Log_Pfad_conf_5_3[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.M_device_soll          = self.config['multilog']['read_trigger_soll']
+        if self.M_device_soll == None:
+            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_soll {self.Log_Pfad_conf_5_3[self.sprache]}')
             self.M_device_soll = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
@@ -271,101 +178,27 @@ class EducrysAntrieb(QObject):
             self.sensor_soll = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Limit_Max    = self.config['PID']['Input_Limit_max']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Limit_Max  = 1 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Limit_Min    = self.config['PID']['Input_Limit_min'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Limit_Min = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Error_Option = self.config['PID']['Input_Error_option']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Error_option {self.Log_Pfad_conf_5[self.sprache]} error')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Error_Option = 'error' 
+        self.PID_Input_Limit_Max    = self.config['PID']['Input_Limit_max']
+        self.PID_Input_Limit_Min    = self.config['PID']['Input_Limit_min']
+        self.PID_Input_Error_Option = self.config['PID']['Input_Error_option']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Schnittstelle:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.Loop = self.config['serial-extra']['serial-loop-read']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} serial-extra|serial-loop-read {self.Log_Pfad_conf_5[self.sprache]} 10')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Loop = 10
-        #//////////////////////////////////////////////////////////////////////
-        try: self.rel_Tolleranz = float(self.config['serial-extra']['rel_tol_write_ans'])
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} serial-extra|rel_tol_write_ans {self.Log_Pfad_conf_5[self.sprache]} 1e-02')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.rel_Tolleranz = 1e-02
+        self.Loop = self.config['serial-extra']['serial-loop-read']
+        self.rel_Tolleranz = self.config['serial-extra']['rel_tol_write_ans']
 
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### PID-Aktiviert:
-        if not type(self.PID_Aktiv) == bool and not self.PID_Aktiv in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} PID_Aktiv - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Aktiv}')
-            self.PID_Aktiv = 0
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
         ### Geschwindigkeits-Limit:
-        if not type(self.oGv) in [float, int] or not self.oGv > 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxSpeed - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGv)}')
-            self.oGv = 1
         if not self.Antriebs_wahl == 'F':   self.uGv = self.oGv * -1
         elif self.Antriebs_wahl == 'F':     self.uGv = 0
         logger.info(f'{self.device_name} - {self.Log_Pfad_Conf_Neu[self.sprache]} {self.uGv}')
         ### Winkel-Limit:
-        if not type(self.oGs) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxPos - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 180 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGs)}')
-            self.oGs = 1
-        if not type(self.uGs) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minPos - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGs)}')
-            self.uGs = 0
         if self.oGs <= self.uGs:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_13[self.sprache]})')
             self.uGs = 0
             self.oGs = 1
-        ### Messzeit:
-        if not type(self.messZeit) in [int, float] or not self.messZeit >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} readTime - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 2 - {self.Log_Pfad_conf_8[self.sprache]} {self.messZeit}')
-            self.messZeit = 2
-        ### Wahl der Antriebsart:
-        if not self.Antriebs_wahl in ['L', 'R', 'F']:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Antriebs_Art - {self.Log_Pfad_conf_2[self.sprache]} [L, R, F] - {self.Log_Pfad_conf_3[self.sprache]} F')
-            self.Antriebs_wahl = 'F'
-        ### While-Loop:
-        if not type(self.Loop) == int or not self.Loop >= 1:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} serial-loop-read - {self.Log_Pfad_conf_2[self.sprache]} Integer (>=1) - {self.Log_Pfad_conf_3[self.sprache]} 10 - {self.Log_Pfad_conf_8[self.sprache]} {self.Loop}')
-            self.Loop = 10
-        ### Relative Toleranz:
-        if not type(self.rel_Tolleranz) == float or not self.rel_Tolleranz >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} rel_tol_write_ans - {self.Log_Pfad_conf_2[self.sprache]} Float (>=0) - {self.Log_Pfad_conf_3[self.sprache]} 1e-02 - {self.Log_Pfad_conf_8[self.sprache]} {self.rel_Tolleranz}')
-            self.rel_Tolleranz = 1e-02
-        ### Start Weg:
-        if not type(self.Start_Weg) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_weg - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.Start_Weg)}')
-            self.Start_Weg = 0
-        ### Start-Wert schreiben:
-        if not type(self.Start_WegLimit_write) == bool and not self.Start_WegLimit_write in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} write_SLP - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.Start_WegLimit_write}')
-            self.Start_WegLimit_write = 0 
-        ### Anlagen-Sciherheit bei Realer-Positions-Limitregelung:
-        if not self.save_mode in [0, 1]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} sicherheit - {self.Log_Pfad_conf_2[self.sprache]} [0, 1] - {self.Log_Pfad_conf_3[self.sprache]} 0')
-            self.save_mode = 0
-        ### Nachkommerstellen:
-        if not type(self.nKS) in [int] or not self.nKS >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} nKS_Aus - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 3 - {self.Log_Pfad_conf_8[self.sprache]} {self.nKS}')
-            self.nKS = 3
 
         ## Andere:
         self.Limit_stop         = False
@@ -399,7 +232,7 @@ class EducrysAntrieb(QObject):
         self.Log_Text_164_str   = ['Startposition:',                                                                                                                                                                        'Starting position:']
         self.Log_Text_165_str   = ['mm',                                                                                                                                                                                    'mm']
         self.Log_Text_180_str   = ['Das Gerät hat keine Startwerte zum Auslesen!',                                                                                                                                          'The device has no start values to read out!']
-        self.Log_Text_PID_str   = ['Start des PID-Threads!',                                                                                                                                                                'Start of the PID thread!']
+        self.Log_Text_PID_str   = ['PID-Regler im PID-Takt!',                                                                                                                                                               'PID controller in the PID cycle!']
         Log_Text_PID_N1         = ['Die Konfiguration',                                                                                                                                                                     'The configuration']
         Log_Text_PID_N2         = ['existiert nicht! Möglich sind nur VV, VM, MM oder MV. Nutzung von Default VV!',                                                                                                         'does not exist! Only VV, VM, MM or MV are possible. Use default VV!']
         Log_Text_PID_N2_1       = ['ist für das Gerät noch nicht umgesetzt! Nutzung von Default VV!',                                                                                                                       'is not yet implemented for the device! Use of default VV!']
@@ -472,6 +305,7 @@ class EducrysAntrieb(QObject):
         # Schnittstelle:
         #---------------------------------------
         logger.info(f"{self.device_name} - {self.Log_Text_60_str[self.sprache]}")
+        self.transaktion = None
         try:
             if not test:
                 com_ak = ''
@@ -483,6 +317,8 @@ class EducrysAntrieb(QObject):
                     self.serial = Serial(**config["serial-interface"])
                 else:
                     self.serial = com_dict[com_ak]
+                ## Lese-Schicht mit Frist (ersetzt die festen Wartezeiten):
+                self.transaktion = transaktion(self.sprache, self.serial, self.config['serial-interface']['port'], 1)
         except SerialException as e:
             self.serial = SerialMock()
             logger.warning(f"{self.device_name} - {self.Log_Text_61_str[self.sprache]}")
@@ -529,20 +365,8 @@ class EducrysAntrieb(QObject):
         logger.info(f'{self.device_name} - {Log_Text_PID_N3[self.sprache]}{self.PID_Option} ({teil_1[self.sprache]}, {teil_2[self.sprache]})')
 
         if self.PID_Aktiv:
-            ## PID-Thread:
-            self.PIDThread = QThread()
-            self.PID.moveToThread(self.PIDThread)
-            logger.info(f'{self.device_name} - {self.Log_Text_PID_str[self.sprache]}') 
-            self.PIDThread.start()
-            self.signal_PID.connect(self.PID.InOutPID)
-            ## Timer:
-            self.timer_PID = QTimer()                                              # Reaktionszeittimer (ruft die Geräte auf, liest aber nur unter bestimmten Bedingungen!)
-            self.timer_PID.setInterval(self.PID_Sample_Time)
-            self.timer_PID.timeout.connect(self.PID_Update)
-            self.timer_PID.start()
-            ### PID-Timer Thread:
-            #self.PIDThreadTimer = threading.Thread(target=self.PID_Update)
-            #self.PIDThreadTimer.start()
+            ## Der PID-Regler wird im gemeinsamen PID-Takt berechnet (pid_takt.py, Anmeldung im vifcon_controller):
+            logger.info(f'{self.device_name} - {self.Log_Text_PID_str[self.sprache]}')
         else:
             logger.info(f'{self.device_name} - {self.Log_Text_PID_N23[self.sprache]}')
         ## Multilog-Lese-Variable für die Daten:
@@ -782,41 +606,40 @@ class EducrysAntrieb(QObject):
         ''' 
         n = 0
         try:
+            # Gemeinsamen Frame verwerfen (der Befehl ändert die Werte):
+            if not self.frame_poller == None: self.frame_poller.verwerfen()
             # Reset Buffer:
-            self.serial.reset_input_buffer()
+            self.transaktion.verwerfen()
             
             # Sende den Befehl:
-            self.serial.write((Befehl+str(Wert)+self.abschluss).encode())
-            logger.debug(f'{self.device_name} - {self.Log_Edu_1_str[self.sprache]} {(Befehl+str(Wert)+self.abschluss).encode()}')
-            # Warte kurz:
-            time.sleep(0.1)
+            self.transaktion.senden((Befehl+str(Wert)+self.abschluss).encode())
+            logger.debug('%s - %s %s', self.device_name, self.Log_Edu_1_str[self.sprache], (Befehl+str(Wert)+self.abschluss).encode())
             # Lese die Antwort und Vergleiche sie:
-            ans = self.read_out(10)
+            ans = self.read_out(10, Befehl)
             ans = ans.strip().replace('\r\n','')
             check = self.answer_check_write(Wert, ans, Antworts_String, Befehl+str(Wert))
 
-            if not check:  logger.debug(f'{self.device_name} - {self.Log_Edu_2_str[self.sprache]} {ans}')
+            if not check:  logger.debug('%s - %s %s', self.device_name, self.Log_Edu_2_str[self.sprache], ans)
             else:                    
                 logger.warning(f'{self.device_name} - {self.Log_Edu_3_str[self.sprache]} {self.Log_Edu_4_str[self.sprache]} - {self.Log_Edu_2_str[self.sprache]} {ans} ({Befehl+str(Wert)})')       
 
-                ans = self.read_out(10)
+                ans = self.read_out(10, Befehl)
                 ans = ans.strip().replace('\r\n','')
                 check = self.answer_check_write(Wert, ans, Antworts_String, Befehl+str(Wert))
 
-                if not check:  logger.debug(f'{self.device_name} - {self.Log_Edu_2_str[self.sprache]} {ans}')
+                if not check:  logger.debug('%s - %s %s', self.device_name, self.Log_Edu_2_str[self.sprache], ans)
                 else:                    
                     logger.warning(f'{self.device_name} - {self.Log_Edu_3_str[self.sprache]} {self.Log_Edu_5_str[self.sprache]} - {self.Log_Edu_2_str[self.sprache]} {ans} ({Befehl+str(Wert)})') 
 
                     # Antwort stimmt nicht:
                     while n != self.Loop:
-                        self.serial.write((Befehl+str(Wert)+self.abschluss).encode())
-                        logger.debug(f'{self.device_name} - {self.Log_Edu_1_str[self.sprache]} {(Befehl+str(Wert)+self.abschluss).encode()}')
-                        time.sleep(0.1)
-                        ans = self.read_out(10)
+                        self.transaktion.senden((Befehl+str(Wert)+self.abschluss).encode())
+                        logger.debug('%s - %s %s', self.device_name, self.Log_Edu_1_str[self.sprache], (Befehl+str(Wert)+self.abschluss).encode())
+                        ans = self.read_out(10, Befehl)
                         ans = ans.strip().replace('\r\n','')
                         check = self.answer_check_write(Wert, ans, Antworts_String, Befehl+str(Wert))
                         if not check:  
-                            logger.debug(f'{self.device_name} - {self.Log_Edu_2_str[self.sprache]} {ans}') 
+                            logger.debug('%s - %s %s', self.device_name, self.Log_Edu_2_str[self.sprache], ans) 
                             break
                         else:                       
                             logger.warning(f'{self.device_name} - {self.Log_Edu_3_str[self.sprache]} {self.Log_Text_159_str[self.sprache]} {n} {self.Log_Text_160_str[self.sprache]} - {self.Log_Edu_2_str[self.sprache]} {ans} ({Befehl+str(Wert)})') 
@@ -913,22 +736,10 @@ class EducrysAntrieb(QObject):
         # Time Check 1:
         ak_time = datetime.datetime.now(datetime.timezone.utc).astimezone()
 
-        # Variablen:
-        error           = False   
-        listen_Error    = False
-        n               = 0
-
         try:
-            # Sende Auslese-Befehl:
-            ## Besteht aus vielen Werten im Format *Wert_1 Wert_2#
-            self.serial.write(('!'+ self.abschluss).encode())
-            ## Etwas Zeit lassen:
-            time.sleep(0.1)
-
-            # Antwort lesen:
-            ans = self.read_out_AZ()
-            ans = ans.replace('\r','').replace('\n','').strip()
-            logger.debug(f'{self.device_name} - {self.Log_Edu_7_str[self.sprache]} {ans}') 
+            # Frame lesen (Antwort auf !, mit den anderen Educrys-Geräten am Arduino geteilt):
+            if self.frame_poller == None:   liste, error = self.lese_Frame()
+            else:                           liste, error = self.frame_poller.lesen(self.device_name, self.lese_Frame)
             ''' Relevante Werte:
                                                     Liste (0 - Ende)            Stelle (1 - Ende)
                          Linear:    Koordinate      23                          24
@@ -936,58 +747,7 @@ class EducrysAntrieb(QObject):
                          Rotation:  Ist-v           25                          26
                          Lüfter:    Ist-v           26                          27
             ''' 
-            ## Antwort prüfen:
-            ### Fehlerfall 1 - End- und Startzeichen richtig:
-            start_end = True
-            if ans != '':
-                if ans[0] == '*' and ans[-1] == '#':    ans = ans.replace('*', '').replace('#','').strip()     
-                else:                                   ans, start_end = '', False
-
-            ### Fehlerfall 2 - String ist Leer - Erneut Senden:    
-            if ans == '':  
-                logger.warning(f'{self.device_name} - {self.Log_Edu_3_str[self.sprache]} {self.Log_Edu_5_str[self.sprache]} {self.Log_Edu_19_str[self.sprache] if not start_end else self.Log_Edu_20_str[self.sprache]} (!)')
-                while n != self.Loop: 
-                    #### Erneut Senden:
-                    self.serial.write(('!'+self.abschluss).encode())
-                    time.sleep(0.1)
-                    #### Antwort Lesen:
-                    ans = self.read_out_AZ()
-                    ans = ans.replace('\r','').replace('\n','').strip()
-                    #### Kontrolle:
-                    start_end = True
-                    if ans != '':
-                        if ans[0] == '*' and ans[-1] == '#':    ans = ans.replace('*', '').replace('#','').strip()     
-                        else:                                   ans, start_end = '', False
-                    #### Auswerten:
-                    if ans == '':   n += 1
-                    else:
-                        logger.debug(f'{self.device_name} - {self.Log_Edu_7_str[self.sprache]} {ans}')
-                        break
-
-            ### While-Schleife hat Anschlag erreicht und wurde beendet:           
-            if n == self.Loop:
-                logger.warning(f"{self.device_name} - {self.Log_Edu_6_str[self.sprache]}")
-                self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_61_str[self.sprache]} (!)')
-                error = True
-            else:
-                logging.debug(f'{self.device_name} - {self.Text_Edu_1_str[self.sprache]} ! {self.Text_Edu_2_str[self.sprache]}')
-
-            ### Kein Fehler:
             if not error:
-                #### Liste erstellen - Fehlerfall 3 - Liste nicht erstellebar:
-                try:
-                    liste = ans.split(' ')
-                except:
-                    listen_Error = True
-                
-                #### Fehlerfall 4 - Liste hat nicht die richtige Länge:
-                if len(liste) != 29 or listen_Error:
-                    logger.warning(f"{self.device_name} - {self.Log_Edu_18_str[self.sprache]} {len(liste)}")
-                    self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_61_str[self.sprache]} (!)')
-                    liste = []
-                    for i in range(0,29,1):
-                        liste.append(m.nan)
-
                 #### Werte eintragen:
                 if self.Antriebs_wahl == 'L':
                     self.value_name['IWs'] = round(float(liste[23]), self.nKS)
@@ -1017,25 +777,92 @@ class EducrysAntrieb(QObject):
             logger.info(f"{self.device_name} - {self.Log_Time_r[self.sprache]} {timediff} {self.Log_Time_wr[self.sprache]}")
         return self.value_name
 
-    def read_out(self, Anz):
-        '''Liest eine bestimmte Anzahl von Zeichen aus, verbindet diese und gibt einen String zurück!
+    def lese_Frame(self):
+        ''' Sendet den Auslese-Befehl (!) und liest die Antwort (Frame mit 29 Werten) aus.
+
+        Return:
+            liste (list):   Werte des Frames (Bei falscher Länge Nan)
+            error (bool):   True - Keine gültige Antwort nach allen Versuchen
+        '''
+        # Variablen:
+        error           = False   
+        listen_Error    = False
+        n               = 0
+        liste           = []
+
+        # Sende Auslese-Befehl:
+        ## Besteht aus vielen Werten im Format *Wert_1 Wert_2#
+        self.transaktion.senden(('!'+ self.abschluss).encode())
+
+        # Antwort lesen:
+        ans = self.read_out_AZ()
+        ans = ans.replace('\r','').replace('\n','').strip()
+        logger.debug('%s - %s %s', self.device_name, self.Log_Edu_7_str[self.sprache], ans) 
+        ## Antwort prüfen:
+        ### Fehlerfall 1 - End- und Startzeichen richtig:
+        start_end = True
+        if ans != '':
+            if ans[0] == '*' and ans[-1] == '#':    ans = ans.replace('*', '').replace('#','').strip()     
+            else:                                   ans, start_end = '', False
+
+        ### Fehlerfall 2 - String ist Leer - Erneut Senden:    
+        if ans == '':  
+            logger.warning(f'{self.device_name} - {self.Log_Edu_3_str[self.sprache]} {self.Log_Edu_5_str[self.sprache]} {self.Log_Edu_19_str[self.sprache] if not start_end else self.Log_Edu_20_str[self.sprache]} (!)')
+            while n != self.Loop: 
+                #### Erneut Senden:
+                self.transaktion.senden(('!'+self.abschluss).encode())
+                #### Antwort Lesen:
+                ans = self.read_out_AZ()
+                ans = ans.replace('\r','').replace('\n','').strip()
+                #### Kontrolle:
+                start_end = True
+                if ans != '':
+                    if ans[0] == '*' and ans[-1] == '#':    ans = ans.replace('*', '').replace('#','').strip()     
+                    else:                                   ans, start_end = '', False
+                #### Auswerten:
+                if ans == '':   n += 1
+                else:
+                    logger.debug('%s - %s %s', self.device_name, self.Log_Edu_7_str[self.sprache], ans)
+                    break
+
+        ### While-Schleife hat Anschlag erreicht und wurde beendet:           
+        if n == self.Loop:
+            logger.warning(f"{self.device_name} - {self.Log_Edu_6_str[self.sprache]}")
+            self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_61_str[self.sprache]} (!)')
+            error = True
+        else:
+            logging.debug('%s - %s ! %s', self.device_name, self.Text_Edu_1_str[self.sprache], self.Text_Edu_2_str[self.sprache])
+
+        ### Kein Fehler:
+        if not error:
+            #### Liste erstellen - Fehlerfall 3 - Liste nicht erstellebar:
+            try:
+                liste = ans.split(' ')
+            except:
+                listen_Error = True
+            
+            #### Fehlerfall 4 - Liste hat nicht die richtige Länge:
+            if len(liste) != 29 or listen_Error:
+                logger.warning(f"{self.device_name} - {self.Log_Edu_18_str[self.sprache]} {len(liste)}")
+                self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_61_str[self.sprache]} (!)')
+                liste = []
+                for i in range(0,29,1):
+                    liste.append(m.nan)
+
+        return liste, error
+
+    def read_out(self, Anz, befehl = ''):
+        '''Liest die Antwort bis zum Zeilenende (\\n) oder bis zur maximalen Anzahl an Zeichen (mit Frist) und gibt einen String zurück!
         
         Args:
             Anz (int):      Anzahl der maximal zu lesenden Zeichen
+            befehl (str):   Gesendeter Befehl (für die Statistik der Antwortzeiten)
         
         Return:
             ans_join (Str): Zurückgegebener String (Bei Fehler Leerer String)
         '''
         try:
-            ans_list = []                                   # Leere Liste
-            i = 0                                           # Kontroll Variable (Zeichen)
-            while 1:                                        # Endlosschleife
-                z = self.serial.read()                      # Lese Zeichen
-                if z != '': ans_list.append(z.decode())     # Wenn nicht Leer, dann füge an Liste
-                if z == b'\n':  break                       # Wenn \n (Newline) beende Endlosschleife
-                if i >= Anz:    break                       # Wenn Anzahl Zeichen überschritten oder gleich, dann Beende Endlosschleife
-                i += 1                                      # Erhöhe Zählvariable
-            ans_join = ''.join(ans_list)                    # Verbinde die Liste zu einem String
+            ans_join = self.transaktion.lesen(befehl = befehl, ende = b'\n', max_anz = Anz + 1, deadline = 0.5).decode()
         except Exception as e:
             logger.warning(f"{self.device_name} - {self.Log_Text_64_str[self.sprache]}")
             logger.exception(f"{self.device_name} - {self.Log_Text_136_str[self.sprache]}")
@@ -1044,32 +871,16 @@ class EducrysAntrieb(QObject):
         return ans_join
 
     def read_out_AZ(self):
-        '''Liest eine bestimmte Anzahl von Zeichen aus, verbindet diese und gibt einen String zurück!
+        '''Liest die Antwort bis zum Abschlusszeichen # (mit Frist) und gibt sie ab dem letzten Start-Zeichen * als String zurück!
         Seperate Funktion für !-Befehl!
 
         Return:
             ans_join (Str): Zurückgegebener String (Bei Fehler Leerer String)
         '''
         try:
-            ans_list    = []                                # Leere Liste
-            i           = 0                                 # Kontroll Variable (Zeichen)
-            max_anz     = 200   
-            try_read = 0                            
-            while 1:                                        # Endlosschleife
-                z = self.serial.read()                      # Lese Zeichen
-                if z != '': ans_list.append(z.decode())     # Wenn nicht Leer, dann füge an Liste
-                if z == b'#':  break                        # Wenn \n (Newline) beende Endlosschleife
-                if z == b'*':                               # Start-Zeichen gefunden - Beginne!
-                    i = 0
-                    ans_list = []
-                    ans_list.append(z.decode())             # Füge das Start-Zeichen an
-                if i >= max_anz:                            # Wenn Anzahl Zeichen überschritten oder gleich, dann Beende Endlosschleife
-                    if z != '#':        
-                        try_read += 1
-                        max_anz += 50
-                    if try_read > 3:    break                       
-                i += 1                                      # Erhöhe Zählvariable
-            ans_join = ''.join(ans_list)                    # Verbinde die Liste zu einem String
+            ans_join = self.transaktion.lesen(befehl = '!', ende = b'#', max_anz = 400).decode()
+            if '*' in ans_join:                             # Start-Zeichen gefunden - Beginne dort!
+                ans_join = ans_join[ans_join.rfind('*'):]
         except Exception as e:
             logger.warning(f"{self.device_name} - {self.Log_Text_64_str[self.sprache]}")
             logger.exception(f"{self.device_name} - {self.Log_Text_136_str[self.sprache]}")
@@ -1147,12 +958,14 @@ class EducrysAntrieb(QObject):
     ###################################################
     # Messdatendatei erstellen und beschrieben:
     ###################################################
-    def messdaten_output(self, pfad="./"):
+    def messdaten_output(self, pfad, schreiber):
         """Erstelle für das Gerät eine csv-Datei mit den Daten.
 
         Args:
-            pfad (str, optional): Speicherort. Default ist "./".
+            pfad (str):                     Speicherort (Messordner)
+            schreiber (Messdaten_Writer):   Gemeinsamer Messdaten-Schreiber (hält die Datei offen und puffert die Zeilen)
         """
+        self.schreiber = schreiber
         PID_x_unit = self.unit_PIDIn
         self.filename = f"{pfad}/{self.device_name}.csv"
         if self.Antriebs_wahl == 'L':
@@ -1163,9 +976,7 @@ class EducrysAntrieb(QObject):
             header = "time_abs,time_rel,Ist-Winkelgeschwindigkeit,Soll-x_PID-Modus_A,Ist-x_PID-Modus_A,\n"
         if self.messZeit != 0:                                          # Erstelle Datei nur wenn gemessen wird!
             logger.info(f"{self.device_name} - {self.Log_Text_71_str[self.sprache]} {self.filename}")
-            with open(self.filename, "w", encoding="utf-8") as f:
-                f.write(units)
-                f.write(header)
+            self.schreiber.anmelden(self.filename, units + header)
         else:
             logger.info(f"{self.device_name} - {self.Log_Text_72_str[self.sprache]}")
 
@@ -1180,18 +991,25 @@ class EducrysAntrieb(QObject):
         line = f"{absolut_Time.isoformat(timespec='milliseconds').replace('T', ' ')},{relativ_Time},"
         for size in daten:
             line = line + f'{daten[size]},'
-        with open(self.filename, "a", encoding="utf-8") as f:
-            f.write(f'{line}\n')
+        self.schreiber.schreiben(self.filename, f'{line}\n', self.device_name)
     
     ##########################################
     # PID-Regler:
     ##########################################
-    def PID_Update(self):
-        '''PID-Regler-Thread-Aufruf'''
+    def PID_Eingang(self):
+        '''Eingänge des PID-Reglers für den PID-Takt (eigener Thread)
+
+        Return:
+            (Istwert, Sollwert, Rezept-Modus, Rezept-Output) - None: Regler nicht aktiv
+        '''
         if self.PID_Aktiv:
             if not self.PID.PID_speere:
-                self.signal_PID.emit(self.Ist, self.Soll, False, 0)
-                self.PID_Out = self.PID.Output
+                return self.Ist, self.Soll, False, 0
+        return None
+
+    def PID_Ausgang(self):
+        '''Output des PID-Reglers nach der Berechnung im PID-Takt übernehmen'''
+        self.PID_Out = self.PID.Output
     
 ##########################################
 # Verworfen:
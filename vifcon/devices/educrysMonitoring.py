@@ -14,10 +14,12 @@ Educrys Monitoring (Temperaturen, PID-Werte und Kristallwerte):
 ## Allgemein:
 import logging
 from serial import Serial, SerialException
-import time
 import math as m
 import datetime
 
+## Eigene:
+from .serial_transaktion import transaktion
+
 # ++++++++++++++++++++++++++++
 # Programm:
 # ++++++++++++++++++++++++++++
@@ -59,6 +61,7 @@ class EducrysMon:
         self.add_Text_To_Ablauf_Datei = add_Ablauf_function
         self.device_name = name
         self.typ = typ
+        self.frame_poller = None                # Gemeinsamer Frame-Poller der Educrys-Anlage (vifcon_controller)
 
         ## Werte Dictionary:
         self.value_name     = {'TC1_T': 0,    'TC2_T': 0,       'PT1_T': 0,   'PT2_T': 0,   'Pyro_T': 0,
@@ -69,74 +72,34 @@ class EducrysMon:
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
+        ''' Die Schlüssel aus config_schema.py kommen geprüft vom Controller (Default bei Fehler).
+        Hier wird nur noch folgendes kontrolliert:
+        1. Schlüssel außerhalb des Schemas mit Default-Vergabe!
+        2. Abhängigkeiten zwischen den Werten (z.B. Grenzen)!
         '''
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ## Einstellung für Log:
-        #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                      'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                         'Possible values:']
-        self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                               'The following types are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                              'Default is used:']
-        self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',    'Error reading config during configuration:']
-        self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                  '; Set to default:']
         self.Log_Pfad_conf_5_1  = ['; Register-Fehler -> Programm zu Ende!!!',              '; Register error -> program ends!!!']
-        self.Log_Pfad_conf_6    = ['Fehlergrund:',                                          'Reason for error:']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                  'Incorrect input:']
         self.Log_Pfad_conf_8_1  = ['Fehlerhafte Typ:',                                      'Incorrect type:']
+        ## Einstellung für Log:
+        #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Zum Start:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.init           = self.config['start']['init']                            # Initialisierung
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|readTime {self.Log_Pfad_conf_5[self.sprache]} 2')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.messZeit = 2
+        self.init           = self.config['start']['init']                            # Initialisierung
+        self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Parameter:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.nKS        = self.config['parameter']['nKS_Aus']                     # Nachkommerstellen
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} parameter|nKS_Aus {self.Log_Pfad_conf_5[self.sprache]} 3')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.nKS = 3
+        self.nKS        = self.config['parameter']['nKS_Aus']                     # Nachkommerstellen
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Schnittstelle:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.Loop = self.config['serial-loop-read']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} serial-loop-read {self.Log_Pfad_conf_5[self.sprache]} 10')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Loop = 10
+        self.Loop = self.config['serial-loop-read']
 
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
-        ### Messzeit:
-        if not type(self.messZeit) in [int, float] or not self.messZeit >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} readTime - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 2 - {self.Log_Pfad_conf_8[self.sprache]} {self.messZeit}')
-            self.messZeit = 2
-        ### Nachkommerstellen:
-        if not type(self.nKS) in [int] or not self.nKS >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} nKS_Aus - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 3 - {self.Log_Pfad_conf_8[self.sprache]} {self.nKS}')
-            self.nKS = 3
-        ### While-Loop:
-        if not type(self.Loop) == int or not self.Loop >= 1:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} serial-loop-read - {self.Log_Pfad_conf_2[self.sprache]} Integer (>=1) - {self.Log_Pfad_conf_3[self.sprache]} 10 - {self.Log_Pfad_conf_8[self.sprache]} {self.Loop}')
-            self.Loop = 10
 
         #--------------------------------------- 
         # Sprach-Einstellung:
@@ -184,6 +147,7 @@ class EducrysMon:
         # Schnittstelle:
         #---------------------------------------
         logger.info(f"{self.device_name} - {self.Log_Text_60_str[self.sprache]}")
+        self.transaktion = None
         try:
             if not test:
                 com_ak = ''
@@ -195,6 +159,8 @@ class EducrysMon:
                     self.serial = Serial(**config["serial-interface"])
                 else:
                     self.serial = com_dict[com_ak]
+                ## Lese-Schicht mit Frist (ersetzt die festen Wartezeiten):
+                self.transaktion = transaktion(self.sprache, self.serial, self.config['serial-interface']['port'], 1)
         except SerialException as e:
             self.serial = SerialMock()
             logger.warning(f"{self.device_name} - {self.Log_Text_61_str[self.sprache]}")
@@ -213,91 +179,13 @@ class EducrysMon:
         # Time Check 1:
         ak_time = datetime.datetime.now(datetime.timezone.utc).astimezone()
 
-        # Variablen:
-        n               = 0
-        listen_Error    = False
-        error           = False 
-        
         try:
-            # Lese alle Monitoringswerte aus (Mehr als gebraucht!) - 29 Werte
-            ## Besteht aus vielen Werten im Format *Wert_1 Wert_2#
-            self.serial.write(('!\r').encode())
-            ## Etwas Zeit lassen:
-            time.sleep(0.1)
-            
-            # Lese Antwort:
-            ''' 
-            1. read_out_AZ()    - liest bis # -> Eigene Funktion! Liest Zeichen für Zeichen!
-            2. decode()         - Bytearray umwandeln
-            3. strip()          - Leerzeichen am Anfang und Ende entfernen
-            4. replace()        - *, # und Abschlusszeichen entfernen
-
-            Antwort-Beispiel: 5212.780 794.726 24.58 -99.00 22.87 -242.02 -99.00 0.00 0 0 0 0.00 0.000000 0 0 1000.00 0.00 22.87 22.85 20.00 -569.24 1000.00 -0.00 200.00 0.00 0.00 0.00 -0.00 0.00
-            '''
-            ans = self.read_out_AZ()
-            ans = ans.replace('\r','').replace('\n','').strip()
-            logger.debug(f'{self.device_name} - {self.Log_Text_63_str[self.sprache]} {ans}')
-
-            ## Antwort prüfen:
-            ### Fehlerfall 1 - End- und Startzeichen richtig:
-            start_end = True
-            if ans != '':
-                if ans[0] == '*' and ans[-1] == '#':    
-                    ans = ans.replace('*', '').replace('#','').replace('#','').replace('\r','').strip()   
-                    logger.debug(f'{self.device_name} - {self.Log_Text_63_str[self.sprache]} {ans} ({self.Log_Text_EM001_str[self.sprache]})')
-                else:                                   
-                    ans         = ''
-                    start_end   = False  
-
-            ### Fehlerfall 2 - String ist Leer - Erneut Senden:    
-            if ans == '':  
-                logger.warning(f'{self.device_name} - {self.Log_Edu_3_str[self.sprache]} {self.Log_Edu_5_str[self.sprache]} {self.Log_Edu_19_str[self.sprache] if not start_end else self.Log_Edu_20_str[self.sprache]} (!)')
-                while n != self.Loop: 
-                    #### Erneut Senden:
-                    self.serial.write(('!'+self.abschluss).encode())
-                    time.sleep(0.1)
-                    #### Antwort Lesen:
-                    ans = self.read_out_AZ()
-                    ans = ans.replace('\r','').replace('\n','').strip()
-                    #### Kontrolle:
-                    start_end = True
-                    if ans != '':
-                        if ans[0] == '*' and ans[-1] == '#':    ans = ans.replace('*', '').replace('#','').strip()     
-                        else:                                   ans, start_end = '', False
-                    #### Auswerten:
-                    if ans == '':   n += 1
-                    else:
-                        logger.debug(f'{self.device_name} - {self.Log_Edu_7_str[self.sprache]} {ans}')
-                        break
+            # Frame lesen (Antwort auf !, mit den anderen Educrys-Geräten am Arduino geteilt):
+            if self.frame_poller == None:   liste, error = self.lese_Frame()
+            else:                           liste, error = self.frame_poller.lesen(self.device_name, self.lese_Frame)
+            if error:
+                liste = [m.nan] * 29
 
-            ### While-Schleife hat Anschlag erreicht und wurde beendet:           
-            if n == self.Loop:
-                logger.warning(f"{self.device_name} - {self.Log_Edu_6_str[self.sprache]}")
-                self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_61_str[self.sprache]} (!)')
-                error = True
-            else:
-                logging.debug(f'{self.device_name} - {self.Text_Edu_1_str[self.sprache]} ! {self.Text_Edu_2_str[self.sprache]}')
-            
-            ### Kein Fehler:
-            if not error:
-                #### Liste erstellen - Fehlerfall 3 - Liste nicht erstellebar:
-                try:
-                    liste = ans.split(' ')
-                except:
-                    listen_Error = True
-                
-                #### Fehlerfall 4 - Liste hat nicht die richtige Länge:
-                if len(liste) != 29 or listen_Error:
-                    logger.warning(f"{self.device_name} - {self.Log_Edu_18_str[self.sprache]} {len(liste)}")
-                    self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_61_str[self.sprache]} (!)')
-                    liste = []
-                    for i in range(0,29,1):
-                        liste.append(m.nan)
-            else:
-                liste = []
-                for i in range(0,29,1):
-                    liste.append(m.nan)
- 
             ## Werte zuweisen:
             self.value_name['TC1_T']        = round(float(liste[2] ), self.nKS)   
             self.value_name['TC2_T']        = round(float(liste[3] ), self.nKS)      
@@ -327,33 +215,108 @@ class EducrysMon:
 
         return self.value_name
 
+    def lese_Frame(self):
+        ''' Sendet den Auslese-Befehl (!) und liest die Antwort (Frame mit 29 Werten) aus.
+
+        Return:
+            liste (list):   Werte des Frames (Bei falscher Länge Nan)
+            error (bool):   True - Keine gültige Antwort nach allen Versuchen
+        '''
+        # Variablen:
+        n               = 0
+        liste           = []
+        listen_Error    = False
+        error           = False 
+
+        # Lese alle Monitoringswerte aus (Mehr als gebraucht!) - 29 Werte
+        ## Besteht aus vielen Werten im Format *Wert_1 Wert_2#
+        self.transaktion.senden(('!\r').encode())
+        
+        # Lese Antwort:
+        ''' 
+        1. read_out_AZ()    - liest bis # -> Eigene Funktion! Liest mit Frist über die Serial_Transaktion!
+        2. decode()         - Bytearray umwandeln
+        3. strip()          - Leerzeichen am Anfang und Ende entfernen
+        4. replace()        - *, # und Abschlusszeichen entfernen
+
+        Antwort-Beispiel: 5212.780 794.726 24.58 -99.00 22.87 -242.02 -99.00 0.00 0 0 0 0.00 0.000000 0 0 1000.00 0.00 22.87 22.85 20.00 -569.24 1000.00 -0.00 200.00 0.00 0.00 0.00 -0.00 0.00
+        '''
+        ans = self.read_out_AZ()
+        ans = ans.replace('\r','').replace('\n','').strip()
+        logger.debug('%s - %s %s', self.device_name, self.Log_Text_63_str[self.sprache], ans)
+
+        ## Antwort prüfen:
+        ### Fehlerfall 1 - End- und Startzeichen richtig:
+        start_end = True
+        if ans != '':
+            if ans[0] == '*' and ans[-1] == '#':    
+                ans = ans.replace('*', '').replace('#','').replace('#','').replace('\r','').strip()   
+                logger.debug('%s - %s %s (%s)', self.device_name, self.Log_Text_63_str[self.sprache], ans, self.Log_Text_EM001_str[self.sprache])
+            else:                                   
+                ans         = ''
+                start_end   = False  
+
+        ### Fehlerfall 2 - String ist Leer - Erneut Senden:    
+        if ans == '':  
+            logger.warning(f'{self.device_name} - {self.Log_Edu_3_str[self.sprache]} {self.Log_Edu_5_str[self.sprache]} {self.Log_Edu_19_str[self.sprache] if not start_end else self.Log_Edu_20_str[self.sprache]} (!)')
+            while n != self.Loop: 
+                #### Erneut Senden:
+                self.transaktion.senden(('!'+self.abschluss).encode())
+                #### Antwort Lesen:
+                ans = self.read_out_AZ()
+                ans = ans.replace('\r','').replace('\n','').strip()
+                #### Kontrolle:
+                start_end = True
+                if ans != '':
+                    if ans[0] == '*' and ans[-1] == '#':    ans = ans.replace('*', '').replace('#','').strip()     
+                    else:                                   ans, start_end = '', False
+                #### Auswerten:
+                if ans == '':   n += 1
+                else:
+                    logger.debug('%s - %s %s', self.device_name, self.Log_Edu_7_str[self.sprache], ans)
+                    break
+
+        ### While-Schleife hat Anschlag erreicht und wurde beendet:           
+        if n == self.Loop:
+            logger.warning(f"{self.device_name} - {self.Log_Edu_6_str[self.sprache]}")
+            self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_61_str[self.sprache]} (!)')
+            error = True
+        else:
+            logging.debug('%s - %s ! %s', self.device_name, self.Text_Edu_1_str[self.sprache], self.Text_Edu_2_str[self.sprache])
+        
+        ### Kein Fehler:
+        if not error:
+            #### Liste erstellen - Fehlerfall 3 - Liste nicht erstellebar:
+            try:
+                liste = ans.split(' ')
+            except:
+                listen_Error = True
+            
+            #### Fehlerfall 4 - Liste hat nicht die richtige Länge:
+            if len(liste) != 29 or listen_Error:
+                logger.warning(f"{self.device_name} - {self.Log_Edu_18_str[self.sprache]} {len(liste)}")
+                self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_61_str[self.sprache]} (!)')
+                liste = []
+                for i in range(0,29,1):
+                    liste.append(m.nan)
+        else:
+            liste = []
+            for i in range(0,29,1):
+                liste.append(m.nan)
+
+        return liste, error
+
     def read_out_AZ(self):
-        '''Liest eine bestimmte Anzahl von Zeichen aus, verbindet diese und gibt einen String zurück!
+        '''Liest die Antwort bis zum Abschlusszeichen # (mit Frist) und gibt sie ab dem letzten Start-Zeichen * als String zurück!
         Seperate Funktion für !-Befehl!
 
         Return:
             ans_join (Str): Zurückgegebener String (Bei Fehler Leerer String)
         '''
         try:
-            ans_list    = []                                # Leere Liste
-            i           = 0                                 # Kontroll Variable (Zeichen)
-            max_anz     = 200   
-            try_read = 0                            
-            while 1:                                        # Endlosschleife
-                z = self.serial.read()                      # Lese Zeichen
-                if z != '': ans_list.append(z.decode())     # Wenn nicht Leer, dann füge an Liste
-                if z == b'#':  break                        # Wenn \n (Newline) beende Endlosschleife
-                if z == b'*':                               # Start-Zeichen gefunden - Beginne!
-                    i = 0
-                    ans_list = []
-                    ans_list.append(z.decode())             # Füge das Start-Zeichen an
-                if i >= max_anz:                            # Wenn Anzahl Zeichen überschritten oder gleich, dann Beende Endlosschleife
-                    if z != '#':        
-                        try_read += 1
-                        max_anz += 50
-                    if try_read > 3:    break                       
-                i += 1                                      # Erhöhe Zählvariable
-            ans_join = ''.join(ans_list)                    # Verbinde die Liste zu einem String
+            ans_join = self.transaktion.lesen(befehl = '!', ende = b'#', max_anz = 400).decode()
+            if '*' in ans_join:                             # Start-Zeichen gefunden - Beginne dort!
+                ans_join = ans_join[ans_join.rfind('*'):]
         except Exception as e:
             logger.warning(f"{self.device_name} - {self.Log_Text_64_str[self.sprache]}")
             logger.exception(f"{self.device_name} - {self.Log_Text_136_str[self.sprache]}")
@@ -386,23 +349,23 @@ class EducrysMon:
     ###################################################
     # Messdatendatei erstellen und beschrieben:
     ###################################################
-    def messdaten_output(self, pfad="./"):
+    def messdaten_output(self, pfad, schreiber):
         """Erstelle für das Gerät eine csv-Datei mit den Daten.
             TC1_T, TC2_T, PT1_T, PT2_T, Pyro_T,
             PID_Out, PID_P, PID_I, PID_D, PID_In, PID_In_M,
             K_weight, K_weight_M, K_d      
             
         Args:
-            pfad (str, optional): Speicherort. Default ist "./".
+            pfad (str):                     Speicherort (Messordner)
+            schreiber (Messdaten_Writer):   Gemeinsamer Messdaten-Schreiber (hält die Datei offen und puffert die Zeilen)
         """
+        self.schreiber = schreiber
         self.filename = f"{pfad}/{self.device_name}.csv"
         units  = "# datetime,s,DEG C,DEG C,DEG C,DEG C,DEG C,ms,ms,ms,ms,DEG C,DEG C,g,g,mm,\n"
         header = "time_abs,time_rel,TC1_Temp,TC2_Temp,PT1_Temp,PT2_Temp,Pyrometer_Temp,PID_Output,PID_P_Anteil,PID_I_Anteil,PID_D_Anteil,PID_Input,PID_Input_gemittelt,Gewicht,Gewicht_gemittelt,Durchmesser,\n"
         if self.messZeit != 0:                                          # Erstelle Datei nur wenn gemessen wird!
             logger.info(f"{self.device_name} - {self.Log_Text_71_str[self.sprache]} {self.filename}")
-            with open(self.filename, "w", encoding="utf-8") as f:
-                f.write(units)
-                f.write(header)
+            self.schreiber.anmelden(self.filename, units + header)
         else:
             logger.info(f"{self.device_name} - {self.Log_Text_72_str[self.sprache]}")
 
@@ -417,8 +380,7 @@ class EducrysMon:
         line = f"{absolut_Time.isoformat(timespec='milliseconds').replace('T', ' ')},{relativ_Time},"
         for size in daten:
             line = line + f'{daten[size]},'
-        with open(self.filename, "a", encoding="utf-8") as f:
-            f.write(f'{line}\n')
+        self.schreiber.schreiben(self.filename, f'{line}\n', self.device_name)
 
 ##########################################
 # Verworfen:
@@ -0,0 +1,116 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Gemeinsamer Frame-Poller der Educrys-Anlage (ein Arduino):
+- Alle Educrys-Geräte an einer Schnittstelle senden für ihre Werte den Befehl ! und lesen denselben Frame (*Wert_1 ... Wert_29#)
+- Der Poller holt den Frame einmal pro Mess-Zyklus und gibt die Werte an alle Educrys-Geräte weiter
+- Ein Frame wird nur genutzt, solange er nicht älter als max_alter ist, und jedes Gerät bekommt ihn nur einmal
+- Schreibt ein Gerät einen Befehl an den Arduino, wird der Frame verworfen
+
+Das Lesen selbst (Senden, Prüfen, Wiederholen) bleibt im Gerät (lese_Frame), der Poller ruft es nur auf.
+Die Educrys-Geräte teilen sich die Schnittstelle und damit den Mutex des Ports (vifcon_controller).
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import time
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+
+class Educrys_Frame:
+    def __init__(self, sprache, port, max_alter = 0.5):
+        ''' Erstellung des Frame-Pollers.
+
+        Args:
+            sprache (int):          Sprache der GUI (Listenplatz)
+            port (str):             Port der Schnittstelle (für das Logging)
+            max_alter (float):      Maximales Alter in s, bis zu dem ein Frame an andere Geräte weitergegeben wird
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache    = sprache
+        self.port       = port
+        self.max_alter  = max_alter
+
+        ## Weitere:
+        self.liste      = None              # Werte des letzten gültigen Frames
+        self.zeit       = 0                 # Zeitpunkt des Frames (time.perf_counter)
+        self.geraete    = []                # Geräte, die den Frame schon bekommen haben
+        ## Statistik:
+        self.anz_Frames     = 0             # Gelesene Frames
+        self.anz_Geteilt    = 0             # Abfragen, die mit einem bereits gelesenen Frame bedient wurden
+        self.anz_Fehler     = 0             # Frames ohne gültige Antwort
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_EF_1 = ['Educrys-Frame-Poller - Port',                                                    'Educrys frame poller - Port']
+        self.Log_Text_EF_2 = ['Gelesene Frames:',                                                               'Frames read:']
+        self.Log_Text_EF_3 = ['Geteilt:',                                                                       'Shared:']
+        self.Log_Text_EF_4 = ['Fehler:',                                                                        'Errors:']
+        self.Log_Text_EF_5 = ['Maximales Alter:',                                                               'Maximum age:']
+
+        logger.info(f'{self.Log_Text_EF_1[self.sprache]} {self.port} - {self.Log_Text_EF_5[self.sprache]} {self.max_alter} s')
+
+    ##########################################
+    # Frame:
+    ##########################################
+    def lesen(self, geraet, lese_Frame):
+        ''' Gibt den aktuellen Frame zurück und liest ihn nur, wenn nötig.
+
+        Args:
+            geraet (str):           Geräte-Name
+            lese_Frame (Funktion):  Lese-Funktion des Gerätes (Return: liste, error)
+        Return:
+            liste (list):           Werte des Frames
+            error (bool):           True - Keine gültige Antwort
+        '''
+        alter = time.perf_counter() - self.zeit
+        if not self.liste == None and alter <= self.max_alter and not geraet in self.geraete:
+            self.anz_Geteilt += 1
+            self.geraete.append(geraet)
+            return list(self.liste), False
+
+        liste, error = lese_Frame()
+        self.anz_Frames += 1
+        if error:
+            self.anz_Fehler += 1
+            self.verwerfen()
+            return liste, error
+        self.liste   = list(liste)
+        self.zeit    = time.perf_counter()
+        self.geraete = [geraet]
+        return liste, error
+
+    def verwerfen(self):
+        ''' Verwirft den Frame (z.B. nach einem Schreib-Befehl), die nächste Abfrage liest neu. '''
+        self.liste   = None
+        self.geraete = []
+
+    ##########################################
+    # Statistik:
+    ##########################################
+    def log_statistik(self):
+        ''' Schreibt die Zähler des Pollers in das Logging. '''
+        logger.info(f'{self.Log_Text_EF_1[self.sprache]} {self.port} - {self.Log_Text_EF_2[self.sprache]} {self.anz_Frames}, {self.Log_Text_EF_3[self.sprache]} {self.anz_Geteilt}, {self.Log_Text_EF_4[self.sprache]} {self.anz_Fehler}')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -14,22 +14,19 @@ Eurotherm Gerät:
 ## GUI:
 from PyQt5.QtCore import (
     QCoreApplication,
-    pyqtSignal,
-    QThread,
-    QTimer,
     QObject
 )
 
 ## Allgemein:
 import logging
 from serial import Serial, SerialException
-import time
 import math as m
 # import threading
 import datetime
 
 ## Eigene:
 from .PID import PID
+from .serial_transaktion import transaktion
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -48,8 +45,6 @@ class SerialMock:
     
 
 class Eurotherm(QObject):
-    signal_PID  = pyqtSignal(float, float, bool, float)
-
     def __init__(self, sprache, config, com_dict, test, neustart, multilog_aktiv, Log_WriteReadTime, add_Ablauf_function, name="Eurotherm", typ = 'Generator'):
         """ Erstelle Eurotherm Schnittstelle. Bereite Messwertaufnahme und Daten senden vor.
 
@@ -93,25 +88,20 @@ class Eurotherm(QObject):
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
+        ''' Die Schlüssel aus config_schema.py kommen geprüft vom Controller (Default bei Fehler).
+        Hier wird nur noch folgendes kontrolliert:
+        1. Schlüssel außerhalb des Schemas mit Default-Vergabe!
+        2. Abhängigkeiten zwischen den Werten (z.B. Grenzen)!
         '''
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Einstellung für Log:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                                                                                                                      'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                                                                                                                         'Possible values:']
         self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                                                                                                                               'The following types are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                                                                                                                              'Default is used:']
         self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                                                                                                    'Error reading config during configuration:']
-        self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                                                                                                                                                  '; Set to default:']
         self.Log_Pfad_conf_5_1  = ['; Register-Fehler -> Programm zu Ende!!!',                                                                                                                                              '; Register error -> program ends!!!']
-        self.Log_Pfad_conf_5_2  = ['; PID-Modus Aus!!',                                                                                                                                                                     '; PID mode off!!']
         self.Log_Pfad_conf_5_3  = ['; Multilog-Link Aus!!',                                                                                                                                                                 '; Multilog-Link off!!']
         self.Log_Pfad_conf_6    = ['Fehlergrund:',                                                                                                                                                                          'Reason for error:']
-        self.Log_Pfad_conf_7    = ['Bitte vor Nutzung Korrigieren und Config Neu Einlesen!',                                                                                                                                'Please correct and re-read config before use!']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                                                                                                                                  'Incorrect input:']
         self.Log_Pfad_conf_8_1  = ['Fehlerhafte Typ:',                                                                                                                                                                      'Incorrect type:']
         self.Log_Pfad_conf_9    = ['Die Obergrenze ist kleiner als die Untergrenze! Setze die Limits auf Default:',                                                                                                         'The upper limit is smaller than the lower limit! Set the limits to default:']
         self.Log_Pfad_conf_10   = ['zu',                                                                                                                                                                                    'to']
@@ -124,121 +114,40 @@ class Eurotherm(QObject):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Zum Start:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.init           = self.config['start']['init']                            # Initialisierung
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|readTime {self.Log_Pfad_conf_5[self.sprache]} 2')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.messZeit = 2
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Ist            = self.config['PID']["start_ist"] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_ist {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Ist = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Soll           = self.config['PID']["start_soll"]
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_soll {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Soll = 0 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Write      = self.config['start']['PID_Write']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|PID_Write {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Write = False 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.startMode = self.config['start']["start_modus"]
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|start_modus {self.Log_Pfad_conf_5[self.sprache]} Manuel')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.startMode = 'Manuel'
+        self.init           = self.config['start']['init']                            # Initialisierung
+        self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
+        self.Ist            = self.config['PID']["start_ist"]
+        self.Soll           = self.config['PID']["start_soll"]
+        self.PID_Write      = self.config['start']['PID_Write']
+        self.startMode = self.config['start']["start_modus"]
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Sicherheit:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.Safety = self.config['start']['sicherheit']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|sicherheit {self.Log_Pfad_conf_5[self.sprache]} True')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Safety = True
+        self.Safety = self.config['start']['sicherheit']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Limits:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.oGOp = self.config["limits"]['opMax']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|opMax {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGOp = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGOp = self.config["limits"]['opMin']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|opMin {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGOp = 0
+        self.oGOp = self.config["limits"]['opMax']
+        self.uGOp = self.config["limits"]['opMin']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### PID:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        error_PID = False
-        try: self.PID_Config             = self.config['PID']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID {self.Log_Pfad_conf_5_2[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            error_PID = True
-            self.PID_Config = {}
-            self.PID_Aktiv  = 0 
-        #//////////////////////////////////////////////////////////////////////
-        if not error_PID:
-            try: self.PID_Aktiv = self.config['PID']['PID_Aktiv']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|PID_Aktiv {self.Log_Pfad_conf_5[self.sprache]} False')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.PID_Aktiv = 0 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Option             = self.config['PID']['Value_Origin'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Value_Origin {self.Log_Pfad_conf_5[self.sprache]} VV')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Option = 'VV' 
+        self.PID_Config             = self.config['PID']
+        self.PID_Aktiv              = self.config['PID']['PID_Aktiv']
+        self.PID_Option             = self.config['PID']['Value_Origin']
+        self.PID_Input_Limit_Max    = self.config['PID']['Input_Limit_max']
+        self.PID_Input_Limit_Min    = self.config['PID']['Input_Limit_min']
+        self.PID_Input_Error_Option = self.config['PID']['Input_Error_option']
         #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Limit_Max    = self.config['PID']['Input_Limit_max']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Limit_Max  = 1 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Limit_Min    = self.config['PID']['Input_Limit_min'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Limit_Min = 0 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Error_Option = self.config['PID']['Input_Error_option']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Error_option {self.Log_Pfad_conf_5[self.sprache]} error')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Error_Option = 'error' 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.M_device_ist           = self.config['multilog']['read_trigger_ist'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|read_trigger_ist {self.Log_Pfad_conf_5_3[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.M_device_ist           = self.config['multilog']['read_trigger_ist']
+        if self.M_device_ist == None:
+            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_ist {self.Log_Pfad_conf_5_3[self.sprache]}')
             self.M_device_ist = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
-        try: self.M_device_soll          = self.config['multilog']['read_trigger_soll'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|read_trigger_soll {self.Log_Pfad_conf_5_3[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.M_device_soll          = self.config['multilog']['read_trigger_soll']
+        if self.M_device_soll == None:
+            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_soll {self.Log_Pfad_conf_5_3[self.sprache]}')
             self.M_device_soll = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
@@ -256,50 +165,12 @@ class Eurotherm(QObject):
             self.sensor_soll = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Sample_Time        = self.config['PID']['sample']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|sample {self.Log_Pfad_conf_5[self.sprache]} 500')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Sample_Time = 500 
-        ### Start-Modus:
-        if not self.startMode in ['Auto', 'Manuel']:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_modus - {self.Log_Pfad_conf_2[self.sprache]} [Auto, Manuel] - {self.Log_Pfad_conf_3[self.sprache]} Manuel - {self.Log_Pfad_conf_8[self.sprache]} {self.startMode}')
-            self.startMode = 'Manuel'
+        self.PID_Sample_Time        = self.config['PID']['sample']
 
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### PID-Aktiviert:
-        if not type(self.PID_Aktiv) == bool and not self.PID_Aktiv in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} PID_Aktiv - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Aktiv}')
-            self.PID_Aktiv = 0
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
-        ### Messzeit:
-        if not type(self.messZeit) in [int, float] or not self.messZeit >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} readTime - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 2 - {self.Log_Pfad_conf_8[self.sprache]} {self.messZeit}')
-            self.messZeit = 2
-        ### PID-Start-Soll:
-        if not type(self.Soll) in [float, int] or not self.Soll >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_soll - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {self.Soll}')
-            self.Soll = 0
-        ### PID-Start-Ist:
-        if not type(self.Ist) in [float, int] or not self.Ist >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_ist - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {self.Ist}')
-            self.Ist = 0
-        ### HO-Start-Sicherheit:
-        if not type(self.Safety) == bool and not self.Safety in [0, 1]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} sicherheit - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} True - {self.Log_Pfad_conf_8[self.sprache]} {self.Safety}')
-            self.Safety = 1
         ### Ausgangsleistungs-Limit:
-        if not type(self.oGOp) in [float, int] or not self.oGOp >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} opMax - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGOp)}')
-            self.oGOp = 1
-        if not type(self.uGOp) in [float, int] or not self.uGOp >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} opMin - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGOp)}')
-            self.uGOp = 0
         if self.oGOp <= self.uGOp:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_11[self.sprache]})')
             self.uGOp = 0
@@ -309,12 +180,6 @@ class Eurotherm(QObject):
             logger.warning(f'{self.device_name} - {Log_Text_PID_N18[sprache]}')
             self.PID_Input_Error_Option = 'error'
         ### PID-Limit:
-        if not type(self.PID_Input_Limit_Max) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_max - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.PID_Input_Limit_Max)}')
-            self.PID_Input_Limit_Max = 1
-        if not type(self.PID_Input_Limit_Min) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_min - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.PID_Input_Limit_Min)}')
-            self.PID_Input_Limit_Min = 0
         if self.PID_Input_Limit_Max <= self.PID_Input_Limit_Min:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
             self.PID_Input_Limit_Min = 0
@@ -327,22 +192,6 @@ class Eurotherm(QObject):
         if not type(self.sensor_soll) == str:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Multilog_Sensor_Soll - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_3[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.sensor_soll)}')
             self.multilog_OnOff = False
-        ### read-Trigger Multilog Ist:
-        if not type(self.M_device_ist) == str:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} read_trigger_ist - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_3[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.M_device_ist)}')
-            self.multilog_OnOff = False
-        ### read-Trigger Multilog Soll:
-        if not type(self.M_device_soll) == str:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} read_trigger_soll - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_3[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.M_device_soll)}')
-            self.multilog_OnOff = False
-        ### PID Sample Zeit:
-        if not type(self.PID_Sample_Time) in [int] or not self.PID_Sample_Time >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} sample - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 500 - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Sample_Time}')
-            self.PID_Sample_Time = 500
-        ### Sende Eurotherm PID-Parameter zum Start:
-        if not type(self.PID_Write) == bool and not self.PID_Write in [0, 1]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} PID_Write - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Write}')
-            self.PID_Write = 0 
 
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Werte Dictionary:
@@ -396,7 +245,7 @@ class Eurotherm(QObject):
         self.Log_Text_183_str   = ['Das Senden der Werte ist fehlgeschlagen! (Rampe)',                                                                                                                                      'Sending the values failed! (Ramp)']
         self.Log_Text_243_str   = ['Beim Startwert senden an Eurotherm gab es einen Fehler! Programm wird beendet! Wurde das Gerät eingeschaltet bzw. wurde die Init-Einstellung richtig gesetzt?',                         'There was an error when sending the start value to Eurotherm! Program will end! Was the device switched on or was the init setting set correctly?']
         self.Log_Text_244_str   = ['Fehler Grund: ',                                                                                                                                                                        'Error reason:']
-        self.Log_Text_PID_str   = ['Start des PID-Threads!',                                                                                                                                                                'Start of the PID thread!']
+        self.Log_Text_PID_str   = ['PID-Regler im PID-Takt!',                                                                                                                                                               'PID controller in the PID cycle!']
         Log_Text_PID_N1         = ['Die Konfiguration',                                                                                                                                                                     'The configuration']
         Log_Text_PID_N2         = ['existiert nicht! Möglich sind nur VV, VM, MM oder MV. Nutzung von Default VV!',                                                                                                         'does not exist! Only VV, VM, MM or MV are possible. Use default VV!']
         Log_Text_PID_N2_1       = ['ist für das Gerät noch nicht umgesetzt! Nutzung von Default VV!',                                                                                                                       'is not yet implemented for the device! Use of default VV!']
@@ -454,6 +303,7 @@ class Eurotherm(QObject):
         # Schnittstelle:
         #---------------------------------------
         logger.info(f"{self.device_name} - {self.Log_Text_60_str[self.sprache]}")
+        self.transaktion = None
         try:
             if not test:
                 com_ak = ''
@@ -465,6 +315,8 @@ class Eurotherm(QObject):
                     self.serial = Serial(**config["serial-interface"])
                 else:
                     self.serial = com_dict[com_ak]
+                ## Lese-Schicht mit Frist (ersetzt die festen Wartezeiten):
+                self.transaktion = transaktion(self.sprache, self.serial, self.config['serial-interface']['port'])
         except SerialException as e:
             self.serial = SerialMock()
             logger.warning(f"{self.device_name} - {self.Log_Text_61_str[self.sprache]}")
@@ -519,20 +371,8 @@ class Eurotherm(QObject):
         logger.info(f'{self.device_name} - {Log_Text_PID_N3[self.sprache]}{self.PID_Option} ({teil_1[self.sprache]}, {teil_2[self.sprache]})')
 
         if self.PID_Aktiv:
-            ## PID-Thread:
-            self.PIDThread = QThread()
-            self.PID.moveToThread(self.PIDThread)
-            logger.info(f'{self.device_name} - {self.Log_Text_PID_str[self.sprache]}') 
-            self.PIDThread.start()
-            self.signal_PID.connect(self.PID.InOutPID)
-            ## Timer:
-            self.timer_PID = QTimer()                                              # Reaktionszeittimer (ruft die Geräte auf, liest aber nur unter bestimmten Bedingungen!)
-            self.timer_PID.setInterval(self.PID_Sample_Time)
-            self.timer_PID.timeout.connect(self.PID_Update)
-            self.timer_PID.start()
-            ### PID-Timer Thread:
-            #self.PIDThreadTimer = threading.Thread(target=self.PID_Update)
-            #self.PIDThreadTimer.start()
+            ## Der PID-Regler wird im gemeinsamen PID-Takt berechnet (pid_takt.py, Anmeldung im vifcon_controller):
+            logger.info(f'{self.device_name} - {self.Log_Text_PID_str[self.sprache]}')
         else:
             logger.info(f'{self.device_name} - {self.Log_Text_PID_N23[self.sprache]}')
         ## Multilog-Lese-Variable für die Daten:
@@ -565,7 +405,7 @@ class Eurotherm(QObject):
         bcc = 0
         for item in bcc_list:
             bcc = (bcc^item)                    # XOR
-        logger.debug(f'{self.device_name} - {self.Log_Text_132_str[self.sprache]} = "{bcc}"')
+        logger.debug('%s - %s = "%s"', self.device_name, self.Log_Text_132_str[self.sprache], bcc)
         return chr(bcc)                         # Dezimalzahl zu ASCII
 
     def write(self, write_Okay, write_value):
@@ -619,8 +459,10 @@ class Eurotherm(QObject):
         #++++++++++++++++++++++++++++++++++++++++++    
         # Normaler Betrieb:
         #++++++++++++++++++++++++++++++++++++++++++
+        PID_Start = write_Okay['PID'] and not self.PID_Ein                  # PID-Modus wird eingeschaltet
         if not write_Okay['PID']:  
             self.PID_Ein = False
+            self.value_old = -1                                             # Beim nächsten Einschalten den PID-Output auf jeden Fall senden
             # Sollwertn Lesen (OP oder Temp):
             sollwert = write_value['Sollwert']
             PID_write_OP = False
@@ -683,8 +525,8 @@ class Eurotherm(QObject):
             #---------------------------------------------
             ## Schreibe Werte:
             #---------------------------------------------
-            PID_write_OP = True
             PowOutPID = self.op
+            PID_write_OP = PowOutPID != self.value_old                      # Nur einen geänderten PID-Output senden
             #---------------------------------------------
             ## Rezept-Modus:
             #---------------------------------------------
@@ -699,7 +541,7 @@ class Eurotherm(QObject):
         if write_Okay['Auto_Mod'] and not write_Okay['PID']:
             self.write_read_answer('SW>', '0000', self.write_Modus)                
             write_Okay['Auto_Mod'] = False
-        elif write_Okay['Manuel_Mod'] or write_Okay['PID']:
+        elif write_Okay['Manuel_Mod'] or PID_Start:
             ## Immer beim Umsachalten, wenn die Sicherheit auf True steht wird der HO ausgelesen:
             value_HO = self.check_HO()
             if value_HO != '' and value_HO != m.nan:
@@ -725,7 +567,10 @@ class Eurotherm(QObject):
                 write_Okay[auswahl] = False
             ## Ausgangsleistung während des PID-Modus:
             elif PID_write_OP:
-                self.write_read_answer('OP', str(PowOutPID), self.write_leistung)
+                if self.write_read_answer('OP', str(PowOutPID), self.write_leistung):
+                    self.value_old = PowOutPID
+                else:
+                    self.value_old = -1                                     # Nicht bestätigt - im nächsten PID-Takt erneut senden
                 PID_write_OP = False
             ## Startwerte:
             elif write_Okay[auswahl] and auswahl == 'Start' and not self.neustart:
@@ -747,8 +592,8 @@ class Eurotherm(QObject):
                 self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_78_str[self.sprache]}')
                 ### Lese aktuellen Sollwert:
                 try:    
-                    self.serial.write(self.read_soll_temperatur.encode())
-                    soll_temperatur = float(self.serial.readline().decode()[3:-2])
+                    self.transaktion.senden(self.read_soll_temperatur.encode())
+                    soll_temperatur = float(self.lese_Antwort('SL').decode()[3:-2])
                 except Exception as e: 
                     soll_temperatur = self.value_name['IWT']    # setze letzten gemessenen Istwert als Sollwert ein!!
                     logger.warning(f"{self.device_name} - {self.Log_Text_64_str[self.sprache]} ({self.read_soll_temperatur.encode()})")
@@ -830,6 +675,8 @@ class Eurotherm(QObject):
             write_mn (str):     Mnemonik Befehl des Eurotherms
             value (str):        übergebender Wert
             befehl_start (str): Start des Befehls
+        Return:
+            True - Befehl vom Gerät bestätigt (ACK)
         '''
         # Ablaufdatei Zusatz:
         if self.PID_Ein and write_mn == 'OP':
@@ -846,7 +693,7 @@ class Eurotherm(QObject):
         # Schreibe:
         bcc_Wert = self.bcc(write_mn + value)
         try: 
-            self.serial.write(f'{befehl_start}{value}\x03{bcc_Wert}'.encode())
+            self.transaktion.senden(f'{befehl_start}{value}\x03{bcc_Wert}'.encode())
         except Exception as e:
             logger.warning(f"{self.device_name} - {self.Log_Text_76_str[self.sprache]}")
             logger.exception(f"{self.device_name} - {self.Log_Text_77_str[self.sprache]}")
@@ -855,11 +702,12 @@ class Eurotherm(QObject):
         if not self.Block_Ablaufdatei:
             self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {write_mn}{value} {self.Text_56_str[self.sprache]}')
         try:
-            answer = self.serial.readline().decode()                                            
+            answer = self.lese_Antwort(write_mn).decode()
             if answer == '\x06':
                 if not self.Block_Ablaufdatei:
                     self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_53_str[self.sprache]}')          
-                logger.debug(f'{self.device_name} {self.Text_53_str[self.sprache]}')
+                logger.debug('%s %s', self.device_name, self.Text_53_str[self.sprache])
+                return True
             elif answer == '\x15':
                 self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_54_str[self.sprache]}')    
                 logger.warning(f"{self.device_name} - {self.Text_54_str[self.sprache]}")
@@ -870,6 +718,7 @@ class Eurotherm(QObject):
             logger.warning(f"{self.device_name} - {self.Log_Text_134_str[self.sprache]}")
             logger.exception(f"{self.device_name} - {self.Log_Text_135_str[self.sprache]}")
             self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_57_str[self.sprache]}')    
+        return False
 
     def write_EuRa(self, Sollwert, Steigung):
         ''' Übergebe und Kontrolliere die Rampeneinstellung
@@ -889,14 +738,14 @@ class Eurotherm(QObject):
                 write_rampe = f"\x040000\x02{Segement[i]}"
                 Sollwert = s
                 bcc_Wert = self.bcc(f'{Segement[i]}' + str(Sollwert))
-                self.serial.write(f'{write_rampe}{Sollwert}\x03{bcc_Wert}'.encode())
+                self.transaktion.senden(f'{write_rampe}{Sollwert}\x03{bcc_Wert}'.encode())
                 befehl_extra = f"{write_rampe}{Sollwert}\x03{bcc_Wert}".encode()
-                logger.debug(f'{self.device_name} - {self.Log_EuRa_Befehl[self.sprache]} {befehl_extra}')
+                logger.debug('%s - %s %s', self.device_name, self.Log_EuRa_Befehl[self.sprache], befehl_extra)
                 try:
-                    answer = self.serial.readline().decode()
+                    answer = self.lese_Antwort(Segement[i]).decode()
                     if answer == '\x06':
                         self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_53_str[self.sprache]}')          
-                        logger.debug(f'{self.device_name} - {self.device_name} {self.Text_53_str[self.sprache]}')
+                        logger.debug('%s - %s %s', self.device_name, self.device_name, self.Text_53_str[self.sprache])
                         i += 1
                         break
                     elif answer == '\x15':
@@ -918,7 +767,7 @@ class Eurotherm(QObject):
                 if stop == 10:
                     logger.warning(f'{self.device_name} - {self.Log_Text_183_str[self.sprache]}')
                     break
-                time.sleep(0.2)       
+                self.transaktion.abstand(0.2)                   # Pause vor der Wiederholung (seit der letzten Antwort)
 
     ##########################################
     # Schnittstelle (lesen):
@@ -957,6 +806,16 @@ class Eurotherm(QObject):
 
         return self.value_name
         
+    def lese_Antwort(self, befehl = ''):
+        ''' Liest eine Antwort des Eurotherms mit Frist: STX Mnemonik Wert ETX BCC oder ein einzelnes Steuerzeichen (EOT, ACK, NAK).
+
+        Args:
+            befehl (str):   Mnemonik des Befehls (für die Statistik der Antwortzeiten)
+        Return:
+            Antwort (bytes)
+        '''
+        return self.transaktion.lesen(befehl = befehl, ende = b'\x03', nachlauf = 1, einzeln = b'\x04\x06\x15')
+
     def read_einzeln(self, befehl):
         ''' Zusammenfassung der einzelnen Sende-Befehle
         
@@ -967,8 +826,8 @@ class Eurotherm(QObject):
             ans (float):    Antwort des Gerätes in Float umgefandelt
         '''
         try:
-            self.serial.write(befehl.encode())
-            ans = float(self.serial.readline().decode()[3:-2])
+            self.transaktion.senden(befehl.encode())
+            ans = float(self.lese_Antwort(befehl[5:-1]).decode()[3:-2])
         except Exception as e: 
             ans = m.nan         # Input-Filter fängt das ab!
             logger.warning(f"{self.device_name} - {self.Log_Text_64_str[self.sprache]} ({befehl.encode()})")
@@ -997,14 +856,14 @@ class Eurotherm(QObject):
             extra_str (str):    Extra String für den Log!
         '''
         ### XP - proportional band
-        self.serial.write("\x040000XP\x05".encode())
-        P = str(self.serial.readline().decode()[3:-2])
+        self.transaktion.senden("\x040000XP\x05".encode())
+        P = str(self.lese_Antwort('XP').decode()[3:-2])
         ### TI - Integral time
-        self.serial.write("\x040000TI\x05".encode())
-        I = str(self.serial.readline().decode()[3:-2])
+        self.transaktion.senden("\x040000TI\x05".encode())
+        I = str(self.lese_Antwort('TI').decode()[3:-2])
         ### TD - Derivative time
-        self.serial.write("\x040000TD\x05".encode())
-        D = str(self.serial.readline().decode()[3:-2])
+        self.transaktion.senden("\x040000TD\x05".encode())
+        D = str(self.lese_Antwort('TD').decode()[3:-2])
         logger.info(f"{self.device_name} - {self.Log_Text_147_str[self.sprache]} {self.Log_Text_148_str[self.sprache]} {P.strip()}, {self.Log_Text_149_str[self.sprache]} {I.strip()}, {self.Log_Text_150_str[self.sprache]} {D.strip()} {extra_str}")
 
     ##########################################
@@ -1036,36 +895,36 @@ class Eurotherm(QObject):
         try:
             ## Instrument Identity:
             instrument = {'E440':'3504' , 'E480':'3508' , '9050':'900EPC'}
-            self.serial.write("\x040000II\x05".encode())
-            ins_ID = str(self.serial.readline().decode()[4:-2])
+            self.transaktion.senden("\x040000II\x05".encode())
+            ins_ID = str(self.lese_Antwort('II').decode()[4:-2])
             try:
                 logger.info(f"{self.device_name} - {self.Log_Text_137_str[self.sprache]} {ins_ID} -> {instrument[ins_ID]}")
             except:
                 logger.info(f"{self.device_name} - {self.Log_Text_137_str[self.sprache]} {ins_ID}")
             ## Software Version:
-            self.serial.write("\x040000V0\x05".encode())
-            version = str(self.serial.readline().decode()[4:-2])
+            self.transaktion.senden("\x040000V0\x05".encode())
+            version = str(self.lese_Antwort('V0').decode()[4:-2])
             logger.info(f"{self.device_name} - {self.Log_Text_138_str[self.sprache]} {version}")
             ## Instrumenten Modus:
             IM = {0:self.Log_Text_140_str[self.sprache] , 1:self.Log_Text_141_str[self.sprache] , 2:self.Log_Text_142_str[self.sprache]}
-            self.serial.write("\x040000IM\x05".encode())
-            mode = int(self.serial.readline().decode()[4:-2])
+            self.transaktion.senden("\x040000IM\x05".encode())
+            mode = int(self.lese_Antwort('IM').decode()[4:-2])
             logger.info(f"{self.device_name} - {self.Log_Text_139_str[self.sprache]} {IM[mode]}")
             ## Display:  
             ### Maximum:
-            self.serial.write("\x0400001H\x05".encode())
-            max_dis = str(self.serial.readline().decode()[3:-3])
+            self.transaktion.senden("\x0400001H\x05".encode())
+            max_dis = str(self.lese_Antwort('1H').decode()[3:-3])
             ### Minimum
-            self.serial.write("\x0400001L\x05".encode())
-            min_dis = str(self.serial.readline().decode()[3:-3])
+            self.transaktion.senden("\x0400001L\x05".encode())
+            min_dis = str(self.lese_Antwort('1L').decode()[3:-3])
             logger.info(f"{self.device_name} - {self.Log_Text_143_str[self.sprache]} {min_dis.strip()} {self.Log_Text_144_str[self.sprache]} {max_dis.strip()} {self.Log_Text_145_str[self.sprache]}")
             ## Sollwert 
             ### Maximum:
-            self.serial.write("\x040000HS\x05".encode())
-            max_s = str(self.serial.readline().decode()[3:-2])
+            self.transaktion.senden("\x040000HS\x05".encode())
+            max_s = str(self.lese_Antwort('HS').decode()[3:-2])
             ### Minimum:
-            self.serial.write("\x040000LS\x05".encode())
-            min_s = str(self.serial.readline().decode()[3:-2])
+            self.transaktion.senden("\x040000LS\x05".encode())
+            min_s = str(self.lese_Antwort('LS').decode()[3:-2])
             logger.info(f"{self.device_name} - {self.Log_Text_146_str[self.sprache]} {min_s} {self.Log_Text_144_str[self.sprache]} {max_s} {self.Log_Text_145_str[self.sprache]}")
             ## PID-Regler Parameter:
             ### Schreiben der PID-Parameter wenn gewollt:
@@ -1087,8 +946,8 @@ class Eurotherm(QObject):
             ## Lese PID-Parameter:
             self.check_PID(f'({self.Log_Extra_2[self.sprache]})')
             ## Statuswort:
-            self.serial.write("\x040000SW\x05".encode())
-            stWort = str(self.serial.readline().decode()[3:-2])
+            self.transaktion.senden("\x040000SW\x05".encode())
+            stWort = str(self.lese_Antwort('SW').decode()[3:-2])
             logger.info(f"{self.device_name} - {self.Log_Text_151_str[self.sprache]} {stWort}")
             if stWort == '>0000' or stWort == '>8000':
                 ## Start-Modus setzen:
@@ -1102,15 +961,15 @@ class Eurotherm(QObject):
                 logger.warning(f"{self.device_name} - {self.Log_Text_154_str[self.sprache]}")
             ## Änderung von HO:
             if self.Safety == False:
-                self.serial.write("\x040000HO\x05".encode())
-                HO_vorher = str(self.serial.readline().decode()[4:-2])
+                self.transaktion.senden("\x040000HO\x05".encode())
+                HO_vorher = str(self.lese_Antwort('HO').decode()[4:-2])
                 self.write_read_answer('HO', str(self.oGOp), self.write_max_leistung)
                 logger.info(f"{self.device_name} - {self.Log_Text_155_str[self.sprache]} {HO_vorher} {self.Log_Text_156_str[self.sprache]} {self.Log_Text_155_str_1[self.sprache]} {self.oGOp} {self.Log_Text_156_str[self.sprache]}")
             else:
                 logger.info(f"{self.device_name} - {self.Log_Text_157_str[self.sprache]}")
             ## Lese HO aus:
-            self.serial.write("\x040000HO\x05".encode())
-            HO_Aktuel= str(self.serial.readline().decode()[4:-2])
+            self.transaktion.senden("\x040000HO\x05".encode())
+            HO_Aktuel= str(self.lese_Antwort('HO').decode()[4:-2])
             logger.info(f"{self.device_name} - {self.Log_Text_157_str_1[self.sprache]} {HO_Aktuel} {self.Log_Text_156_str[self.sprache]}")
         except Exception as e:
             if self.init:
@@ -1123,21 +982,21 @@ class Eurotherm(QObject):
     ###################################################
     # Messdatendatei erstellen und beschrieben:
     ###################################################
-    def messdaten_output(self, pfad="./"):
+    def messdaten_output(self, pfad, schreiber):
         """Erstelle für das Gerät eine csv-Datei mit den Daten.
 
         Args:
-            pfad (str, optional): Speicherort. Default ist "./".
+            pfad (str):                     Speicherort (Messordner)
+            schreiber (Messdaten_Writer):   Gemeinsamer Messdaten-Schreiber (hält die Datei offen und puffert die Zeilen)
         """
+        self.schreiber = schreiber
         self.filename = f"{pfad}/{self.device_name}.csv"
         units = "# datetime,s,DEG C,DEG C,%,DEG C,DEG C,\n"
         #scaling = f"# -,-,{self.}"
         header = "time_abs,time_rel,Soll-Temperatur,Ist-Temperatur,Operating-point,Soll-Temperatur_PID-Modus,Ist-Temperatur_PID-Modus,\n"
         if self.messZeit != 0:                                          # Erstelle Datei nur wenn gemessen wird!
             logger.info(f"{self.device_name} - {self.Log_Text_71_str[self.sprache]} {self.filename}")
-            with open(self.filename, "w", encoding="utf-8") as f:
-                f.write(units)
-                f.write(header)
+            self.schreiber.anmelden(self.filename, units + header)
         else:
             logger.info(f"{self.device_name} - {self.Log_Text_72_str[self.sprache]}")
 
@@ -1152,18 +1011,25 @@ class Eurotherm(QObject):
         line = f"{absolut_Time.isoformat(timespec='milliseconds').replace('T', ' ')},{relativ_Time},"
         for size in daten:
             line = line + f'{daten[size]},'
-        with open(self.filename, "a", encoding="utf-8") as f:
-            f.write(f'{line}\n')
+        self.schreiber.schreiben(self.filename, f'{line}\n', self.device_name)
 
     ##########################################
     # PID-Regler:
     ##########################################
-    def PID_Update(self):
-        '''PID-Regler-Thread-Aufruf'''
+    def PID_Eingang(self):
+        '''Eingänge des PID-Reglers für den PID-Takt (eigener Thread)
+
+        Return:
+            (Istwert, Sollwert, Rezept-Modus, Rezept-Output) - None: Regler nicht aktiv
+        '''
         if self.PID_Aktiv:
             if not self.PID.PID_speere:
-                self.signal_PID.emit(self.Ist, self.Soll, self.mode_aktiv, self.Rez_OP)
-                self.op = self.PID.Output
+                return self.Ist, self.Soll, self.mode_aktiv, self.Rez_OP
+        return None
+
+    def PID_Ausgang(self):
+        '''Output des PID-Reglers nach der Berechnung im PID-Takt übernehmen'''
+        self.op = self.PID.Output
 
 ##########################################
 # Verworfen:
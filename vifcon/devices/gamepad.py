@@ -4,6 +4,9 @@
 '''
 Gamepad Controller initialisieren:
 - Ertsellt eine While-Schleife, die die Aktionen des Gamepads ausliest und dann Funktionen der Antriebe auslöst.
+- Die Schleife wartet blockierend auf Ereignisse (pygame.event.wait mit begrenzter Wartezeit) - im Leerlauf keine CPU-Last
+- Die Sperrzeiten der Knöpfe (PI-Achse) liegen in einem Heap, geweckt wird zum nächsten Ablauf
+- Die Zuordnung Knopf -> Achsen-Funktion wird einmal beim Start als Tabelle erstellt (ZUORDNUNG)
 '''
 
 # ++++++++++++++++++++++++++++
@@ -17,7 +20,8 @@ from PyQt5.QtCore import (
 ## Algemein:
 import logging
 import pygame
-import datetime
+import heapq
+import time
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -26,6 +30,25 @@ logger = logging.getLogger(__name__)
 
 pygame.init()
 
+MAX_WARTEN = 250                    # Maximale Wartezeit auf ein Ereignis in ms (Reaktion auf ende)
+
+## Zuordnung der Ereignisse zu den Funktionen der Achsen: (Geräte-Art, Button_Link): {Ereignis: (Funktion, Riegel)}
+### Ereignis: ('Knopf', Nummer) oder ('Achse', Richtung) - Riegel: Funktion mit True aufrufen, nur wenn die Achse steht, danach Sperrzeit
+ZUORDNUNG = {
+    ('PI-Achse', 'PIx'):                {('Knopf', 0): ('fahre_rechts', True),  ('Knopf', 2): ('fahre_links', True)},
+    ('PI-Achse', 'PIy'):                {('Knopf', 1): ('fahre_rechts', True),  ('Knopf', 3): ('fahre_links', True)},
+    ('PI-Achse', 'PIh'):                {('Achse', 'Rechts'): ('fahre_rechts', True), ('Achse', 'Links'): ('fahre_links', True)},
+    ('PI-Achse', 'PIz'):                {('Achse', 'Runter'): ('fahre_rechts', True), ('Achse', 'Hoch'): ('fahre_links', True)},
+    ('Nemo-Achse-Linear', 'HubS'):      {('Knopf', 0): ('fahre_Hoch', False),   ('Knopf', 2): ('fahre_Runter', False)},
+    ('Nemo-Achse-Linear', 'HubT'):      {('Achse', 'Runter'): ('fahre_Runter', False), ('Achse', 'Hoch'): ('fahre_Hoch', False)},
+    ('Nemo-Achse-Rotation', 'RotS'):    {('Knopf', 1): ('fahre_ccw', False),    ('Knopf', 3): ('fahre_cw', False)},
+    ('Nemo-Achse-Rotation', 'RotT'):    {('Achse', 'Rechts'): ('fahre_ccw', False), ('Achse', 'Links'): ('fahre_cw', False)},
+    ('Educrys-Antrieb', 'EduL'):        {('Knopf', 0): ('fahre_links_K', False), ('Knopf', 2): ('fahre_rechts_K', False), ('Achse', 'Runter'): ('fahre_rechts_K', False), ('Achse', 'Hoch'): ('fahre_links_K', False)},
+    ('Educrys-Antrieb', 'EduR'):        {('Knopf', 1): ('fahre_rechts_K', False), ('Knopf', 3): ('fahre_links_K', False), ('Achse', 'Rechts'): ('fahre_rechts_K', False), ('Achse', 'Links'): ('fahre_links_K', False)},
+    ('Educrys-Antrieb', 'EduF'):        {('Knopf', 9): ('fahre_links_K', False)},
+}
+GERAETE_ARTEN = ['PI-Achse', 'Nemo-Achse-Linear', 'Nemo-Achse-Rotation', 'Educrys-Antrieb']
+
 class Gamepad_1(QObject):
     '''Quelle: https://www.pygame.org/docs/ref/joystick.html'''
     def __init__(self, sprache, Achsen_list, Ablauf_Funktion):
@@ -75,6 +98,10 @@ class Gamepad_1(QObject):
         self.Log_Text_243_str       = ['Knopf betätigt - Achse Runter!',                                        'Button pressed - axes down!']                                          
         self.Log_Text_244_str       = ['Knopf betätigt - Achse Rechts!',                                        'Button pressed - axes right!']                                          
         self.Log_Text_245_str       = ['Knopf betätigt - Achse Links!',                                         'Button pressed - axes left!']                                          
+        self.Log_Text_246_str       = ['Latenz (Ereignis bis bearbeitet) -',                                    'Latency (event to handled) -']
+        self.Log_Text_247_str       = ['Verspätung der Sperrzeiten -',                                          'Delay of the lock times -']
+        self.Log_Text_248_str       = ['Mittelwert:',                                                           'Mean:']
+        self.Log_Text_249_str       = ['Maximum:',                                                              'Maximum:']
         #---------------------------------------
         # Informationen:
         #---------------------------------------
@@ -107,165 +134,104 @@ class Gamepad_1(QObject):
         hats = self.joystick.get_numhats()
         logger.info(f"{self.Log_Text_224_str[self.sprache]} - {self.Log_Text_231_str[self.sprache]} {hats}")
 
+        #---------------------------------------
+        # Zuordnung und Sperrzeiten:
+        #---------------------------------------
+        ## Text je Ereignis:
+        self.ereignis_text = {('Knopf', 0): self.Log_Text_234_str, ('Knopf', 1): self.Log_Text_235_str, ('Knopf', 2): self.Log_Text_236_str, ('Knopf', 3): self.Log_Text_237_str,
+                              ('Knopf', 4): self.Log_Text_238_str, ('Knopf', 5): self.Log_Text_239_str, ('Knopf', 8): self.Log_Text_240_str, ('Knopf', 9): self.Log_Text_241_str,
+                              ('Achse', 'Rechts'): self.Log_Text_244_str, ('Achse', 'Links'): self.Log_Text_245_str, ('Achse', 'Runter'): self.Log_Text_243_str, ('Achse', 'Hoch'): self.Log_Text_242_str}
+        ## Tabelle Ereignis -> [(Achse, Funktion, Riegel), ...]:
+        self.tabelle = {}
+        for achse in self.Achsen_list:
+            art = [name for name in GERAETE_ARTEN if name in achse.device_name]
+            if art == []:
+                continue
+            for ereignis, (funktion, riegel) in ZUORDNUNG.get((art[0], achse.Button_Link), {}).items():
+                self.tabelle.setdefault(ereignis, []).append((achse, getattr(achse, funktion), riegel))
+            self.tabelle.setdefault(('Knopf', 8), []).append((achse, achse.Stopp, False))       # Select: Stopp aller Achsen
+
         # PI-Achse Riegel:
-        self.Riegel_dict = {}
+        self.Riegel_dict = {}                                                   # Achse: Ablauf der Sperrzeit (time.monotonic)
+        self.Riegel_heap = []                                                   # [Ablauf, Nummer, Achse]
+        self.Riegel_nr   = 0
+
+        ## Latenz (Ereignis empfangen bis bearbeitet) und Verspätung der Sperrzeiten:
+        self.latenz      = [0, 0, 0]                                            # Anzahl, Summe in s, Maximum in s
+        self.verspaetung = [0, 0, 0]
 
     def event_Loop(self):
-        '''While-Schleife die bis zum Programm Ende läuft - Reaktion auf Knöpfe!'''
+        '''Schleife bis zum Programm Ende - wartet blockierend auf Knöpfe und die nächste Sperrzeit!'''
+        pygame.event.set_blocked(None)                                          # Nur die genutzten Ereignisse wecken die Schleife
+        pygame.event.set_allowed([pygame.QUIT, pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION])
         while not self.done:
-            for achse in self.Riegel_dict:
-                if achse.mode == 1 and self.Riegel_dict[achse][0] != 0:
-                    timediff = (
-                        datetime.datetime.now(datetime.timezone.utc).astimezone() - self.Riegel_dict[achse][1]
-                    ).total_seconds() 
-                    if timediff >= self.Riegel_dict[achse][0]:
-                        achse.entriegel_Knopf(True)    
-                        self.Riegel_dict[achse][0] = 0    
-
-            for event in pygame.event.get():
-                logger.debug(f"{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_232_str[self.sprache]} {event}")
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-
-                if event.type == pygame.JOYBUTTONDOWN:
-                    if event.button == 0: # X
-                        self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_234_str[self.sprache]}')
-                        logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_234_str[self.sprache]}')
-                        for achse in self.Achsen_list:
-                            if achse.gamepad.isChecked() and 'PI-Achse' in achse.device_name and achse.Button_Link == 'PIx':
-                                if achse.Achse_steht: 
-                                    achse.fahre_rechts(True)
-                                    startzeit = datetime.datetime.now(datetime.timezone.utc).astimezone()
-                                    self.Riegel_dict.update({achse: [achse.time_Riegel, startzeit]})
-                            if achse.gamepad.isChecked() and 'Nemo-Achse-Linear' in achse.device_name and achse.Button_Link == 'HubS':
-                                achse.fahre_Hoch()
-                            if achse.gamepad.isChecked() and 'Educrys-Antrieb' in achse.device_name and achse.Button_Link == 'EduL':
-                                achse.fahre_links_K()
-
-                    if event.button == 1: # A
-                        self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_235_str[self.sprache]}')
-                        logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_235_str[self.sprache]}')
-                        for achse in self.Achsen_list:
-                            if achse.gamepad.isChecked() and 'PI-Achse' in achse.device_name and achse.Button_Link == 'PIy':
-                                if achse.Achse_steht: 
-                                    achse.fahre_rechts(True)
-                                    startzeit = datetime.datetime.now(datetime.timezone.utc).astimezone()
-                                    self.Riegel_dict.update({achse: [achse.time_Riegel, startzeit]})
-                            if achse.gamepad.isChecked() and 'Nemo-Achse-Rotation' in achse.device_name and achse.Button_Link == 'RotS':
-                                achse.fahre_ccw()
-                            if achse.gamepad.isChecked() and 'Educrys-Antrieb' in achse.device_name and achse.Button_Link == 'EduR':
-                                achse.fahre_rechts_K()
-
-                    if event.button == 2: # B
-                        self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_236_str[self.sprache]}')
-                        logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_236_str[self.sprache]}')
-                        for achse in self.Achsen_list: 
-                            if achse.gamepad.isChecked() and 'PI-Achse' in achse.device_name and achse.Button_Link == 'PIx':
-                                if achse.Achse_steht: 
-                                    achse.fahre_links(True)
-                                    startzeit = datetime.datetime.now(datetime.timezone.utc).astimezone()
-                                    self.Riegel_dict.update({achse: [achse.time_Riegel, startzeit]})
-                            if achse.gamepad.isChecked() and 'Nemo-Achse-Linear' in achse.device_name and achse.Button_Link == 'HubS':
-                                achse.fahre_Runter()
-                            if achse.gamepad.isChecked() and 'Educrys-Antrieb' in achse.device_name and achse.Button_Link == 'EduL':
-                                achse.fahre_rechts_K()
-                    
-                    if event.button == 3: # Y
-                        self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_237_str[self.sprache]}')
-                        logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_237_str[self.sprache]}')
-                        for achse in self.Achsen_list:
-                            if achse.gamepad.isChecked() and 'PI-Achse' in achse.device_name and achse.Button_Link == 'PIy':
-                                if achse.Achse_steht: 
-                                    achse.fahre_links(True)
-                                    startzeit = datetime.datetime.now(datetime.timezone.utc).astimezone()
-                                    self.Riegel_dict.update({achse: [achse.time_Riegel, startzeit]})
-                            if achse.gamepad.isChecked() and 'Nemo-Achse-Rotation' in achse.device_name and achse.Button_Link == 'RotS':
-                                achse.fahre_cw()
-                            if achse.gamepad.isChecked() and 'Educrys-Antrieb' in achse.device_name and achse.Button_Link == 'EduR':
-                                achse.fahre_links_K()
-                        
-                    if event.button == 4: # L
-                        self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_238_str[self.sprache]}')
-                        logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_238_str[self.sprache]}')
-                    
-                    if event.button == 5: # R
-                        self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_239_str[self.sprache]}')
-                        logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_239_str[self.sprache]}')
-                    
-                    if event.button == 8: # Select
-                        self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_240_str[self.sprache]}')
-                        logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_240_str[self.sprache]}')
-                        for achse in self.Achsen_list:
-                            if achse.gamepad.isChecked():
-                                achse.Stopp()
-
-                    if event.button == 9: # Start
-                        self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_241_str[self.sprache]}')
-                        logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_241_str[self.sprache]}')
-                        for achse in self.Achsen_list:
-                            if achse.gamepad.isChecked() and 'Educrys-Antrieb' in achse.device_name and achse.Button_Link == 'EduF':
-                                achse.fahre_links_K()
-                    
-                elif event.type == pygame.JOYAXISMOTION:
-                    if event.axis == 0:         # Links, Rechts
-                        if round(self.joystick.get_axis(0)) == 1: # Rechts
-                            self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_244_str[self.sprache]}')
-                            logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_244_str[self.sprache]}')
-                            for achse in self.Achsen_list:
-                                if achse.gamepad.isChecked() and 'PI-Achse' in achse.device_name and achse.Button_Link == 'PIh':
-                                    if achse.Achse_steht: 
-                                        achse.fahre_rechts(True)
-                                        startzeit = datetime.datetime.now(datetime.timezone.utc).astimezone()
-                                        self.Riegel_dict.update({achse: [achse.time_Riegel, startzeit]})
-                                if achse.gamepad.isChecked() and 'Nemo-Achse-Rotation' in achse.device_name and achse.Button_Link == 'RotT':
-                                    achse.fahre_ccw()
-                                if achse.gamepad.isChecked() and 'Educrys-Antrieb' in achse.device_name and achse.Button_Link == 'EduR':
-                                    achse.fahre_rechts_K()
-                        elif round(self.joystick.get_axis(0)) == -1: # Links
-                            self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_245_str[self.sprache]}')
-                            logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_245_str[self.sprache]}') 
-                            for achse in self.Achsen_list: 
-                                if achse.gamepad.isChecked() and 'PI-Achse' in achse.device_name and achse.Button_Link == 'PIh':
-                                    if achse.Achse_steht: 
-                                        achse.fahre_links(True)
-                                        startzeit = datetime.datetime.now(datetime.timezone.utc).astimezone()
-                                        self.Riegel_dict.update({achse: [achse.time_Riegel, startzeit]})
-                                if achse.gamepad.isChecked() and 'Nemo-Achse-Rotation' in achse.device_name and achse.Button_Link == 'RotT':
-                                    achse.fahre_cw()
-                                if achse.gamepad.isChecked() and 'Educrys-Antrieb' in achse.device_name and achse.Button_Link == 'EduR':
-                                    achse.fahre_links_K()
-                    
-                    if event.axis == 1:         # Auf, Runter
-                        if round(self.joystick.get_axis(1)) == 1: # Runter
-                            self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_243_str[self.sprache]}')
-                            logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_243_str[self.sprache]}')
-                            for achse in self.Achsen_list:
-                                if achse.gamepad.isChecked() and 'PI-Achse' in achse.device_name and achse.Button_Link == 'PIz':
-                                    if achse.Achse_steht: 
-                                        achse.fahre_rechts(True)
-                                        startzeit = datetime.datetime.now(datetime.timezone.utc).astimezone()
-                                        self.Riegel_dict.update({achse: [achse.time_Riegel, startzeit]})
-                                if achse.gamepad.isChecked() and 'Nemo-Achse-Linear' in achse.device_name and achse.Button_Link == 'HubT':
-                                    achse.fahre_Runter()
-                                if achse.gamepad.isChecked() and 'Educrys-Antrieb' in achse.device_name and achse.Button_Link == 'EduL':
-                                    achse.fahre_rechts_K()
-                        elif round(self.joystick.get_axis(1)) == -1: # Hoch
-                            self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_242_str[self.sprache]}')
-                            logger.debug(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {self.Log_Text_242_str[self.sprache]}')
-                            for achse in self.Achsen_list:
-                                if achse.gamepad.isChecked() and 'PI-Achse' in achse.device_name and achse.Button_Link == 'PIz':
-                                    if achse.Achse_steht: 
-                                        achse.fahre_links(True)
-                                        startzeit = datetime.datetime.now(datetime.timezone.utc).astimezone()
-                                        self.Riegel_dict.update({achse: [achse.time_Riegel, startzeit]})
-                                if achse.gamepad.isChecked() and 'Nemo-Achse-Linear' in achse.device_name and achse.Button_Link == 'HubT':
-                                    achse.fahre_Hoch()
-                                if achse.gamepad.isChecked() and 'Educrys-Antrieb' in achse.device_name and achse.Button_Link == 'EduL':
-                                    achse.fahre_links_K()
+            ## Wartezeit bis zur nächsten Sperrzeit (begrenzt):
+            warten = MAX_WARTEN
+            if self.Riegel_heap:
+                warten = min(warten, max(int((self.Riegel_heap[0][0] - time.monotonic()) * 1000) + 1, 0))
+            event = pygame.event.wait(warten)
+            start = time.perf_counter()
+
+            ## Abgelaufene Sperrzeiten:
+            jetzt = time.monotonic()
+            while self.Riegel_heap and self.Riegel_heap[0][0] <= jetzt:
+                ablauf, nummer, achse = heapq.heappop(self.Riegel_heap)
+                if self.Riegel_dict.get(achse) == ablauf:                       # Nicht durch erneutes Drücken ersetzt
+                    del self.Riegel_dict[achse]
+                    if achse.mode == 1:
+                        achse.entriegel_Knopf(True)
+                    self.messen(self.verspaetung, jetzt - ablauf)
+
+            if event.type == pygame.NOEVENT:
+                continue
+            logger.debug("%s - %s - %s %s", self.Log_Text_224_str[self.sprache], self.name, self.Log_Text_232_str[self.sprache], event)
+            if event.type == pygame.QUIT:
+                pygame.quit()
+            elif event.type == pygame.JOYBUTTONDOWN:
+                self.bearbeiten(('Knopf', event.button))
+            elif event.type == pygame.JOYAXISMOTION and event.axis in [0, 1]:
+                richtung = round(event.value)
+                if event.axis == 0 and richtung == 1:       self.bearbeiten(('Achse', 'Rechts'))
+                elif event.axis == 0 and richtung == -1:    self.bearbeiten(('Achse', 'Links'))
+                elif event.axis == 1 and richtung == 1:     self.bearbeiten(('Achse', 'Runter'))
+                elif event.axis == 1 and richtung == -1:    self.bearbeiten(('Achse', 'Hoch'))
+            self.messen(self.latenz, time.perf_counter() - start)
+
+    def bearbeiten(self, ereignis):
+        '''Führt die Funktionen der Achsen zu einem Ereignis aus (Tabelle)
+        
+        Args:
+            ereignis (tuple):       ('Knopf', Nummer) oder ('Achse', Richtung)
+        '''
+        if ereignis in self.ereignis_text:
+            text = self.ereignis_text[ereignis][self.sprache]
+            self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_224_str[self.sprache]} - {self.name} - {text}')
+            logger.debug('%s - %s - %s', self.Log_Text_224_str[self.sprache], self.name, text)
+        for achse, funktion, riegel in self.tabelle.get(ereignis, []):
+            if not achse.gamepad.isChecked():
+                continue
+            if not riegel:
+                funktion()
+            elif achse.Achse_steht:
+                funktion(True)
+                if achse.time_Riegel != 0:
+                    ablauf = time.monotonic() + achse.time_Riegel
+                    self.Riegel_dict[achse] = ablauf
+                    self.Riegel_nr += 1
+                    heapq.heappush(self.Riegel_heap, (ablauf, self.Riegel_nr, achse))
+
+    def messen(self, werte, dauer):
+        '''Speichert eine Zeit (Anzahl, Summe, Maximum)'''
+        werte[0] += 1
+        werte[1] += dauer
+        werte[2]  = max(werte[2], dauer)
 
     def ende(self):
         '''Beendet die Nutzung des Gamepads. Beendet While-Schleife!'''
         self.done = True
+        for name, (anzahl, summe, maximum) in [[self.Log_Text_246_str[self.sprache], self.latenz], [self.Log_Text_247_str[self.sprache], self.verspaetung]]:
+            if anzahl > 0:
+                logger.info(f"{self.Log_Text_224_str[self.sprache]} - {name} {self.Log_Text_225_str[self.sprache]} {anzahl}, {self.Log_Text_248_str[self.sprache]} {summe/anzahl*1000:.2f} ms, {self.Log_Text_249_str[self.sprache]} {maximum*1000:.2f} ms")
 
 ##########################################
 # Verworfen:
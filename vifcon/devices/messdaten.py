@@ -0,0 +1,362 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Gemeinsamer Messdaten-Schreiber für alle Geräte:
+- Die Messdaten-Dateien bleiben während der gesamten Messung geöffnet
+- Die Zeilen der Geräte werden im Speicher gesammelt und von einem eigenen Thread geschrieben
+- Geschrieben wird bei Erreichen einer Zeilen-Anzahl oder einer Zeit und beim Beenden der Anwendung
+- Mit fsync werden die Daten in einem einstellbaren Abstand auf die SD-Karte/Festplatte gebracht
+
+Die Sample-Threads hängen die Zeilen nur an einen Puffer an und warten somit nie auf die Festplatte.
+Die Dauer für das Anhängen wird pro Gerät gemessen und beim Beenden gelogged.
+
+Spalten-Format (optional, neben der csv-Datei):
+- Datei <Gerät>.vcol mit typisierten Spalten (float64), blockweise (Chunks) angehängt und mit zlib komprimiert
+- Kopf mit JSON-Metadaten: Gerät, Spalten-Namen, Einheiten, Zeitzone und Skalierungsfaktoren
+- time_abs wird als Unix-Zeit in s gespeichert, time_rel bleibt die Schlüssel-Spalte
+- Aufbau: MAGIC | uint32 Länge + JSON-Metadaten | Chunks: uint32 Zeilen, uint32 Spalten, uint32 Länge, zlib(Spalte für Spalte)
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Algemein:
+import logging
+import os
+import threading
+import time
+import datetime
+import json
+import struct
+import sys
+import zlib
+from array import array
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+SPALTEN_MAGIC   = b'VIFCOL\x01\n'        # Kennung und Version des Spalten-Formats
+SPALTEN_KOPF    = struct.Struct('<I')      # Länge der Metadaten
+SPALTEN_CHUNK   = struct.Struct('<III')    # Zeilen, Spalten, Länge der komprimierten Daten
+
+
+class Messdaten_Writer:
+    def __init__(self, sprache, flush_zeilen = 50, flush_zeit = 5, fsync_zeit = 60, spalten_format = False, skalierung = {}):
+        ''' Erstellung des Messdaten-Schreibers
+
+        Args:
+            sprache (int):          Sprache der GUI (Listenplatz)
+            flush_zeilen (int):     Anzahl gepufferter Zeilen (über alle Dateien) ab der geschrieben wird
+            flush_zeit (float):     Maximale Zeit in s, die eine Zeile im Puffer bleibt
+            fsync_zeit (float):     Abstand in s für fsync (0 - fsync bei jedem Schreiben)
+            spalten_format (bool):  True - Zusätzlich das Spalten-Format (.vcol) schreiben
+            skalierung (dict):      Skalierungsfaktoren der Plots (skalFak) für die Metadaten
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache        = sprache
+        self.flush_zeilen   = flush_zeilen
+        self.flush_zeit     = flush_zeit
+        self.fsync_zeit     = fsync_zeit
+        self.spalten_format = spalten_format
+        self.skalierung     = skalierung
+
+        ## Weitere:
+        self.dateien        = {}                    # Datei-Pfad: geöffnetes Datei-Objekt
+        self.spalten        = {}                    # Datei-Pfad (csv): Spalten_Datei
+        self.puffer         = {}                    # Datei-Pfad: Liste mit Zeilen
+        self.anz_Puffer     = 0                     # Anzahl der Zeilen in allen Puffern
+        self.latenz         = {}                    # Geräte-Name: [Anzahl, Summe, Maximum] der Zeit für schreiben()
+        self.anz_Flush      = 0
+        self.flush_max      = 0
+        self.letzter_fsync  = time.perf_counter()
+        self.done           = False
+
+        self.lock           = threading.Lock()      # Schutz des Puffers und der Statistik (Sample-Threads <-> Schreib-Thread <-> GUI)
+        self.event          = threading.Event()     # Weckt den Schreib-Thread vorzeitig
+        self.thread         = threading.Thread(target=self.event_Loop, name='Messdaten_Writer', daemon=True)
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_MW_1  = ['Messdaten-Writer - Einstellungen (Zeilen, Flush-Zeit, fsync-Zeit):',                   'Measurement data writer - Settings (rows, flush time, fsync time):']
+        self.Log_Text_MW_2  = ['Messdaten-Writer - Fehler beim Schreiben der Datei',                                   'Measurement data writer - Error writing the file']
+        self.Log_Text_MW_3  = ['Messdaten-Writer - Fehlergrund:',                                                      'Measurement data writer - Reason for error:']
+        self.Log_Text_MW_4  = ['Messdaten-Writer - Anzahl Flush:',                                                     'Measurement data writer - Number of flushes:']
+        self.Log_Text_MW_5  = ['Max. Flush-Dauer:',                                                                    'Max. flush duration:']
+        self.Log_Text_MW_6  = ['Messdaten-Writer - Latenz der Sample-Threads',                                         'Measurement data writer - Latency of the sample threads']
+        self.Log_Text_MW_7  = ['Zeilen',                                                                               'Rows']
+        self.Log_Text_MW_8  = ['Mittel/Max',                                                                           'Mean/Max']
+        self.Log_Text_MW_9  = ['ms',                                                                                   'ms']
+        self.Log_Text_MW_10 = ['Messdaten-Writer - Datei ist nicht angemeldet:',                                        'Measurement data writer - File is not registered:']
+
+        self.Log_Text_MW_11 = ['Messdaten-Writer - Spalten-Format (.vcol) aktiv!',                                     'Measurement data writer - Column format (.vcol) active!']
+
+        logger.info(f'{self.Log_Text_MW_1[self.sprache]} {self.flush_zeilen}, {self.flush_zeit} s, {self.fsync_zeit} s')
+        if self.spalten_format:
+            logger.info(self.Log_Text_MW_11[self.sprache])
+        self.thread.start()
+
+    ##########################################
+    # Schnittstelle für die Geräte:
+    ##########################################
+    def anmelden(self, datei, kopf):
+        ''' Erstellt die Datei, schreibt den Kopf und hält die Datei offen.
+
+        Args:
+            datei (str):    Pfad der Messdaten-Datei
+            kopf (str):     Einheiten- und Header-Zeile
+        '''
+        f = open(datei, "w", encoding="utf-8")
+        f.write(kopf)
+        f.flush()
+        if self.spalten_format:
+            try:
+                self.spalten[datei] = Spalten_Datei(f'{os.path.splitext(datei)[0]}.vcol', kopf, self.skalierung)
+            except Exception as e:
+                logger.warning(f'{self.Log_Text_MW_2[self.sprache]} {datei}')
+                logger.exception(self.Log_Text_MW_3[self.sprache])
+        with self.lock:
+            self.dateien[datei] = f
+            self.puffer[datei]  = []
+
+    def schreiben(self, datei, zeile, name):
+        ''' Hängt eine Zeile an den Puffer der Datei an (wird aus den Sample-Threads aufgerufen).
+
+        Args:
+            datei (str):    Pfad der Messdaten-Datei
+            zeile (str):    Fertige CSV-Zeile inklusive Zeilenumbruch
+            name (str):     Geräte-Name für die Latenz-Statistik
+        '''
+        start = time.perf_counter()
+        with self.lock:
+            if not datei in self.puffer:
+                logger.warning(f'{self.Log_Text_MW_10[self.sprache]} {datei}')
+                return
+            self.puffer[datei].append(zeile)
+            self.anz_Puffer += 1
+            voll = self.anz_Puffer >= self.flush_zeilen
+            ## Latenz:
+            dauer = time.perf_counter() - start
+            stat = self.latenz.setdefault(name, [0, 0, 0])
+            stat[0] += 1
+            stat[1] += dauer
+            stat[2] = max(stat[2], dauer)
+        if voll:
+            self.event.set()
+
+    ##########################################
+    # Schreib-Thread:
+    ##########################################
+    def event_Loop(self):
+        ''' Schreibt die Puffer zeit- oder mengengesteuert in die Dateien. '''
+        while not self.done:
+            self.event.wait(self.flush_zeit)
+            self.event.clear()
+            self.flush()
+
+    def flush(self, sync = False):
+        ''' Schreibt alle Puffer in die Dateien.
+
+        Args:
+            sync (bool):    True - fsync unabhängig von der fsync-Zeit ausführen
+        '''
+        ## Puffer tauschen, damit die Sample-Threads nicht auf das Schreiben warten:
+        with self.lock:
+            arbeit = {}
+            for datei in self.puffer:
+                if self.puffer[datei] != []:
+                    arbeit[datei] = self.puffer[datei]
+                    self.puffer[datei] = []
+            self.anz_Puffer = 0
+        if arbeit == {} and not sync:
+            return
+
+        start = time.perf_counter()
+        for datei in arbeit:
+            try:
+                f = self.dateien[datei]
+                f.write(''.join(arbeit[datei]))
+                f.flush()
+                if datei in self.spalten:
+                    self.spalten[datei].anhaengen(arbeit[datei])
+            except Exception as e:
+                logger.warning(f'{self.Log_Text_MW_2[self.sprache]} {datei}')
+                logger.exception(self.Log_Text_MW_3[self.sprache])
+        ## fsync:
+        jetzt = time.perf_counter()
+        if sync or jetzt - self.letzter_fsync >= self.fsync_zeit:
+            for datei in self.dateien:
+                try:
+                    os.fsync(self.dateien[datei].fileno())
+                    if datei in self.spalten:
+                        os.fsync(self.spalten[datei].datei.fileno())
+                except Exception as e:
+                    logger.warning(f'{self.Log_Text_MW_2[self.sprache]} {datei}')
+                    logger.exception(self.Log_Text_MW_3[self.sprache])
+            self.letzter_fsync = jetzt
+        dauer = time.perf_counter() - start
+        with self.lock:
+            self.anz_Flush += 1
+            self.flush_max = max(self.flush_max, dauer)
+
+    ##########################################
+    # Beenden:
+    ##########################################
+    def ende(self):
+        ''' Beendet den Schreib-Thread, schreibt den Rest, führt fsync aus und schließt alle Dateien (Aufruf in Controller.exit). '''
+        self.done = True
+        self.event.set()
+        self.thread.join()
+        self.flush(sync = True)
+        for datei in self.dateien:
+            try:
+                self.dateien[datei].close()
+                if datei in self.spalten:
+                    self.spalten[datei].datei.close()
+            except Exception as e:
+                logger.warning(f'{self.Log_Text_MW_2[self.sprache]} {datei}')
+                logger.exception(self.Log_Text_MW_3[self.sprache])
+        self.log_statistik()
+
+    def log_statistik(self):
+        ''' Schreibt die Latenz- und Flush-Statistik in das Logging. '''
+        ms = self.Log_Text_MW_9[self.sprache]
+        with self.lock:
+            anz_Flush, flush_max = self.anz_Flush, self.flush_max
+            latenz = {name: list(stat) for name, stat in self.latenz.items()}
+        logger.info(f'{self.Log_Text_MW_4[self.sprache]} {anz_Flush} - {self.Log_Text_MW_5[self.sprache]} {round(flush_max * 1000, 3)} {ms}')
+        for name in latenz:
+            anz, summe, maximum = latenz[name]
+            logger.info(f'{self.Log_Text_MW_6[self.sprache]} - {name}: {self.Log_Text_MW_7[self.sprache]} {anz}, {self.Log_Text_MW_8[self.sprache]} {round(summe / anz * 1000, 4)}/{round(maximum * 1000, 4)} {ms}')
+
+
+class Spalten_Datei:
+    def __init__(self, datei, kopf, skalierung = {}, modus = 'w'):
+        ''' Typisierte, blockweise komprimierte Spalten-Datei zu einer Messdaten-Datei
+
+        Args:
+            datei (str):        Pfad der Spalten-Datei (.vcol)
+            kopf (str):         Einheiten- und Header-Zeile der csv-Datei
+            skalierung (dict):  Skalierungsfaktoren der Plots (skalFak)
+            modus (str):        w - neu erstellen, a - an bestehende Datei anhängen
+        '''
+        ## Kopf der csv-Datei auswerten:
+        zeilen  = kopf.strip('\n').split('\n')
+        units   = zeilen[0].lstrip('#').strip().split(',')
+        header  = zeilen[1].split(',')
+        ### Letztes Komma in der csv-Datei erzeugt einen leeren Eintrag:
+        while header != [] and header[-1] == '':
+            header.pop()
+        units = (units + [''] * len(header))[0:len(header)]
+        if len(units) > 0 and units[0] == 'datetime':
+            units[0] = 's (Unix)'
+
+        self.spalten    = header
+        self.anz_Spalten = len(header)
+        self.datei      = open(datei, f'{modus}b')
+        if modus == 'w':
+            meta = {
+                'format':       'VIFCON-Spalten',
+                'version':      1,
+                'device':       os.path.splitext(os.path.basename(datei))[0],
+                'columns':      header,
+                'units':        units,
+                'key':          'time_rel',
+                'time_zone':    datetime.datetime.now(datetime.timezone.utc).astimezone().strftime('%z'),
+                'scaling':      skalierung,
+            }
+            meta_bytes = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+            self.datei.write(SPALTEN_MAGIC + SPALTEN_KOPF.pack(len(meta_bytes)) + meta_bytes)
+            self.datei.flush()
+
+    def anhaengen(self, zeilen):
+        ''' Hängt die csv-Zeilen als einen komprimierten Block an.
+
+        Args:
+            zeilen (list):  csv-Zeilen (time_abs, time_rel, Werte...)
+        '''
+        spalten = [array('d') for i in range(self.anz_Spalten)]
+        for zeile in zeilen:
+            werte = zeile.rstrip('\n').split(',')
+            for i in range(self.anz_Spalten):
+                if i < len(werte):  spalten[i].append(wert_umwandeln(werte[i], i == 0))
+                else:               spalten[i].append(float('nan'))
+        if sys.byteorder != 'little':
+            for spalte in spalten:
+                spalte.byteswap()
+        komprimiert = zlib.compress(b''.join([spalte.tobytes() for spalte in spalten]), 6)
+        self.datei.write(SPALTEN_CHUNK.pack(len(zeilen), self.anz_Spalten, len(komprimiert)) + komprimiert)
+        self.datei.flush()
+
+
+def wert_umwandeln(wert, zeitstempel = False):
+    ''' Wandelt einen csv-Eintrag in einen Float-Wert um.
+
+    Args:
+        wert (str):             Eintrag aus der csv-Datei
+        zeitstempel (bool):     True - Eintrag ist time_abs (ISO-Format) und wird zur Unix-Zeit
+    Return:
+        Float-Wert (Fehler: nan)
+    '''
+    try:
+        if zeitstempel:             return datetime.datetime.fromisoformat(wert).timestamp()
+        if wert == 'True':          return 1.0
+        if wert == 'False':         return 0.0
+        return float(wert)
+    except Exception:
+        return float('nan')
+
+def lese_spalten_datei(datei):
+    ''' Liest eine Spalten-Datei (.vcol) vollständig ein.
+
+    Args:
+        datei (str):    Pfad der Spalten-Datei
+    Return:
+        meta (dict):    Metadaten (Gerät, Spalten, Einheiten, Skalierung)
+        daten (dict):   Spalten-Name: array('d')
+    '''
+    with open(datei, 'rb') as f:
+        inhalt = f.read()
+    if not inhalt.startswith(SPALTEN_MAGIC):
+        raise ValueError(f'{datei}: no VIFCON column file')
+    pos = len(SPALTEN_MAGIC)
+    (meta_len,) = SPALTEN_KOPF.unpack_from(inhalt, pos)
+    pos += SPALTEN_KOPF.size
+    meta = json.loads(inhalt[pos:pos + meta_len].decode('utf-8'))
+    pos += meta_len
+
+    daten = {name: array('d') for name in meta['columns']}
+    namen = meta['columns']
+    while pos + SPALTEN_CHUNK.size <= len(inhalt):
+        anz_Zeilen, anz_Spalten, laenge = SPALTEN_CHUNK.unpack_from(inhalt, pos)
+        pos += SPALTEN_CHUNK.size
+        ## Abgebrochener letzter Block (z.B. Absturz) wird ignoriert:
+        if pos + laenge > len(inhalt):
+            break
+        block = zlib.decompress(inhalt[pos:pos + laenge])
+        pos += laenge
+        breite = anz_Zeilen * 8
+        for i in range(min(anz_Spalten, len(namen))):
+            teil = array('d')
+            teil.frombytes(block[i * breite:(i + 1) * breite])
+            if sys.byteorder != 'little':
+                teil.byteswap()
+            daten[namen[i]].extend(teil)
+    return meta, daten
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
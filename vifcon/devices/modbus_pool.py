@@ -0,0 +1,236 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Gemeinsame Modbus-TCP-Verbindungen (Pool) für die Nemo-Geräte:
+- Pro SPS (Host und Port) gibt es genau eine dauerhafte Verbindung, die sich alle Nemo-Geräte teilen
+- Anfragen der Geräte werden über einen Lock nacheinander auf der Verbindung ausgeführt
+- Bricht die Verbindung ab, wird sie in einem eigenen Thread mit wachsender Wartezeit (Backoff) neu aufgebaut
+- Solange die Verbindung unterbrochen ist, kehren Anfragen sofort mit None zurück (kein Warten im Sample-Thread)
+- Zählt Anfragen, Fehler, Abbrüche, Wiederverbindungen und die Ausfallzeit
+
+Die Verbindung verhält sich für die Geräte wie ein ModbusClient (pyModbusTCP):
+read_input_registers, write_single_coil, write_multiple_registers, open, close und is_open.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import threading
+import time
+from pyModbusTCP.client import ModbusClient
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+BACKOFF_START   = 0.1               # Erste Wartezeit in s vor dem Neuaufbau der Verbindung
+BACKOFF_MAX     = 5                 # Maximale Wartezeit in s zwischen zwei Versuchen
+
+VERBINDUNGEN    = {}                # (Host, Port): Modbus_Verbindung
+VERBINDUNGEN_LOCK = threading.Lock()
+
+
+def verbindung(sprache, schnittstelle):
+    ''' Gibt die gemeinsame Verbindung zur SPS zurück und erstellt sie beim ersten Aufruf.
+
+    Args:
+        sprache (int):          Sprache der GUI (Listenplatz)
+        schnittstelle (dict):   Konfiguration serial-interface (Parameter des ModbusClient)
+    Return:
+        Modbus_Verbindung
+    '''
+    schluessel = (schnittstelle.get('host', 'localhost'), schnittstelle.get('port', 502))
+    with VERBINDUNGEN_LOCK:
+        if not schluessel in VERBINDUNGEN:
+            VERBINDUNGEN[schluessel] = Modbus_Verbindung(sprache, schnittstelle)
+        return VERBINDUNGEN[schluessel]
+
+
+class Modbus_Verbindung:
+    def __init__(self, sprache, schnittstelle):
+        ''' Erstellung einer gemeinsamen Verbindung.
+
+        Args:
+            sprache (int):          Sprache der GUI (Listenplatz)
+            schnittstelle (dict):   Konfiguration serial-interface (Parameter des ModbusClient)
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache        = sprache
+        self.name           = f"{schnittstelle.get('host', 'localhost')}:{schnittstelle.get('port', 502)}"
+
+        ## Weitere:
+        self.client         = ModbusClient(**schnittstelle)
+        self.client.auto_open = False           # Das Öffnen übernimmt die Verbindung selbst (kein Warten in den Anfragen)
+        self.verbunden      = False
+        self.beendet        = False
+        self.abbruch_zeit   = 0                 # Zeitpunkt des Abbruchs (time.perf_counter)
+        self.lock           = threading.Lock()  # Eine Anfrage zur Zeit auf der Verbindung, Schutz von verbunden und der Statistik
+        self.thread         = None              # Thread für den Neuaufbau
+        ## Statistik:
+        self.anz_Anfragen   = 0
+        self.anz_Fehler     = 0                 # Anfragen ohne Antwort (auch Modbus-Fehler bei offener Verbindung)
+        self.anz_Abgelehnt  = 0                 # Anfragen während der Unterbrechung
+        self.anz_Abbrueche  = 0
+        self.anz_Verbunden  = 0                 # Erfolgreiche Neuaufbauten nach einem Abbruch
+        self.ausfall        = 0                 # Summe der Ausfallzeit in s
+        self.dauer_summe    = 0                 # Summe der Anfrage-Dauer in s
+        self.dauer_max      = 0
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_MP_1 = ['Modbus-Verbindung',                                                              'Modbus connection']
+        self.Log_Text_MP_2 = ['Verbindung unterbrochen! Neuaufbau im Hintergrund.',                             'Connection interrupted! Reconnecting in the background.']
+        self.Log_Text_MP_3 = ['Verbindung wieder hergestellt nach',                                             'Connection restored after']
+        self.Log_Text_MP_4 = ['Anfragen:',                                                                      'Requests:']
+        self.Log_Text_MP_5 = ['Fehler:',                                                                        'Errors:']
+        self.Log_Text_MP_6 = ['Abgelehnt:',                                                                     'Rejected:']
+        self.Log_Text_MP_7 = ['Abbrüche:',                                                                      'Interruptions:']
+        self.Log_Text_MP_8 = ['Wiederverbunden:',                                                               'Reconnected:']
+        self.Log_Text_MP_9 = ['Ausfallzeit:',                                                                   'Downtime:']
+        self.Log_Text_MP_10 = ['Anfrage-Dauer Mittel/Max:',                                                     'Request duration mean/max:']
+
+    ##########################################
+    # Verbindung:
+    ##########################################
+    @property
+    def is_open(self):
+        ''' Return: True - Verbindung steht (nach der letzten Anfrage) '''
+        return self.verbunden
+
+    def open(self):
+        ''' Öffnet die Verbindung.
+
+        Läuft bereits ein Neuaufbau im Hintergrund, wird nicht gewartet, sondern nur der Zustand zurückgegeben.
+
+        Return:
+            True - Verbindung offen
+        '''
+        if self.verbunden or self.neuaufbau_aktiv():
+            return self.verbunden
+        self.beendet = False
+        with self.lock:
+            self.verbunden = self.client.open()
+        return self.verbunden
+
+    def close(self):
+        ''' Schließt die Verbindung und beendet einen laufenden Neuaufbau. '''
+        self.beendet = True
+        with self.lock:
+            self.client.close()
+            self.verbunden = False
+
+    def neuaufbau_aktiv(self):
+        ''' Return: True - Der Neuaufbau läuft im Hintergrund '''
+        return not self.thread == None and self.thread.is_alive()
+
+    def abbruch(self):
+        ''' Verbindung als unterbrochen markieren und den Neuaufbau starten. '''
+        with self.lock:
+            if not self.verbunden:
+                return
+            self.verbunden      = False
+            self.abbruch_zeit   = time.perf_counter()
+            self.anz_Abbrueche += 1
+        logger.warning(f'{self.Log_Text_MP_1[self.sprache]} {self.name} - {self.Log_Text_MP_2[self.sprache]}')
+        if not self.beendet and not self.neuaufbau_aktiv():
+            self.thread = threading.Thread(target=self.neuaufbau, name=f'Modbus_{self.name}', daemon=True)
+            self.thread.start()
+
+    def neuaufbau(self):
+        ''' Thread: Baut die Verbindung mit wachsender Wartezeit neu auf. '''
+        warten = BACKOFF_START
+        while not self.beendet:
+            time.sleep(warten)
+            if self.beendet:
+                break
+            ## Während der Unterbrechung nutzt keine Anfrage den Client, das Öffnen (bis zum Timeout) blockiert somit niemanden:
+            self.client.close()
+            offen = self.client.open()
+            with self.lock:
+                if self.beendet:
+                    self.client.close()
+                    break
+                if offen:
+                    dauer = time.perf_counter() - self.abbruch_zeit
+                    self.ausfall       += dauer
+                    self.anz_Verbunden += 1
+                    self.verbunden      = True
+                    self.abbruch_zeit   = 0
+            if offen:
+                logger.info(f'{self.Log_Text_MP_1[self.sprache]} {self.name} - {self.Log_Text_MP_3[self.sprache]} {dauer:.2f} s')
+                break
+            warten = min(2 * warten, BACKOFF_MAX)
+
+    ##########################################
+    # Anfragen:
+    ##########################################
+    def anfrage(self, funktion, *args):
+        ''' Führt eine Anfrage auf der Verbindung aus.
+
+        Args:
+            funktion (str):     Name der Funktion des ModbusClient
+            args:               Parameter der Funktion
+        Return:
+            Antwort des ModbusClient (None - keine Verbindung oder Fehler)
+        '''
+        if not self.verbunden:
+            with self.lock:
+                self.anz_Abgelehnt += 1
+            return None
+        with self.lock:
+            if not self.verbunden:
+                self.anz_Abgelehnt += 1
+                return None
+            start = time.perf_counter()
+            ans = getattr(self.client, funktion)(*args)
+            dauer = time.perf_counter() - start
+            offen = self.client.is_open
+            self.anz_Anfragen += 1
+            self.dauer_summe  += dauer
+            self.dauer_max     = max(self.dauer_max, dauer)
+            if ans == None or ans == False:
+                self.anz_Fehler += 1
+        if ans == None or ans == False:
+            ## pyModbusTCP schließt den Socket bei Timeout und Verbindungsfehlern (Modbus-Fehler lassen ihn offen):
+            if not offen:
+                self.abbruch()
+        return ans
+
+    def read_input_registers(self, start, anzahl):
+        return self.anfrage('read_input_registers', start, anzahl)
+
+    def write_single_coil(self, register, wert):
+        return self.anfrage('write_single_coil', register, wert)
+
+    def write_multiple_registers(self, register, werte):
+        return self.anfrage('write_multiple_registers', register, werte)
+
+    ##########################################
+    # Statistik:
+    ##########################################
+    def log_statistik(self):
+        ''' Schreibt die Zähler der Verbindung in das Logging. '''
+        ausfall = self.ausfall
+        if self.abbruch_zeit != 0:
+            ausfall += time.perf_counter() - self.abbruch_zeit
+        mittel = self.dauer_summe / self.anz_Anfragen if self.anz_Anfragen > 0 else 0
+        logger.info(f'{self.Log_Text_MP_1[self.sprache]} {self.name} - {self.Log_Text_MP_4[self.sprache]} {self.anz_Anfragen}, {self.Log_Text_MP_5[self.sprache]} {self.anz_Fehler}, {self.Log_Text_MP_6[self.sprache]} {self.anz_Abgelehnt}, {self.Log_Text_MP_7[self.sprache]} {self.anz_Abbrueche}, {self.Log_Text_MP_8[self.sprache]} {self.anz_Verbunden}, {self.Log_Text_MP_9[self.sprache]} {ausfall:.2f} s, {self.Log_Text_MP_10[self.sprache]} {1000*mittel:.1f}/{1000*self.dauer_max:.1f} ms')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
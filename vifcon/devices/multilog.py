@@ -5,6 +5,11 @@
 Verbindung mit Multilog
 - In Zusammenarbeit mit Felix Osterle, Studentische Hilfskraft im IKZ - Gruppe: Modellexperimente (Student an der TU Berlin)
 - Vorlage für die Verknüpfung stammt von Felix Osterle
+- Event-Loop mit selectors: Alle Send- und Read-Ports werden gleichzeitig bedient, eine stille Verbindung blockiert keine andere
+- Verbindungen werden im Hintergrund angenommen (auch erneut nach einer Trennung durch Multilog)
+- Empfangene Bytes werden gepuffert: Trigger-Wörter und JSON-Dokumente werden erst bei Vollständigkeit bearbeitet
+- Die Latenz jedes Triggers wird gemessen und beim Beenden in das Logging geschrieben
+- Rahmen (Multilog_extra|framing, payload): alter JSON-Modus oder versionierter Rahmen mit Längenangabe (siehe multilog_frame.py)
 '''
 
 # ++++++++++++++++++++++++++++
@@ -20,7 +25,11 @@ from PyQt5.QtCore import (
 ## Algemein:
 import logging
 import socket                       # TCP-Verbindungen
-import json                         # Dicts zu String
+import selectors                    # Überwachung aller Sockets
+import time
+
+## Eigene:
+from .multilog_frame import Multilog_Rahmen, Rahmen_Leser
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -29,7 +38,7 @@ logger = logging.getLogger(__name__)
 
 
 class Multilog(QObject):
-    def __init__(self, sprache, ports_send, ports_read, Ablauf_Funktion, widget_dict, device_dict, trigger_dict_sM, trigger_dict_rM, timeout, connection_Errorcase):
+    def __init__(self, sprache, ports_send, ports_read, Ablauf_Funktion, widget_dict, device_dict, trigger_dict_sM, trigger_dict_rM, timeout, connection_Errorcase, framing = 'json', payload = 'json'):
         ''' Erstellung einer Verbindung zum IKZ System Multilog
         
         Args:
@@ -41,6 +50,10 @@ class Multilog(QObject):
             device_dict (dict):         Dictionary mit allen Geräte-Schnittstellen
             trigger_dict_sM (dict):     Dictionary mit allen Triggern für das senden an Multilog
             trigger_dict_rM (dict):     Dictionary mit allen Triggern für das Empfangen von Werten von Multilog
+            timeout (int):              Timeout für den Verbindungsaufbau und die Antworten in s
+            connection_Errorcase (int): Verhalten bei fehlender Verbindung (1 - Exit, 2 - Start ohne Port)
+            framing (str):              Senden an Multilog: 'json' (ohne Rahmen) oder 'frame'
+            payload (str):              Nutzlast im Rahmen: 'json', 'msgpack' oder 'struct'
         '''
         super().__init__()
 
@@ -98,6 +111,11 @@ class Multilog(QObject):
         self.Log_Text_PETOF_str =   ['Fehlergrund (Port-Verbindungsfehler):',                                                           'Reason for error (port connection error):']
         self.Log_Text_PETOE_str =   ['VIFCON wird wegen des Multilog-Port-Verbindungsfehlers geschlossen!',                             'VIFCON is closed due to multilog port connection error!']
         self.Log_Text_PETOP_str =   ['Der PID-Regler wird gesperrt! Gerät:',                                                            'The PID controller is locked! Device:']
+        self.Log_Text_ML_1      =   ['Warte auf neue Verbindung - Port:',                                                               'Waiting for new connection - Port:']
+        self.Log_Text_ML_2      =   ['Keine Antwort innerhalb des Timeouts, Anfrage wird wiederholt:',                                  'No response within the timeout, request is repeated:']
+        self.Log_Text_ML_3      =   ['Latenz Trigger',                                                                                  'Latency trigger']
+        self.Log_Text_ML_4      =   ['Mittelwert:',                                                                                     'Mean:']
+        self.Log_Text_ML_5      =   ['Maximum:',                                                                                        'Maximum:']
 
         #--------------------------------------- 
         # Informationen 1:
@@ -108,6 +126,14 @@ class Multilog(QObject):
         for n in self.trigger_read:
             self.trigger_read_List.append(self.trigger_read[n])
 
+        ## Rahmen und vorberechnete Geräte je Trigger (Senden):
+        self.rahmen = Multilog_Rahmen(self.sprache, framing, payload)
+        self.trigger_geraete = {}
+        for device in self.trigger_send:
+            self.trigger_geraete.setdefault(self.trigger_send[device], []).append(device)
+        for trigger in self.trigger_geraete:
+            self.rahmen.schema(trigger, self.trigger_geraete[trigger])
+
         ## Logging-Infos:
         logger.info(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_187_str[self.sprache]}")
         logger.info(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_188_str[self.sprache]} {portList_send}")
@@ -153,36 +179,29 @@ class Multilog(QObject):
         #--------------------------------------------------
         # Multilog Verbindungsaufbau 1 & Informationen 2:
         #--------------------------------------------------
-        self.connectList            = []
-        ReadSend                    = {}
-        self.ReadSend_Connection    = {}
-        self.Trigger_Connection     = {}
-        portList                    = []
+        self.selector               = selectors.DefaultSelector()   # Überwacht alle Server- und Verbindungs-Sockets gleichzeitig
+        self.server                 = {}                            # Port: Server-Socket
+        self.connectList            = []                            # Bestehende Verbindungen
+        self.latenz                 = {}                            # Trigger: [Anzahl, Summe in s, Maximum in s]
+        self.ReadSend               = {}
         for n in portList_send:
-            ReadSend.update({n:'Send'})
-            portList.append(n)
+            self.ReadSend.update({n:'Send'})
         for n in portList_read:
-            ReadSend.update({n:'Read'})
-            portList.append(n)
+            self.ReadSend.update({n:'Read'})
 
-        portList.sort()                                             # Liste der Ports muss sortiert sein!
         if not error:
-            for port in portList:
-                c, a = self.create_socket(port)                     # Erstellen einer neuen Verbindung
-                if not c == '':
-                    logger.info(f"{self.Log_Text_186_str[self.sprache]} - {port}{self.Log_Text_192_str[self.sprache]} {c} {self.Log_Text_193_str[self.sprache]} {a}")
-                    self.connectList.append(c)                      # Verbindung zu einer Liste hinzufügen
-                    self.ReadSend_Connection.update({c:ReadSend[port]})
-                    if self.ReadSend_Connection[c] == 'Read':
-                        self.Trigger_Connection.update({c:trigger_dict_rM[port]})
-                else:
-                   ### Bei Read-Port soll PID-Regler gesperrt werden:
-                   if ReadSend[port] == 'Read':
-                       name_device = self.trigger_read[port][1]
-                       self.device_widget[name_device].PID_Aktiv  = False
-                       self.device_schnitt[name_device].PID_Aktiv = False
-                       self.device_widget[name_device].PID_cb.setEnabled(False)
-                       logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_PETOP_str[self.sprache]} {name_device}")
+            for port in sorted(self.ReadSend):
+                self.create_socket(port)                            # Server-Socket (nicht blockierend) erstellen
+            self.verbindungen_warten()                              # Alle Ports gleichzeitig bis zum Timeout annehmen
+            ### Bei fehlendem Read-Port soll PID-Regler gesperrt werden:
+            verbunden = [self.selector.get_key(c).data['port'] for c in self.connectList]
+            for port in self.server:
+                if not port in verbunden and self.ReadSend[port] == 'Read':
+                    name_device = self.trigger_read[port][1]
+                    self.device_widget[name_device].PID_Aktiv  = False
+                    self.device_schnitt[name_device].PID_Aktiv = False
+                    self.device_widget[name_device].PID_cb.setEnabled(False)
+                    logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_PETOP_str[self.sprache]} {name_device}")
         else:
             logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_210_str[self.sprache]}")
             self.done = True
@@ -191,36 +210,92 @@ class Multilog(QObject):
     # Multilog Verbindungsaufbau 2:
     ##########################################
     def create_socket(self, TCP_PORT):
-        '''Erstellt die Verbindung zum TCP Port
+        '''Erstellt den Server-Socket für einen TCP Port (Verbindungen werden in der Event-Loop angenommen)
         
         Args:
             TCP_PORT (int):         Port aus der Config
-        Return:
-            connection (objekt):    Verbindung (<class 'socket.socket'>)            - neues Objekt zum Senden und Empfangen von Daten über die Verbindung
-            address (tuple):        Adresse (raddr z.B. ('172.18.52.219', 62576))   - Adresse die an den Socket am anderen Ende der Verbindung gebunden ist
-                                                                                    -> Quelle: https://docs.python.org/3/library/socket.html#socket.socket.accept
         '''
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:    # durch with, kann auf das close verzichtet werden
-            server_socket.settimeout(self.timeout)                                  # Setze ein Timeout
-            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            server_socket.bind(('', TCP_PORT))                                      # Eine bestimmte IP muss nur in Mutilog angegeben werden
-            server_socket.listen(1)
-            logging.warning(f'{self.Log_Text_209_str[self.sprache]} {TCP_PORT}')
-            try:    connection, address = server_socket.accept()                    # Verbindungsaufbau    
-            except Exception as e:                                                  # Timeout sorgt für einen Fehler und löst Except aus
-                logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_PETO_str[self.sprache]} {TCP_PORT}")
-                logger.exception(f'{self.Log_Text_PETOF_str[self.sprache]}')
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server_socket.bind(('', TCP_PORT))                                          # Eine bestimmte IP muss nur in Mutilog angegeben werden
+        server_socket.listen(1)
+        server_socket.setblocking(False)
+        self.selector.register(server_socket, selectors.EVENT_READ, {'art': 'Server', 'port': TCP_PORT})
+        self.server[TCP_PORT] = server_socket
+        logging.warning(f'{self.Log_Text_209_str[self.sprache]} {TCP_PORT}')
+
+    def verbindungen_warten(self):
+        '''Wartet beim Start auf die Verbindungen aller Ports gleichzeitig (ein Timeout für alle Ports)'''
+        ende_zeit = time.monotonic() + self.timeout
+        while len(self.connectList) < len(self.server) and time.monotonic() < ende_zeit:
+            for key, events in self.selector.select(timeout = ende_zeit - time.monotonic()):
+                self.ereignis(key, events)                                          # Bereits verbundene Ports werden schon bedient
+        verbunden = [self.selector.get_key(c).data['port'] for c in self.connectList]
+        for port in self.server:
+            if not port in verbunden:
+                logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_PETO_str[self.sprache]} {port}")
                 if self.Error_Case == 1:                                            # Error Case 1: Programm wird beendet
                     logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_PETOE_str[self.sprache]}")
-                    exit()                                                          
-                elif self.Error_Case == 2:                                          # Error Case 1: Programm wird gestartet aber ohne den Trigger   
-                    connection, address = '',''
-            server_socket.settimeout(None)                      
-        return connection, address 
+                    exit()
+                                                                                    # Error Case 2: Programm wird gestartet, der Port wird im Hintergrund weiter angenommen
+
+    def annehmen(self, key):
+        '''Nimmt eine Verbindung von Multilog an einem Server-Socket an
+        
+        Args:
+            key (SelectorKey):      Schlüssel des Server-Sockets
+        '''
+        port = key.data['port']
+        try:    connection, address = key.fileobj.accept()                          # Verbindungsaufbau
+        except BlockingIOError:
+            return
+        connection.setblocking(False)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)           # Kleine Antworten sofort senden (kein Warten auf ACK)
+        daten = {'art': self.ReadSend[port], 'port': port, 'ein': b'', 'aus': b'', 'anfrage': None, 'leser': Rahmen_Leser(self.sprache)}
+        self.selector.register(connection, selectors.EVENT_READ, daten)
+        self.selector.unregister(key.fileobj)                                       # Nur eine Verbindung pro Port (listen(1))
+        self.connectList.append(connection)
+        logger.info(f"{self.Log_Text_186_str[self.sprache]} - {port}{self.Log_Text_192_str[self.sprache]} {connection} {self.Log_Text_193_str[self.sprache]} {address}")
+        if daten['art'] == 'Read':
+            self.HoleData(connection)
+        else:
+            self.rahmen.neu_verbunden()                                             # Schema (struct) erneut senden
+
+    def trennen(self, c, grund = ''):
+        '''Trennt eine Verbindung, der Port nimmt danach wieder eine Verbindung an
+        
+        Args:
+            c (<class 'socket.socket'>):        Verbindung
+            grund (str):                        Text für das Logging
+        '''
+        port = self.selector.get_key(c).data['port']
+        self.selector.unregister(c)
+        self.connectList.remove(c)
+        c.close()
+        if not self.done:
+            self.selector.register(self.server[port], selectors.EVENT_READ, {'art': 'Server', 'port': port})
+            logger.info(f"{self.Log_Text_186_str[self.sprache]} - {grund} {self.Log_Text_ML_1[self.sprache]} {port}")
 
     ##########################################
     # Daten besorgen und weitersenden:
     ##########################################
+    def senden(self, c, data):
+        '''Hängt Daten an den Ausgangspuffer einer Verbindung und sendet so viel wie möglich
+        
+        Args:
+            c (<class 'socket.socket'>):        Verbindung
+            data (bytes):                       Daten
+        '''
+        key = self.selector.get_key(c)
+        key.data['aus'] += data
+        try:
+            gesendet = c.send(key.data['aus'])
+            key.data['aus'] = key.data['aus'][gesendet:]
+        except BlockingIOError:
+            pass
+        ## Rest wird gesendet, sobald der Socket wieder schreibbar ist:
+        self.selector.modify(c, selectors.EVENT_READ | (selectors.EVENT_WRITE if key.data['aus'] else 0), key.data)
+
     def sendData(self, c, trigger):
         '''Hole und Sende Daten
         
@@ -228,68 +303,158 @@ class Multilog(QObject):
             c (<class 'socket.socket'>):        Verbindung
             trigger (str):                      Trigger Wort
         '''
-        logger.debug(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_194_str[self.sprache]} {trigger} {self.Log_Text_195_str[self.sprache]} {c}")
-
-        # Trigger ist in Liste:
-        if trigger in self.trigger_send_List :
-            deviceJSON = ""
-            for device in self.trigger_send:
-                if trigger == self.trigger_send[device]:
-                    data_ak = self.device_widget[device].data
-                    logger.debug(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_196_str[self.sprache]} ({trigger}) {data_ak}")
-                    deviceJSON += json.dumps(data_ak) 
-
-            data = bytes(deviceJSON,encoding="utf-8")       # Dict zu String zu Bianry
-            c.sendall(data)                                 # Dict senden
-        # Client (Multilog) wurde beendet bzw. die Verbindung wurde getrennt --> Leerer Stirng:
-        elif trigger == '' and not self.done:
-            logger.info(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_200_str[self.sprache]}")
-            self.ende()
-        # Trigger ist nicht in Liste:
-        elif not trigger in self.trigger_send_List  and not self.done:
-            logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_197_str[self.sprache]} {trigger}")
-            logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_198_str[self.sprache]} {self.trigger_send_List }")
-            logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_202_str[self.sprache]} {c}")
-            self.connectList.remove(c)                      # Entfernt Verbindung des falschen Triggers!
-            
-    def HoleData(self, c, trigger_Device):
-        '''Hole Daten von Multilog und gebe sie ans richtige Gerät!
+        logger.debug("%s - %s %s %s %s", self.Log_Text_186_str[self.sprache], self.Log_Text_194_str[self.sprache], trigger, self.Log_Text_195_str[self.sprache], c)
+        start = time.perf_counter()
+        daten_liste = [self.device_widget[device].data for device in self.trigger_geraete[trigger]]
+        logger.debug("%s - %s (%s) %s", self.Log_Text_186_str[self.sprache], self.Log_Text_196_str[self.sprache], trigger, daten_liste)
+        data = self.rahmen.kodieren(trigger, daten_liste)   # Dicts zu Binary (JSON oder Rahmen)
+        self.senden(c, data)                                # Daten senden
+        self.latenz_messen(trigger, time.perf_counter() - start)
+
+    def Trigger_lesen(self, c):
+        '''Zerlegt die empfangenen Bytes einer Send-Verbindung in Trigger-Wörter (mehrere oder geteilte Trigger möglich)
+        
+        Args:
+            c (<class 'socket.socket'>):        Verbindung
+        '''
+        key = self.selector.get_key(c)
+        while key.data['ein']:
+            text = key.data['ein'].decode('utf-8', errors = 'replace')
+            passend = [trigger for trigger in self.trigger_send_List if text.startswith(trigger)]
+            if passend != []:
+                trigger = max(passend, key = len)                                   # Längster passender Trigger
+                key.data['ein'] = key.data['ein'][len(trigger.encode('utf-8')):]
+                self.sendData(c, trigger)                                           # erstelle und sende die Daten
+            elif any([trigger.startswith(text) for trigger in self.trigger_send_List]):
+                break                                                               # Trigger ist noch nicht vollständig
+            else:
+                # Trigger ist nicht in Liste:
+                logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_197_str[self.sprache]} {text}")
+                logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_198_str[self.sprache]} {self.trigger_send_List }")
+                logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_202_str[self.sprache]} {c}")
+                self.trennen(c)                                                     # Entfernt Verbindung des falschen Triggers!
+                break
+
+    def HoleData(self, c):
+        '''Sende den Trigger an Multilog (Anfrage) - die Antwort wird in der Event-Loop gelesen
         
         Args:
             c (<class 'socket.socket'>):        Verbindung
-            trigger_Device (list):              Trigger Wort, Geräte-Name
         '''
+        key = self.selector.get_key(c)
+        key.data['anfrage'] = time.perf_counter()
+        self.senden(c, bytes(self.trigger_read[key.data['port']][0], 'UTF-8'))
+
+    def Antwort_lesen(self, c):
+        '''Liest vollständige Dokumente (JSON oder Rahmen) aus den empfangenen Bytes und gibt sie ans richtige Gerät!
+        
+        Args:
+            c (<class 'socket.socket'>):        Verbindung
+        '''
+        key = self.selector.get_key(c)
+        trigger_Device = self.trigger_read[key.data['port']]
         try:
-            c.send(bytes(trigger_Device[0], 'UTF-8'))
-            received = c.recv(1024)
-            received = received.decode("utf-8")
-            data = json.loads(received)
-            logger.debug(f'{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_MD_1[self.sprache]} {data} {self.Log_Text_MD_2[self.sprache]} {trigger_Device[1]}')
-            self.device_schnitt[trigger_Device[1]].mult_data.update(data)
+            dokumente = key.data['leser'].lesen(key.data['ein'])
         except Exception as e:
+            key.data['leser'] = Rahmen_Leser(self.sprache)
+            dokumente = []
             logger.exception(f'{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_201_str[self.sprache]} - {self.Log_Text_rM[self.sprache]}{c}, {trigger_Device}')
+        key.data['ein'] = b''                                                       # Puffer liegt im Leser
+        if dokumente == []:
+            return                                                                  # Dokument ist noch nicht vollständig
+        for data in dokumente:
+            try:
+                logger.debug('%s - %s %s %s %s', self.Log_Text_186_str[self.sprache], self.Log_Text_MD_1[self.sprache], data, self.Log_Text_MD_2[self.sprache], trigger_Device[1])
+                self.device_schnitt[trigger_Device[1]].mult_data.update(data)
+            except Exception as e:
+                logger.exception(f'{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_201_str[self.sprache]} - {self.Log_Text_rM[self.sprache]}{c}, {trigger_Device}')
+        self.latenz_messen(trigger_Device[0], time.perf_counter() - key.data['anfrage'])
+        self.HoleData(c)                                                            # Nächste Anfrage
+
+    ##########################################
+    # Latenz:
+    ##########################################
+    def latenz_messen(self, trigger, dauer):
+        '''Speichert die Latenz eines Triggers (Send: Trigger bis Daten gesendet, Read: Anfrage bis Antwort)
+        
+        Args:
+            trigger (str):          Trigger Wort
+            dauer (float):          Latenz in s
+        '''
+        werte = self.latenz.setdefault(trigger, [0, 0, 0])
+        werte[0] += 1
+        werte[1] += dauer
+        werte[2]  = max(werte[2], dauer)
+        logger.debug("%s - %s %s: %.2f ms", self.Log_Text_186_str[self.sprache], self.Log_Text_ML_3[self.sprache], trigger, dauer*1000)
+
+    def latenz_bericht(self):
+        '''Schreibt die Latenz aller Trigger (Anzahl, Mittelwert, Maximum) in das Logging'''
+        for trigger, (anzahl, summe, maximum) in self.latenz.items():
+            logger.info(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_ML_3[self.sprache]} {trigger}: {self.Log_Text_211_str[self.sprache]} {anzahl}, {self.Log_Text_ML_4[self.sprache]} {summe/anzahl*1000:.2f} ms, {self.Log_Text_ML_5[self.sprache]} {maximum*1000:.2f} ms")
             
     ##########################################
-    # Endlosschleife und Endfunktion:
+    # Event-Loop und Endfunktion:
     ##########################################
     def event_Loop(self):
-        '''Endlosschleife: Empfang der Trigger und Senden der Daten'''
+        '''Event-Loop: Annahme der Verbindungen, Empfang der Trigger und Senden der Daten (alle Ports gleichzeitig)'''
         while not self.done:
             try:
-                for c in self.connectList:                  # gehe jede Verbindung die besteht durch
-                    if self.ReadSend_Connection[c] == 'Send':
-                        trigger = c.recv(1024).decode('utf-8')  # warte auf Triggerwort und lese dieses
-                        self.sendData(c, trigger)               # erstelle und sende die Daten
-                    elif self.ReadSend_Connection[c] == 'Read':
-                        self.HoleData(c, self.Trigger_Connection[c])
+                for key, events in self.selector.select(timeout = 0.1):             # Nur Sockets mit Ereignis (kein Warten auf stille Verbindungen)
+                    if self.done:
+                        break
+                    self.ereignis(key, events)
+                ## Keine Antwort auf eine Anfrage (Read) innerhalb des Timeouts:
+                jetzt = time.perf_counter()
+                for c in list(self.connectList):
+                    key = self.selector.get_key(c)
+                    if key.data['art'] == 'Read' and not key.data['anfrage'] == None and jetzt - key.data['anfrage'] > self.timeout:
+                        logger.warning(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_ML_2[self.sprache]} {self.trigger_read[key.data['port']]}")
+                        key.data['leser'] = Rahmen_Leser(self.sprache)
+                        self.HoleData(c)
             except Exception as e:
                 logger.exception(f'{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_201_str[self.sprache]}')
+        ## Sockets schließen:
+        for c in list(self.connectList):
+            self.trennen(c)
+        for port in self.server:
+            self.server[port].close()
+        self.selector.close()
     
+    def ereignis(self, key, events):
+        '''Bearbeitet das Ereignis eines Sockets
+        
+        Args:
+            key (SelectorKey):      Schlüssel des Sockets
+            events (int):           Ereignisse (EVENT_READ, EVENT_WRITE)
+        '''
+        if key.data['art'] == 'Server':
+            self.annehmen(key)
+            return
+        c = key.fileobj
+        if events & selectors.EVENT_WRITE:
+            self.senden(c, b'')                                                     # Rest des Ausgangspuffers senden
+        if events & selectors.EVENT_READ:
+            try:    data = c.recv(4096)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:                                                         # z.B. Verbindung von Multilog zurückgesetzt
+                data = b''
+            # Client (Multilog) wurde beendet bzw. die Verbindung wurde getrennt --> Leere Bytes:
+            if data == b'':
+                self.trennen(c, self.Log_Text_200_str[self.sprache])
+                return
+            key.data['ein'] += data
+            if key.data['art'] == 'Send':
+                self.Trigger_lesen(c)
+            else:
+                self.Antwort_lesen(c)
+
     def ende(self):
-        '''Setzt While-Schleifen Bedingung auf True und beendet so Endlosschleife!'''
+        '''Setzt While-Schleifen Bedingung auf True und beendet so die Event-Loop!'''
         self.done = True
         self.add_Text_To_Ablauf_Datei(f'{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_199_str[self.sprache]}')
         logger.info(f"{self.Log_Text_186_str[self.sprache]} - {self.Log_Text_199_str[self.sprache]}")
+        self.latenz_bericht()
 
 
 ##########################################
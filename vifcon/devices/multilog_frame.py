@@ -0,0 +1,250 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Rahmen (Framing) für den Datenaustausch mit Multilog:
+- Modus 'json' (Standard, alt):  JSON-Dokumente ohne Trennzeichen (ein Dokument pro Gerät beim Senden)
+- Modus 'frame':                 Versionierter Rahmen mit Längenangabe, Nutzlast JSON, msgpack (optional) oder struct
+
+Aufbau eines Rahmens (Netzwerk-Byte-Reihenfolge, 12 Byte Kopf):
+    Kennung  4s  b'VFML'
+    Version  B   1
+    Art      B   0 - JSON, 1 - msgpack, 2 - struct (float64), 3 - Schema (JSON)
+    Schema   H   Nummer des Schemas (nur struct, sonst 0)
+    Länge    I   Länge der Nutzlast in Byte
+
+Nutzlast JSON/msgpack: {Gerät: Daten-Dict}
+Nutzlast struct:       Werte als float64 in der Reihenfolge des Schemas (None -> NaN)
+Nutzlast Schema:       JSON-Liste [[Gerät, Schlüssel], ...] - wird vor dem ersten struct-Rahmen und bei jeder Änderung der Schlüssel gesendet
+
+Der Leser erkennt beide Modi selbst (Kennung oder JSON), Antworten von Multilog können daher weiterhin JSON sein.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import struct
+import json
+import math
+
+try:
+    import msgpack                  # Optional - nur für die Nutzlast msgpack
+except ImportError:
+    msgpack = None
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+KENNUNG     = b'VFML'
+VERSION     = 1
+KOPF        = struct.Struct('!4sBBHI')
+ART_JSON, ART_MSGPACK, ART_STRUCT, ART_SCHEMA = 0, 1, 2, 3
+MAX_PUFFER  = 1024 * 1024           # Maximale Größe eines Dokuments bzw. Rahmens in Bytes (darüber wird der Puffer verworfen)
+
+
+def rahmen(art, nutzlast, schema = 0):
+    ''' Erstellt einen Rahmen (Kopf + Nutzlast).
+
+    Args:
+        art (int):          Art der Nutzlast
+        nutzlast (bytes):   Nutzlast
+        schema (int):       Nummer des Schemas (struct)
+    Return:
+        Rahmen (bytes)
+    '''
+    return KOPF.pack(KENNUNG, VERSION, art, schema, len(nutzlast)) + nutzlast
+
+
+class Trigger_Schema:
+    def __init__(self, trigger, geraete):
+        ''' Vorberechnetes Schema eines Triggers (Geräte und deren Schlüssel, struct-Format).
+
+        Args:
+            trigger (str):      Trigger Wort
+            geraete (list):     Geräte des Triggers (Reihenfolge der Daten)
+        '''
+        self.trigger    = trigger
+        self.geraete    = geraete
+        self.nummer     = 0                     # Nummer des Schemas (0 - noch kein Schema)
+        self.schluessel = None                  # [(Gerät, Schlüssel-Tupel), ...]
+        self.packer     = None                  # struct.Struct für die Werte
+
+    def pruefen(self, daten_liste):
+        ''' Prüft, ob die Schlüssel noch dem Schema entsprechen (sonst neues Schema).
+
+        Args:
+            daten_liste (list):     Daten-Dicts der Geräte (Reihenfolge wie geraete)
+        Return:
+            True, wenn ein neues Schema erstellt wurde
+        '''
+        schluessel = [(geraet, tuple(daten)) for geraet, daten in zip(self.geraete, daten_liste)]
+        if schluessel == self.schluessel:
+            return False
+        self.schluessel = schluessel
+        self.packer     = struct.Struct(f'!{sum([len(teil[1]) for teil in schluessel])}d')
+        self.nummer     = self.nummer % 65535 + 1
+        return True
+
+    def schema_rahmen(self):
+        ''' Rahmen mit den Schlüsseln des Schemas. '''
+        liste = [[geraet, name] for geraet, namen in self.schluessel for name in namen]
+        return rahmen(ART_SCHEMA, json.dumps(liste).encode('utf-8'), self.nummer)
+
+
+class Multilog_Rahmen:
+    def __init__(self, sprache, modus = 'json', nutzlast = 'json'):
+        ''' Kodierung der Daten, die an Multilog gesendet werden.
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+            modus (str):        'json' (alt, ohne Rahmen) oder 'frame'
+            nutzlast (str):     'json', 'msgpack' oder 'struct' (nur Modus frame)
+        '''
+        self.modus      = modus
+        self.nutzlast   = nutzlast
+        self.schemata   = {}                    # Trigger: Trigger_Schema
+
+        ## Logging:
+        self.Log_Text_MR_1 = ['Multilog-Rahmen: msgpack ist nicht installiert, die Nutzlast wird als JSON gesendet!',   'Multilog framing: msgpack is not installed, the payload is sent as JSON!']
+        self.Log_Text_MR_2 = ['Multilog-Rahmen - Modus:',                                                               'Multilog framing - Mode:']
+        self.Log_Text_MR_3 = ['Nutzlast:',                                                                              'Payload:']
+
+        if self.nutzlast == 'msgpack' and msgpack == None:
+            logger.warning(self.Log_Text_MR_1[sprache])
+            self.nutzlast = 'json'
+        logger.info(f'{self.Log_Text_MR_2[sprache]} {self.modus}, {self.Log_Text_MR_3[sprache]} {self.nutzlast}')
+
+    def schema(self, trigger, geraete):
+        ''' Legt das Schema eines Triggers an (einmal beim Start).
+
+        Args:
+            trigger (str):      Trigger Wort
+            geraete (list):     Geräte des Triggers
+        '''
+        self.schemata[trigger] = Trigger_Schema(trigger, geraete)
+
+    def neu_verbunden(self):
+        ''' Nach einer neuen Verbindung wird das Schema erneut gesendet. '''
+        for schema in self.schemata.values():
+            schema.schluessel = None
+
+    def kodieren(self, trigger, daten_liste):
+        ''' Kodiert die Daten der Geräte eines Triggers.
+
+        Args:
+            trigger (str):          Trigger Wort
+            daten_liste (list):     Daten-Dicts der Geräte (Reihenfolge wie im Schema)
+        Return:
+            Bytes zum Senden
+        '''
+        if self.modus == 'json':
+            return ''.join([json.dumps(daten) for daten in daten_liste]).encode('utf-8')
+        schema = self.schemata[trigger]
+        if self.nutzlast == 'struct':
+            try:
+                werte  = [math.nan if wert == None else float(wert) for daten in daten_liste for wert in daten.values()]
+                vorne  = schema.schema_rahmen() if schema.pruefen(daten_liste) else b''
+                return vorne + rahmen(ART_STRUCT, schema.packer.pack(*werte), schema.nummer)
+            except (TypeError, ValueError, struct.error):
+                pass                                                                # Nicht-numerische Werte -> JSON-Rahmen
+        dokument = dict(zip(schema.geraete, daten_liste))
+        if self.nutzlast == 'msgpack':
+            return rahmen(ART_MSGPACK, msgpack.packb(dokument))
+        return rahmen(ART_JSON, json.dumps(dokument).encode('utf-8'))
+
+
+class Rahmen_Leser:
+    def __init__(self, sprache = 1):
+        ''' Liest vollständige Dokumente (JSON ohne Rahmen oder Rahmen) aus empfangenen Bytes.
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+        '''
+        self.sprache    = sprache
+        self.puffer     = b''                   # Empfangene Bytes (roh, erst beim Parsen dekodiert)
+        self.decoder    = json.JSONDecoder()
+        self.schemata   = {}                    # Nummer: [(Gerät, Schlüssel), ...]
+        self.anz_Verworfen = 0
+
+        ## Logging:
+        self.Log_Text_MR_4 = ['Multilog-Rahmen: Empfangs-Puffer ohne gültiges Dokument verworfen (Bytes):',            'Multilog framing: Receive buffer without a valid document discarded (bytes):']
+
+    def lesen(self, data):
+        ''' Fügt Bytes hinzu und gibt alle vollständigen Dokumente zurück.
+
+        Args:
+            data (bytes):       empfangene Bytes
+        Return:
+            Liste von Dicts
+        '''
+        self.puffer += data
+        dokumente = []
+        while self.puffer:
+            if self.puffer[:4] == KENNUNG[:len(self.puffer[:4])]:
+                if len(self.puffer) < KOPF.size:
+                    break
+                kennung, version, art, nummer, laenge = KOPF.unpack_from(self.puffer)
+                if not version == VERSION:
+                    raise ValueError(f'Multilog frame: unknown version {version}')
+                if laenge > MAX_PUFFER:
+                    self.verwerfen()
+                    break
+                if len(self.puffer) < KOPF.size + laenge:
+                    break
+                nutzlast    = self.puffer[KOPF.size:KOPF.size + laenge]
+                self.puffer = self.puffer[KOPF.size + laenge:]
+                dokument    = self.dekodieren(art, nummer, nutzlast)
+                if not dokument == None:
+                    dokumente.append(dokument)
+            else:
+                self.puffer = self.puffer.lstrip()
+                if self.puffer == b'':
+                    break
+                ## surrogateescape: Ungültige bzw. geteilte UTF-8-Zeichen bleiben als Bytes erhalten (Position in Bytes bestimmbar):
+                text = self.puffer.decode('utf-8', errors = 'surrogateescape')
+                try:
+                    dokument, ende = self.decoder.raw_decode(text)
+                except json.JSONDecodeError:
+                    if len(self.puffer) > MAX_PUFFER:
+                        self.verwerfen()
+                    break                                                           # Dokument ist noch nicht vollständig
+                self.puffer = self.puffer[len(text[0:ende].encode('utf-8', errors = 'surrogateescape')):]
+                dokumente.append(dokument)
+        return dokumente
+
+    def verwerfen(self):
+        ''' Verwirft den Puffer (Daten, die nie ein gültiges Dokument ergeben bzw. zu groß sind). '''
+        logger.warning(f'{self.Log_Text_MR_4[self.sprache]} {len(self.puffer)} - {self.puffer[0:80]!r}')
+        self.anz_Verworfen += 1
+        self.puffer = b''
+
+    def dekodieren(self, art, nummer, nutzlast):
+        ''' Nutzlast eines Rahmens zu einem Dict (Schema-Rahmen: None). '''
+        if art == ART_JSON:
+            return json.loads(nutzlast.decode('utf-8'))
+        elif art == ART_MSGPACK:
+            return msgpack.unpackb(nutzlast)
+        elif art == ART_SCHEMA:
+            self.schemata[nummer] = json.loads(nutzlast.decode('utf-8'))
+            return None
+        elif art == ART_STRUCT:
+            werte    = struct.unpack(f'!{len(nutzlast) // 8}d', nutzlast)
+            dokument = {}
+            for (geraet, name), wert in zip(self.schemata[nummer], werte):
+                dokument.setdefault(geraet, {})[name] = wert
+            return dokument
+        raise ValueError(f'Multilog frame: unknown payload type {art}')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -13,24 +13,20 @@ Nemo-Achse Lineare Bewegungs Gerät:
 # ++++++++++++++++++++++++++++
 ## GUI:
 from PyQt5.QtCore import (
-    pyqtSignal,
-    QThread,
-    QTimer,
     QObject
 )
 
 ## Allgemein:
 import yaml
 import logging
-from pyModbusTCP.client import ModbusClient
 from pyModbusTCP import utils
 import datetime
-import time
 import math as m
 # import threading
 
 ## Eigene:
 from .PID import PID
+from .modbus_pool import verbindung
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -49,8 +45,6 @@ class SerialMock:
 
 
 class NemoAchseLin(QObject):
-    signal_PID  = pyqtSignal(float, float, bool, float)
-
     def __init__(self, sprache, config, config_dat, com_dict, test, neustart, multilog_aktiv, Log_WriteReadTime, add_Ablauf_function, name="Nemo-Achse-Linear", typ = 'Antrieb'):
         """ Erstelle Nemo-Achse Lin Schnittstelle. Bereite Messwertaufnahme und Daten senden vor.
 
@@ -89,29 +83,26 @@ class NemoAchseLin(QObject):
         self.PID_Ein            = False
         self.Block_Ablaufdatei  = False
         self.value_old          = -1
+        self.register_karte     = None         # Gemeinsame Register-Karte der Nemo-Anlage (vifcon_controller)
 
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
+        ''' Die Schlüssel aus config_schema.py kommen geprüft vom Controller (Default bei Fehler).
+        Hier wird nur noch folgendes kontrolliert:
+        1. Schlüssel außerhalb des Schemas mit Default-Vergabe!
+        2. Abhängigkeiten zwischen den Werten (z.B. Grenzen)!
         '''
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Einstellung für Log:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         self.Log_Pfad_conf_1        = ['Konfigurationsfehler im Element:',                                                                                                                                                      'Configuration error in element:']
-        self.Log_Pfad_conf_2        = ['Möglich sind:',                                                                                                                                                                         'Possible values:']
         self.Log_Pfad_conf_2_1      = ['Möglich sind die Typen:',                                                                                                                                                               'The following types are possible:']
-        self.Log_Pfad_conf_3        = ['Default wird eingesetzt:',                                                                                                                                                              'Default is used:']
         self.Log_Pfad_conf_4        = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                                                                                                    'Error reading config during configuration:']
         self.Log_Pfad_conf_5        = ['; Setze auf Default:',                                                                                                                                                                  '; Set to default:']
         self.Log_Pfad_conf_5_1      = ['; Register-Fehler -> Programm zu Ende!!!',                                                                                                                                              '; Register error -> program ends!!!']
-        self.Log_Pfad_conf_5_2      = ['; PID-Modus Aus!!',                                                                                                                                                                     '; PID mode off!!']
         self.Log_Pfad_conf_5_3      = ['; Multilog-Link Aus!!',                                                                                                                                                                 '; Multilog-Link off!!']
         self.Log_Pfad_conf_6        = ['Fehlergrund:',                                                                                                                                                                          'Reason for error:']
-        self.Log_Pfad_conf_7        = ['Bitte vor Nutzung Korrigieren und Config Neu Einlesen!',                                                                                                                                'Please correct and re-read config before use!']
-        self.Log_Pfad_conf_8        = ['Fehlerhafte Eingabe:',                                                                                                                                                                  'Incorrect input:']
         self.Log_Pfad_conf_8_1      = ['Fehlerhafte Typ:',                                                                                                                                                                      'Incorrect type:']
         self.Log_Pfad_conf_9        = ['Die Obergrenze ist kleiner als die Untergrenze! Setze die Limits auf Default:',                                                                                                         'The upper limit is smaller than the lower limit! Set the limits to default:']
         self.Log_Pfad_conf_10       = ['zu',                                                                                                                                                                                    'to']
@@ -126,87 +117,25 @@ class NemoAchseLin(QObject):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Übergeordnet:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.Anlage = self.config['nemo-Version']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} nemo-Version {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Anlage = 1
+        self.Anlage = self.config['nemo-Version']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Zum Start:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.init           = self.config['start']['init']                            # Initialisierung
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|readTime {self.Log_Pfad_conf_5[self.sprache]} 2')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.messZeit = 2
-        #//////////////////////////////////////////////////////////////////////
-        try: self.v_invert       = self.config['start']['invert']                          # Invertierung bei True der Geschwindigkeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|invert {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.v_invert = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Ist                    = self.config['PID']["start_ist"] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_ist {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Ist = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Soll              = self.config['PID']["start_soll"]
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_soll {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Soll = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Start_Weg   = self.config['start']['start_weg']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|start_weg {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Start_Weg = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.control_pos_choise   = self.config['start']['pos_control'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|pos_control {self.Log_Pfad_conf_5[self.sprache]} SIM')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.control_pos_choise = 'SIM' 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.save_mode = self.config['start']['sicherheit']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|sicherheit {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.save_mode = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.invert_Pos = self.config['start']['invert_Pos']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|invert_Pos {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.invert_Pos = 0
+        self.init           = self.config['start']['init']                            # Initialisierung
+        self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
+        self.v_invert       = self.config['start']['invert']                          # Invertierung bei True der Geschwindigkeit
+        self.Ist                    = self.config['PID']["start_ist"]
+        self.Soll              = self.config['PID']["start_soll"]
+        self.Start_Weg   = self.config['start']['start_weg']
+        self.control_pos_choise   = self.config['start']['pos_control']
+        self.save_mode = self.config['start']['sicherheit']
+        self.invert_Pos = self.config['start']['invert_Pos']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Parameter:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.nKS        = self.config['parameter']['nKS_Aus']                     # Nachkommerstellen
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} parameter|nKS_Aus {self.Log_Pfad_conf_5[self.sprache]} 3')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.nKS = 3
-        #//////////////////////////////////////////////////////////////////////
-        try: self.vF_ist     = float(str(self.config['parameter']['Vorfaktor_Ist']).replace(',','.'))               # Vorfaktor Istgeschwindigkeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} parameter|vF_ist {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.vF_ist = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.vF_soll    = float(str(self.config['parameter']['Vorfaktor_Soll']).replace(',','.'))               # Vorfaktor Sollgeschwindigkeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} parameter|vF_soll {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.vF_soll = 1
+        self.nKS        = self.config['parameter']['nKS_Aus']                     # Nachkommerstellen
+        self.vF_ist     = float(self.config['parameter']['Vorfaktor_Ist'])               # Vorfaktor Istgeschwindigkeit
+        self.vF_soll    = float(self.config['parameter']['Vorfaktor_Soll'])               # Vorfaktor Sollgeschwindigkeit
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Register:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -272,44 +201,14 @@ class NemoAchseLin(QObject):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Limits:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.oGv = self.config["limits"]['maxSpeed']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxSpeed {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGv = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.oGs = self.config["limits"]['maxPos']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxPos {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGs = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGs = self.config["limits"]['minPos']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minPos {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGs = 0
+        self.oGv = self.config["limits"]['maxSpeed']
+        self.oGs = self.config["limits"]['maxPos']
+        self.uGs = self.config["limits"]['minPos']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### PID:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        error_PID = False
-        try: self.PID_Config             = self.config['PID']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID {self.Log_Pfad_conf_5_2[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            error_PID = True
-            self.PID_Config = {}
-            self.PID_Aktiv  = 0 
-        #//////////////////////////////////////////////////////////////////////
-        if not error_PID:
-            try: self.PID_Aktiv = self.config['PID']['PID_Aktiv']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|PID_Aktiv {self.Log_Pfad_conf_5[self.sprache]} False')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.PID_Aktiv = 0 
+        self.PID_Config             = self.config['PID']
+        self.PID_Aktiv              = self.config['PID']['PID_Aktiv']
         #//////////////////////////////////////////////////////////////////////
         try: self.unit_PIDIn             = self.config['PID']['Input_Size_unit']
         except Exception as e: 
@@ -317,29 +216,18 @@ class NemoAchseLin(QObject):
             logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
             self.unit_PIDIn = 'mm'
         #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Option             = self.config['PID']['Value_Origin'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Value_Origin {self.Log_Pfad_conf_5[self.sprache]} VV')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Option = 'VV' 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Sample_Time        = self.config['PID']['sample']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|sample {self.Log_Pfad_conf_5[self.sprache]} 500')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Sample_Time = 500 
+        self.PID_Option             = self.config['PID']['Value_Origin']
+        self.PID_Sample_Time        = self.config['PID']['sample']
         #//////////////////////////////////////////////////////////////////////
-        try: self.M_device_ist           = self.config['multilog']['read_trigger_ist'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|read_trigger_ist {self.Log_Pfad_conf_5_3[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.M_device_ist           = self.config['multilog']['read_trigger_ist']
+        if self.M_device_ist == None:
+            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_ist {self.Log_Pfad_conf_5_3[self.sprache]}')
             self.M_device_ist = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
-        try: self.M_device_soll          = self.config['multilog']['read_trigger_soll'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|read_trigger_soll {self.Log_Pfad_conf_5_3[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.M_device_soll          = self.config['multilog']['read_trigger_soll']
+        if self.M_device_soll == None:
+            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_soll {self.Log_Pfad_conf_5_3[self.sprache]}')
             self.M_device_soll = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
@@ -357,62 +245,21 @@ class NemoAchseLin(QObject):
             self.sensor_soll = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Limit_Max    = self.config['PID']['Input_Limit_max']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Limit_Max  = 1 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Limit_Min    = self.config['PID']['Input_Limit_min'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Limit_Min = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Error_Option = self.config['PID']['Input_Error_option']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Error_option {self.Log_Pfad_conf_5[self.sprache]} error')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Error_Option = 'error' 
+        self.PID_Input_Limit_Max    = self.config['PID']['Input_Limit_max']
+        self.PID_Input_Limit_Min    = self.config['PID']['Input_Limit_min']
+        self.PID_Input_Error_Option = self.config['PID']['Input_Error_option']
 
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### PID-Aktiviert:
-        if not type(self.PID_Aktiv) == bool and not self.PID_Aktiv in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} PID_Aktiv - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Aktiv}')
-            self.PID_Aktiv = 0
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
         ### Geschwindigkeits-Limit:
-        if not type(self.oGv) in [float, int] or not self.oGv > 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxSpeed - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGv)}')
-            self.oGv = 1
         self.uGv = self.oGv * -1
         logger.info(f'{self.device_name} - {self.Log_Pfad_Conf_Neu[self.sprache]} {self.uGv}')
         ### Winkel-Limit:
-        if not type(self.oGs) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxPos - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 180 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGs)}')
-            self.oGs = 1
-        if not type(self.uGs) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minPos - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGs)}')
-            self.uGs = 0
         if self.oGs <= self.uGs:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_13[self.sprache]})')
             self.uGs = 0
             self.oGs = 1
-        ### Messzeit:
-        if not type(self.messZeit) in [int, float] or not self.messZeit >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} readTime - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 2 - {self.Log_Pfad_conf_8[self.sprache]} {self.messZeit}')
-            self.messZeit = 2
-        ### Achsen-Invert:
-        if not type(self.v_invert) == bool and not self.v_invert in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} invert - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.v_invert}')
-            self.v_invert = 0
         ### Register hoch:
         if not type(self.reg_h) == int:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} hoch - {self.Log_Pfad_conf_2_1[self.sprache]} [int] - {self.Log_Pfad_conf_5_1[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.reg_h)}')
@@ -453,37 +300,11 @@ class NemoAchseLin(QObject):
         if not type(self.reg_Info) == int:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} InfoReg - {self.Log_Pfad_conf_2_1[self.sprache]} [int] - {self.Log_Pfad_conf_5_1[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.reg_Info)}')
             exit()
-        ### Vorfaktor Ist:
-        if not type(self.vF_ist) in [float, int] or not self.vF_ist >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Vorfaktor_Ist - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8[self.sprache]} {self.vF_ist}')
-            self.vF_ist = 1
-        ### Vorfaktor Soll:
-        if not type(self.vF_soll) in [float, int] or not self.vF_soll >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Vorfaktor_Ist - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8[self.sprache]} {self.vF_soll}')
-            self.vF_soll = 1
-        ### Nachkommerstellen:
-        if not type(self.nKS) in [int] or not self.nKS >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} nKS_Aus - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 3 - {self.Log_Pfad_conf_8[self.sprache]} {self.nKS}')
-            self.nKS = 3
-        ### Start Weg:
-        if not type(self.Start_Weg) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_weg - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.Start_Weg)}')
-            self.Start_Weg = 0
-        ### PID Sample Zeit:
-        if not type(self.PID_Sample_Time) in [int] or not self.PID_Sample_Time >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} sample - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 500 - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Sample_Time}')
-            self.PID_Sample_Time = 500
         ### PID-Wert-Fehler:
         if self.PID_Input_Error_Option not in ['min', 'max', 'error']:
             logger.warning(f'{self.device_name} - {Log_Text_PID_N18[sprache]}')
             self.PID_Input_Error_Option = 'error'
         ### PID-Limit:
-        if not type(self.PID_Input_Limit_Max) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_max - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.PID_Input_Limit_Max)}')
-            self.PID_Input_Limit_Max = 1
-        if not type(self.PID_Input_Limit_Min) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_min - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.PID_Input_Limit_Min)}')
-            self.PID_Input_Limit_Min = 0
         if self.PID_Input_Limit_Max <= self.PID_Input_Limit_Min:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
             self.PID_Input_Limit_Min = 0
@@ -496,38 +317,7 @@ class NemoAchseLin(QObject):
         if not type(self.sensor_soll) == str:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Multilog_Sensor_Soll - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_3[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.sensor_soll)}')
             self.multilog_OnOff = False
-        ### read-Trigger Multilog Ist:
-        if not type(self.M_device_ist) == str:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} read_trigger_ist - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_3[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.M_device_ist)}')
-            self.multilog_OnOff = False
-        ### read-Trigger Multilog Soll:
-        if not type(self.M_device_soll) == str:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} read_trigger_soll - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_3[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.M_device_soll)}')
-            self.multilog_OnOff = False
-        ### PID-Start-Soll:
-        if not type(self.Soll) in [float, int] or not self.Soll >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_soll - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {self.Soll}')
-            self.Soll = 0
-        ### PID-Start-Ist:
-        if not type(self.Ist) in [float, int] or not self.Ist >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_ist - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {self.Ist}')
-            self.Ist = 0
-        ### Anlagen-Version:
-        if not self.Anlage in [1, 2]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} nemo-Version - {self.Log_Pfad_conf_2[self.sprache]} [1, 2] - {self.Log_Pfad_conf_3[self.sprache]} 1')
-            self.Anlage = 1
-        ### Positions Kontroll Wahl:
-        if not self.control_pos_choise in ['SIM', 'REAL']:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} pos_control - {self.Log_Pfad_conf_2[self.sprache]} [SIM, REAL] - {self.Log_Pfad_conf_3[self.sprache]} SIM')
-            self.control_pos_choise = 'SIM'
-        ### Anlagen-Sicherheit bei Realer-Positions-Limitregelung:
-        if not self.save_mode in [0, 1]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} sicherheit - {self.Log_Pfad_conf_2[self.sprache]} [0, 1] - {self.Log_Pfad_conf_3[self.sprache]} 0')
-            self.save_mode = 0
         ### Positions Invertierung:
-        if not type(self.invert_Pos) == bool and not self.invert_Pos in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} invert_Pos - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.invert_Pos}')
-            self.invert_Pos = 0
         if self.control_pos_choise == 'SIM' or self.Anlage == 1: # Notiz: Eventuell noch - and self.invert_Pos = True
             self.invert_Pos = 0  
             logger.warning(f'{self.device_name} - {self.Log_Block_invert_Pos[self.sprache]}')
@@ -585,7 +375,7 @@ class NemoAchseLin(QObject):
         self.Log_Text_Port_3    = ['Antwort der Test-Abfrage war None. Bearbeitung nicht möglich!',                                                                                                                         'The answer to the test query was None. Processing not possible!']
         self.Log_Text_Port_4    = ['Bei der Werte-Umwandlung ist ein Fehler aufgetreten!',                                                                                                                                  'An error occurred during value conversion!']
         self.Log_Text_Port_5    = ['Fehlerbeschreibung:',                                                                                                                                                                   'Error description:']
-        self.Log_Text_PID_str   = ['Start des PID-Threads!',                                                                                                                                                                'Start of the PID thread!']
+        self.Log_Text_PID_str   = ['PID-Regler im PID-Takt!',                                                                                                                                                               'PID controller in the PID cycle!']
         Log_Text_PID_N1         = ['Die Konfiguration',                                                                                                                                                                     'The configuration']
         Log_Text_PID_N2         = ['existiert nicht! Möglich sind nur VV, VM, MM oder MV. Nutzung von Default VV!',                                                                                                         'does not exist! Only VV, VM, MM or MV are possible. Use default VV!']
         Log_Text_PID_N2_1       = ['ist für das Gerät noch nicht umgesetzt! Nutzung von Default VV!',                                                                                                                       'is not yet implemented for the device! Use of default VV!']
@@ -653,15 +443,7 @@ class NemoAchseLin(QObject):
         logger.info(f"{self.device_name} - {self.Log_Text_60_str[self.sprache]}")
         try:
             if not test:
-                com_ak = ''
-                for com in com_dict:
-                    if com == self.config['serial-interface']['port']:
-                        com_ak = com
-                        break
-                if com_ak == '':
-                    self.serial = ModbusClient(**config["serial-interface"])
-                else:
-                    self.serial = com_dict[com_ak]
+                self.serial = verbindung(self.sprache, config["serial-interface"])      # Gemeinsame Verbindung aller Nemo-Geräte der SPS (Host, Port)
         except Exception as e:
             self.serial = SerialMock()
             logger.warning(f"{self.device_name} - {self.Log_Text_61_str[self.sprache]}")
@@ -684,6 +466,10 @@ class NemoAchseLin(QObject):
         # Befehle:
         #---------------------------------------
         self.lese_anz_Register = 12
+        ## Input-Register für read (Register-Karte):
+        self.lese_Bereiche = [[self.start_Lese_Register, self.lese_anz_Register]]
+        if self.Anlage == 2:   self.lese_Bereiche += [[self.Status_Reg, 2], [self.Status_RegEil, 2]]
+        elif self.Anlage == 1: self.lese_Bereiche += [[self.Status_Reg, 1]]
 
         #---------------------------------------
         # Variablen Positions-Controlle:
@@ -748,20 +534,8 @@ class NemoAchseLin(QObject):
         logger.info(f'{self.device_name} - {Log_Text_PID_N3[self.sprache]}{self.PID_Option} ({teil_1[self.sprache]}, {teil_2[self.sprache]})')
 
         if self.PID_Aktiv:
-            ## PID-Thread:
-            self.PIDThread = QThread()
-            self.PID.moveToThread(self.PIDThread)
-            logger.info(f'{self.device_name} - {self.Log_Text_PID_str[self.sprache]}') 
-            self.PIDThread.start()
-            self.signal_PID.connect(self.PID.InOutPID)
-            ## Timer:
-            self.timer_PID = QTimer()                                              # Reaktionszeittimer (ruft die Geräte auf, liest aber nur unter bestimmten Bedingungen!)
-            self.timer_PID.setInterval(self.PID_Sample_Time)
-            self.timer_PID.timeout.connect(self.PID_Update)
-            self.timer_PID.start()
-            ### PID-Timer Thread:
-            #self.PIDThreadTimer = threading.Thread(target=self.PID_Update)
-            #self.PIDThreadTimer.start()
+            ## Der PID-Regler wird im gemeinsamen PID-Takt berechnet (pid_takt.py, Anmeldung im vifcon_controller):
+            logger.info(f'{self.device_name} - {self.Log_Text_PID_str[self.sprache]}')
         else:
             logger.info(f'{self.device_name} - {self.Log_Text_PID_N23[self.sprache]}')
         ## Multilog-Lese-Variable für die Daten:
@@ -872,7 +646,7 @@ class NemoAchseLin(QObject):
             self.start_Time = datetime.datetime.now(datetime.timezone.utc).astimezone() # Neuer zyklus
             ## Berechne Weg:
             ans = self.serial.read_input_registers(self.start_Lese_Register, 2)         # vIst ist das erste Register!
-            logger.debug(f'{self.device_name} - {self.Log_Text_166_str[self.sprache]} {ans}')
+            logger.debug('%s - %s %s', self.device_name, self.Log_Text_166_str[self.sprache], ans)
             self.ak_speed = self.umwandeln_Float(ans)[0] * self.vF_ist                  # Istwert kann negativ sein. Beachtung eines Vorfaktors!
             pos = self.umFak * abs(self.ak_speed) * timediff 
             if self.rechne == 'Add':
@@ -1180,10 +954,11 @@ class NemoAchseLin(QObject):
             Aktuelle Werte (dict)   - self.value_name
         '''
         ak_time = datetime.datetime.now(datetime.timezone.utc).astimezone()
+        if not self.register_karte == None: self.register_karte.zyklus(self.device_name)
 
         # Lese: vIst, vSoll, posIst, posSoll, posMax, posMin
-        ans = self.serial.read_input_registers(self.start_Lese_Register, self.lese_anz_Register)
-        logger.debug(f'{self.device_name} - {self.Log_Text_63_str[self.sprache]} {ans}')
+        ans = self.lese_Register(self.start_Lese_Register, self.lese_anz_Register)
+        logger.debug('%s - %s %s', self.device_name, self.Log_Text_63_str[self.sprache], ans)
         value = self.umwandeln_Float(ans)
         multi = -1 if self.v_invert else 1                                       # Spindel ist invertiert
 
@@ -1207,12 +982,12 @@ class NemoAchseLin(QObject):
         self.value_name['SWs']  = round(value[3], self.nKS)                                                         # Einheit: mm
         self.value_name['oGs']  = round(self.oGs, self.nKS)                                         # value[4]      # Einheit: mm
         self.value_name['uGs']  = round(self.uGs, self.nKS)                                         # value[5]      # Einheit: mm
-        logger.debug(f'{self.device_name} - {self.Log_Text_175_str[self.sprache]} {value[3]}, {self.Log_Text_176_str[self.sprache]}: {value[4]}, {self.Log_Text_177_str[self.sprache]}: {value[5]}')
+        logger.debug('%s - %s %s, %s: %s, %s: %s', self.device_name, self.Log_Text_175_str[self.sprache], value[3], self.Log_Text_176_str[self.sprache], value[4], self.Log_Text_177_str[self.sprache], value[5])
 
         # Lese: Status
         if self.Anlage == 2:   Stat_Reg_anz = 2
         elif self.Anlage == 1: Stat_Reg_anz = 1
-        ans = self.serial.read_input_registers(self.Status_Reg, Stat_Reg_anz)
+        ans = self.lese_Register(self.Status_Reg, Stat_Reg_anz)
         if not ans == None and type(ans[0]) == int: self.value_name['Status'] = ans[0]
         else:                                       self.value_name['Status'] = 64
 
@@ -1225,7 +1000,7 @@ class NemoAchseLin(QObject):
         # Lese: Status-Eilgang
         if self.Anlage == 2:
             error_Stat = False
-            ans = self.serial.read_input_registers(self.Status_RegEil, 2)
+            ans = self.lese_Register(self.Status_RegEil, 2)
             if not ans == None and type(ans[0]) == int: self.value_name['StatusEil']   = ans[0]
             else:  error_Stat = True 
             if not ans == None and type(ans[1]) == int: self.value_name['StatusEil_2'] = ans[1]
@@ -1247,6 +1022,18 @@ class NemoAchseLin(QObject):
 
         return self.value_name
 
+    def lese_Register(self, start, anzahl):
+        ''' Liest Input-Register direkt oder über die gemeinsame Register-Karte.
+
+        Args:
+            start (int):    Start-Register
+            anzahl (int):   Anzahl der Register
+        Return:
+            Liste der Register (None - Fehler)
+        '''
+        if self.register_karte == None: return self.serial.read_input_registers(start, anzahl)
+        return self.register_karte.lesen(self.device_name, start, anzahl)
+
     def umwandeln_Float(self, int_Byte_liste):
         ''' Wandelt die Register-Werte in Zahlen um.
 
@@ -1257,14 +1044,14 @@ class NemoAchseLin(QObject):
         '''
         try:
             Bits_List_32 = utils.word_list_to_long(int_Byte_liste, big_endian=True, long_long=False)
-            logger.debug(f'{self.device_name} - {self.Log_Text_66_str[self.sprache]} {Bits_List_32}')
+            logger.debug('%s - %s %s', self.device_name, self.Log_Text_66_str[self.sprache], Bits_List_32)
 
             value_list = []
             i = 1
             for word in Bits_List_32:
                 value = utils.decode_ieee(word)
                 value_list.append(round(value, self.nKS))
-                logger.debug(f'{self.device_name} - {self.Log_Text_67_str[self.sprache]} {i}: {value}')
+                logger.debug('%s - %s %s: %s', self.device_name, self.Log_Text_67_str[self.sprache], i, value)
                 i += 1
         except Exception as e:
             logger.warning(self.Log_Text_Port_4[self.sprache])
@@ -1332,21 +1119,21 @@ class NemoAchseLin(QObject):
     ###################################################
     # Messdatendatei erstellen und beschrieben:
     ###################################################
-    def messdaten_output(self, pfad="./"):
+    def messdaten_output(self, pfad, schreiber):
         """Erstelle für das Gerät eine csv-Datei mit den Daten.
 
         Args:
-            pfad (str, optional): Speicherort. Default ist "./".
+            pfad (str):                     Speicherort (Messordner)
+            schreiber (Messdaten_Writer):   Gemeinsamer Messdaten-Schreiber (hält die Datei offen und puffert die Zeilen)
         """
+        self.schreiber = schreiber
         PID_x_unit = self.unit_PIDIn
         self.filename = f"{pfad}/{self.device_name}.csv"
         units = f"# datetime,s,mm,mm,mm/min,mm/min,mm,mm,mm,{PID_x_unit},{PID_x_unit},\n"
         header = "time_abs,time_rel,Ist-Position-sim,Ist-Position-real,Ist-Geschwindigkeit,Soll-Geschwindigkeit,Soll-Position,max.Pos.,min.Pos.,Soll-x_PID-Modus_A,Ist-x_PID-Modus_A,\n"
         if self.messZeit != 0:                                          # Erstelle Datei nur wenn gemessen wird!
             logger.info(f"{self.device_name} - {self.Log_Text_71_str[self.sprache]} {self.filename}")
-            with open(self.filename, "w", encoding="utf-8") as f:
-                f.write(units)
-                f.write(header)
+            self.schreiber.anmelden(self.filename, units + header)
         else:
             logger.info(f"{self.device_name} - {self.Log_Text_72_str[self.sprache]}")
 
@@ -1365,18 +1152,25 @@ class NemoAchseLin(QObject):
             #if not size == 'Status':
             if not 'Status' in size:
                 line = line + f'{daten[size]},'
-        with open(self.filename, "a", encoding="utf-8") as f:
-            f.write(f'{line}\n')
+        self.schreiber.schreiben(self.filename, f'{line}\n', self.device_name)
     
     ##########################################
     # PID-Regler:
     ##########################################
-    def PID_Update(self):
-        '''PID-Regler-Thread-Aufruf'''
+    def PID_Eingang(self):
+        '''Eingänge des PID-Reglers für den PID-Takt (eigener Thread)
+
+        Return:
+            (Istwert, Sollwert, Rezept-Modus, Rezept-Output) - None: Regler nicht aktiv
+        '''
         if self.PID_Aktiv:
             if not self.PID.PID_speere:
-                self.signal_PID.emit(self.Ist, self.Soll, False, 0)
-                self.PID_Out = self.PID.Output
+                return self.Ist, self.Soll, False, 0
+        return None
+
+    def PID_Ausgang(self):
+        '''Output des PID-Reglers nach der Berechnung im PID-Takt übernehmen'''
+        self.PID_Out = self.PID.Output
 
     ###################################################
     # Prüfe die Verbindung:
@@ -1389,8 +1183,8 @@ class NemoAchseLin(QObject):
             True or False   - Eingeschaltet/Ausgeschaltet
         '''
         try:
-            self.serial.open()
-            time.sleep(0.1)         # Dadurch kann es in Ruhe öffnen
+            if not self.serial.open():                      # Läuft der Neuaufbau im Hintergrund (Verbindungs-Pool), wird nicht gewartet
+                raise ValueError(self.Log_Text_Port_2[self.sprache])
             ans = self.serial.read_input_registers(self.start_Lese_Register, 2)  # vIst
             if ans == None:
                 raise ValueError(self.Log_Text_Port_3[self.sprache])
@@ -1398,7 +1192,6 @@ class NemoAchseLin(QObject):
                 antwort = self.umwandeln_Float(ans)
         except Exception as e:
             if test: logger.exception(self.Log_Text_Port_1[self.sprache])
-            self.serial.close()
             return False
         return True
 
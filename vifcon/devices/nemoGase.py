@@ -13,12 +13,13 @@ Nemo Gase (Drücke, Durchfluss und Drehzahl):
 # ++++++++++++++++++++++++++++
 ## Allgemein:
 import logging
-from pyModbusTCP.client import ModbusClient
 from pyModbusTCP import utils
-import time
 import math as m
 import datetime
 
+## Eigene:
+from .modbus_pool import verbindung
+
 # ++++++++++++++++++++++++++++
 # Programm:
 # ++++++++++++++++++++++++++++
@@ -60,6 +61,7 @@ class NemoGase:
         self.add_Text_To_Ablauf_Datei = add_Ablauf_function
         self.device_name = name
         self.typ = typ
+        self.register_karte = None         # Gemeinsame Register-Karte der Nemo-Anlage (vifcon_controller)
     
         ## Werte Dictionary:
         self.value_name = {'MFC24': 0, 'MFC25': 0, 'MFC26': 0, 'MFC27': 0, 'DM21': 0, 'PP21': 0, 'PP22': 0, 'PP21Status': 0, 'PP22Status': 0, 'PP22I': 0, 
@@ -78,54 +80,34 @@ class NemoGase:
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
+        ''' Die Schlüssel aus config_schema.py kommen geprüft vom Controller (Default bei Fehler).
+        Hier wird nur noch folgendes kontrolliert:
+        1. Schlüssel außerhalb des Schemas mit Default-Vergabe!
+        2. Abhängigkeiten zwischen den Werten (z.B. Grenzen)!
         '''
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Einstellung für Log:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                      'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                         'Possible values:']
         self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                               'The following types are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                              'Default is used:']
         self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',    'Error reading config during configuration:']
-        self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                  '; Set to default:']
         self.Log_Pfad_conf_5_1  = ['; Register-Fehler -> Programm zu Ende!!!',              '; Register error -> program ends!!!']
         self.Log_Pfad_conf_6    = ['Fehlergrund:',                                          'Reason for error:']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                  'Incorrect input:']
         self.Log_Pfad_conf_8_1  = ['Fehlerhafte Typ:',                                      'Incorrect type:']
         
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Übergeordnet:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.Anlage = self.config['nemo-Version']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} nemo-Version {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Anlage = 1
+        self.Anlage = self.config['nemo-Version']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Zum Start:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.init           = self.config['start']['init']                            # Initialisierung
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|readTime {self.Log_Pfad_conf_5[self.sprache]} 2')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.messZeit = 2
+        self.init           = self.config['start']['init']                            # Initialisierung
+        self.messZeit       = self.config['start']["readTime"]                        # Auslesezeit
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Parameter:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.nKS        = self.config['parameter']['nKS_Aus']                     # Nachkommerstellen
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} parameter|nKS_Aus {self.Log_Pfad_conf_5[self.sprache]} 3')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.nKS = 3
+        self.nKS        = self.config['parameter']['nKS_Aus']                     # Nachkommerstellen
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Register:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -156,18 +138,6 @@ class NemoGase:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
-        ### Messzeit:
-        if not type(self.messZeit) in [int, float] or not self.messZeit >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} readTime - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 2 - {self.Log_Pfad_conf_8[self.sprache]} {self.messZeit}')
-            self.messZeit = 2
-        ### Nachkommerstellen:
-        if not type(self.nKS) in [int] or not self.nKS >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} nKS_Aus - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 3 - {self.Log_Pfad_conf_8[self.sprache]} {self.nKS}')
-            self.nKS = 3
         ### Register Lese VGP 1:
         if not type(self.start_Lese_Register_VGP_1) == int:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} lese_st_Reg_VGP_1 - {self.Log_Pfad_conf_2_1[self.sprache]} [int] - {self.Log_Pfad_conf_5_1[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.start_Lese_Register_VGP_1)}')
@@ -184,10 +154,6 @@ class NemoGase:
         if not type(self.start_Lese_Register_AS) == int:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} lese_st_Reg_AS - {self.Log_Pfad_conf_2_1[self.sprache]} [int] - {self.Log_Pfad_conf_5_1[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.start_Lese_Register_AS)}')
             exit()
-        ### Anlagen-Version:
-        if not self.Anlage in [1, 2]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} nemo-Version - {self.Log_Pfad_conf_2[self.sprache]} [1, 2] - {self.Log_Pfad_conf_3[self.sprache]} 1')
-            self.Anlage = 1
 
         #--------------------------------------- 
         # Sprach-Einstellung:
@@ -228,15 +194,7 @@ class NemoGase:
         logger.info(f"{self.device_name} - {self.Log_Text_60_str[self.sprache]}")
         try:
             if not test:
-                com_ak = ''
-                for com in com_dict:
-                    if com == self.config['serial-interface']['port']:
-                        com_ak = com
-                        break
-                if com_ak == '':
-                    self.serial = ModbusClient(**config["serial-interface"])
-                else:
-                    self.serial = com_dict[com_ak]
+                self.serial = verbindung(self.sprache, config["serial-interface"])      # Gemeinsame Verbindung aller Nemo-Geräte der SPS (Host, Port)
         except Exception as e:
             self.serial = SerialMock()
             logger.warning(f"{self.device_name} - {self.Log_Text_61_str[self.sprache]}")
@@ -255,6 +213,13 @@ class NemoGase:
                 logger.warning(f"{self.device_name} - {self.Log_Text_Port_2[self.sprache]}")
                 exit()
 
+        #---------------------------------------
+        # Befehle:
+        #---------------------------------------
+        ## Input-Register für read (Register-Karte):
+        self.lese_Bereiche = [[self.start_Lese_Register_VGP_1, 18]]
+        if self.Anlage == 2: self.lese_Bereiche += [[self.start_Lese_Register_VGP_2, 57], [self.start_Lese_Register_K, 36], [self.start_Lese_Register_AS, 8]]
+
     ##########################################
     # Schnittstelle (lesen):
     ##########################################
@@ -265,14 +230,15 @@ class NemoGase:
             self.value_name (dict): Aktuelle Werte 
         '''
         ak_time = datetime.datetime.now(datetime.timezone.utc).astimezone()
+        if not self.register_karte == None: self.register_karte.zyklus(self.device_name)
 
         try:
             # Auslese-Teil 1 - Vakuum, Gase und Pumpen:
             # Lese: MFC24, MFC25, MFC26,  MFC27, DM21, PP21, PP22, PP21 Status, PP22 Status, PP22 Drehzahl: 
             # Notiz:    8 Gleitkommazahlen
             #           2 Statuswörter          --> (8 * 2) + 2 = 18 Regsiter
-            ans = self.serial.read_input_registers(self.start_Lese_Register_VGP_1, 18)
-            logger.debug(f'{self.device_name} - {self.Log_Text_63_str[self.sprache]} {ans} ({self.Bezeichnung_1[self.sprache]} 1)')
+            ans = self.lese_Register(self.start_Lese_Register_VGP_1, 18)
+            logger.debug('%s - %s %s (%s 1)', self.device_name, self.Log_Text_63_str[self.sprache], ans, self.Bezeichnung_1[self.sprache])
 
             if not ans == None:
                 value_1 = self.umwandeln_Float(ans[0:14])   # MFC24, MFC25, MFC26, MFC27, DM21, PP21, PP22,
@@ -311,8 +277,8 @@ class NemoGase:
                 # Notiz:    Alle _m und _RE werden noch nicht in die GUI integriert -> Rampen-Werte!
                 #           22 Gleitkommazahlen
                 #           13 Statuswörter         --> (22 * 2) + 13 = 57 Register
-                ans = self.serial.read_input_registers(self.start_Lese_Register_VGP_2, 57)
-                logger.debug(f'{self.device_name} - {self.Log_Text_63_str[self.sprache]} {ans} ({self.Bezeichnung_1[self.sprache]} 2)')
+                ans = self.lese_Register(self.start_Lese_Register_VGP_2, 57)
+                logger.debug('%s - %s %s (%s 2)', self.device_name, self.Log_Text_63_str[self.sprache], ans, self.Bezeichnung_1[self.sprache])
                 if not ans == None:     value_3 = self.umwandeln_Float(ans[0:46])   
                 else:
                     value_3 = []
@@ -329,8 +295,8 @@ class NemoGase:
                 # Lese:     KWKDF_1, KWKDF_2, KWKDF_3, KWKDF_4, KWKDF_5, KWKDF_6, KWKDF_7, KWKDF_8, KWKDF_9,
                 #           KWKT_1, KWKT_2, KWKT_3, KWKT_4, KWKT_5, KWKT_6, KWKT_7, KWKT_8, KWKT_9,
                 # Notiz:    18 Gleitkommazahlen           --> (18 * 2) = 36 Register     
-                ans = self.serial.read_input_registers(self.start_Lese_Register_K, 36)
-                logger.debug(f'{self.device_name} - {self.Log_Text_63_str[self.sprache]} {ans} ({self.Bezeichnung_2[self.sprache]})')
+                ans = self.lese_Register(self.start_Lese_Register_K, 36)
+                logger.debug('%s - %s %s (%s)', self.device_name, self.Log_Text_63_str[self.sprache], ans, self.Bezeichnung_2[self.sprache])
                 if not ans == None:     value_4 = self.umwandeln_Float(ans)   
                 else:
                     value_4 = []
@@ -341,8 +307,8 @@ class NemoGase:
                 # Lese:     ASTO, ASTM, ASTU, ASBMStatus, ASStatus
                 # Notiz:    3 Gleitkommazahlen           
                 #           2 Statuswörter          --> (3 * 2) + 2 = 8 Register
-                ans = self.serial.read_input_registers(self.start_Lese_Register_AS, 8)
-                logger.debug(f'{self.device_name} - {self.Log_Text_63_str[self.sprache]} {ans} ({self.Bezeichnung_3[self.sprache]})')
+                ans = self.lese_Register(self.start_Lese_Register_AS, 8)
+                logger.debug('%s - %s %s (%s)', self.device_name, self.Log_Text_63_str[self.sprache], ans, self.Bezeichnung_3[self.sprache])
                 value_5 = []
                 if not ans == None:     value_5 = self.umwandeln_Float(ans[0:6])   
                 else:
@@ -422,6 +388,18 @@ class NemoGase:
 
         return self.value_name
     
+    def lese_Register(self, start, anzahl):
+        ''' Liest Input-Register direkt oder über die gemeinsame Register-Karte.
+
+        Args:
+            start (int):    Start-Register
+            anzahl (int):   Anzahl der Register
+        Return:
+            Liste der Register (None - Fehler)
+        '''
+        if self.register_karte == None: return self.serial.read_input_registers(start, anzahl)
+        return self.register_karte.lesen(self.device_name, start, anzahl)
+
     def umwandeln_Float(self, int_Byte_liste):
         ''' Sendet den Lese-Befehl an die Achse.
 
@@ -432,14 +410,14 @@ class NemoGase:
         '''
         try:
             Bits_List_32 = utils.word_list_to_long(int_Byte_liste, big_endian=True, long_long=False)
-            logger.debug(f'{self.device_name} - {self.Log_Text_66_str[self.sprache]} {Bits_List_32}')
+            logger.debug('%s - %s %s', self.device_name, self.Log_Text_66_str[self.sprache], Bits_List_32)
 
             value_list = []
             i = 1
             for word in Bits_List_32:
                 value = utils.decode_ieee(word)
                 value_list.append(round(value, self.nKS))
-                logger.debug(f'{self.device_name} - {self.Log_Text_67_str[self.sprache]} {i}: {value}')
+                logger.debug('%s - %s %s: %s', self.device_name, self.Log_Text_67_str[self.sprache], i, value)
                 i += 1
         except Exception as e:
             logger.warning(self.Log_Text_Port_4[self.sprache])
@@ -481,7 +459,7 @@ class NemoGase:
     ###################################################
     # Messdatendatei erstellen und beschrieben:
     ###################################################
-    def messdaten_output(self, pfad="./"):
+    def messdaten_output(self, pfad, schreiber):
         """Erstelle für das Gerät eine csv-Datei mit den Daten.
             Nemo-1:
             MFC24, MFC25, MFC26, MFC27, DM21, PP21, PP22, PP21Status, PP22Status, PP22I
@@ -496,8 +474,10 @@ class NemoGase:
             ASTO, ASTM, ASTU, ASBMStatus, ASStatus
         
         Args:
-            pfad (str, optional): Speicherort. Default ist "./".
+            pfad (str):                     Speicherort (Messordner)
+            schreiber (Messdaten_Writer):   Gemeinsamer Messdaten-Schreiber (hält die Datei offen und puffert die Zeilen)
         """
+        self.schreiber = schreiber
         self.filename = f"{pfad}/{self.device_name}.csv"
         if self.Anlage == 1:    
             units  = "# datetime,s,ml/min,ml/min,ml/min,ml/min,mbar,mbar,mbar,%,\n"
@@ -507,9 +487,7 @@ class NemoGase:
             header = "time_abs,time_rel,MFC1_Ist,MFC2_Ist,MFC3_Ist,MFC4_Ist,PP1,PP2,P2I,PP2mPtS,MV1_Ist,MV1_Soll,MV1_VS,MFC1_Soll,MFC1_FlowMax,MFC2_Soll,MFC2_FlowMax,MFC3_Soll,MFC3_FlowMax,MFC4_Soll,MFC4_FlowMax,WK1Flow,WK2Flow,WK3Flow,WK4Flow,WK5Flow,WK6Flow,WK7Flow,WK8Flow,WK9Flow,WK1T,WK2T,WK3T,WK4T,WK5T,WK6T,WK7T,WK8T,WK9T,SaveThermoOben,SaveThermoMitte,SaveThermoUnten,\n"
         if self.messZeit != 0:                                          # Erstelle Datei nur wenn gemessen wird!
             logger.info(f"{self.device_name} - {self.Log_Text_71_str[self.sprache]} {self.filename}")
-            with open(self.filename, "w", encoding="utf-8") as f:
-                f.write(units)
-                f.write(header)
+            self.schreiber.anmelden(self.filename, units + header)
         else:
             logger.info(f"{self.device_name} - {self.Log_Text_72_str[self.sprache]}")
 
@@ -529,8 +507,7 @@ class NemoGase:
                     skip = 1
                 if not skip:
                     line = line + f'{daten[size]},'
-        with open(self.filename, "a", encoding="utf-8") as f:
-            f.write(f'{line}\n')
+        self.schreiber.schreiben(self.filename, f'{line}\n', self.device_name)
     
     ###################################################
     # Prüfe die Verbindung:
@@ -543,8 +520,8 @@ class NemoGase:
             True or False   - Eingeschaltet/Ausgeschaltet
         '''
         try:
-            self.serial.open()
-            time.sleep(0.1)         # Dadurch kann es in Ruhe öffnen
+            if not self.serial.open():                      # Läuft der Neuaufbau im Hintergrund (Verbindungs-Pool), wird nicht gewartet
+                raise ValueError(self.Log_Text_Port_2[self.sprache])
             ans = self.serial.read_input_registers(self.start_Lese_Register_VGP_1, 1)  # MFC24
             if ans == None:
                 raise ValueError(self.Log_Text_Port_3[self.sprache])
@@ -552,7 +529,6 @@ class NemoGase:
                 antwort = self.umwandeln_Float(ans)
         except Exception as e:
             if test: logger.exception(self.Log_Text_Port_1[self.sprache])
-            self.serial.close()
             return False
         return True
             
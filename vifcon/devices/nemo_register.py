@@ -0,0 +1,209 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Gemeinsame Register-Karte einer Nemo-Anlage (Modbus-SPS):
+- Alle Nemo-Geräte an einer Schnittstelle melden ihre Input-Register-Bereiche an (lese_Bereiche)
+- Nah beieinander liegende Bereiche werden zu Blöcken zusammengefasst (max. 125 Register pro Modbus-Anfrage)
+- Ein Block wird mit einer Anfrage gelesen und jedes Gerät bekommt seinen Ausschnitt daraus
+- Die Geräte eines Mess-Zyklus teilen sich die Blöcke, jedes Gerät liest aber nie zweimal dieselben Daten
+
+Die Karte wird nur aus den Sample-Threads genutzt. Diese teilen sich die Schnittstelle und damit den Mutex
+des Ports (vifcon_controller), so dass die Karte nicht selbst gesperrt werden muss.
+Liefert die SPS für einen Block mehrmals hintereinander (MAX_FEHLER) einen Fehler (z.B. nicht belegte Register
+in einer Lücke), der Bereich allein aber nicht, so wird der Block aufgeteilt (erst in lückenlose Blöcke, dann in
+die einzelnen Bereiche). Ein einzelner Fehler (z.B. Störung auf dem Bus) teilt den Block somit nicht dauerhaft auf.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import time
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+MAX_REGISTER = 125                  # Maximale Anzahl Input-Register pro Modbus-Anfrage (Funktion 4)
+MAX_FEHLER   = 3                    # Anzahl aufeinanderfolgender Block-Fehler (Bereich allein lesbar) bis zur Aufteilung
+
+
+class Nemo_Register:
+    def __init__(self, sprache, serial, port, max_luecke = 32, max_alter = 0.1):
+        ''' Erstellung der Register-Karte.
+
+        Args:
+            sprache (int):          Sprache der GUI (Listenplatz)
+            serial (Modbus_Verbindung): Gemeinsame Verbindung der Nemo-Geräte (modbus_pool)
+            port (int/str):         Port der Schnittstelle (für das Logging)
+            max_luecke (int):       Maximale Anzahl nicht benötigter Register zwischen zwei Bereichen eines Blocks
+            max_alter (float):      Maximales Alter in s, die gelesene Daten von anderen Geräten genutzt werden dürfen
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache    = sprache
+        self.serial     = serial
+        self.port       = port
+        self.max_luecke = max_luecke
+        self.max_alter  = max_alter
+
+        ## Weitere:
+        self.bereiche   = {}                # Geräte-Name: Liste mit [Start-Register, Anzahl]
+        self.bloecke    = []                # Liste mit {'start', 'anzahl', 'bereiche', 'luecke', 'daten', 'fehler'}
+        self.zyklen     = {}                # Geräte-Name: Nummer des aktuellen Lese-Zyklus
+        ## Statistik:
+        self.anz_Anfragen   = 0             # Modbus-Anfragen der Blöcke
+        self.anz_Gespart    = 0             # Zugriffe, die aus einem bereits gelesenen Block bedient wurden
+        self.anz_Einzeln    = 0             # Zugriffe außerhalb der Karte
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_NR_1 = ['Nemo-Register-Karte - Port',                                                     'Nemo register map - Port']
+        self.Log_Text_NR_2 = ['Blöcke (Start, Anzahl):',                                                        'Blocks (start, count):']
+        self.Log_Text_NR_3 = ['Der Block kann nicht gelesen werden, der Bereich allein aber schon. Der Block wird aufgeteilt:',   'The block cannot be read, but the range alone can. The block is split:']
+        self.Log_Text_NR_4 = ['Anfragen:',                                                                      'Requests:']
+        self.Log_Text_NR_5 = ['Eingespart:',                                                                    'Saved:']
+        self.Log_Text_NR_6 = ['Außerhalb der Karte:',                                                           'Outside the map:']
+
+    ##########################################
+    # Karte:
+    ##########################################
+    def anmelden(self, geraet, bereiche):
+        ''' Meldet die Input-Register-Bereiche eines Gerätes an.
+
+        Args:
+            geraet (str):       Geräte-Name
+            bereiche (list):    Liste mit [Start-Register, Anzahl]
+        '''
+        self.bereiche[geraet] = [list(b) for b in bereiche]
+        self.zyklen[geraet]   = 0
+
+    def karte_erstellen(self):
+        ''' Fasst die angemeldeten Bereiche aller Geräte zu Blöcken zusammen. '''
+        alle = []
+        for geraet in self.bereiche:
+            alle += self.bereiche[geraet]
+        self.bloecke = self.zusammenfassen(alle, self.max_luecke)
+        logger.info(f"{self.Log_Text_NR_1[self.sprache]} {self.port} - {self.Log_Text_NR_2[self.sprache]} {[(b['start'], b['anzahl']) for b in self.bloecke]}")
+
+    def zusammenfassen(self, bereiche, max_luecke):
+        ''' Fasst Bereiche zu Blöcken zusammen.
+
+        Args:
+            bereiche (list):    Liste mit [Start-Register, Anzahl]
+            max_luecke (int):   Maximale Anzahl nicht benötigter Register zwischen zwei Bereichen
+        Return:
+            Liste der Blöcke
+        '''
+        bloecke = []
+        for start, anzahl in sorted(bereiche):
+            ende = start + anzahl
+            if bloecke != []:
+                block = bloecke[-1]
+                block_ende = block['start'] + block['anzahl']
+                if start <= block_ende + max_luecke and max(ende, block_ende) - block['start'] <= MAX_REGISTER:
+                    block['anzahl'] = max(ende, block_ende) - block['start']
+                    block['bereiche'].append([start, anzahl])
+                    continue
+            bloecke.append({'start': start, 'anzahl': anzahl, 'bereiche': [[start, anzahl]], 'luecke': max_luecke, 'daten': None, 'fehler': 0})
+        return bloecke
+
+    def block_aufteilen(self, block):
+        ''' Teilt einen Block, den die SPS wiederholt nicht liefert, auf: Erst in lückenlose Blöcke, danach in die einzelnen Bereiche.
+
+        Args:
+            block (dict):       Block aus self.bloecke
+        '''
+        i = self.bloecke.index(block)
+        if block['luecke'] > 0:
+            neu = self.zusammenfassen(block['bereiche'], 0)
+        else:
+            neu = [{'start': s, 'anzahl': a, 'bereiche': [[s, a]], 'luecke': -1, 'daten': None, 'fehler': 0} for s, a in block['bereiche']]
+        self.bloecke[i:i+1] = neu
+        logger.warning(f"{self.Log_Text_NR_1[self.sprache]} {self.port} - {self.Log_Text_NR_3[self.sprache]} ({block['start']}, {block['anzahl']}) -> {[(b['start'], b['anzahl']) for b in neu]}")
+
+    def block_suchen(self, start, anzahl):
+        ''' Return: Block, der den Bereich vollständig enthält (None - kein Block) '''
+        for block in self.bloecke:
+            if block['start'] <= start and start + anzahl <= block['start'] + block['anzahl']:
+                return block
+        return None
+
+    ##########################################
+    # Lesen:
+    ##########################################
+    def zyklus(self, geraet):
+        ''' Beginnt einen neuen Lese-Zyklus des Gerätes (Aufruf am Anfang von read).
+
+        Args:
+            geraet (str):       Geräte-Name
+        '''
+        self.zyklen[geraet] = self.zyklen.get(geraet, 0) + 1
+
+    def lesen(self, geraet, start, anzahl):
+        ''' Liest Input-Register über die Karte (Ersatz für serial.read_input_registers).
+
+        Die Daten eines Blocks werden erneut gelesen, wenn sie älter als max_alter sind
+        oder das Gerät sie schon in einem früheren Zyklus bekommen hat.
+
+        Args:
+            geraet (str):       Geräte-Name
+            start (int):        Start-Register
+            anzahl (int):       Anzahl der Register
+        Return:
+            Liste der Register (None - Fehler)
+        '''
+        block = self.block_suchen(start, anzahl)
+        if block == None:
+            self.anz_Einzeln += 1
+            return self.serial.read_input_registers(start, anzahl)
+
+        jetzt  = time.perf_counter()
+        zyklus = self.zyklen.get(geraet, 0)
+        daten  = block['daten']
+        if daten == None or jetzt - daten['zeit'] > self.max_alter or daten['geraete'].get(geraet, zyklus) != zyklus:
+            werte = self.serial.read_input_registers(block['start'], block['anzahl'])
+            self.anz_Anfragen += 1
+            if werte == None or len(werte) != block['anzahl']:
+                block['daten'] = None
+                if block['luecke'] == -1 or len(block['bereiche']) == 1:
+                    return None
+                ## Bereich allein lesen (Fehler im Block oder Schnittstellen-Problem):
+                werte = self.serial.read_input_registers(start, anzahl)
+                if werte != None:
+                    block['fehler'] += 1
+                    if block['fehler'] >= MAX_FEHLER:
+                        self.block_aufteilen(block)
+                return werte
+            block['fehler'] = 0
+            daten = {'werte': werte, 'zeit': jetzt, 'geraete': {}}
+            block['daten'] = daten
+        else:
+            self.anz_Gespart += 1
+        daten['geraete'][geraet] = zyklus
+        i = start - block['start']
+        return daten['werte'][i:i+anzahl]
+
+    ##########################################
+    # Statistik:
+    ##########################################
+    def log_statistik(self):
+        ''' Schreibt die Zähler der Karte in das Logging. '''
+        logger.info(f"{self.Log_Text_NR_1[self.sprache]} {self.port} - {self.Log_Text_NR_4[self.sprache]} {self.anz_Anfragen}, {self.Log_Text_NR_5[self.sprache]} {self.anz_Gespart}, {self.Log_Text_NR_6[self.sprache]} {self.anz_Einzeln}")
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,163 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Gemeinsamer Speicher (Bank) aller PID-Regler:
+- Parameter und Zustände aller Regler (kp, ki, kd, ITerm, letzter Istwert, Grenzen, Output) liegen in NumPy-Arrays
+- Jeder Regler (PID.py) hat einen Listenplatz (Index) und greift über seine Attribute direkt auf die Arrays zu
+- Alle fälligen Regler eines PID-Taktes werden in einem Schritt berechnet (berechnen)
+- Die Begrenzung von I-Anteil und Output ist dieselbe wie bisher im einzelnen Regler (erst Max, dann Min)
+
+Die Bank wird vom PID-Takt (pid_takt.py) und von PID.InOutPID genutzt. Ein Lock schützt die Arrays
+beim Vergrößern und Berechnen.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import threading
+import time
+import numpy as np
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+# Felder der Bank (Attribut-Namen des PID-Reglers):
+FELDER = ['kp', 'ki', 'kd', 'ITerm', 'last_Input', 'last_time', 'Output', 'OutMax', 'OutMin', 'sample_time']
+
+
+class PID_Bank:
+    def __init__(self, kapazitaet = 8):
+        ''' Erstellung der Bank.
+
+        Args:
+            kapazitaet (int):       Anzahl der Listenplätze beim Start (wird bei Bedarf verdoppelt)
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        self.lock       = threading.RLock()
+        self.anzahl     = 0                     # Belegte Listenplätze
+        for feld in FELDER:
+            setattr(self, feld, np.zeros(kapazitaet))
+        self.last_time[:] = np.nan              # NaN - Regler wurde noch nicht berechnet
+
+    ##########################################
+    # Listenplätze:
+    ##########################################
+    def anmelden(self):
+        ''' Vergibt einen Listenplatz für einen neuen Regler.
+
+        Return:
+            index (int):            Listenplatz des Reglers
+        '''
+        with self.lock:
+            if self.anzahl == len(self.kp):
+                self.vergroessern()
+            index = self.anzahl
+            self.anzahl += 1
+        return index
+
+    def vergroessern(self):
+        ''' Verdoppelt die Länge aller Arrays. '''
+        alt = len(self.kp)
+        for feld in FELDER:
+            neu = np.zeros(2 * alt)
+            neu[:alt] = getattr(self, feld)
+            setattr(self, feld, neu)
+        self.last_time[alt:] = np.nan
+
+    ##########################################
+    # Regelung:
+    ##########################################
+    def berechnen(self, indizes, Input_Ist, Input_Soll, Modus, Rezept_OP, jetzt = None):
+        ''' Berechnet die Regler der Listenplätze in einem Schritt.
+
+        Args:
+            indizes (list):         Listenplätze der Regler
+            Input_Ist (list):       Istwerte der Regler
+            Input_Soll (list):      Sollwerte der Regler
+            Modus (list):           True - Rezept-Modus aktiv
+            Rezept_OP (list):       Output im Rezept-Modus (-1 - Regler-Output bleibt)
+            jetzt (float):          Zeitpunkt der Berechnung (time.perf_counter, None - aktuelle Zeit)
+        Return:
+            Output (ndarray):       Outputs der Regler (auf 3 Nachkommastellen gerundet)
+            timediff (ndarray):     Abstand zur letzten Berechnung in s (erste Berechnung: Sample-Zeit)
+        '''
+        i       = np.asarray(indizes, dtype=int)
+        ist     = np.asarray(Input_Ist, dtype=float)
+        soll    = np.asarray(Input_Soll, dtype=float)
+        modus   = np.asarray(Modus, dtype=bool)
+        rez_op  = np.asarray(Rezept_OP, dtype=float)
+        with self.lock:
+            if jetzt == None:
+                jetzt = time.perf_counter()
+            OutMax = self.OutMax[i]
+            OutMin = self.OutMin[i]
+            # Zeit:
+            letzte   = self.last_time[i]
+            timediff = np.where(np.isnan(letzte), self.sample_time[i] / 1000, jetzt - letzte)
+            dt       = timediff * 1000                              # ms (Einheit der Sample-Zeit, auf die ki und kd bezogen sind)
+            # Fehler Variablen:
+            ## Fehler:
+            error = soll - ist
+            ## I-Anteil:
+            ITerm = self.ITerm[i] + self.ki[i] * dt * error
+            ITerm = np.where(ITerm > OutMax, OutMax, np.where(ITerm < OutMin, OutMin, ITerm))
+            ## D-Anteil:
+            dInput = ist - self.last_Input[i]
+            DTerm  = np.where(dt > 0, self.kd[i] / np.where(dt > 0, dt, 1) * dInput, 0)
+            # PID-Ausgang:
+            Output = self.kp[i] * error + ITerm - DTerm
+            Output = np.where(Output > OutMax, OutMax, np.where(Output < OutMin, OutMin, Output))
+            # Nächster Durchgang:
+            self.ITerm[i]      = ITerm
+            self.last_time[i]  = jetzt
+            self.last_Input[i] = ist
+            # Rezept-Modus:
+            Output = np.where(modus & (rez_op != -1), rez_op, Output)
+            self.Output[i] = np.round(Output, 3)
+            return self.Output[i], timediff
+
+    def reset(self, index):
+        ''' Setzt den Zustand eines Reglers zurück (PID.Reset).
+
+        Args:
+            index (int):            Listenplatz des Reglers
+        '''
+        with self.lock:
+            self.ITerm[index]      = 0
+            self.last_Input[index] = 0
+            self.Output[index]     = 0
+            self.last_time[index]  = np.nan
+
+
+# Bank aller Regler des Programms:
+BANK = PID_Bank()
+
+
+def bank_attribut(feld):
+    ''' Erstellt ein Attribut (property) des PID-Reglers, das auf seinen Listenplatz in der Bank zugreift.
+
+    Args:
+        feld (str):                 Feld der Bank
+    '''
+    def lesen(pid):
+        return float(getattr(pid.bank, feld)[pid.index])
+    def schreiben(pid, wert):
+        getattr(pid.bank, feld)[pid.index] = wert
+    return property(lesen, schreiben)
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,241 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Gemeinsamer PID-Takt aller Geräte:
+- Ein eigener Thread (kein QTimer im GUI-Thread) ruft die PID-Regler aller Geräte auf
+- Geplant wird mit der monotonen Uhr (time.perf_counter), jeder Regler in seiner Sample-Zeit (PID|sample)
+- Alle Regler, die im selben Takt fällig sind, werden in einem Schritt in der PID-Bank berechnet (pid_bank.py)
+- Die Geräte liefern nur die Eingänge (PID_Eingang) und übernehmen den Output (PID_Ausgang)
+- Verpasste Takte werden übersprungen (phasentreu) und gezählt
+- Pro Regler wird die Abweichung vom geplanten Abstand in einem Histogramm gezählt
+
+Die Regler selbst rechnen mit dem tatsächlich gemessenen Abstand (PID.InOutPID), so dass ein
+verspäteter Takt die Regelung nicht mehr verfälscht.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import threading
+import time
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+AUFLOESUNG  = 0.001                                         # Regler, die innerhalb dieser Zeit in s fällig werden, werden im selben Takt berechnet
+MIN_PERIODE = 0.01                                          # Kleinste Sample-Zeit in s
+GRENZEN     = [0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100]     # Obere Grenzen der Histogramm-Klassen in ms
+
+
+class PID_Takt:
+    def __init__(self, sprache):
+        ''' Erstellung des PID-Taktes.
+
+        Args:
+            sprache (int):          Sprache der GUI (Listenplatz)
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache    = sprache
+
+        ## Weitere:
+        self.regler     = {}                    # Geräte-Name: Planungs- und Statistik-Daten
+        self.lock       = threading.Lock()
+        self.beendet    = threading.Event()
+        self.thread     = None
+        ## Statistik:
+        self.anz_Takt   = 0                     # Takte mit mindestens einem fälligen Regler
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_PT_1 = ['PID-Takt - Regler hinzugefügt:',                                                 'PID cycle - Controller added:']
+        self.Log_Text_PT_2 = ['Sample-Zeit',                                                                    'Sample time']
+        self.Log_Text_PT_3 = ['PID-Takt - Regler',                                                              'PID cycle - Controller']
+        self.Log_Text_PT_4 = ['Aufrufe:',                                                                       'Calls:']
+        self.Log_Text_PT_5 = ['Verpasst:',                                                                      'Missed:']
+        self.Log_Text_PT_6 = ['Abweichung Mittel/Max:',                                                         'Deviation mean/max:']
+        self.Log_Text_PT_7 = ['Dauer Max:',                                                                     'Duration max:']
+        self.Log_Text_PT_8 = ['Histogramm:',                                                                    'Histogram:']
+        self.Log_Text_PT_9 = ['PID-Takt - Takte:',                                                              'PID cycle - Cycles:']
+        self.Log_Text_PT_10 = ['Fehler im PID-Regler:',                                                         'Error in the PID controller:']
+
+    ##########################################
+    # Regler-Verwaltung:
+    ##########################################
+    def anmelden(self, geraet, pid, eingang, ausgang):
+        ''' Nimmt den PID-Regler eines Gerätes in den Takt auf.
+
+        Args:
+            geraet (str):           Geräte-Name
+            pid (PID):              PID-Regler des Gerätes
+            eingang (Funktion):     Funktion des Gerätes, die die Eingänge des Reglers liefert (PID_Eingang)
+            ausgang (Funktion):     Funktion des Gerätes, die den Output übernimmt (PID_Ausgang)
+        '''
+        periode = max(pid.sample_time / 1000, MIN_PERIODE)
+        jetzt   = time.perf_counter()
+        with self.lock:
+            self.regler[geraet] = {
+                'pid':          pid,
+                'eingang':      eingang,
+                'ausgang':      ausgang,
+                'periode':      periode,
+                'naechster':    jetzt + periode,
+                'letzter':      None,
+                ## Statistik:
+                'aufrufe':      0,
+                'verpasst':     0,
+                'abw_summe':    0,
+                'abw_max':      0,
+                'dauer_max':    0,
+                'klassen':      [0] * (len(GRENZEN) + 1),
+            }
+        logger.info(f'{self.Log_Text_PT_1[self.sprache]} {geraet} - {self.Log_Text_PT_2[self.sprache]}: {periode} s')
+
+    ##########################################
+    # Thread:
+    ##########################################
+    def start(self):
+        ''' Startet den Thread des Taktes. '''
+        if self.regler == {} or not self.thread == None:
+            return
+        self.thread = threading.Thread(target=self.schleife, name='PID_Takt', daemon=True)
+        self.thread.start()
+
+    def ende(self, timeout = 2):
+        ''' Beendet den Thread und wartet auf den laufenden Takt.
+
+        Args:
+            timeout (float):    Maximale Wartezeit in s
+        Return:
+            True, wenn der Thread beendet wurde
+        '''
+        self.beendet.set()
+        if not self.thread == None:
+            self.thread.join(timeout=timeout)
+            return not self.thread.is_alive()
+        return True
+
+    def schleife(self):
+        ''' Thread: Wartet bis zum nächsten fälligen Regler und berechnet alle fälligen Regler zusammen. '''
+        while not self.beendet.is_set():
+            with self.lock:
+                naechster = min(self.regler[geraet]['naechster'] for geraet in self.regler)
+            warten = naechster - time.perf_counter()
+            if warten > 0:
+                self.beendet.wait(warten)
+                continue
+            self.takt()
+
+    def takt(self):
+        ''' Berechnet alle fälligen Regler in einem Schritt und plant ihren nächsten Aufruf. '''
+        jetzt = time.perf_counter()
+        with self.lock:
+            faellig = [geraet for geraet in self.regler if self.regler[geraet]['naechster'] <= jetzt + AUFLOESUNG]
+        if faellig == []:
+            return
+        self.anz_Takt += 1
+
+        ## Eingänge der aktiven Regler sammeln (pro Bank):
+        banken = {}
+        for geraet in faellig:
+            eintrag = self.regler[geraet]
+            try:
+                werte = eintrag['eingang']()
+            except Exception as e:
+                logger.exception(f'{self.Log_Text_PT_3[self.sprache]} {geraet} - {self.Log_Text_PT_10[self.sprache]}')
+                werte = None
+            if werte == None:
+                continue
+            bank = eintrag['pid'].bank
+            if not id(bank) in banken:
+                banken[id(bank)] = {'bank': bank, 'geraete': [], 'werte': []}
+            banken[id(bank)]['geraete'].append(geraet)
+            banken[id(bank)]['werte'].append(werte)
+
+        ## Berechnen und Output an die Geräte übergeben:
+        for teil in banken.values():
+            ist, soll, modus, rez_op = zip(*teil['werte'])
+            indizes = [self.regler[geraet]['pid'].index for geraet in teil['geraete']]
+            try:
+                Output, timediff = teil['bank'].berechnen(indizes, ist, soll, modus, rez_op, jetzt)
+            except Exception as e:
+                logger.exception(f"{self.Log_Text_PT_3[self.sprache]} {teil['geraete']} - {self.Log_Text_PT_10[self.sprache]}")
+                continue
+            for n, geraet in enumerate(teil['geraete']):
+                eintrag = self.regler[geraet]
+                try:
+                    eintrag['pid'].protokoll(float(timediff[n]), ist[n], soll[n], float(Output[n]))
+                    eintrag['ausgang']()
+                except Exception as e:
+                    logger.exception(f'{self.Log_Text_PT_3[self.sprache]} {geraet} - {self.Log_Text_PT_10[self.sprache]}')
+        dauer = time.perf_counter() - jetzt
+
+        ## Statistik und nächster Takt (phasentreu, verpasste Takte werden übersprungen und gezählt):
+        ende = jetzt + dauer
+        for geraet in faellig:
+            eintrag = self.regler[geraet]
+            self.zaehlen(eintrag, jetzt, dauer)
+            periode   = eintrag['periode']
+            naechster = eintrag['naechster'] + periode
+            if naechster <= ende:
+                verpasst = int((ende - naechster) / periode) + 1
+                eintrag['verpasst'] += verpasst
+                naechster += verpasst * periode
+            eintrag['naechster'] = naechster
+
+    ##########################################
+    # Statistik:
+    ##########################################
+    def zaehlen(self, eintrag, start, dauer):
+        ''' Zählt die Abweichung des Abstandes zum letzten Aufruf von der Sample-Zeit im Histogramm.
+
+        Args:
+            eintrag (dict):         Planungsdaten des Reglers
+            start (float):          Zeitpunkt des Aufrufs (time.perf_counter)
+            dauer (float):          Dauer des Taktes in s
+        '''
+        eintrag['aufrufe']  += 1
+        eintrag['dauer_max'] = max(eintrag['dauer_max'], dauer)
+        if not eintrag['letzter'] == None:
+            abweichung = abs(start - eintrag['letzter'] - eintrag['periode'])
+            eintrag['abw_summe'] += abweichung
+            eintrag['abw_max']    = max(eintrag['abw_max'], abweichung)
+            ms = 1000 * abweichung
+            i = 0
+            while i < len(GRENZEN) and ms > GRENZEN[i]:
+                i += 1
+            eintrag['klassen'][i] += 1
+        eintrag['letzter'] = start
+
+    def log_statistik(self):
+        ''' Schreibt die Histogramme aller Regler in das Logging. '''
+        logger.info(f'{self.Log_Text_PT_9[self.sprache]} {self.anz_Takt}')
+        for geraet in self.regler:
+            eintrag = self.regler[geraet]
+            anzahl  = max(eintrag['aufrufe'] - 1, 1)
+            mittel  = eintrag['abw_summe'] / anzahl
+            klassen = []
+            for i, anz in enumerate(eintrag['klassen']):
+                if anz == 0:
+                    continue
+                klassen.append(f'<={GRENZEN[i]} ms: {anz}' if i < len(GRENZEN) else f'>{GRENZEN[-1]} ms: {anz}')
+            logger.info(f"{self.Log_Text_PT_3[self.sprache]} {geraet} - {self.Log_Text_PT_4[self.sprache]} {eintrag['aufrufe']}, {self.Log_Text_PT_5[self.sprache]} {eintrag['verpasst']}, {self.Log_Text_PT_6[self.sprache]} {1000*mittel:.2f}/{1000*eintrag['abw_max']:.2f} ms, {self.Log_Text_PT_7[self.sprache]} {1000*eintrag['dauer_max']:.2f} ms, {self.Log_Text_PT_8[self.sprache]} {', '.join(klassen)}")
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,229 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Gemeinsame Lese-Schicht (Transaktion) für die seriellen Geräte:
+- Statt fester Wartezeiten nach dem Senden wird gelesen, bis die Antwort vollständig ist oder die Frist (Deadline) abläuft
+- Vollständig ist eine Antwort nach dem Abschlusszeichen (plus Nachlauf, z.B. BCC), nach einer Anzahl Bytes
+  oder wenn das erste Byte allein schon die Antwort ist (z.B. ACK/NAK)
+- Es werden alle bereits empfangenen Bytes auf einmal gelesen (in_waiting), nicht Zeichen für Zeichen
+- Bytes hinter dem Ende der Antwort werden für die nächste Antwort aufgehoben (wie bei readline)
+- Pro Befehl wird die Dauer (Senden bis Antwort) in einem Histogramm gezählt
+- Pro Schnittstelle (Port) gibt es genau eine Lese-Schicht, die sich alle Geräte an diesem Port teilen (transaktion),
+  so sehen aufgehobene Bytes und der Abstand zwischen zwei Befehlen alle Geräte am Port (Zugriff über den Mutex des Ports)
+
+Auf eine Antwort wird mit dem Timeout der Schnittstelle (serial-interface) gewartet. Die Frist wird daher
+höchstens um diesen Timeout überschritten.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import threading
+import time
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+DEADLINE    = 0.5                                       # Standard-Frist in s für eine Antwort
+MAX_ANZ     = 1024                                      # Maximale Länge einer Antwort in Bytes
+GRENZEN     = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000] # Obere Grenzen der Histogramm-Klassen in ms
+
+TRANSAKTIONEN      = {}                                 # Port: Serial_Transaktion
+TRANSAKTIONEN_LOCK = threading.Lock()
+
+
+def transaktion(sprache, serial, port, deadline = DEADLINE):
+    ''' Gibt die gemeinsame Lese-Schicht des Ports zurück und erstellt sie beim ersten Aufruf.
+
+    Args:
+        sprache (int):          Sprache der GUI (Listenplatz)
+        serial (Serial):        Schnittstelle (pyserial, für alle Geräte am Port dieselbe - com_dict)
+        port (str):             Port der Schnittstelle (serial-interface|port)
+        deadline (float):       Standard-Frist in s für eine Antwort
+    Return:
+        Serial_Transaktion
+    '''
+    with TRANSAKTIONEN_LOCK:
+        if not port in TRANSAKTIONEN or not TRANSAKTIONEN[port].serial is serial:
+            TRANSAKTIONEN[port] = Serial_Transaktion(sprache, serial, port, deadline)
+        return TRANSAKTIONEN[port]
+
+
+class Serial_Transaktion:
+    def __init__(self, sprache, serial, name, deadline = DEADLINE):
+        ''' Erstellung der Lese-Schicht einer Schnittstelle.
+
+        Args:
+            sprache (int):          Sprache der GUI (Listenplatz)
+            serial (Serial):        Schnittstelle (pyserial)
+            name (str):             Port (für das Logging)
+            deadline (float):       Standard-Frist in s für eine Antwort
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache    = sprache
+        self.serial     = serial
+        self.name       = name
+        self.deadline   = deadline
+
+        ## Weitere:
+        self.rest       = b''                           # Empfangene Bytes hinter der letzten Antwort
+        self.gesendet   = None                          # Zeitpunkt des letzten Sendens (time.perf_counter)
+        self.letzte     = 0                             # Ende der letzten Transaktion (time.perf_counter)
+        ## Statistik:
+        self.statistik  = {}                            # Befehl: {'anzahl', 'fristen', 'summe', 'max', 'klassen'}
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_ST_1 = ['Serielle Transaktion - Befehl',                                                   'Serial transaction - Command']
+        self.Log_Text_ST_2 = ['Anzahl:',                                                                         'Count:']
+        self.Log_Text_ST_3 = ['Frist abgelaufen:',                                                               'Deadline expired:']
+        self.Log_Text_ST_4 = ['Dauer Mittel/Max:',                                                               'Duration mean/max:']
+        self.Log_Text_ST_5 = ['Histogramm:',                                                                     'Histogram:']
+        self.Log_Text_ST_6 = ['Frist abgelaufen - Unvollständige Antwort:',                                      'Deadline expired - Incomplete answer:']
+
+    ##########################################
+    # Senden:
+    ##########################################
+    def senden(self, daten):
+        ''' Sendet einen Befehl und merkt sich den Zeitpunkt für die Dauer der Antwort.
+
+        Args:
+            daten (bytes):          Befehl
+        '''
+        self.serial.write(daten)
+        self.gesendet = time.perf_counter()
+
+    def abstand(self, pause):
+        ''' Wartet nur so lange, bis seit dem Ende der letzten Transaktion mindestens die Pause vergangen ist.
+
+        Args:
+            pause (float):          Mindestabstand in s zwischen zwei Befehlen
+        '''
+        warten = self.letzte + pause - time.perf_counter()
+        if warten > 0:
+            time.sleep(warten)
+
+    def verwerfen(self):
+        ''' Verwirft aufgehobene und noch nicht gelesene Bytes (Ersatz für reset_input_buffer). '''
+        self.rest = b''
+        self.serial.reset_input_buffer()
+
+    ##########################################
+    # Lesen:
+    ##########################################
+    def lesen(self, befehl = '', ende = None, nachlauf = 0, anzahl = None, einzeln = b'', max_anz = MAX_ANZ, deadline = None):
+        ''' Liest eine Antwort, bis sie vollständig ist oder die Frist abläuft.
+
+        Args:
+            befehl (str):           Befehl (Schlüssel für die Statistik)
+            ende (bytes):           Abschlusszeichen der Antwort
+            nachlauf (int):         Anzahl Bytes nach dem Abschlusszeichen (z.B. Prüfsumme)
+            anzahl (int/Funktion):  Länge der Antwort oder Funktion(Puffer), die die Länge zurückgibt (None - noch unbekannt)
+            einzeln (bytes):        Bytes, die als erstes Byte allein die Antwort sind (z.B. ACK, NAK)
+            max_anz (int):          Maximale Länge der Antwort
+            deadline (float):       Frist in s (None - Standard-Frist)
+        Return:
+            puffer (bytes):         Antwort (bei abgelaufener Frist das bis dahin Empfangene)
+        '''
+        deadline  = self.deadline if deadline == None else deadline
+        start     = self.gesendet if not self.gesendet == None else time.perf_counter()
+        frist     = start + deadline
+        puffer    = self.rest
+        self.rest = b''
+
+        fertig, laenge = self.vollstaendig(puffer, ende, nachlauf, anzahl, einzeln, max_anz)
+        while not fertig and time.perf_counter() < frist:
+            warten = self.serial.in_waiting
+            if warten > 0:  puffer += self.serial.read(warten)          # Alles Empfangene auf einmal
+            else:           puffer += self.serial.read(1)               # Auf das nächste Byte warten (Timeout der Schnittstelle)
+            fertig, laenge = self.vollstaendig(puffer, ende, nachlauf, anzahl, einzeln, max_anz)
+
+        ## Bytes hinter der Antwort aufheben:
+        if fertig and len(puffer) > laenge:
+            self.rest = puffer[laenge:]
+            puffer    = puffer[:laenge]
+
+        self.letzte   = time.perf_counter()
+        self.gesendet = None
+        self.zaehlen(befehl, self.letzte - start, fertig)
+        if not fertig:
+            logger.debug('%s - %s %s (%s)', self.name, self.Log_Text_ST_6[self.sprache], puffer, befehl)
+        return bytes(puffer)
+
+    def vollstaendig(self, puffer, ende, nachlauf, anzahl, einzeln, max_anz):
+        ''' Prüft, ob die Antwort vollständig ist.
+
+        Return:
+            fertig (bool):          True - Antwort vollständig
+            laenge (int):           Länge der Antwort im Puffer
+        '''
+        if len(puffer) >= 1 and puffer[0:1] in einzeln:
+            return True, 1
+        if not ende == None:
+            i = puffer.find(ende)
+            if i >= 0 and len(puffer) >= i + len(ende) + nachlauf:
+                return True, i + len(ende) + nachlauf
+        if not anzahl == None:
+            laenge = anzahl(puffer) if callable(anzahl) else anzahl
+            if not laenge == None and len(puffer) >= laenge:
+                return True, laenge
+        if len(puffer) >= max_anz:
+            return True, max_anz
+        return False, len(puffer)
+
+    ##########################################
+    # Statistik:
+    ##########################################
+    def zaehlen(self, befehl, dauer, fertig):
+        ''' Zählt die Dauer einer Transaktion im Histogramm des Befehls.
+
+        Args:
+            befehl (str):           Befehl
+            dauer (float):          Dauer in s
+            fertig (bool):          False - Frist abgelaufen
+        '''
+        if not befehl in self.statistik:
+            self.statistik[befehl] = {'anzahl': 0, 'fristen': 0, 'summe': 0, 'max': 0, 'klassen': [0] * (len(GRENZEN) + 1)}
+        s = self.statistik[befehl]
+        s['anzahl'] += 1
+        s['summe']  += dauer
+        s['max']     = max(s['max'], dauer)
+        if not fertig:
+            s['fristen'] += 1
+        ms = 1000 * dauer
+        i = 0
+        while i < len(GRENZEN) and ms > GRENZEN[i]:
+            i += 1
+        s['klassen'][i] += 1
+
+    def log_statistik(self):
+        ''' Schreibt die Histogramme aller Befehle in das Logging. '''
+        for befehl in self.statistik:
+            s = self.statistik[befehl]
+            mittel = s['summe'] / s['anzahl']
+            klassen = []
+            for i, anz in enumerate(s['klassen']):
+                if anz == 0:
+                    continue
+                klassen.append(f'<={GRENZEN[i]} ms: {anz}' if i < len(GRENZEN) else f'>{GRENZEN[-1]} ms: {anz}')
+            logger.info(f"{self.name} - {self.Log_Text_ST_1[self.sprache]} {befehl} - {self.Log_Text_ST_2[self.sprache]} {s['anzahl']}, {self.Log_Text_ST_3[self.sprache]} {s['fristen']}, {self.Log_Text_ST_4[self.sprache]} {1000*mittel:.1f}/{1000*s['max']:.1f} ms, {self.Log_Text_ST_5[self.sprache]} {', '.join(klassen)}")
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -13,22 +13,19 @@ TruHeat Generator:
 # ++++++++++++++++++++++++++++
 ## GUI:
 from PyQt5.QtCore import (
-    pyqtSignal,
-    QThread,
-    QTimer,
     QObject
 )
 
 ## Allgemein:
 import logging
 from serial import Serial, SerialException
-import time
 import math as m
 # import threading
 import datetime
 
 ## Eigene:
 from .PID import PID
+from .serial_transaktion import transaktion
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -47,8 +44,6 @@ class SerialMock: # Notiz: Näher ansehen!
 
 
 class TruHeat(QObject):
-    signal_PID  = pyqtSignal(float, float, bool, float)
-
     def __init__(self, sprache, config, com_dict, test, neustart, multilog_aktiv, Log_WriteReadTime, add_Ablauf_function, name="TruHeat", typ = 'Generator'):
         """ Erstelle TruHeat Schnittstelle. Bereite Messwertaufnahme und Daten senden vor.
 
@@ -98,25 +93,21 @@ class TruHeat(QObject):
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
+        ''' Die Schlüssel aus config_schema.py kommen geprüft vom Controller (Default bei Fehler).
+        Hier wird nur noch folgendes kontrolliert:
+        1. Schlüssel außerhalb des Schemas mit Default-Vergabe!
+        2. Abhängigkeiten zwischen den Werten (z.B. Grenzen)!
         '''
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Einstellung für Log:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                                                                                                                      'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                                                                                                                         'Possible values:']
         self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                                                                                                                               'The following types are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                                                                                                                              'Default is used:']
         self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                                                                                                    'Error reading config during configuration:']
         self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                                                                                                                                                  '; Set to default:']
         self.Log_Pfad_conf_5_1  = ['; Adressen-Fehler -> Programm zu Ende!!!',                                                                                                                                              '; Address error -> program ends!!!']
-        self.Log_Pfad_conf_5_2  = ['; PID-Modus Aus!!',                                                                                                                                                                     '; PID mode off!!']
         self.Log_Pfad_conf_5_3  = ['; Multilog-Link Aus!!',                                                                                                                                                                 '; Multilog-Link off!!']
         self.Log_Pfad_conf_6    = ['Fehlergrund:',                                                                                                                                                                          'Reason for error:']
-        self.Log_Pfad_conf_7    = ['Bitte vor Nutzung Korrigieren und Config Neu Einlesen!',                                                                                                                                'Please correct and re-read config before use!']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                                                                                                                                  'Incorrect input:']
         self.Log_Pfad_conf_8_1  = ['Fehlerhafte Typ:',                                                                                                                                                                      'Incorrect type:']
         self.Log_Pfad_conf_9    = ['Die Obergrenze ist kleiner als die Untergrenze! Setze die Limits auf Default:',                                                                                                         'The upper limit is smaller than the lower limit! Set the limits to default:']
         self.Log_Pfad_conf_10   = ['zu',                                                                                                                                                                                    'to']
@@ -129,17 +120,8 @@ class TruHeat(QObject):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Zum Start:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.init       = self.config['start']['init']           # Initialisierung
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.messZeit   = self.config['start']["readTime"]       # Auslesezeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|readTime {self.Log_Pfad_conf_5[self.sprache]} 2')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.messZeit = 2
+        self.init       = self.config['start']['init']           # Initialisierung
+        self.messZeit   = self.config['start']["readTime"]       # Auslesezeit
         #//////////////////////////////////////////////////////////////////////
         try: self.adress     = self.config['start']['ad']             # Generatoradresse
         except Exception as e: 
@@ -147,87 +129,24 @@ class TruHeat(QObject):
             logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
             exit()
         #//////////////////////////////////////////////////////////////////////
-        try: self.wdT        = self.config['start']['watchdog_Time']  # Watchdog-Zeit in ms
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|watchdog_Time {self.Log_Pfad_conf_5[self.sprache]} 5000')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.wdT = 5000
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Delay_sT   = self.config['start']['send_Delay']     # Sende Delay in ms
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|send_Delay {self.Log_Pfad_conf_5[self.sprache]} 20')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Delay_sT = 20
-        #//////////////////////////////////////////////////////////////////////
-        try: self.startMod   = self.config['start']['start_modus'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|start_modus {self.Log_Pfad_conf_5[self.sprache]} P')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.startMod = 'P'
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Ist                    = self.config['PID']["start_ist"] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_ist {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Ist = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.Soll              = self.config['PID']["start_soll"]
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_soll {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Soll = 0 
+        self.wdT        = self.config['start']['watchdog_Time']  # Watchdog-Zeit in ms
+        self.Delay_sT   = self.config['start']['send_Delay']     # Sende Delay in ms
+        self.startMod   = self.config['start']['start_modus']
+        self.Ist                    = self.config['PID']["start_ist"]
+        self.Soll              = self.config['PID']["start_soll"]
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~      
         ## Limits:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.oGP = self.config["limits"]['maxP']  
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxP {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGP = 1
-        #//////////////////////////////////////////////////////////////////////      
-        try: self.uGP = self.config["limits"]['minP']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minP {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGP = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.oGI = self.config["limits"]['maxI']   
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxI {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGI = 1
-        #//////////////////////////////////////////////////////////////////////     
-        try: self.uGI = self.config["limits"]['minI']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minI {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGI = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.oGU = self.config["limits"]['maxU']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxU {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGU = 1        
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGU = self.config["limits"]['minU']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minU {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGU = 0
+        self.oGP = self.config["limits"]['maxP']
+        self.uGP = self.config["limits"]['minP']
+        self.oGI = self.config["limits"]['maxI']
+        self.uGI = self.config["limits"]['minI']
+        self.oGU = self.config["limits"]['maxU']
+        self.uGU = self.config["limits"]['minU']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Schnittstelle Extra:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.Loop = self.config['serial-loop-read']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} serial-loop-read {self.Log_Pfad_conf_5[self.sprache]} 10')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Loop = 10
+        self.Loop = self.config['serial-loop-read']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## PID:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -237,65 +156,23 @@ class TruHeat(QObject):
             logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
             self.unit_PIDIn = 'mm'
         #//////////////////////////////////////////////////////////////////////
-        error_PID = False
-        try: self.PID_Config             = self.config['PID']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID {self.Log_Pfad_conf_5_2[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            error_PID = True
-            self.PID_Config = {}
-            self.PID_Aktiv  = 0 
-        #//////////////////////////////////////////////////////////////////////
-        if not error_PID:
-            try: self.PID_Aktiv = self.config['PID']['PID_Aktiv']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|PID_Aktiv {self.Log_Pfad_conf_5[self.sprache]} False')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.PID_Aktiv = 0 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Option             = self.config['PID']['Value_Origin'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Value_Origin {self.Log_Pfad_conf_5[self.sprache]} VV')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Option = 'VV'
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Sample_Time        = self.config['PID']['sample']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|sample {self.Log_Pfad_conf_5[self.sprache]} 500')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Sample_Time = 500 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Limit_Max    = self.config['PID']['Input_Limit_max']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Limit_Max  = 1 
+        self.PID_Config             = self.config['PID']
+        self.PID_Aktiv              = self.config['PID']['PID_Aktiv']
+        self.PID_Option             = self.config['PID']['Value_Origin']
+        self.PID_Sample_Time        = self.config['PID']['sample']
+        self.PID_Input_Limit_Max    = self.config['PID']['Input_Limit_max']
+        self.PID_Input_Limit_Min    = self.config['PID']['Input_Limit_min']
+        self.PID_Input_Error_Option = self.config['PID']['Input_Error_option']
         #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Limit_Min    = self.config['PID']['Input_Limit_min'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Limit_Min = 0 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Input_Error_Option = self.config['PID']['Input_Error_option']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Error_option {self.Log_Pfad_conf_5[self.sprache]} error')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Input_Error_Option = 'error'
-        #//////////////////////////////////////////////////////////////////////
-        try: self.M_device_ist           = self.config['multilog']['read_trigger_ist'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|read_trigger_ist {self.Log_Pfad_conf_5_3[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.M_device_ist           = self.config['multilog']['read_trigger_ist']
+        if self.M_device_ist == None:
+            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_ist {self.Log_Pfad_conf_5_3[self.sprache]}')
             self.M_device_ist = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
-        try: self.M_device_soll          = self.config['multilog']['read_trigger_soll'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|read_trigger_soll {self.Log_Pfad_conf_5_3[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.M_device_soll          = self.config['multilog']['read_trigger_soll']
+        if self.M_device_soll == None:
+            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_soll {self.Log_Pfad_conf_5_3[self.sprache]}')
             self.M_device_soll = ''
             self.multilog_OnOff = False
         #//////////////////////////////////////////////////////////////////////
@@ -316,86 +193,22 @@ class TruHeat(QObject):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### While-Check-Loop:
-        if not type(self.Loop) == int or not self.Loop >= 1:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} serial-loop-read - {self.Log_Pfad_conf_2[self.sprache]} Integer (>=1) - {self.Log_Pfad_conf_3[self.sprache]} 10 - {self.Log_Pfad_conf_8[self.sprache]} {self.Loop}')
-            self.Loop = 10
-        ### PID-Aktiviert:
-        if not type(self.PID_Aktiv) == bool and not self.PID_Aktiv in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} PID_Aktiv - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Aktiv}')
-            self.PID_Aktiv = 0
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
-        ### Messzeit:
-        if not type(self.messZeit) in [int, float] or not self.messZeit >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} readTime - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 2 - {self.Log_Pfad_conf_8[self.sprache]} {self.messZeit}')
-            self.messZeit = 2
-        ### Start-Modus:
-        if not self.startMod in ['P', 'I', 'U']:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_modus - {self.Log_Pfad_conf_2[self.sprache]} [P, I, U] - {self.Log_Pfad_conf_3[self.sprache]} P - {self.Log_Pfad_conf_8[self.sprache]} {self.startMod}')
-            self.startMod = 'P'
-        ### Watchdog-Zeit:
-        if not type(self.wdT) == int or not self.wdT >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} watchdog_Time - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 5000 - {self.Log_Pfad_conf_8[self.sprache]} {self.wdT}')
-            self.wdT = 5000
-        ### Sende Delay:
-        if not type(self.Delay_sT) == int or not self.Delay_sT >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} send_Delay - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 20 - {self.Log_Pfad_conf_8[self.sprache]} {self.Delay_sT}')
-            self.Delay_sT = 20
-        ### PID-Start-Soll:
-        if not type(self.Soll) in [float, int] or not self.Soll >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_soll - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {self.Soll}')
-            self.Soll = 0
-        ### PID-Start-Ist:
-        if not type(self.Ist) in [float, int] or not self.Ist >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_ist - {self.Log_Pfad_conf_2_1[self.sprache]} [Integer, Float] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {self.Ist}')
-            self.Ist = 0
         ### Leistungs-Limit:
-        if not type(self.oGP) in [float, int] or not self.oGP >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxP - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGP)}')
-            self.oGP = 1
-        if not type(self.uGP) in [float, int] or not self.oGP >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minP - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGP)}')
-            self.uGP = 0
         if self.oGP <= self.uGP:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
             self.uGP = 0
             self.oGP = 1
         ### Strom-Limit:
-        if not type(self.oGI) in [float, int] or not self.oGI >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxP - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGI)}')
-            self.oGI = 1
-        if not type(self.uGI) in [float, int] or not self.oGI >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minP - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGI)}')
-            self.uGI = 0
         if self.oGI <= self.uGI:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
             self.uGI = 0
             self.oGI = 1
         ### Spannung-Limit:
-        if not type(self.oGU) in [float, int] or not self.oGU >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxP - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGU)}')
-            self.oGU = 1
-        if not type(self.uGU) in [float, int] or not self.oGU >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minP - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGU)}')
-            self.uGU = 0
         if self.oGU <= self.uGU:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
             self.uGU = 0
             self.oGU = 1
-        ### PID Sample Zeit:
-        if not type(self.PID_Sample_Time) in [int] or not self.PID_Sample_Time >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} sample - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 500 - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Sample_Time}')
-            self.PID_Sample_Time = 500 
         ### PID-Limit:
-        if not type(self.PID_Input_Limit_Max) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_max - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.PID_Input_Limit_Max)}')
-            self.PID_Input_Limit_Max = 1
-        if not type(self.PID_Input_Limit_Min) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_min - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.PID_Input_Limit_Min)}')
-            self.PID_Input_Limit_Min = 0
         if self.PID_Input_Limit_Max <= self.PID_Input_Limit_Min:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
             self.PID_Input_Limit_Min = 0
@@ -408,14 +221,6 @@ class TruHeat(QObject):
         if not type(self.sensor_soll) == str:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Multilog_Sensor_Soll - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_3[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.sensor_soll)}')
             self.multilog_OnOff = False
-        ### read-Trigger Multilog Ist:
-        if not type(self.M_device_ist) == str:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} read_trigger_ist - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_3[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.M_device_ist)}')
-            self.multilog_OnOff = False
-        ### read-Trigger Multilog Soll:
-        if not type(self.M_device_soll) == str:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} read_trigger_soll - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_3[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.M_device_soll)}')
-            self.multilog_OnOff = False
         ### Adresse:
         if not type(self.adress) == str:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} ad - {self.Log_Pfad_conf_2_1[self.sprache]} [str] - {self.Log_Pfad_conf_5_1[self.sprache].replace("; ", "")} - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.adress)}')
@@ -497,7 +302,7 @@ class TruHeat(QObject):
         self.Log_Text_129_str   = ['Aktives Interface: Unbekannt! Ausgelesen:',                                                                                                                                             'Active Interface: Unknown! Read:']
         self.Log_Text_130_str   = ['Gibt es:',                                                                                                                                                                              'There is:']
         self.Log_Text_131_str   = ['Das aktuelle Interface ist nicht RS-232!',                                                                                                                                              'The current interface is not RS-232!']
-        self.Log_Text_PID_str   = ['Start des PID-Threads!',                                                                                                                                                                'Start of the PID thread!']
+        self.Log_Text_PID_str   = ['PID-Regler im PID-Takt!',                                                                                                                                                               'PID controller in the PID cycle!']
         Log_Text_PID_N1         = ['Die Konfiguration',                                                                                                                                                                     'The configuration']
         Log_Text_PID_N2         = ['existiert nicht! Möglich sind nur VV, VM, MM oder MV. Nutzung von Default VV!',                                                                                                         'does not exist! Only VV, VM, MM or MV are possible. Use default VV!']
         Log_Text_PID_N2_1       = ['ist für das Gerät noch nicht umgesetzt! Nutzung von Default VV!',                                                                                                                       'is not yet implemented for the device! Use of default VV!']
@@ -551,6 +356,7 @@ class TruHeat(QObject):
         # Schnittstelle:
         #---------------------------------------
         logger.info(f" {self.device_name} - {self.Log_Text_60_str[self.sprache]}")
+        self.transaktion = None
         try:
             if not test:
                 com_ak = ''
@@ -562,6 +368,8 @@ class TruHeat(QObject):
                     self.serial = Serial(**config["serial-interface"])
                 else:
                     self.serial = com_dict[com_ak]
+                ## Lese-Schicht mit Frist (ersetzt die festen Wartezeiten):
+                self.transaktion = transaktion(self.sprache, self.serial, self.config['serial-interface']['port'])
         except SerialException as e:
             self.serial = SerialMock()
             logger.warning(f"{self.device_name} - {self.Log_Text_61_str[self.sprache]}")
@@ -623,20 +431,8 @@ class TruHeat(QObject):
         logger.info(f'{self.device_name} - {Log_Text_PID_N3[self.sprache]}{self.PID_Option} ({teil_1[self.sprache]}, {teil_2[self.sprache]})')
 
         if self.PID_Aktiv:
-            ## PID-Thread:
-            self.PIDThread = QThread()
-            self.PID.moveToThread(self.PIDThread)
-            logger.info(f'{self.device_name} - {self.Log_Text_PID_str[self.sprache]}') 
-            self.PIDThread.start()
-            self.signal_PID.connect(self.PID.InOutPID)
-            ## Timer:
-            self.timer_PID = QTimer()                                              # Reaktionszeittimer (ruft die Geräte auf, liest aber nur unter bestimmten Bedingungen!)
-            self.timer_PID.setInterval(self.PID_Sample_Time)
-            self.timer_PID.timeout.connect(self.PID_Update)
-            self.timer_PID.start()
-            ### PID-Timer Thread:
-            #self.PIDThreadTimer = threading.Thread(target=self.PID_Update)
-            #self.PIDThreadTimer.start()
+            ## Der PID-Regler wird im gemeinsamen PID-Takt berechnet (pid_takt.py, Anmeldung im vifcon_controller):
+            logger.info(f'{self.device_name} - {self.Log_Text_PID_str[self.sprache]}')
         else:
             logger.info(f'{self.device_name} - {self.Log_Text_PID_N23[self.sprache]}')
         ## Multilog-Lese-Variable für die Daten:
@@ -882,8 +678,8 @@ class TruHeat(QObject):
             Anz_DatBy (str):    Anzahl der Datenbytes in Binär!
             op_Anz_DatBy (Str): Optionales Längenbyte
         '''
-        # Kurze Verzögerung:
-        time.sleep(self.Delay_sT/1000)                          # ms in s
+        # Abstand zum letzten Befehl:
+        self.transaktion.abstand(self.Delay_sT/1000)            # ms in s
         # Schreibe:
         ## Vorbereitung:
         write_list = []                                         # Aussehen: [Header, Befehl, (optionales Längenbyte), Datenbytes, Checksumme]
@@ -916,7 +712,7 @@ class TruHeat(QObject):
         ### Checksumme:
         cs = self.hex_schnitt(self.write_checksum(write_list))
         write_list.append(cs)
-        logging.debug(f"{self.device_name} - {self.Log_Text_75_str[self.sprache]} {write_list}")
+        logging.debug("%s - %s %s", self.device_name, self.Log_Text_75_str[self.sprache], write_list)
 
         # Senden des Befehls und Auslesen der Antwort:
         while_n = 0
@@ -925,9 +721,7 @@ class TruHeat(QObject):
             ## Senden
             error = False
             try:
-                for n in write_list:
-                    self.serial.write(bytearray.fromhex(n))
-                    #logging.debug(f"{self.device_name} - Sende das Hexadezimal Zeichen: {n}")
+                self.transaktion.senden(bytearray.fromhex(''.join(write_list)))     # Alle Bytes auf einmal
             except Exception as e:
                 logger.warning(f"{self.device_name} - {self.Log_Text_76_str[self.sprache]}")
                 logger.exception(f"{self.device_name} - {self.Log_Text_77_str[self.sprache]}")
@@ -935,14 +729,14 @@ class TruHeat(QObject):
 
             if not error:
                 ## Lese Antwort (Kontrolle des Eingangs des Befehls):
-                for byte_bef in range(1,6):                         # ACK, Header, Befehl, Quittierungsnachricht, CS
-                    ans = self.serial.read()                        # Notiz: eventuell wird noch ein Try-Except gebraucht!
-                    ans_list.append(ans)
-                    #time.sleep(0.1)
-                logging.debug(f"{self.device_name} - {self.Log_Text_78_str[self.sprache]} {ans_list}")
+                ans = self.transaktion.lesen(befehl = befehl, anzahl = self.antwort_laenge)    # ACK, Header, Befehl, Quittierungsnachricht, CS
+                ans_list = [ans[i:i+1] for i in range(0, len(ans))]
+                if ans_list == []:                                  # Keine Antwort (Frist abgelaufen)
+                    ans_list = [b'']
+                logging.debug("%s - %s %s", self.device_name, self.Log_Text_78_str[self.sprache], ans_list)
                 if ans_list[0] == b'\x06':
                     self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_53_str[self.sprache]}')             
-                    logging.debug(f"{self.device_name} - {self.Log_Text_79_str[self.sprache]} {befehl} - {self.Log_Text_80_str[self.sprache]}")
+                    logging.debug("%s - %s %s - %s", self.device_name, self.Log_Text_79_str[self.sprache], befehl, self.Log_Text_80_str[self.sprache])
                     ans_list.pop(0)
                     ### Prüfe-Checksumme:
                     key_alt = b'\x00'                               # Vieleicht noch in Funktion da 2mal gebraucht
@@ -951,12 +745,12 @@ class TruHeat(QObject):
                         key_alt = key
                     if key == b'\x00':
                         ans_list.pop(-1)
-                        logging.debug(f"{self.device_name} - {self.Log_Text_81_str[self.sprache]}")
+                        logging.debug("%s - %s", self.device_name, self.Log_Text_81_str[self.sprache])
                         self.serial.write(bytearray.fromhex('06'))  # bestätigte das alles in Ordnung ist!
                         # Quittierungsmedlung ansehen:
                         quittierung = int(ans_list[2].hex(),16)
                         if quittierung == 0:
-                            logging.debug(f"{self.device_name} - {self.Log_Text_82_str[self.sprache]}")
+                            logging.debug("%s - %s", self.device_name, self.Log_Text_82_str[self.sprache])
                         elif quittierung == 2:
                             logging.warning(f"{self.device_name} - {self.Log_Text_83_str[self.sprache]}")
                         elif quittierung == 4:
@@ -979,11 +773,12 @@ class TruHeat(QObject):
                     self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_55_str[self.sprache]}')  
                     logging.warning(f"{self.device_name} - {self.Log_Text_79_str[self.sprache]} {befehl} - {self.Log_Text_91_str[self.sprache]}")
                 
-            # Kurze Verzögerung:
-            time.sleep(self.Delay_sT/1000) # ms in s
+            # Abstand zum letzten Befehl und Antwort-Reste verwerfen:
+            self.transaktion.abstand(self.Delay_sT/1000)    # ms in s
+            self.transaktion.verwerfen()
             # Wiederhole Senden!
             while_n += 1 
-            logging.debug(f"{self.device_name} - {self.Log_Text_79_str[self.sprache]} {befehl} - {self.Log_Text_92_str[self.sprache]} {while_n}")
+            logging.debug("%s - %s %s - %s %s", self.device_name, self.Log_Text_79_str[self.sprache], befehl, self.Log_Text_92_str[self.sprache], while_n)
 
         if while_n == self.Loop:
             logging.warning(f"{self.device_name} - {self.Log_Text_93_str[self.sprache]}")
@@ -1005,6 +800,27 @@ class TruHeat(QObject):
         
         return bytes([_a ^ _b for _a, _b in zip(ba1, ba2)])        
 
+    def antwort_laenge(self, puffer):
+        ''' Bestimmt die Länge der Antwort aus den ersten Bytes (für die Serial_Transaktion).
+
+        Args:
+            puffer (bytes):     Bisher empfangene Bytes
+        Return:
+            Länge der Antwort in Bytes (None - noch unbekannt)
+        '''
+        if len(puffer) < 1:
+            return None
+        if not puffer[0:1] == b'\x06':                  # NAK oder Fehler - Nur ein Byte
+            return 1
+        if len(puffer) < 2:
+            return None
+        anz_DatBy = puffer[1] & 0b111                   # Anzahl Datenbytes aus dem Header
+        if not anz_DatBy == 7:
+            return 3 + anz_DatBy + 1                    # ACK, Header, Befehl, Datenbytes, CS
+        if len(puffer) < 4:
+            return None
+        return 4 + puffer[3] + 1                        # ACK, Header, Befehl, Optionales Längenbyte, Datenbytes, CS
+
     def read_send(self, befehl, dat_Anz, res, um, dreh = True):
         ''' Sende Lese-Befehl und Lese die Antowrt des Lesebefehls aus!
         
@@ -1019,8 +835,8 @@ class TruHeat(QObject):
                                       Im Fall des Befehls 0x82 sind in der Antwort zwei Werte enthalten, da es den Max. Stromsollwert seperat
                                       gibt, muss hier etwas spezielles getan werden!
         '''
-        # Kurze Verzögerung:
-        time.sleep(self.Delay_sT/1000)              # ms in s
+        # Abstand zum letzten Befehl:
+        self.transaktion.abstand(self.Delay_sT/1000)    # ms in s
         # Befehl erstellen:
         ## Vorbereitung:
         write_list = []                             # Aussehen: [Header, Befehl, Checksumme]
@@ -1032,30 +848,27 @@ class TruHeat(QObject):
         write_list.append(befehl)
         ## Checksumme:
         write_list.append(self.hex_schnitt(self.write_checksum(write_list)))
-        logging.debug(f"{self.device_name} - {self.Log_Text_94_str[self.sprache]} {write_list}")
+        logging.debug("%s - %s %s", self.device_name, self.Log_Text_94_str[self.sprache], write_list)
 
         # Senden und Auslesen:
         n = 0
         while n != self.Loop:
             ans_list = []
-            ## Sende Befehl:
-            for send_byte in write_list:
-                self.serial.write(bytearray.fromhex(send_byte))
-                logging.debug(f"{self.device_name} - {self.Log_Text_95_str[self.sprache]} {send_byte}!")
+            ## Sende Befehl (alle Bytes auf einmal):
+            self.transaktion.senden(bytearray.fromhex(''.join(write_list)))
+            logging.debug("%s - %s %s!", self.device_name, self.Log_Text_95_str[self.sprache], write_list)
 
             ## Antwort auslesen:
-            for ans_byte in range(1,dat_Anz + 6):   # ACK, Header, Befehl, Datenbytes, CS, Optionales Längenbyte bei Datenbytes >7 (oder 6)           
-                ans = self.serial.read()
-                ans_list.append(ans)
-                #time.sleep(0.1)
-            logging.debug(f"{self.device_name} - {self.Log_Text_96_str[self.sprache]} {ans_list}")
+            ans = self.transaktion.lesen(befehl = befehl, anzahl = self.antwort_laenge, max_anz = dat_Anz + 6)   # ACK, Header, Befehl, (Optionales Längenbyte), Datenbytes, CS
+            ans_list = [ans[i:i+1] for i in range(0, len(ans))]
+            logging.debug("%s - %s %s", self.device_name, self.Log_Text_96_str[self.sprache], ans_list)
             
             ## Antwort verarbeiten:
-            if b'' in ans_list:                     # Entferne Leere Byte-Arrays
-                ans_list.remove(b'')   
+            if ans_list == []:                      # Keine Antwort (Frist abgelaufen)
+                ans_list = [b'']
             ### Überprüfe Sendebestätigung 
             if ans_list[0] == b'\x06':              
-                logger.debug(f"{self.device_name} - {self.Log_Text_97_str[self.sprache]} {befehl}")
+                logger.debug("%s - %s %s", self.device_name, self.Log_Text_97_str[self.sprache], befehl)
                 ans_list.pop(0)                     # Entferne ACK
                 ### Prüfe-Checksumme:
                 key_alt = b'\x00'   
@@ -1064,9 +877,9 @@ class TruHeat(QObject):
                     key_alt = key
                 if key == b'\x00':
                     ans_list.pop(-1)                # Entferne Checksumme
-                    logger.debug(f"{self.device_name} - {self.Log_Text_98_str[self.sprache]}")
+                    logger.debug("%s - %s", self.device_name, self.Log_Text_98_str[self.sprache])
                     ### Bestätige dem Generator das alles in Ordnung ist:
-                    logger.debug(f"{self.device_name} - {self.Log_Text_99_str[self.sprache]}")
+                    logger.debug("%s - %s", self.device_name, self.Log_Text_99_str[self.sprache])
                     self.serial.write(bytearray.fromhex('06')) 
                     break
             elif ans_list[0] == b'\x15':
@@ -1079,11 +892,12 @@ class TruHeat(QObject):
                 logger.warning(f"{self.device_name} - {self.Log_Text_101_str[self.sprache]} {befehl}")
                 #break
             
-            # Kurze Verzögerung:
-            time.sleep(self.Delay_sT/1000)                      # ms in s
+            # Abstand zum letzten Befehl und Antwort-Reste verwerfen:
+            self.transaktion.abstand(self.Delay_sT/1000)        # ms in s
+            self.transaktion.verwerfen()
             # Nächste Schleife:
             n += 1
-            logger.debug(f"{self.device_name} - {self.Log_Text_102_str[self.sprache]} {befehl} - {self.Log_Text_92_str[self.sprache]} {n}: {self.Log_Text_103_str[self.sprache]}")
+            logger.debug("%s - %s %s - %s %s: %s", self.device_name, self.Log_Text_102_str[self.sprache], befehl, self.Log_Text_92_str[self.sprache], n, self.Log_Text_103_str[self.sprache])
 
         # Auswertung der Datenbytes:
         if not n == self.Loop:
@@ -1120,7 +934,7 @@ class TruHeat(QObject):
                 value = ''.join(dat_list)
         else:
             value = m.nan                                        
-        logger.debug(f"{self.device_name} - {self.Log_Text_104_str[self.sprache]} {value}")
+        logger.debug("%s - %s %s", self.device_name, self.Log_Text_104_str[self.sprache], value)
 
         return value
             
@@ -1134,43 +948,43 @@ class TruHeat(QObject):
 
         try:
             # Lese Ist-Leistung:
-            logger.debug(f"{self.device_name} - {self.Log_Text_105_str[self.sprache]}")
+            logger.debug("%s - %s", self.device_name, self.Log_Text_105_str[self.sprache])
             value = self.read_send(self.rbefIP, 2, self.resP, self.umP)
             value = value if type(value) == float else m.nan
             if m.isnan(value): logger.warning(f'{self.device_name} - {self.Log_Nan_1_Float[self.sprache]} ({self.rbefIP})')
             self.value_name['IWP'] = value                                                  # Einheit: kW
             # Lese Ist-Spannung:
-            logger.debug(f"{self.device_name} - {self.Log_Text_106_str[self.sprache]}")
+            logger.debug("%s - %s", self.device_name, self.Log_Text_106_str[self.sprache])
             value = self.read_send(self.rbefIU, 2, self.resU, self.umU)
             value = value if type(value) == float else m.nan
             if m.isnan(value): logger.warning(f'{self.device_name} - {self.Log_Nan_1_Float[self.sprache]} ({self.rbefIU})')
             self.value_name['IWU'] = value                                                  # Einheit: V 
             # Lese Ist-Strom:
-            logger.debug(f"{self.device_name} - {self.Log_Text_107_str[self.sprache]}")
+            logger.debug("%s - %s", self.device_name, self.Log_Text_107_str[self.sprache])
             value = self.read_send(self.rbefII, 2, self.resI, self.umI)
             if m.isnan(value): logger.warning(f'{self.device_name} - {self.Log_Nan_1_Float[self.sprache]} ({self.rbefII})')
             value = value if type(value) == float else m.nan
             self.value_name['IWI'] = value                                                  # Einheit: A
             # Lese Ist-Frequenz:
-            logger.debug(f"{self.device_name} - {self.Log_Text_108_str[self.sprache]}")
+            logger.debug("%s - %s", self.device_name, self.Log_Text_108_str[self.sprache])
             value = self.read_send(self.rbefIf, 2, self.resf, self.umf)
             value = value if type(value) == float else m.nan
             if m.isnan(value): logger.warning(f'{self.device_name} - {self.Log_Nan_1_Float[self.sprache]} ({self.rbefIf})')
             self.value_name['IWf'] = value                                                  # Einheit: kHz
             # Lese Soll-Leistung:
-            logger.debug(f"{self.device_name} - {self.Log_Text_109_str[self.sprache]}")
+            logger.debug("%s - %s", self.device_name, self.Log_Text_109_str[self.sprache])
             value = self.read_send(self.rbefSP, 2, self.resP, self.umP) 
             value = value if type(value) == float else m.nan
             if m.isnan(value): logger.warning(f'{self.device_name} - {self.Log_Nan_1_Float[self.sprache]} ({self.rbefSP})')
             self.value_name['SWP'] = value                                                 # Einheit: kW
             # Lese Soll-Spannung:
-            logger.debug(f"{self.device_name} - {self.Log_Text_110_str[self.sprache]}")
+            logger.debug("%s - %s", self.device_name, self.Log_Text_110_str[self.sprache])
             value = self.read_send(self.rbefSU, 2, self.resU, self.umU)
             value = value if type(value) == float else m.nan
             if m.isnan(value): logger.warning(f'{self.device_name} - {self.Log_Nan_1_Float[self.sprache]} ({self.rbefSU})')
             self.value_name['SWU'] = value                                                 # Einheit: V
             # Lese Soll-Leistung:
-            logger.debug(f"{self.device_name} - {self.Log_Text_111_str[self.sprache]}")
+            logger.debug("%s - %s", self.device_name, self.Log_Text_111_str[self.sprache])
             value = self.read_send(self.rbefSI, 2, self.resI, self.umI)
             value = value if type(value) == float else m.nan
             if m.isnan(value): logger.warning(f'{self.device_name} - {self.Log_Nan_1_Float[self.sprache]} ({self.rbefSI})')
@@ -1285,12 +1099,14 @@ class TruHeat(QObject):
     ###################################################
     # Messdatendatei erstellen und beschrieben:
     ###################################################
-    def messdaten_output(self, pfad="./"):
+    def messdaten_output(self, pfad, schreiber):
         """Erstelle für das Gerät eine csv-Datei mit den Daten.
 
         Args:
-            pfad (str, optional): Speicherort. Default ist "./".
+            pfad (str):                     Speicherort (Messordner)
+            schreiber (Messdaten_Writer):   Gemeinsamer Messdaten-Schreiber (hält die Datei offen und puffert die Zeilen)
         """
+        self.schreiber = schreiber
         PID_x_unit = self.unit_PIDIn
         self.filename = f"{pfad}/{self.device_name}.csv"
         units = f"# datetime,s,kW,V,A,kHz,kW,V,A,{PID_x_unit},{PID_x_unit},\n"
@@ -1298,9 +1114,7 @@ class TruHeat(QObject):
         header = "time_abs,time_rel,Ist-Leistung,Ist-Spannung,Ist-Strom,Ist-Frequenz,Soll-Leistung,Soll-Spannung,Soll-Strom,Soll-x_PID-Modus_G,Ist-x_PID-Modus_G,\n"
         if self.messZeit != 0:                                          # Erstelle Datei nur wenn gemessen wird!
             logger.info(f"{self.device_name} - {self.Log_Text_71_str[self.sprache]} {self.filename}")
-            with open(self.filename, "w", encoding="utf-8") as f:
-                f.write(units)
-                f.write(header)
+            self.schreiber.anmelden(self.filename, units + header)
         else:
             logger.info(f"{self.device_name} - {self.Log_Text_72_str[self.sprache]}")
 
@@ -1315,18 +1129,25 @@ class TruHeat(QObject):
         line = f"{absolut_Time.isoformat(timespec='milliseconds').replace('T', ' ')},{relativ_Time},"
         for size in daten:
             line = line + f'{daten[size]},'
-        with open(self.filename, "a", encoding="utf-8") as f:
-            f.write(f'{line}\n')
+        self.schreiber.schreiben(self.filename, f'{line}\n', self.device_name)
     
     ##########################################
     # PID-Regler:
     ##########################################
-    def PID_Update(self):
-        '''PID-Regler-Thread-Aufruf'''
+    def PID_Eingang(self):
+        '''Eingänge des PID-Reglers für den PID-Takt (eigener Thread)
+
+        Return:
+            (Istwert, Sollwert, Rezept-Modus, Rezept-Output) - None: Regler nicht aktiv
+        '''
         if self.PID_Aktiv:
             if not self.PID.PID_speere:
-                self.signal_PID.emit(self.Ist, self.Soll, False, 0)
-                self.PID_Out = self.PID.Output
+                return self.Ist, self.Soll, False, 0
+        return None
+
+    def PID_Ausgang(self):
+        '''Output des PID-Reglers nach der Berechnung im PID-Takt übernehmen'''
+        self.PID_Out = self.PID.Output
 
 ##########################################
 # Verworfen:
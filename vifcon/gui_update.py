@@ -0,0 +1,177 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Zusammenfassung der GUI-Updates (Bildraten-Begrenzung):
+- Jede Messung eines Samplers wird sofort in die Daten des Widgets übernommen (update_Daten, Kurven-Speicher)
+- Label und Plot werden nur mit maximal GUI|max_fps Bildern pro Sekunde neu gezeichnet (update_GUI mit dem letzten Wert)
+- Zählt zusammengefasste Messungen und ausgefallene Bilder
+
+Dadurch bleibt die Ereignisschleife von Qt auch bei vielen schnellen Geräten frei für Benutzereingaben.
+Die Messdaten-Dateien sind davon nicht betroffen, sie werden im Sampler geschrieben.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## GUI:
+from PyQt5.QtCore import (
+    QObject,
+    QTimer,
+)
+
+## Algemein:
+import logging
+import time
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+
+class GUI_Update(QObject):
+    def __init__(self, sprache, widgets, max_fps = 10):
+        ''' Erstellung der GUI-Update-Zusammenfassung.
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+            widgets (dict):     Geräte-Name: Geräte-Widget
+            max_fps (float):    Maximale Bildrate (0 - jede Messung sofort zeichnen)
+        '''
+        super().__init__()
+
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache    = sprache
+        self.widgets    = widgets
+        self.max_fps    = max_fps
+
+        ## Weitere:
+        self.offen      = {}                    # Geräte-Name: [Werte, Zeit] der letzten noch nicht gezeichneten Messung
+        self.letztes_bild = 0                   # Zeitpunkt des letzten Bildes (time.perf_counter)
+        ## Statistik:
+        self.anz_Messungen          = 0         # Empfangene Messungen
+        self.anz_Bilder             = 0         # Gezeichnete Geräte-Bilder
+        self.anz_Zusammengefasst    = 0         # Messungen, die nicht selbst gezeichnet wurden (in ein späteres Bild eingeflossen)
+        self.anz_Ausgefallen        = 0         # Bilder, die ausgefallen sind, weil der Takt verspätet war
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_GU_1 = ['GUI-Update - Maximale Bildrate:',                                                 'GUI update - Maximum frame rate:']
+        self.Log_Text_GU_2 = ['GUI-Update - Jede Messung wird sofort gezeichnet!',                               'GUI update - Every measurement is drawn immediately!']
+        self.Log_Text_GU_3 = ['Update der GUI von',                                                              'Update the GUI of']
+        self.Log_Text_GU_4 = ['Fehler beim Update der GUI von',                                                  'Error updating the GUI of']
+        self.Log_Text_GU_5 = ['GUI-Update-Statistik - Messungen:',                                               'GUI update statistics - Measurements:']
+        self.Log_Text_GU_6 = ['Bilder:',                                                                         'Frames:']
+        self.Log_Text_GU_7 = ['Zusammengefasst:',                                                                'Merged:']
+        self.Log_Text_GU_8 = ['Ausgefallene Bilder:',                                                            'Dropped frames:']
+
+        #---------------------------------------
+        # Timer:
+        #---------------------------------------
+        self.timer = QTimer()
+        if self.max_fps > 0:
+            self.intervall = 1 / self.max_fps
+            self.timer.setInterval(int(1000 * self.intervall))
+            self.timer.timeout.connect(self.zeichnen)
+            self.timer.start()
+            logger.info(f'{self.Log_Text_GU_1[self.sprache]} {self.max_fps} fps')
+        else:
+            self.intervall = 0
+            logger.info(f'{self.Log_Text_GU_2[self.sprache]}')
+
+    ##########################################
+    # Messungen:
+    ##########################################
+    def neu(self, name, werte, zeit):
+        ''' Neue Messung eines Samplers (verbunden über update_view im Controller).
+
+        Args:
+            name (str):         Geräte-Name
+            werte (dict):       Messwerte
+            zeit (float):       relative Zeit der Messung
+        '''
+        self.anz_Messungen += 1
+        werte = dict(werte)                     # Der Sampler nutzt das Dictionary weiter
+        try:
+            self.widgets[name].update_Daten(werte, zeit)
+        except Exception as e:
+            logger.exception(f"{self.Log_Text_GU_4[self.sprache]} {name}.")
+        if self.max_fps <= 0:
+            self.gui_update(name, werte, zeit)
+            return
+        if name in self.offen:
+            self.anz_Zusammengefasst += 1
+        self.offen[name] = [werte, zeit]
+
+    ##########################################
+    # Zeichnen:
+    ##########################################
+    def zeichnen(self):
+        ''' Takt der Bildrate: Zeichnet für jedes Gerät mit neuen Messungen die letzte Messung. '''
+        jetzt = time.perf_counter()
+        ## Ausgefallene Bilder (Takt kam zu spät, z.B. weil die Ereignisschleife blockiert war):
+        if self.letztes_bild != 0:
+            verspaetung = jetzt - self.letztes_bild - self.intervall
+            if verspaetung >= self.intervall:
+                self.anz_Ausgefallen += int(verspaetung / self.intervall)
+        self.letztes_bild = jetzt
+
+        offen = self.offen
+        self.offen = {}
+        for name in offen:
+            werte, zeit = offen[name]
+            self.gui_update(name, werte, zeit)
+
+    def gui_update(self, name, werte, zeit):
+        ''' Zeichnet Label und Plot eines Gerätes.
+
+        Args:
+            name (str):         Geräte-Name
+            werte (dict):       Messwerte
+            zeit (float):       relative Zeit der Messung
+        '''
+        self.anz_Bilder += 1
+        try:
+            logger.debug(f"{self.Log_Text_GU_3[self.sprache]} {name}")
+            self.widgets[name].update_GUI(werte, zeit)
+        except Exception as e:
+            logger.exception(f"{self.Log_Text_GU_4[self.sprache]} {name}.")
+
+    def ende(self):
+        ''' Zeichnet die offenen Messungen, stoppt den Takt und schreibt die Statistik in das Logging. '''
+        self.timer.stop()
+        self.zeichnen()
+        self.log_statistik()
+
+    ##########################################
+    # Statistik:
+    ##########################################
+    def statistik(self):
+        ''' Return: Zähler der GUI-Updates (dict) '''
+        return {
+            'Messungen':        self.anz_Messungen,
+            'Bilder':           self.anz_Bilder,
+            'Zusammengefasst':  self.anz_Zusammengefasst,
+            'Ausgefallen':      self.anz_Ausgefallen,
+        }
+
+    def log_statistik(self):
+        ''' Schreibt die Statistik in das Logging. '''
+        s = self.statistik()
+        logger.info(f"{self.Log_Text_GU_5[self.sprache]} {s['Messungen']}, {self.Log_Text_GU_6[self.sprache]} {s['Bilder']}, {self.Log_Text_GU_7[self.sprache]} {s['Zusammengefasst']}, {self.Log_Text_GU_8[self.sprache]} {s['Ausgefallen']}")
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
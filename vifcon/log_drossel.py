@@ -0,0 +1,174 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Logging-Schicht für die Geräte (Sample- und PID-Pfad):
+- Log_Drossel:  Filter, der gleiche Meldungen (Logger, Level, Text bzw. Vorlage mit Werten) pro Zeitfenster begrenzt
+                Unterdrückte Meldungen werden gezählt, die nächste durchgelassene Meldung nennt die Anzahl
+                Fehler (ERROR, CRITICAL) werden nie unterdrückt
+- Log_Queue:    Optionaler Queue-Handler, die Handler (Datei, Konsole) schreiben in einem eigenen Thread (QueueListener)
+                Die Sample-Threads legen die Meldung nur in die Queue und warten somit nicht auf die Datei bzw. Konsole
+
+Die Geräte loggen im Sample-Pfad mit Vorlagen (logger.debug('%s - %s %s', ...)), der Text wird somit nur erstellt,
+wenn das Level aktiv ist. Für den Vergleich wird der Text nicht erstellt (Vorlage und Werte).
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import logging.handlers
+import threading
+import queue
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+MAX_EINTRAEGE = 5000                    # Maximale Anzahl gemerkter Meldungen (danach werden abgelaufene Fenster gelöscht)
+
+
+class Log_Drossel(logging.Filter):
+    def __init__(self, sprache, zeit = 10, anzahl = 3):
+        ''' Erstellung des Drossel-Filters.
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+            zeit (float):       Länge des Zeitfensters in s
+            anzahl (int):       Anzahl gleicher Meldungen pro Zeitfenster
+        '''
+        super().__init__()
+
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        self.sprache            = sprache
+        self.zeit               = zeit
+        self.anzahl             = anzahl
+
+        self.eintraege          = {}                # Schlüssel: [Fenster-Start, Anzahl im Fenster, unterdrückt seit der letzten Ausgabe]
+        self.unterdrueckt       = {}                # Schlüssel: [Anzahl unterdrückt (gesamt), Werte der Meldung (record.args)]
+        self.anz_Meldungen      = 0
+        self.anz_Unterdrueckt   = 0
+        self.lock               = threading.Lock()
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_LD_1 = ['gleiche Meldungen unterdrückt',                                                   'identical messages suppressed']
+        self.Log_Text_LD_2 = ['Log-Drossel - Meldungen:',                                                        'Log throttle - Messages:']
+        self.Log_Text_LD_3 = ['Unterdrückt:',                                                                    'Suppressed:']
+        self.Log_Text_LD_4 = ['Log-Drossel - Häufigste unterdrückte Meldung',                                    'Log throttle - Most suppressed message']
+        self.Log_Text_LD_5 = ['Log-Drossel - Einstellungen (Zeitfenster, Anzahl):',                              'Log throttle - Settings (time window, count):']
+
+        logger.info(f'{self.Log_Text_LD_5[self.sprache]} {self.zeit} s, {self.anzahl}')
+
+    def filter(self, record):
+        ''' Entscheidet, ob die Meldung ausgegeben wird (einmal pro Meldung, auch bei mehreren Handlern).
+
+        Args:
+            record (LogRecord):     Log-Meldung
+        Return:
+            True - Ausgeben, False - Unterdrücken
+        '''
+        entscheidung = getattr(record, 'drossel', None)
+        if not entscheidung == None:
+            return entscheidung
+        if record.levelno >= logging.ERROR:
+            record.drossel = True
+            return True
+
+        try:
+            schluessel = (record.name, record.levelno, str(record.msg), record.args)
+            hash(schluessel)
+        except TypeError:
+            schluessel = (record.name, record.levelno, str(record.msg), repr(record.args))       # z.B. Listen als Werte
+        jetzt = record.created
+        with self.lock:
+            self.anz_Meldungen += 1
+            eintrag = self.eintraege.get(schluessel)
+            if eintrag == None or jetzt - eintrag[0] >= self.zeit:
+                ## Neues Zeitfenster:
+                if not eintrag == None and eintrag[2] > 0:
+                    record.msg = f'{record.msg} (+{eintrag[2]} {self.Log_Text_LD_1[self.sprache]})'
+                if eintrag == None and len(self.eintraege) >= MAX_EINTRAEGE:
+                    self.aufraeumen(jetzt)
+                self.eintraege[schluessel] = [jetzt, 1, 0]
+                record.drossel = True
+            elif eintrag[1] < self.anzahl:
+                eintrag[1] += 1
+                record.drossel = True
+            else:
+                eintrag[2] += 1
+                self.anz_Unterdrueckt += 1
+                if not schluessel in self.unterdrueckt:
+                    self.unterdrueckt[schluessel] = [0, record.args]                                # Original-Werte (Schlüssel kann repr enthalten)
+                self.unterdrueckt[schluessel][0] += 1
+                record.drossel = False
+        return record.drossel
+
+    def aufraeumen(self, jetzt):
+        ''' Löscht die Meldungen mit abgelaufenem Zeitfenster ohne unterdrückte Meldungen (Lock wird gehalten). '''
+        for schluessel in [s for s, e in self.eintraege.items() if jetzt - e[0] >= self.zeit and e[2] == 0]:
+            del self.eintraege[schluessel]
+        if len(self.eintraege) >= MAX_EINTRAEGE:
+            self.eintraege.clear()
+
+    def log_statistik(self):
+        ''' Schreibt die Anzahl der Meldungen und die am häufigsten unterdrückten Meldungen in das Logging. '''
+        logger.info(f'{self.Log_Text_LD_2[self.sprache]} {self.anz_Meldungen} - {self.Log_Text_LD_3[self.sprache]} {self.anz_Unterdrueckt}')
+        with self.lock:
+            liste = sorted(self.unterdrueckt.items(), key=lambda teil: teil[1][0], reverse=True)[0:5]
+        for (name, level, text, _), (anz, werte) in liste:
+            if werte:
+                try:                text = text % werte
+                except Exception:   pass
+            logger.info(f'{self.Log_Text_LD_4[self.sprache]} ({anz}x, {logging.getLevelName(level)}, {name}): {text[0:200]}')
+
+
+class Log_Queue:
+    def __init__(self, drossel = None):
+        ''' Ersetzt die Handler des Root-Loggers durch einen Queue-Handler. Die bisherigen Handler (mit Level und Filtern)
+        werden vom QueueListener in einem eigenen Thread aufgerufen.
+
+        Args:
+            drossel (Log_Drossel):  Filter am Queue-Handler (wird somit schon im aufrufenden Thread angewendet), None - keiner
+        '''
+        self.root       = logging.getLogger()
+        self.handler    = self.root.handlers[:]
+        self.queue      = queue.SimpleQueue()
+        self.queue_handler = logging.handlers.QueueHandler(self.queue)
+        if not drossel == None:
+            self.queue_handler.addFilter(drossel)
+        for handler in self.handler:
+            self.root.removeHandler(handler)
+        self.root.addHandler(self.queue_handler)
+        self.listener   = logging.handlers.QueueListener(self.queue, *self.handler, respect_handler_level=True)
+        self.listener.start()
+
+    def ende(self):
+        ''' Schreibt die restlichen Meldungen, beendet den Thread und setzt die Handler wieder direkt ein. '''
+        self.listener.stop()
+        self.root.removeHandler(self.queue_handler)
+        for handler in self.handler:
+            self.root.addHandler(handler)
+            handler.flush()
+
+
+def drossel_anhaengen(drossel):
+    ''' Hängt den Drossel-Filter an alle Handler des Root-Loggers (ohne Queue). '''
+    for handler in logging.getLogger().handlers:
+        handler.addFilter(drossel)
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
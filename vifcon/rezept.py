@@ -0,0 +1,100 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Rezept-Compiler und Zeitplan für die Rezepte aller Geräte-Widgets:
+- Das Widget liest und prüft das Rezept (Rezept_lesen_controll) und erstellt daraus einmal den Zeitplan
+- Rampen (r, opr) werden mit einer Funktion in Schritte zerlegt (rampe), optional feiner als im Rezept angegeben (Auflösung)
+- Die Schritte einer Rampe ergeben zusammen genau die Segment-Zeit des Rezeptes
+- Der Zeitplan (Rezept_Zeitplan) enthält die Endzeiten der Schritte relativ zum Rezept-Start (NumPy)
+- Die Ausführung (RezTimer) plant mit dem Zeitplan jeden Schritt gegen die monotone Startzeit des Rezeptes (time.perf_counter),
+  so dass sich Verzögerungen des Timers nicht über die Schritte aufsummieren
+- Beim synchronen Start (Controller.sync_rezept) erhalten alle Rezepte dieselbe Startzeit
+
+Die Auflösung wird vom Controller aus der Config (time|rezept_aufloesung) gesetzt.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import numpy as np
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+AUFLOESUNG = 0                                          # Maximale Schrittweite in s für Rampen (0 - Schrittweite aus dem Rezept)
+
+
+def aufloesung_setzen(aufloesung):
+    ''' Setzt die Auflösung der Rampen für alle Widgets.
+
+    Args:
+        aufloesung (float):     Maximale Schrittweite in s (0 - Schrittweite aus dem Rezept)
+    '''
+    global AUFLOESUNG
+    AUFLOESUNG = aufloesung
+
+def rampe(start, ziel, dauer, schritt, aufloesung = None):
+    ''' Zerlegt eine Rampe in Schritte.
+
+    Args:
+        start (float):          Wert vor der Rampe
+        ziel (float):           Wert am Ende der Rampe
+        dauer (float):          Segment-Zeit in s
+        schritt (float):        Schrittweite aus dem Rezept in s
+        aufloesung (float):     Maximale Schrittweite in s (None - Einstellung des Programms, 0 - Schrittweite aus dem Rezept)
+    Return:
+        zeiten (list):          Dauer der Schritte (Summe = Segment-Zeit)
+        werte (list):           Werte der Schritte (letzter Wert = Zielwert)
+    '''
+    aufloesung = AUFLOESUNG if aufloesung == None else aufloesung
+    if not schritt > 0 or not dauer >= 0:
+        raise ValueError(f'Ramp: time {dauer} s and step {schritt} s must be positive')
+    breite = min(schritt, aufloesung) if aufloesung > 0 else schritt
+    anzahl = max(int(dauer / breite), 1)
+    hoehe  = (ziel - start) / anzahl
+    werte  = [round(start + hoehe * n, 3) for n in range(1, anzahl)] + [ziel]             # Runden: Eurotherm könnte bis 6 Nachkommerstellen, Display nur 2
+    zeiten = [breite] * (anzahl - 1) + [dauer - breite * (anzahl - 1)]                      # Letzter Schritt erhält den Rest der Segment-Zeit
+    return zeiten, werte
+
+
+class Rezept_Zeitplan:
+    def __init__(self, time_list, value_list):
+        ''' Erstellung des Zeitplans aus den Listen des Widgets.
+
+        Args:
+            time_list (list):       Dauer der Rezept-Schritte in s
+            value_list (list):      Sollwerte der Rezept-Schritte
+        '''
+        dauer = np.asarray(time_list, dtype=float)
+        wert  = np.asarray(value_list, dtype=float)
+        if len(dauer) == 0 or not len(dauer) == len(wert):
+            raise ValueError(f'Recipe: {len(dauer)} times and {len(wert)} values')
+        if not np.isfinite(dauer).all() or not np.isfinite(wert).all() or (dauer < 0).any():
+            raise ValueError('Recipe: times and values must be finite, times must be positive')
+        self.ende   = np.cumsum(dauer)                      # Ende der Schritte relativ zum Rezept-Start in s
+
+    def intervall(self, step, vergangen):
+        ''' Zeit bis zum Ende eines Schrittes (Intervall des RezTimers).
+
+        Args:
+            step (int):             aktueller Rezept-Schritt
+            vergangen (float):      Zeit seit dem Rezept-Start in s (time.perf_counter)
+        Return:
+            Intervall in ms (0 - Schritt ist schon vorbei)
+        '''
+        return max(int(round((self.ende[step] - vergangen) * 1000)), 0)
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,291 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Sampling-Scheduler:
+- Kennt für jedes Gerät die Messzeit (messZeit) und die PID-Sample-Zeit
+- Weckt jeden Sampler nur dann, wenn bei ihm etwas fällig ist (Lesen, Schreib-Auftrag, PID-Takt, Grenz-Überwachung)
+- Teilt dem Sampler mit, ob gelesen und ob geschrieben werden muss (Befehls-Liste, befehle.py)
+- Sammelt pro Gerät Jitter- und Overrun-Statistiken
+
+Der Reaktionstimer (time|dt-main) des Controllers gibt nur noch die Auflösung des Schedulers vor.
+Ein Gerät mit 2 s Messzeit wird somit nicht mehr bei jedem Takt des schnellsten Gerätes aufgerufen.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## GUI:
+from PyQt5.QtCore import (
+    QObject,
+)
+
+## Algemein:
+import logging
+import time
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+# Einträge im write_task-Dictionary die einen Zustand beschreiben und keinen einmaligen Auftrag darstellen:
+ZUSTANDS_TASKS = ['PID', 'PID_Rezept_Mode_OP', 'Rezept Aktiv', 'Rezept_PID_RW', 'EndRot']
+
+# Geräte, die ihre Grenzen (Endlagen) in der write-Funktion überwachen und daher bei jedem Takt geschrieben werden:
+DAUER_GERAETE = ['PI-Achse', 'Nemo-Achse-Linear', 'Nemo-Achse-Rotation', 'Educrys-Antrieb']
+
+
+class Scheduler(QObject):
+    def __init__(self, sprache):
+        ''' Erstellung des Sampling-Schedulers
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+        '''
+        super().__init__()
+
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        ## Init:
+        self.sprache    = sprache
+
+        ## Weitere:
+        self.eintraege  = {}                    # Geräte-Name: Planungs- und Statistik-Daten
+        self.anz_Takt   = 0                     # Anzahl der Scheduler-Takte
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_Sch_1 = ['Scheduler - Gerät hinzugefügt:',                                                 'Scheduler - Device added:']
+        self.Log_Text_Sch_2 = ['Messzeit',                                                                       'Measurement time']
+        self.Log_Text_Sch_3 = ['PID-Sample-Zeit',                                                                'PID sample time']
+        self.Log_Text_Sch_4 = ['Dauer-Überwachung (jeder Takt)',                                                 'Continuous monitoring (every cycle)']
+        self.Log_Text_Sch_5 = ['Scheduler-Statistik',                                                            'Scheduler statistics']
+        self.Log_Text_Sch_6 = ['Aufrufe',                                                                        'Calls']
+        self.Log_Text_Sch_7 = ['Lesungen',                                                                       'Readings']
+        self.Log_Text_Sch_8 = ['Jitter (Mittel/Max)',                                                            'Jitter (mean/max)']
+        self.Log_Text_Sch_9 = ['Overruns (Sampler belegt/Lese-Slot verpasst)',                                   'Overruns (sampler busy/read slot missed)']
+        self.Log_Text_Sch_10 = ['Max. Dauer',                                                                    'Max. duration']
+        self.Log_Text_Sch_11 = ['Scheduler-Takte:',                                                              'Scheduler cycles:']
+        self.Log_Text_Sch_12 = ['ms',                                                                            'ms']
+
+    ##########################################
+    # Geräte-Verwaltung:
+    ##########################################
+    def add_sampler(self, sampler):
+        ''' Nimmt einen Sampler in die Planung auf.
+
+        Args:
+            sampler (Sampler):  Sampler-Objekt aus dem Controller
+        '''
+        name    = sampler.device_name
+        jetzt   = time.perf_counter()
+
+        schreiben = not 'Nemo-Gase' in name and not 'Educrys-Monitoring' in name
+        ## PID-Sample-Zeit (ms -> s):
+        if schreiben:   pid_periode = sampler.device.PID.sample_time / 1000
+        else:           pid_periode = 0
+
+        self.eintraege[name] = {
+            'sampler':          sampler,
+            'schreiben':        schreiben,
+            'dauer_modus':      self.dauer_ueberwachung(sampler),   # Grenzen werden in der write-Funktion überwacht
+            'pid_periode':      pid_periode,
+            'naechstes_lesen':  jetzt,
+            'naechster_pid':    jetzt,
+            'belegt':           False,
+            ## Statistik:
+            'aufrufe':          0,
+            'lesungen':         0,
+            'jitter_summe':     0,
+            'jitter_max':       0,
+            'overrun_belegt':   0,
+            'overrun_verpasst': 0,
+            'dauer_max':        0,
+        }
+        sampler.signal_fertig.connect(self.fertig)
+
+        extra = f' - {self.Log_Text_Sch_4[self.sprache]}' if self.eintraege[name]['dauer_modus'] else ''
+        logger.info(f'{self.Log_Text_Sch_1[self.sprache]} {name} - {self.Log_Text_Sch_2[self.sprache]}: {sampler.messTime} s - {self.Log_Text_Sch_3[self.sprache]}: {pid_periode} s{extra}')
+
+    def dauer_ueberwachung(self, sampler):
+        ''' Prüft, ob das Gerät seine Grenzen in der write-Funktion überwacht und somit bei jedem Takt geschrieben werden muss.
+
+        Args:
+            sampler (Sampler):  Sampler-Objekt aus dem Controller
+        Return:
+            True, wenn das Gerät in DAUER_GERAETE steht (Educrys-Antrieb: nur der Linear-Antrieb L hat Endlagen)
+        '''
+        name = sampler.device_name
+        for geraet in DAUER_GERAETE:
+            if geraet in name:
+                if geraet == 'Educrys-Antrieb':
+                    return sampler.device.Antriebs_wahl == 'L'
+                return True
+        return False
+
+    ##########################################
+    # Planung:
+    ##########################################
+    def takt(self):
+        ''' Wird vom Reaktionstimer des Controllers aufgerufen. Weckt nur die Sampler, bei denen etwas fällig ist. '''
+        self.anz_Takt += 1
+        jetzt = time.perf_counter()
+        for name in self.eintraege:
+            eintrag = self.eintraege[name]
+            lesen     = self.lesen_faellig(eintrag, jetzt)
+            schreiben = self.schreiben_faellig(eintrag, jetzt)
+            if not lesen and not schreiben:
+                continue
+            ## Sampler arbeitet noch am letzten Auftrag:
+            if eintrag['belegt']:
+                eintrag['overrun_belegt'] += 1
+                continue
+            self.ausloesen(eintrag, lesen, schreiben, jetzt)
+
+    def alle_ausloesen(self, namen = None):
+        ''' Weckt alle Sampler unabhängig von ihrer Planung (z.B. beim Beenden, damit der sichere Endzustand gesendet wird).
+
+        Args:
+            namen (list):       Nur diese Geräte wecken (z.B. die Geräte eines Ports), None - alle Geräte
+        '''
+        jetzt = time.perf_counter()
+        for name in self.eintraege if namen == None else namen:
+            eintrag = self.eintraege[name]
+            self.ausloesen(eintrag, self.lesen_faellig(eintrag, jetzt), True, jetzt)
+
+    def lesen_faellig(self, eintrag, jetzt):
+        ''' Prüft, ob das Gerät ausgelesen werden muss.
+
+        Args:
+            eintrag (dict):     Planungsdaten des Gerätes
+            jetzt (float):      aktuelle Zeit (time.perf_counter)
+        Return:
+            True, wenn die Messzeit erreicht wurde
+        '''
+        messTime = eintrag['sampler'].messTime
+        return messTime != 0 and jetzt >= eintrag['naechstes_lesen']
+
+    def schreiben_faellig(self, eintrag, jetzt):
+        ''' Prüft, ob das Gerät für das Schreiben bzw. die Kontrolle geweckt werden muss.
+
+        Args:
+            eintrag (dict):     Planungsdaten des Gerätes
+            jetzt (float):      aktuelle Zeit (time.perf_counter)
+        Return:
+            True, wenn ein Auftrag ansteht, der PID-Takt erreicht ist oder das Gerät dauerhaft überwacht wird
+        '''
+        widget = eintrag['sampler'].device_widget
+        task   = widget.write_task
+
+        ## Initialisierung kann jedes Gerät haben:
+        if task['Init']:
+            return True
+        if not eintrag['schreiben']:
+            return False
+        ## Dauer-Überwachung (Achsen, Educrys-Antrieb L):
+        if eintrag['dauer_modus']:
+            return True
+        ## Einmalige Aufträge aus der GUI, dem Gamepad oder dem Rezept:
+        for auftrag in task:
+            if task[auftrag] and not auftrag in ZUSTANDS_TASKS:
+                return True
+        ## Pop-Up bei späterem Start:
+        if getattr(widget, 'start_later', False):
+            return True
+        ## PID-Modus:
+        if task['PID'] and jetzt >= eintrag['naechster_pid']:
+            return True
+        return False
+
+    def ausloesen(self, eintrag, lesen, schreiben, jetzt):
+        ''' Sendet das Start-Signal an den Sampler und plant den nächsten Aufruf.
+
+        Args:
+            eintrag (dict):     Planungsdaten des Gerätes
+            lesen (bool):       Sampler soll das Gerät auslesen
+            schreiben (bool):   Sampler soll die write-Funktion des Gerätes aufrufen
+            jetzt (float):      aktuelle Zeit (time.perf_counter)
+        '''
+        sampler = eintrag['sampler']
+        if lesen:
+            soll_zeit = eintrag['naechstes_lesen']
+            ## Nächster Lese-Slot (Phasentreu, verpasste Slots werden übersprungen und gezählt):
+            messTime  = sampler.messTime
+            naechstes = soll_zeit + messTime
+            if naechstes <= jetzt:
+                verpasst = int((jetzt - naechstes) / messTime) + 1
+                eintrag['overrun_verpasst'] += verpasst
+                naechstes += verpasst * messTime
+            eintrag['naechstes_lesen'] = naechstes
+        else:
+            soll_zeit = jetzt
+        if eintrag['pid_periode'] != 0 and jetzt >= eintrag['naechster_pid']:
+            eintrag['naechster_pid'] = jetzt + eintrag['pid_periode']
+        eintrag['belegt']   = True
+        eintrag['aufrufe'] += 1
+        sampler.auftrag()
+        sampler.signal_start.emit(lesen, schreiben, soll_zeit)
+
+    def fertig(self, name, jitter, dauer):
+        ''' Rückmeldung eines Samplers nach Ablauf der sample-Funktion.
+
+        Args:
+            name (str):         Geräte-Name
+            jitter (float):     Verzögerung der Lesung zum geplanten Zeitpunkt in s (-1: keine Lesung)
+            dauer (float):      Dauer der sample-Funktion in s
+        '''
+        eintrag = self.eintraege[name]
+        eintrag['belegt'] = False
+        if jitter >= 0:
+            eintrag['lesungen']     += 1
+            eintrag['jitter_summe'] += jitter
+            eintrag['jitter_max']    = max(eintrag['jitter_max'], jitter)
+        eintrag['dauer_max'] = max(eintrag['dauer_max'], dauer)
+
+    ##########################################
+    # Statistik:
+    ##########################################
+    def statistik(self):
+        ''' Erstellt die Jitter- und Overrun-Statistik aller Geräte.
+
+        Return:
+            stat (dict):    Geräte-Name: Statistik (Zeiten in ms)
+        '''
+        stat = {}
+        for name in self.eintraege:
+            eintrag = self.eintraege[name]
+            if eintrag['lesungen'] != 0:    jitter_mittel = eintrag['jitter_summe'] / eintrag['lesungen']
+            else:                           jitter_mittel = 0
+            stat[name] = {
+                'Aufrufe':          eintrag['aufrufe'],
+                'Lesungen':         eintrag['lesungen'],
+                'Jitter_Mittel':    round(jitter_mittel * 1000, 3),
+                'Jitter_Max':       round(eintrag['jitter_max'] * 1000, 3),
+                'Overrun_Belegt':   eintrag['overrun_belegt'],
+                'Overrun_Verpasst': eintrag['overrun_verpasst'],
+                'Dauer_Max':        round(eintrag['dauer_max'] * 1000, 3),
+            }
+        return stat
+
+    def log_statistik(self):
+        ''' Schreibt die Statistik in das Logging. '''
+        ms = self.Log_Text_Sch_12[self.sprache]
+        logger.info(f'{self.Log_Text_Sch_5[self.sprache]} - {self.Log_Text_Sch_11[self.sprache]} {self.anz_Takt}')
+        stat = self.statistik()
+        for name in stat:
+            s = stat[name]
+            logger.info(f"{self.Log_Text_Sch_5[self.sprache]} - {name}: {self.Log_Text_Sch_6[self.sprache]} {s['Aufrufe']}, {self.Log_Text_Sch_7[self.sprache]} {s['Lesungen']}, {self.Log_Text_Sch_8[self.sprache]} {s['Jitter_Mittel']}/{s['Jitter_Max']} {ms}, {self.Log_Text_Sch_9[self.sprache]} {s['Overrun_Belegt']}/{s['Overrun_Verpasst']}, {self.Log_Text_Sch_10[self.sprache]} {s['Dauer_Max']} {ms}")
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -0,0 +1,108 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Messung des Programmstarts (Start-Profil):
+- Der Controller markiert das Ende jeder Phase seiner Initialisierung (Config, Module, GUI, Geräte, Threads, ...)
+- Für jedes Gerät werden Import, Erstellung des Geräte-Objekts und Erstellung des Widgets getrennt gemessen
+- Nach dem ersten Durchlauf der Event-Loop (Fenster sichtbar) wird der Bericht in das Logging geschrieben
+
+Gemessen wird mit der monotonen Uhr (time.perf_counter), Startpunkt ist der Start von vifcon_main.py.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Allgemein:
+import logging
+import time
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+
+class Start_Profil:
+    def __init__(self, start = None):
+        ''' Erstellung des Start-Profils.
+
+        Args:
+            start (float):      Startzeitpunkt des Programms (time.perf_counter), None - jetzt
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        jetzt               = time.perf_counter()
+        self.start          = jetzt if start == None else start
+        self.phasen         = []                                # Liste von [Phase, Dauer in s]
+        self.geraete        = {}                                # Gerät: {Teil: Dauer in s}
+        self.phase_marke    = self.start
+        self.geraet_marke   = jetzt
+        if not start == None:
+            self.phasen.append(['Python + Import', jetzt - start])
+            self.phase_marke = jetzt
+
+        #---------------------------------------
+        # Sprach-Einstellung:
+        #---------------------------------------
+        ## Logging:
+        self.Log_Text_SP_1 = ['Start-Profil - Phase',                                                           'Startup profile - Phase']
+        self.Log_Text_SP_2 = ['Start-Profil - Gerät',                                                           'Startup profile - Device']
+        self.Log_Text_SP_3 = ['Start-Profil - Zeit bis zum ersten Fenster:',                                    'Startup profile - Time to first window:']
+        self.Log_Text_SP_4 = ['ms',                                                                             'ms']
+
+    ##########################################
+    # Messung:
+    ##########################################
+    def phase(self, name):
+        ''' Beendet eine Phase des Starts (Dauer seit der letzten Phase).
+
+        Args:
+            name (str):         Name der Phase
+        '''
+        jetzt = time.perf_counter()
+        self.phasen.append([name, jetzt - self.phase_marke])
+        self.phase_marke = jetzt
+
+    def geraet_start(self):
+        ''' Beginn der Erstellung eines Gerätes. '''
+        self.geraet_marke = time.perf_counter()
+
+    def geraet(self, device_name, teil):
+        ''' Beendet einen Teil der Erstellung eines Gerätes (Dauer seit dem letzten Teil).
+
+        Args:
+            device_name (str):  Name des Gerätes
+            teil (str):         Name des Teils (z.B. Import, Gerät, Widget)
+        '''
+        jetzt = time.perf_counter()
+        self.geraete.setdefault(device_name, {})[teil] = jetzt - self.geraet_marke
+        self.geraet_marke = jetzt
+
+    ##########################################
+    # Bericht:
+    ##########################################
+    def bericht(self, sprache):
+        ''' Schreibt die Zeiten in das Logging.
+
+        Args:
+            sprache (int):      Sprache der GUI (Listenplatz)
+        '''
+        gesamt = time.perf_counter() - self.start
+        for name, dauer in self.phasen:
+            logger.info(f'{self.Log_Text_SP_1[sprache]} {name}: {dauer*1000:.1f} {self.Log_Text_SP_4[sprache]}')
+        for device_name in self.geraete:
+            teile = ', '.join([f'{teil} {dauer*1000:.1f}' for teil, dauer in self.geraete[device_name].items()])
+            logger.info(f'{self.Log_Text_SP_2[sprache]} {device_name}: {teile} {self.Log_Text_SP_4[sprache]}')
+        logger.info(f'{self.Log_Text_SP_3[sprache]} {gesamt*1000:.1f} {self.Log_Text_SP_4[sprache]}')
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
@@ -12,7 +12,7 @@ Erstellung verschiedener Objekte:
 # Bibliotheken:
 # ++++++++++++++++++++++++++++
 ## GUI:
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import (
     QWidget,
     QSplitter,
@@ -37,6 +37,16 @@ import logging
 # ++++++++++++++++++++++++++++
 logger = logging.getLogger(__name__)
 
+def text_setzen(label, text):
+    ''' Setzt den Text eines Labels nur dann, wenn er sich geändert hat (spart das Neuzeichnen des Labels).
+
+    Args:
+        label (QLabel):     Label
+        text (str):         neuer Text
+    '''
+    if label.text() != text:
+        label.setText(text)
+
 
 class Splitter(QWidget):
     def __init__(self, orientation = 'V', collaps = True, parent=None):
@@ -95,46 +105,16 @@ class PlotWidget(QWidget):
         self.toggle_Grid        = True
         fontsize                = 12                                   # Integer, Schriftgröße Achsen
 
+        ## Level of Detail:
+        self.lod_kurven         = {}                                   # Kurve (PlotDataItem): [Kurven-Speicher (Plot_Daten), Name]
+        self.lod_ansicht        = None                                 # Ansicht der letzten Neuberechnung (x-Bereich, Breite)
+
         #---------------------------------------------------------
-        # Konfigurationskontrolle und Konfigurationsvariablen:
+        # Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
-        '''
-        #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ## Einstellung für Log:
-        #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                                              'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                                                 'Possible values:']
-        self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                                                       'The following types are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                                                      'Default is used:']
-        self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                            'Error reading config during configuration:']
-        self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                                                                          '; Set to default:']
-        self.Log_Pfad_conf_6    = ['Fehlergrund:',                                                                                                  'Reason for error:']
-        self.Log_Pfad_conf_7    = ['Bitte vor Nutzung Korrigieren und Config Neu Einlesen!',                                                        'Please correct and re-read config before use!']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                                                          'Incorrect input:']
-        self.Log_Pfad_conf_8_1  = ['Fehlerhafte Typ:',                                                                                              'Incorrect type:']
-        
-        ### Legenden Position:
-        try: self.legend_pos         = legend_ops['legend_pos'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} legend|{typ}|legend_pos {self.Log_Pfad_conf_5[self.sprache]} SIDE')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            self.legend_pos = 'SIDE'
-        if not self.legend_pos in ['IN', 'OUT', 'SIDE']:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} legend_pos ({typ}) - {self.Log_Pfad_conf_2[self.sprache]} [IN, OUT, SIDE] - {self.Log_Pfad_conf_3[self.sprache]} SIDE - {self.Log_Pfad_conf_8[self.sprache]} {self.legend_pos}')
-            self.legend_pos = 'SIDE'
-
-        ### Legenden Spalten Anzahl:
-        try: self.legend_anz = legend_ops['legend_anz']
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} legend|{typ}|legend_anz {self.Log_Pfad_conf_5[self.sprache]} 2')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            self.legend_anz = 2
-        if not type(self.legend_anz) == int or not self.legend_anz >= 1:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} legend_anz ({typ}) - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (>=1) - {self.Log_Pfad_conf_3[self.sprache]} 2 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.legend_anz)}')
-            self.legend_anz = 2
+        ## Legende (geprüft vom Controller, siehe config_schema.py):
+        self.legend_pos             = legend_ops['legend_pos']
+        self.legend_anz             = legend_ops['legend_anz']
 
         #--------------------------------------- 
         # Sprach-Einstellung:
@@ -216,6 +196,17 @@ class PlotWidget(QWidget):
 
             updateViews()
             self.achse_1.vb.sigResized.connect(updateViews)
+
+        #---------------------------------------
+        # Level of Detail:
+        #---------------------------------------
+        ## Neuberechnung nur bei Zoom/Verschieben (mehrere Änderungen kurz hintereinander werden zusammengefasst):
+        self.lod_timer = QTimer()
+        self.lod_timer.setSingleShot(True)
+        self.lod_timer.setInterval(50)
+        self.lod_timer.timeout.connect(self.lod_neu)
+        self.achse_1.vb.sigXRangeChanged.connect(self.lod_bereich_geaendert)
+        self.achse_1.vb.sigResized.connect(self.lod_bereich_geaendert)
     
         #---------------------------------------
         # Grid und AutoRange - Menüleiste:
@@ -247,6 +238,9 @@ class PlotWidget(QWidget):
     
     def AutoRange(self):
         ''' Auslösen des Anpassen der Kurven und Aktivierung des Auto Scalings'''
+        ## Kurven vorher wieder vollständig übergeben, da nach einem Zoom nur der sichtbare Bereich im Plot liegt:
+        self.achse_1.enableAutoRange(axis="x")
+        self.lod_neu()
         self.achse_1.autoRange()
         self.achse_2.autoRange()
         self.achse_1.enableAutoRange(axis="x")
@@ -256,6 +250,53 @@ class PlotWidget(QWidget):
         # Notiz:    Wenn in der Legende nur Kurven der Achse 2 ausgewählt sind, so wird die x-Achse nicht angepasst für die Achse 2
         #           Um die Anpassung manschmal hinzubekommen, muss Autorange betätigt werden!
 
+    ##########################################
+    # Level of Detail:
+    ##########################################
+    def kurve_setzen(self, kurve, plot_daten, name):
+        ''' Übergibt die Punkte einer Kurve im sichtbaren Bereich (reduziert) an den Plot.
+
+        Args:
+            kurve (PlotDataItem):       Kurve im Plot
+            plot_daten (Plot_Daten):    Kurven-Speicher des Gerätes
+            name (str):                 Name der Kurve im Speicher
+        '''
+        self.lod_kurven[kurve] = [plot_daten, name]
+        x_min, x_max, pixel = self.lod_sicht()
+        kurve.setData(*plot_daten.lod(name, x_min, x_max, pixel))
+
+    def lod_sicht(self):
+        ''' Aktuelle Ansicht des Plots.
+
+        Return:
+            x_min, x_max (float):   sichtbarer x-Bereich (Auto-Range: gesamte Kurve)
+            pixel (int):            Breite des Plots in Pixel
+        '''
+        vb    = self.achse_1.vb
+        pixel = max(int(vb.width()), 100)
+        if vb.autoRangeEnabled()[0]:
+            return -float('inf'), float('inf'), pixel
+        x_min, x_max = vb.viewRange()[0]
+        return x_min, x_max, pixel
+
+    def lod_bereich_geaendert(self):
+        ''' Zoom, Verschieben oder Größenänderung des Plots. '''
+        ## Bei Auto-Range folgt der Bereich den Daten, die Kurven sind dann bereits vollständig übergeben:
+        if self.achse_1.vb.autoRangeEnabled()[0] and self.lod_ansicht != None and self.lod_ansicht[0] == -float('inf'):
+            return
+        self.lod_timer.start()
+
+    def lod_neu(self):
+        ''' Berechnet alle Kurven für die aktuelle Ansicht neu. '''
+        ansicht = self.lod_sicht()
+        if ansicht == self.lod_ansicht and not self.achse_1.vb.autoRangeEnabled()[0]:
+            return
+        self.lod_ansicht = ansicht
+        x_min, x_max, pixel = ansicht
+        for kurve in self.lod_kurven:
+            plot_daten, name = self.lod_kurven[kurve]
+            kurve.setData(*plot_daten.lod(name, x_min, x_max, pixel))
+
     ##########################################
     # Speicher Plot:
     ##########################################
@@ -42,7 +42,14 @@ import pyqtgraph as pg
 ## Allgemein:
 import logging
 import datetime
-import yaml
+import time
+
+## Eigene:
+from ..config_cache import lade_yaml
+from ..config_schema import config_pruefen
+from ..rezept import rampe, Rezept_Zeitplan
+from .plot_daten import Plot_Daten
+from .base_classes import text_setzen
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -102,24 +109,18 @@ class EducrysHeizerWidget(QWidget):
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
+        ''' Die Schlüssel aus config_schema.py kommen geprüft vom Controller (Default bei Fehler).
+        Hier wird nur noch folgendes kontrolliert:
+        1. Schlüssel außerhalb des Schemas mit Default-Vergabe!
+        2. Abhängigkeiten zwischen den Werten (z.B. Grenzen)!
         '''
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Einstellung für Log:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                                                  'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                                                     'Possible values:']
-        self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                                                           'The following types are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                                                          'Default is used:']
-        self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                                'Error reading config during configuration:']
         self.Log_Pfad_conf_4_1  = ['Fehler beim Auslesen der Config!',                                                                                  'Error reading config!']
         self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                                                                              '; Set to default:']
         self.Log_Pfad_conf_6    = ['Fehlergrund:',                                                                                                      'Reason for error:']
         self.Log_Pfad_conf_7    = ['Bitte vor Nutzung Korrigieren und Config Neu Einlesen!',                                                            'Please correct and re-read config before use!']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                                                              'Incorrect input:']
-        self.Log_Pfad_conf_8_1  = ['Fehlerhafte Typ:',                                                                                                  'Incorrect type:']
         self.Log_Pfad_conf_9    = ['Die Obergrenze ist kleiner als die Untergrenze! Setze die Limits auf Default:',                                     'The upper limit is smaller than the lower limit! Set the limits to default:']
         self.Log_Pfad_conf_10   = ['zu',                                                                                                                'to']
         self.Log_Pfad_conf_11   = ['Temperatur',                                                                                                        'Temperatur']
@@ -130,211 +131,67 @@ class EducrysHeizerWidget(QWidget):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Zum Start:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.init = self.config['start']['init']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.startMode = self.config['start']["start_modus"]
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|start_modus {self.Log_Pfad_conf_5[self.sprache]} Manuel')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.startMode = 'Manuel'
-        #//////////////////////////////////////////////////////////////////////
-        try: self.StartRampe = self.config['start']["ramp_start_value"].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|ramp_start_value {self.Log_Pfad_conf_5[self.sprache]} IST')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.StartRampe = 'IST'
+        self.init = self.config['start']['init']
+        self.startMode = self.config['start']["start_modus"]
+        self.StartRampe = self.config['start']["ramp_start_value"]
         # Wert Kontrolle: unter `Nachrichten im Log-File:` zu finden!
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.startTemp = float(str(self.config["defaults"]['startTemp']).replace(',','.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|startTemp {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.startTemp = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.startPow = float(str(self.config["defaults"]['startPow']).replace(',','.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|startPow {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.startPow = 0
+        self.startTemp = float(self.config["defaults"]['startTemp'])
+        self.startPow = float(self.config["defaults"]['startPow'])
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Limits:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Solltemperatur:
-        try: self.oGST = self.config["limits"]['maxTemp'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxTemp {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGST = 1
-        #//////////////////////////////////////////////////////////////////////       
-        try: self.uGST = self.config["limits"]['minTemp']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minTemp {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGST = 0
+        self.oGST = self.config["limits"]['maxTemp']
+        self.uGST = self.config["limits"]['minTemp']
         ### Ausgangsleistung (Operating Point)
-        try: self.oGOp = self.config["limits"]['opMax']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|opMax {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGOp = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGOp = self.config["limits"]['opMin']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|opMin {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGOp = 0
+        self.oGOp = self.config["limits"]['opMax']
+        self.uGOp = self.config["limits"]['opMin']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### GUI:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: 
-            self.legenden_inhalt = self.config['GUI']['legend'].split(';')
-            self.legenden_inhalt = [a.strip() for a in self.legenden_inhalt]    # sollten Unnötige Leerzeichen vorhanden sein, so werden diese entfernt!
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} GUI|legend {self.Log_Pfad_conf_5[self.sprache]} [IWv, IWw]')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.legenden_inhalt = ['IWT', 'IWOp']
+        self.legenden_inhalt = self.config['GUI']['legend'].split(';')
+        self.legenden_inhalt = [a.strip() for a in self.legenden_inhalt]    # sollten Unnötige Leerzeichen vorhanden sein, so werden diese entfernt!
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### Rezepte:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.rezept_config = self.config["rezepte"]
-        except Exception as e: 
-            self.rezept_config = {'rezept_Default':  {'n1': '10 ; 0 ; s'}}
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} rezepte {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.rezept_config = self.config["rezepte"]
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ### PID:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.PID_Aktiv = self.config['PID']['PID_Aktiv']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|PID_Aktiv {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Aktiv = 0 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.origin    = self.config['PID']['Value_Origin'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Value_Origin {self.Log_Pfad_conf_5[self.sprache]} VV')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.origin = 'VV'
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Mode_Switch_Value = float(str(self.config['PID']['umstell_wert']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|umstell_wert {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Mode_Switch_Value = 0  
-        #//////////////////////////////////////////////////////////////////////
-        try: self.oGPID    = self.config['PID']['Input_Limit_max']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGPID  = 1 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGPID    = self.config['PID']['Input_Limit_min'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGPID = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: kp_conf                 = float(str(self.config['PID']['kp']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|kp {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            kp_conf = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: ki_conf                 = float(str(self.config['PID']['ki']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|ki {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            ki_conf = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: kd_conf                 = float(str(self.config['PID']['kd']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|kd {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            kd_conf = 0  
+        self.PID_Aktiv = self.config['PID']['PID_Aktiv']
+        self.origin    = self.config['PID']['Value_Origin']
+        self.PID_Mode_Switch_Value = float(self.config['PID']['umstell_wert'])
+        self.oGPID    = self.config['PID']['Input_Limit_max']
+        self.uGPID    = self.config['PID']['Input_Limit_min']
+        kp_conf                 = float(self.config['PID']['kp'])
+        ki_conf                 = float(self.config['PID']['ki'])
+        kd_conf                 = float(self.config['PID']['kd'])
         
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### PID-Aktiv:
-        if not type(self.PID_Aktiv) == bool and not self.PID_Aktiv in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} PID_Aktiv - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Aktiv}')
-            self.PID_Aktiv = 0
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
         ### Temperatur-Limit:
-        if not type(self.oGST) in [float, int] or not self.oGST >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxTemp - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGST)}')
-            self.oGST = 1
-        if not type(self.uGST) in [float, int] or not self.uGST >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minTemp - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGST)}')
-            self.uGST = 0
         if self.oGST <= self.uGST:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_11[self.sprache]})')
             self.uGST = 0
             self.oGST = 1
         ### Ausgangsleistungs-Limit:
-        if not type(self.oGOp) in [float, int] or not self.oGOp >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} opMax - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGOp)}')
-            self.oGOp = 1
-        if not type(self.uGOp) in [float, int] or not self.uGOp >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} opMin - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGOp)}')
-            self.uGOp = 0
         if self.oGOp <= self.uGOp:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_13[self.sprache]})')
             self.uGOp = 0
             self.oGOp = 1
         ### PID-Limit:
-        if not type(self.oGPID) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_max - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGPID)}')
-            self.oGPID = 1
-        if not type(self.uGPID) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_min - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGPID)}')
-            self.uGPID = 0
         if self.oGPID <= self.uGPID:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
             self.uGPID = 0
             self.oGPID = 1 
-        ### Start-Modus:
-        if not self.startMode in ['Auto', 'Manuel']:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_modus - {self.Log_Pfad_conf_2[self.sprache]} [Auto, Manuel] - {self.Log_Pfad_conf_3[self.sprache]} Manuel - {self.Log_Pfad_conf_8[self.sprache]} {self.startMode}')
-            self.startMode = 'Manuel'
-        ### Start-Temperatur:
-        if not type(self.startTemp) in [float, int] or not self.startTemp >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} startTemp - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {self.startTemp}')
-            self.startTemp = 0
-        ### Start-Leistung (OP):
-        if not type(self.startPow) in [float, int] or not self.startPow >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} startPow - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {self.startPow}')
-            self.startPow = 0
         ### PID-Herkunft:
-        if not type(self.origin) == str or not self.origin in ['MM', 'MV', 'VV', 'VM']:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Value_Origin - {self.Log_Pfad_conf_2[self.sprache]} [VV, MM, VM, MV] - {self.Log_Pfad_conf_3[self.sprache]} VV - {self.Log_Pfad_conf_8[self.sprache]} {self.origin}')
-            self.origin = 'VV'
         if not self.multilog_OnOff and self.origin in ['MM', 'MV', 'VM']:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_14[self.sprache]}')
             self.origin = 'VV'
-        ### PID-Umschaltwert:
-        if not type(self.PID_Mode_Switch_Value) in [float, int] or not self.PID_Mode_Switch_Value >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} umstell_wert - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.PID_Mode_Switch_Value)}')
-            self.PID_Mode_Switch_Value = 0
         
         #--------------------------------------- 
         # Sprach-Einstellung:
@@ -494,15 +351,7 @@ class EducrysHeizerWidget(QWidget):
         #---------------------------------------
         # Konfigurationen Check:
         #---------------------------------------
-        try: self.write_value['PID-Sollwert'] = self.config['PID']['start_soll'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_soll {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.write_value['PID-Sollwert'] = 0
-        #//////////////////////////////////////////////////////////////////////
-        if not type(self.write_value['PID-Sollwert']) in [int, float]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_soll - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.write_value["PID-Sollwert"])}')
-            self.write_value['PID-Sollwert'] = 0
+        self.write_value['PID-Sollwert'] = self.config['PID']['start_soll']
 
         #---------------------------------------
         # Nachrichten im Log-File:
@@ -762,21 +611,6 @@ class EducrysHeizerWidget(QWidget):
                     self.typ_widget.legend_achsen_Links_widget.layout.addWidget(widget)
                 self.kurven_side_legend.update({side_checkbox: kurve})
 
-        ## Kurven-Daten-Listen:
-        ### Messgrößen:
-        self.opList         = []
-        self.istTpList      = []
-        self.sollTpList     = []
-        self.sollTPID       = []
-        self.istTPID        = []
-        ### Grenzen
-        self.ToGList        = []
-        self.TuGList        = []
-        self.OpoGList       = []
-        self.OpuGList       = []
-        self.XoGList        = []
-        self.XuGList        = []
-
         #---------------------------------------
         # Dictionarys:
         #---------------------------------------
@@ -785,9 +619,9 @@ class EducrysHeizerWidget(QWidget):
                 self.curveDict[kurve] = self.kurven_dict[kurve] 
         self.labelDict      = {'IWT': self.La_IstTemp_wert,                                                'IWOp': self.La_IstPow_wert,      'SWT': self.La_SollTemp_wert}                              # Label
         self.labelUnitDict  = {'IWT': self.T_unit_einzel[self.sprache],                                    'IWOp': self.P_unit_einzel[self.sprache]}                                                    # Einheit
-        self.listDict       = {'IWT': self.istTpList,       'SWT': self.sollTpList,                        'IWOp': self.opList,              'SWTPID':self.sollTPID,        'IWTPID':self.istTPID}      # Werte-Listen y
+        self.messListe      = ['IWT', 'SWT', 'IWOp', 'SWTPID', 'IWTPID']                          # Messgrößen im Kurven-Speicher
         #self.listDict_x     = {'IWT': [],                   'SWT': [],                                     'IWOp': [],                       'SWTPID':[],                   'IWTPID':[]}                # Werte-Listen x
-        self.grenzListDict  = {'oGT': self.ToGList,         'uGT': self.TuGList,    'oGOp': self.OpoGList, 'uGOp': self.OpuGList,            'oGPID': self.XoGList,         'uGPID': self.XuGList}
+        self.grenzListe     = ['oGT', 'uGT', 'oGOp', 'uGOp', 'oGPID', 'uGPID']                          # Grenzen im Kurven-Speicher
         self.grenzValueDict = {'oGT': self.oGST,            'uGT': self.uGST,       'oGOp': self.oGOp,     'uGOp': self.uGOp,                'oGPID': self.oGPID,           'uGPID': self.uGPID}
 
         ## Plot-Skalierungsfaktoren:
@@ -798,11 +632,17 @@ class EducrysHeizerWidget(QWidget):
             if 'WOp' in size:
                 self.skalFak_dict.update({size: self.skalFak['Op']})
 
+        ## Kurven-Daten (gemeinsame Zeitachse, NumPy-Puffer):
+        self.plot_daten = Plot_Daten(self.typ_widget.plot_max_punkte)
+        for messung in self.messListe:   self.plot_daten.kurve_hinzufuegen(messung, self.skalFak_dict.get(messung, 1))
+        for grenze in self.grenzListe:   self.plot_daten.kurve_hinzufuegen(grenze, stufen=True)                          # Grenzwerte werden bereits skaliert übergeben
+
         #---------------------------------------
         # Timer:
         #---------------------------------------
         ## Rezept-Timer
         self.RezTimer = QTimer()
+        self.RezTimer.setTimerType(Qt.PreciseTimer)
         self.RezTimer.timeout.connect(self.Rezept)
 
         #---------------------------------------
@@ -1100,9 +940,8 @@ class EducrysHeizerWidget(QWidget):
         # Yaml erneut laden:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         try:
-            with open(self.config_dat, encoding="utf-8") as f: 
-                config = yaml.safe_load(f)
-                logger.info(f"{self.device_name} - {self.Log_Text_205_str[self.sprache]} {config}")
+            config = config_pruefen(lade_yaml(self.config_dat)).geprueft('devices', self.device_name)
+            logger.info(f"{self.device_name} - {self.Log_Text_205_str[self.sprache]} {config}")
             skippen = 0
         except Exception as e:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4_1[self.sprache]}')         
@@ -1115,78 +954,24 @@ class EducrysHeizerWidget(QWidget):
             # Konfiguration prüfen:
             #~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             ### Solltemperatur:
-            try: self.oGST = config['devices'][self.device_name]["limits"]['maxTemp'] 
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxTemp {self.Log_Pfad_conf_5[self.sprache]} 1')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.oGST = 1       
-            #//////////////////////////////////////////////////////////////////////
-            try: self.uGST = config['devices'][self.device_name]["limits"]['minTemp']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minTemp {self.Log_Pfad_conf_5[self.sprache]} 0')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.uGST = 0
-            #//////////////////////////////////////////////////////////////////////
-            if not type(self.oGST) in [float, int] or not self.oGST >= 0:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxTemp - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGST)}')
-                self.oGST = 1
-            if not type(self.uGST) in [float, int] or not self.uGST >= 0:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minTemp - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGST)}')
-                self.uGST = 0
+            self.oGST = config["limits"]['maxTemp']
+            self.uGST = config["limits"]['minTemp']
             if self.oGST <= self.uGST:
                 logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_11[self.sprache]})')
                 self.uGST = 0
                 self.oGST = 1
             #//////////////////////////////////////////////////////////////////////
             ### Ausgangsleistung (Operating Point)
-            try: self.oGOp = config['devices'][self.device_name]["limits"]['opMax']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|opMax {self.Log_Pfad_conf_5[self.sprache]} 1')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.oGOp = 1
-            #//////////////////////////////////////////////////////////////////////
-            try: self.uGOp = config['devices'][self.device_name]["limits"]['opMin']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|opMin {self.Log_Pfad_conf_5[self.sprache]} 0')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.uGOp = 0
-            #//////////////////////////////////////////////////////////////////////
-            if not type(self.oGOp) in [float, int] or not self.oGOp >= 0:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} opMax - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGOp)}')
-                self.oGOp = 1
-            if not type(self.uGOp) in [float, int] or not self.uGOp >= 0:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} opMin - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGOp)}')
-                self.uGOp = 0
+            self.oGOp = config["limits"]['opMax']
+            self.uGOp = config["limits"]['opMin']
             if self.oGOp <= self.uGOp:
                 logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_13[self.sprache]})')
                 self.uGOp = 0
                 self.oGOp = 1
             #//////////////////////////////////////////////////////////////////////
             ### PID-Input-Output:
-            try: self.oGPID = config['devices'][self.device_name]['PID']['Input_Limit_max']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.oGPID = 1
-            #//////////////////////////////////////////////////////////////////////
-            try: self.uGPID = self.uGPID = config['devices'][self.device_name]['PID']['Input_Limit_min']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.uGPID = 0
-            #//////////////////////////////////////////////////////////////////////
-            if not type(self.oGPID) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_max - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGPID)}')
-                self.oGPID = 1
-            if not type(self.uGPID) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_min - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGPID)}')
-                self.uGPID = 0
+            self.oGPID = config['PID']['Input_Limit_max']
+            self.uGPID = config['PID']['Input_Limit_min']
             if self.oGPID <= self.uGPID:
                 logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
                 self.uGPID = 0
@@ -1226,8 +1011,7 @@ class EducrysHeizerWidget(QWidget):
             
             # Config auslesen:
             try:
-                with open(self.config_dat, encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
+                config = lade_yaml(self.config_dat)
                 logger.info(f'{self.device_name} - {self.Log_Text_EPID_1[self.sprache]} {config}')
                 skippen = 0
             except Exception as e:
@@ -1292,33 +1076,15 @@ class EducrysHeizerWidget(QWidget):
     ##########################################
     # Betrachtung der Labels und Plots:
     ##########################################
-    def update_GUI(self, value_dict, x_value):
-        ''' Update der GUI, Plot und Label!
+    def update_Daten(self, value_dict, x_value):
+        ''' Übernahme der Messwerte in die Daten und den Kurven-Speicher (jede Messung)!
 
         Args:
             value_dict (dict):  Dictionary mit den aktuellen Werten!
-            x_value (list):     Werte für die x-Achse
+            x_value (float):    Zeitpunkt für die x-Achse
         '''
-
-        ## Kurven Update:
-        self.data.update({'Time' : x_value[-1]})                    
-        self.data.update(value_dict)   
-        
-        for messung in value_dict:
-            if not 'SWT' in messung:
-                if 'IWT' in messung:
-                    if messung == 'IWT' and not self.PID_cb.isChecked():   self.labelDict[messung].setText(f'{value_dict[messung]} {self.labelUnitDict[messung]}') 
-                    elif messung == 'IWTPID' and  self.PID_cb.isChecked(): self.labelDict['IWT'].setText(f'{value_dict[messung]} {self.labelUnitDict["IWT"]}')
-                else:
-                    self.labelDict[messung].setText(f'{value_dict[messung]} {self.labelUnitDict[messung]}')
-            else:
-                if messung == 'SWT' and not self.PID_cb.isChecked():   self.labelDict[messung].setText(f'({value_dict[messung]})') 
-                elif messung == 'SWTPID' and  self.PID_cb.isChecked(): self.labelDict['SWT'].setText(f'({value_dict[messung]})') 
-            self.listDict[messung].append(value_dict[messung])
-            if not self.curveDict[messung] == '':
-                faktor = self.skalFak_dict[messung]
-                y = [a * faktor for a in self.listDict[messung]]
-                self.curveDict[messung].setData(x_value, y)
+        self.data.update({'Time' : x_value})
+        self.data.update(value_dict)
 
         ## Grenz-Kurven:
         ### Update Grenzwert-Dictionary:
@@ -1328,11 +1094,33 @@ class EducrysHeizerWidget(QWidget):
         self.grenzValueDict['uGOp']   = self.uGOp  * self.skalFak['Op']
         self.grenzValueDict['oGPID']  = self.oGPID * self.skalFak['Temp']
         self.grenzValueDict['uGPID']  = self.uGPID * self.skalFak['Temp']
-        ### Update-Kurven:
+        ### Kurven-Speicher (neuer Punkt für alle Messgrößen und Grenzen):
+        self.plot_daten.anhaengen(x_value, self.grenzValueDict, value_dict)
+
+    def update_GUI(self, value_dict, x_value):
+        ''' Update der GUI, Plot und Label (mit dem letzten Wert pro Bild)!
+
+        Args:
+            value_dict (dict):  Dictionary mit den aktuellen Werten!
+            x_value (float):    Zeitpunkt für die x-Achse
+        '''
+
+        ## Label:
+        for messung in value_dict:
+            if not 'SWT' in messung:
+                if 'IWT' in messung:
+                    if messung == 'IWT' and not self.PID_cb.isChecked():   text_setzen(self.labelDict[messung], f'{value_dict[messung]} {self.labelUnitDict[messung]}') 
+                    elif messung == 'IWTPID' and  self.PID_cb.isChecked(): text_setzen(self.labelDict['IWT'], f'{value_dict[messung]} {self.labelUnitDict["IWT"]}')
+                else:
+                    text_setzen(self.labelDict[messung], f'{value_dict[messung]} {self.labelUnitDict[messung]}')
+            else:
+                if messung == 'SWT' and not self.PID_cb.isChecked():   text_setzen(self.labelDict[messung], f'({value_dict[messung]})') 
+                elif messung == 'SWTPID' and  self.PID_cb.isChecked(): text_setzen(self.labelDict['SWT'], f'({value_dict[messung]})') 
+
+        ## Kurven (sichtbarer Bereich, reduziert):
         for kurve in self.kurven_dict:
-            if kurve in self.grenzListDict:
-                self.grenzListDict[kurve].append(float(self.grenzValueDict[kurve]))
-                self.kurven_dict[kurve].setData(x_value, self.grenzListDict[kurve])
+            if kurve in self.plot_daten:
+                self.typ_widget.plot.kurve_setzen(self.kurven_dict[kurve], self.plot_daten, kurve)
             
     ########################################## 
     # Reaktion auf Initialisierung:
@@ -1374,8 +1162,13 @@ class EducrysHeizerWidget(QWidget):
     ##########################################
     # Reaktion auf Rezepte:
     ##########################################
-    def RezStart(self, execute = 1):
-        ''' Rezept wurde gestartet '''
+    def RezStart(self, execute = 1, start = None):
+        ''' Rezept wurde gestartet 
+
+        Args:
+            execute (int):      Auslöser (1 - Knopf, 2 - Synchron-Start)
+            start (float):      Startzeit des Rezeptes (time.perf_counter, None - jetzt)
+        '''
         if self.init:
             if not self.Rezept_Aktiv:
                 if execute == 1: self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_87_str[self.sprache]}')
@@ -1434,7 +1227,8 @@ class EducrysHeizerWidget(QWidget):
                     self.PID_cb.setEnabled(False)
 
                     # Timer Starten:
-                    self.RezTimer.setInterval(int(abs(self.time_list[self.step]*1000)))
+                    self.rez_start = time.perf_counter() if start == None else start           # Monotone Startzeit (Schritte werden gegen diese Zeit geplant)
+                    self.RezTimer.setInterval(self.zeitplan.intervall(self.step, time.perf_counter() - self.rez_start))
                     self.RezTimer.start()
                     self.Fehler_Output(0)
                 else:
@@ -1502,7 +1296,7 @@ class EducrysHeizerWidget(QWidget):
             self.RezEnde(True, 2)
         # Nächster Schritt:
         else:
-            self.RezTimer.setInterval(int(abs(self.time_list[self.step]*1000)))
+            self.RezTimer.setInterval(self.zeitplan.intervall(self.step, time.perf_counter() - self.rez_start))
 
             # Nächstes Element senden:
             if self.Art_list[self.step] == 'r' or self.Art_list[self.step] == 's' or 'op' in self.Art_list[self.step]:
@@ -1580,8 +1374,7 @@ class EducrysHeizerWidget(QWidget):
             ak_rezept = self.rezept_config[rezept]
             if 'dat' in ak_rezept:
                 try:
-                    with open(f'vifcon/rezepte/{ak_rezept["dat"]}', encoding="utf-8") as f:
-                        rez_dat = yaml.safe_load(f)
+                    rez_dat = lade_yaml(f'vifcon/rezepte/{ak_rezept["dat"]}')
                     self.rezept_datei = f'({ak_rezept["dat"]})'
                 except Exception as e:
                     self.Fehler_Output(1, self.err_10_str[self.sprache])
@@ -1640,18 +1433,11 @@ class EducrysHeizerWidget(QWidget):
                 ### Rampe:
                 if werte[2].strip() == 'r':                        
                     rampen_config_step = float(werte[3].replace(',','.'))       # Zeitabstand für den Rampensprung (x-Achse)
-                    rampen_bereich = value - self.value_list[-1]                # Bereich in dem die Rampe wirkt: Aktueller Wert - Letzten Eintrag (Rezept Stufe)
-                    rampen_value = int(time/rampen_config_step)                 # Anzahl der Rampensprünge
-                    rampen_step = rampen_bereich/rampen_value                   # Höhe des Sprungs je Rampensprung (y-Achse)
+                    zeiten, rampen_werte = rampe(self.value_list[-1], value, time, rampen_config_step)      # Rampe in Schritte zerlegen (Rezept-Compiler)
                     #### Berechnung der Listen Elemente:        
-                    for rampen_n in range(1,rampen_value+1):        
-                        if not rampen_n == rampen_value:        
-                            ak_ramp = self.value_list[-1] + rampen_step         # Sollwert berechnen für eigene Rampe
-                            self.value_list.append(round(ak_ramp,3))            
-                            self.time_list.append(rampen_config_step)           # Zeitwert eintragen
-                        else: # Letzter Wert!
-                            self.value_list.append(value)
-                            self.time_list.append(rampen_config_step)    
+                    for rampen_n in range(len(zeiten)):
+                        self.value_list.append(rampen_werte[rampen_n])
+                        self.time_list.append(zeiten[rampen_n])
                         self.Art_list.append('r')                               # Rampen-Art: r
                         self.value_list_op.append(0)                            # OP-Wert auf Null
                         self.Steigung.append(rampen_config_step)                # Steigungswert eintragen
@@ -1686,23 +1472,16 @@ class EducrysHeizerWidget(QWidget):
                             opRampStart = float(valueOP)
                     except:
                         opRampStart = 0
-                    rampen_bereich = float(werte[3].replace(',','.')) - opRampStart                         # Bereich in dem die Rampe wirkt: Aktueller Wert - Letzten Eintrag (Rezept Stufe)
-                    rampen_value = int(time/rampen_config_step)                                             # Anzahl der Rampensprünge
-                    rampen_step = rampen_bereich/rampen_value                                               # Höhe des Sprungs je Rampensprung (y-Achse)
+                    zeiten, rampen_werte = rampe(opRampStart, float(werte[3].replace(',','.')), time, rampen_config_step)  # Rampe in Schritte zerlegen (Rezept-Compiler)
                     self.value_list_op.append(opRampStart)
                     self.time_list.append(rampen_config_step)                                               # Zeitwert eintragen
                     self.Art_list.append('opr')                                                             # Rampen-Art: opr
                     self.Steigung.append(rampen_config_step)                                                # Steigungswert eintragen
                     self.value_list.append(value)                                                           # Sollwert (Temp) speichern
                     #### Berechnung der Listen Elemente:        
-                    for rampen_n in range(1,rampen_value+1):        
-                        if not rampen_n == rampen_value:        
-                            ak_ramp = self.value_list_op[-1] + rampen_step      # Sollwert berechnen für eigene Rampe
-                            self.value_list_op.append(round(ak_ramp,3))         
-                            self.time_list.append(rampen_config_step)           # Zeitwert eintragen
-                        else: # Letzter Wert!
-                            self.value_list_op.append(float(werte[3].replace(',','.')))
-                            self.time_list.append(rampen_config_step)    
+                    for rampen_n in range(len(zeiten)):
+                        self.value_list_op.append(rampen_werte[rampen_n])
+                        self.time_list.append(zeiten[rampen_n])
                         self.Art_list.append('opr')                             # Rampen-Art: opr
                         self.Steigung.append(rampen_config_step)                # Steigungswert eintragen
                         self.value_list.append(value)                           # Sollwert (Temp) speichern
@@ -1751,7 +1530,9 @@ class EducrysHeizerWidget(QWidget):
         ak_time = round((ak_time_1 - self.typ_widget.start_zeit).total_seconds(), 3)         # Aktuelle Zeit Relativ
 
         ## Fehler-Kontrolle:
-        try: error = self.Rezept_lesen_controll()
+        try: 
+            error = self.Rezept_lesen_controll()
+            if not error: self.zeitplan = Rezept_Zeitplan(self.time_list, self.value_list)     # Zeitplan für die Ausführung (Rezept-Compiler)
         except Exception as e:
             error = True
             logger.exception(f'{self.device_name} - {self.Log_Text_Ex1_str[self.sprache]}')
@@ -1832,25 +1613,17 @@ class EducrysHeizerWidget(QWidget):
 
             # Config einlesen für das Gerät:
             try:
-                # Yaml erneut laden:
-                yaml_error = 1
-                with open(self.config_dat, encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
-
-                yaml_error = 2
-                self.rezept_config = config['devices'][self.device_name]['rezepte']
+                # Yaml erneut laden (geprüft):
+                config = config_pruefen(lade_yaml(self.config_dat)).geprueft('devices', self.device_name)
+                self.rezept_config = config['rezepte']
             except Exception as e: 
                 self.rezept_config = {'rezept_Default':  {'n1': '10 ; 0 ; s'}}
                 self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_Update_2[self.sprache]}')
                 self.Fehler_Output(1, self.err_RezDef_str[self.sprache])
                 error = True
-                if yaml_error == 1:
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4_1[self.sprache]} {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                elif yaml_error == 2:
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} rezepte {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                    logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4_1[self.sprache]} {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
+                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
+                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
             
             # Combo-Box neu beschreiben:
             self.cb_Rezept.addItem('------------')
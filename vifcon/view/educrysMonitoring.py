@@ -30,6 +30,9 @@ from PyQt5.QtCore import (
 ## Allgemein:
 import logging
 
+## Eigene:
+from .base_classes import text_setzen
+
 # ++++++++++++++++++++++++++++
 # Programm:
 # ++++++++++++++++++++++++++++
@@ -100,31 +103,16 @@ class EducrysMonWidget:
         self.Text_1_str         = ['Initialisierungsknopf betätigt.',                           'Initialization button pressed.']
         ## Logging: ################################################################################################################################################################################################################################################################################                     
         self.Log_Text_1_str     = ['Erstelle Widget.',                                          'Create widget.']
-        self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                          'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                             'Possible values:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                  'Default is used:']
-        self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',        'Error reading config during configuration:']
-        self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                      '; Set to default:']
-        self.Log_Pfad_conf_6    = ['Fehlergrund:',                                              'Reason for error:']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                      'Incorrect input:']
 
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
         ## Zum Start:
-        try: self.init = self.config['start']['init']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
+        self.init = self.config['start']['init']
 
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
 
         #---------------------------------------    
         # GUI:
@@ -319,19 +307,27 @@ class EducrysMonWidget:
     ##########################################
     # Betrachtung der Labels:
     ##########################################
-    def update_GUI(self, value_dict, x_value):
-        ''' Update der GUI, Plot und Label!
+    def update_Daten(self, value_dict, x_value):
+        ''' Übernahme der Messwerte in die Daten (jede Messung)!
 
         Args:
             value_dict (dict):  Dictionary mit den aktuellen Werten!
-            x_value (list):     Werte für die x-Achse
+            x_value (float):    Zeitpunkt für die x-Achse
         '''
+        self.data.update({'Time' : x_value})
+        self.data.update(value_dict)
+
+    def update_GUI(self, value_dict, x_value):
+        ''' Update der GUI, Plot und Label (mit dem letzten Wert pro Bild)!
 
-        self.data.update({'Time' : x_value[-1]})  
-        self.data.update(value_dict)   
+        Args:
+            value_dict (dict):  Dictionary mit den aktuellen Werten!
+            x_value (float):    Zeitpunkt für die x-Achse
+        '''
 
+        # Label:
         for messung in value_dict:
-            self.labelDict[messung].setText(f'{value_dict[messung]}')
+            text_setzen(self.labelDict[messung], f'{value_dict[messung]}')
 
     ##########################################
     # Reaktion auf Initialisierung:
@@ -41,7 +41,14 @@ import pyqtgraph as pg
 ## Allgemein:
 import logging
 import datetime
-import yaml
+import time
+
+## Eigene:
+from ..config_cache import lade_yaml
+from ..config_schema import config_pruefen
+from ..rezept import rampe, Rezept_Zeitplan
+from .plot_daten import Plot_Daten
+from .base_classes import text_setzen
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -100,16 +107,16 @@ class NemoAchseLinWidget(QWidget):
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
+        ''' Die Schlüssel aus config_schema.py kommen geprüft vom Controller (Default bei Fehler).
+        Hier wird nur noch folgendes kontrolliert:
+        1. Schlüssel außerhalb des Schemas mit Default-Vergabe!
+        2. Abhängigkeiten zwischen den Werten (z.B. Grenzen)!
         '''
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Einstellung für Log:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                                                  'Configuration error in element:']
         self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                                                     'Possible values:']
-        self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                                                           'The following types are possible:']
         self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                                                          'Default is used:']
         self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                                'Error reading config during configuration:']
         self.Log_Pfad_conf_4_1  = ['Fehler beim Auslesen der Config!',                                                                                  'Error reading config!']
@@ -118,7 +125,6 @@ class NemoAchseLinWidget(QWidget):
         self.Log_Pfad_conf_6    = ['Fehlergrund:',                                                                                                      'Reason for error:']
         self.Log_Pfad_conf_7    = ['Bitte vor Nutzung Korrigieren und Config Neu Einlesen!',                                                            'Please correct and re-read config before use!']
         self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                                                              'Incorrect input:']
-        self.Log_Pfad_conf_8_1  = ['Fehlerhafte Typ:',                                                                                                  'Incorrect type:']
         self.Log_Pfad_conf_9    = ['Die Obergrenze ist kleiner als die Untergrenze! Setze die Limits auf Default:',                                     'The upper limit is smaller than the lower limit! Set the limits to default:']
         self.Log_Pfad_conf_10   = ['zu',                                                                                                                'to']
         self.Log_Pfad_conf_11   = ['Geschwindhigkeit',                                                                                                  'Velocity']
@@ -130,99 +136,32 @@ class NemoAchseLinWidget(QWidget):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Übergeordnet:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.Anlage = self.config['nemo-Version']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} nemo-Version {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Anlage = 1
+        self.Anlage = self.config['nemo-Version']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Zum Start:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.init = self.config['start']['init']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.v_invert       = self.config['start']['invert']                          # Invertierung bei True der Geschwindigkeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|invert {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.v_invert = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.startSpeed = float(str(self.config["defaults"]['startSpeed']).replace(',','.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} defaults|startSpeed {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.startSpeed = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.control_pos_choise   = self.config['start']['pos_control'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|pos_control {self.Log_Pfad_conf_5[self.sprache]} SIM')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.control_pos_choise = 'SIM' 
+        self.init = self.config['start']['init']
+        self.v_invert       = self.config['start']['invert']                          # Invertierung bei True der Geschwindigkeit
+        self.startSpeed = float(self.config["defaults"]['startSpeed'])
+        self.control_pos_choise   = self.config['start']['pos_control']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Limits:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.oGv = self.config["limits"]['maxSpeed']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxSpeed {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGv = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.oGs = self.config["limits"]['maxPos']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxPos {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGs = 1  
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGs = self.config["limits"]['minPos']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minPos {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGs = 0  
-        #//////////////////////////////////////////////////////////////////////
-        try: self.oGx = self.config['PID']['Input_Limit_max']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGx = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGx = self.config['PID']['Input_Limit_min']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGx = 0    
+        self.oGv = self.config["limits"]['maxSpeed']
+        self.oGs = self.config["limits"]['maxPos']
+        self.uGs = self.config["limits"]['minPos']
+        self.oGx = self.config['PID']['Input_Limit_max']
+        self.uGx = self.config['PID']['Input_Limit_min']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## GUI:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: 
-            self.legenden_inhalt = self.config['GUI']['legend'].split(';')
-            self.legenden_inhalt = [a.strip() for a in self.legenden_inhalt]    # sollten Unnötige Leerzeichen vorhanden sein, so werden diese entfernt!
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} GUI|legend {self.Log_Pfad_conf_5[self.sprache]} [IWv, IWs]')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.legenden_inhalt = ['IWv', 'IWs']
-        #//////////////////////////////////////////////////////////////////////
-        try: self.BTN_BW_grün     = self.config['GUI']['knopf_anzeige']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} GUI|knopf_anzeige {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.BTN_BW_grün = False
+        self.legenden_inhalt = self.config['GUI']['legend'].split(';')
+        self.legenden_inhalt = [a.strip() for a in self.legenden_inhalt]    # sollten Unnötige Leerzeichen vorhanden sein, so werden diese entfernt!
+        self.BTN_BW_grün     = self.config['GUI']['knopf_anzeige']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Rezepte:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.rezept_config = self.config["rezepte"]
-        except Exception as e: 
-            self.rezept_config = {'rezept_Default':  {'n1': '10 ; 0 ; s'}}
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} rezepte {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+        self.rezept_config = self.config["rezepte"]
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Gamepad:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -235,17 +174,8 @@ class NemoAchseLinWidget(QWidget):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## PID:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.PID_Aktiv = self.config['PID']['PID_Aktiv']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|PID_Aktiv {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Aktiv = 0 
-        #//////////////////////////////////////////////////////////////////////
-        try: self.origin    = self.config['PID']['Value_Origin'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Value_Origin {self.Log_Pfad_conf_5[self.sprache]} VV')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.origin = 'VV'   
+        self.PID_Aktiv = self.config['PID']['PID_Aktiv']
+        self.origin    = self.config['PID']['Value_Origin']
         #//////////////////////////////////////////////////////////////////////
         try: self.unit_PIDIn    = self.config['PID']['Input_Size_unit']
         except Exception as e: 
@@ -253,108 +183,36 @@ class NemoAchseLinWidget(QWidget):
             logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
             self.unit_PIDIn = 'mm'
         #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Mode_Switch_Value = float(str(self.config['PID']['umstell_wert']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|umstell_wert {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Mode_Switch_Value = 0 
-        #//////////////////////////////////////////////////////////////////////
-        try: kp_conf                 = float(str(self.config['PID']['kp']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|kp {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            kp_conf = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: ki_conf                 = float(str(self.config['PID']['ki']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|ki {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            ki_conf = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: kd_conf                 = float(str(self.config['PID']['kd']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|kd {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            kd_conf = 0
+        self.PID_Mode_Switch_Value = float(self.config['PID']['umstell_wert'])
+        kp_conf                 = float(self.config['PID']['kp'])
+        ki_conf                 = float(self.config['PID']['ki'])
+        kd_conf                 = float(self.config['PID']['kd'])
 
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### Anzeige eines betätigen Knopfes:
-        if not type(self.BTN_BW_grün) == bool and not self.BTN_BW_grün in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} knopf_anzeige - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False')
-            self.BTN_BW_grün = 0
-        ### Anlagenbezeichnung:
-        if not self.Anlage in [1, 2]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} nemo-Version - {self.Log_Pfad_conf_2[self.sprache]} [1, 2] - {self.Log_Pfad_conf_3[self.sprache]} 1')
-            self.Anlage = 1
-        ### PID-Aktiv:
-        if not type(self.PID_Aktiv) == bool and not self.PID_Aktiv in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} PID_Aktiv - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Aktiv}')
-            self.PID_Aktiv = 0
         ### Gamepad-Button:
         if not self.Button_Link in ['HubS', 'HubT']:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} gamepad_Button - {self.Log_Pfad_conf_2[self.sprache]} [HubS, HubT] - {self.Log_Pfad_conf_5_4[self.sprache].replace("; ","")} - {self.Log_Pfad_conf_8[self.sprache]} {self.Button_Link}')
             self.Button_Link = 'HubS'
             self.gamepad_aktiv = False
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
         ### PID-Limit:
-        if not type(self.oGx) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_max - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGx)}')
-            self.oGx = 1
-        if not type(self.uGx) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_min - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGx)}')
-            self.uGx = 0
         if self.oGx <= self.uGx:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
             self.uGx = 0
             self.oGx = 1
         ### Geschwindigkeits-Limit:
-        if not type(self.oGv) in [float, int] or not self.oGv > 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxSpeed - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGv)}')
-            self.oGv = 1
         self.uGv = self.oGv * -1
         logger.info(f'{self.device_name} - {self.Log_Pfad_Conf_Neu[self.sprache]} {self.uGv}')
         ### Positions-Limit:
-        if not type(self.oGs) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxPos - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGs)}')
-            self.oGs = 1
-        if not type(self.uGs) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minPos - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGs)}')
-            self.uGs = 0
         if self.oGs <= self.uGs:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_13[self.sprache]})')
             self.uGs = 0
             self.oGs = 1
-        ### Achsen-Invert:
-        if not type(self.v_invert) == bool and not self.v_invert in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} invert - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.v_invert}')
-            self.v_invert = 0
-        ### Start-Geschwindigkeit:
-        if not type(self.startSpeed) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} startSpeed - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.startSpeed)}')
-            self.startSpeed = 1
         ### PID-Herkunft:
-        if not type(self.origin) == str or not self.origin in ['MM', 'MV', 'VV', 'VM']:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Value_Origin - {self.Log_Pfad_conf_2[self.sprache]} [VV, MM, VM, MV] - {self.Log_Pfad_conf_3[self.sprache]} VV - {self.Log_Pfad_conf_8[self.sprache]} {self.origin}')
-            self.origin = 'VV'
         if not self.multilog_OnOff and self.origin in ['MM', 'MV', 'VM']:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_14[self.sprache]}')
             self.origin = 'VV'
-        ### PID-Umschaltwert:
-        if not type(self.PID_Mode_Switch_Value) in [float, int] or not self.PID_Mode_Switch_Value >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} umstell_wert - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.PID_Mode_Switch_Value)}')
-            self.PID_Mode_Switch_Value = 0
-        ### Positions Kontroll Wahl:
-        if not self.control_pos_choise in ['SIM', 'REAL']:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} pos_control - {self.Log_Pfad_conf_2[self.sprache]} [SIM, REAL] - {self.Log_Pfad_conf_3[self.sprache]} SIM')
-            self.control_pos_choise = 'SIM'
 
         #--------------------------------------- 
         # Sprach-Einstellung:
@@ -607,15 +465,7 @@ class NemoAchseLinWidget(QWidget):
         #---------------------------------------
         # Konfigurationen Check:
         #---------------------------------------
-        try: self.write_value['PID-Sollwert'] = self.config['PID']['start_soll'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_soll {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.write_value['PID-Sollwert'] = 0
-        #//////////////////////////////////////////////////////////////////////
-        if not type(self.write_value['PID-Sollwert']) in [int, float]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_soll - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.write_value["PID-Sollwert"])}')
-            self.write_value['PID-Sollwert'] = 0
+        self.write_value['PID-Sollwert'] = self.config['PID']['start_soll']
 
         #---------------------------------------
         # Nachrichten im Log-File:
@@ -931,23 +781,6 @@ class NemoAchseLinWidget(QWidget):
                     self.typ_widget.legend_achsen_Links_widget.layout.addWidget(widget)
                 self.kurven_side_legend.update({side_checkbox: kurve})
 
-        ## Kurven-Daten-Listen:
-        ### Messgrößen:
-        self.posList        = []
-        self.speedList      = []
-        self.sollspeedList  = []
-        self.sollposList    = []
-        self.posListOr      = []
-        self.sollxPID       = []
-        self.istxPID        = []
-        ### Grenzen:
-        self.VoGList        = []
-        self.VuGList        = []
-        self.SoGList        = []
-        self.SuGList        = []
-        self.XoGList        = []
-        self.XuGList        = []
-
         #---------------------------------------
         # Dictionarys:
         #---------------------------------------
@@ -956,8 +789,8 @@ class NemoAchseLinWidget(QWidget):
             self.curveDict[kurve] = self.kurven_dict[kurve]
         self.labelDict      = {'IWs': self.La_IstPos_wert,                                  'IWv': self.La_IstSpeed_wert,               'SWv':self.La_SollSpeed_wert,                                       'IWsd': self.La_IstPosOr_wert,                  'SWxPID': self.La_SollPID_wert,                     'IWxPID': self.La_IstPID_wert}                      # Label
         self.labelUnitDict  = {'IWs': self.einheit_s_einzel[self.sprache],                  'IWv': self.einheit_v_einzel[self.sprache], 'SWv':self.einheit_v_einzel[self.sprache],                          'IWsd': self.einheit_s_einzel[self.sprache],    'SWxPID': self.einheit_x_einzel[self.sprache],      'IWxPID': self.einheit_x_einzel[self.sprache]}      # Einheit
-        self.listDict       = {'IWs': self.posList,                                         'IWv': self.speedList,                      'SWv':self.sollspeedList,                   'SWs':self.sollposList, 'IWsd': self.posListOr,                         'SWxPID': self.sollxPID,                            'IWxPID': self.istxPID}                             # Werteliste
-        self.grenzListDict  = {'oGv': self.VoGList,        'uGv': self.VuGList,             'oGs':self.SoGList,                         'uGs':self.SuGList,                                                                                                 'oGPID': self.XoGList,                              'uGPID': self.XuGList}
+        self.messListe      = ['IWs', 'IWv', 'SWv', 'SWs', 'IWsd', 'SWxPID', 'IWxPID']                          # Messgrößen im Kurven-Speicher
+        self.grenzListe     = ['oGv', 'uGv', 'oGs', 'uGs', 'oGPID', 'uGPID']                          # Grenzen im Kurven-Speicher
         self.grenzValueDict = {'oGv': self.oGv,            'uGv': self.uGv,                 'oGs':self.oGs,                             'uGs':self.uGs,                                                                                                     'oGPID': self.oGx,                                  'uGPID': self.uGx}
 
         ## Plot-Skalierungsfaktoren:
@@ -970,11 +803,17 @@ class NemoAchseLinWidget(QWidget):
             if 'Wx' in size:
                 self.skalFak_dict.update({size: self.skalFak['PIDA']})
 
+        ## Kurven-Daten (gemeinsame Zeitachse, NumPy-Puffer):
+        self.plot_daten = Plot_Daten(self.typ_widget.plot_max_punkte)
+        for messung in self.messListe:   self.plot_daten.kurve_hinzufuegen(messung, self.skalFak_dict.get(messung, 1))
+        for grenze in self.grenzListe:   self.plot_daten.kurve_hinzufuegen(grenze, stufen=True)                          # Grenzwerte werden bereits skaliert übergeben
+
         #---------------------------------------
         # Timer:
         #---------------------------------------
         ## Rezept-Timer
         self.RezTimer = QTimer()
+        self.RezTimer.setTimerType(Qt.PreciseTimer)
         self.RezTimer.timeout.connect(self.Rezept)
 
         #---------------------------------------
@@ -1241,29 +1080,15 @@ class NemoAchseLinWidget(QWidget):
     ##########################################
     # Betrachtung der Labels und Plots:
     ##########################################
-    def update_GUI(self, value_dict, x_value):
-        ''' Update der GUI, Plot und Label!
+    def update_Daten(self, value_dict, x_value):
+        ''' Übernahme der Messwerte in die Daten und den Kurven-Speicher (jede Messung)!
 
         Args:
             value_dict (dict):  Dictionary mit den aktuellen Werten!
-            x_value (list):     Werte für die x-Achse
+            x_value (float):    Zeitpunkt für die x-Achse
         '''
-               
-        ## Kurven Update:
-        self.data.update({'Time' : x_value[-1]})                    
-        self.data.update(value_dict)   
-
-        for messung in value_dict:
-            if not 'Gs' in messung and not 'Gv'in messung and not 'Status' in messung:
-                if not 'SWs' in messung:
-                    self.labelDict[messung].setText(f'{value_dict[messung]} {self.labelUnitDict[messung]}')
-                self.listDict[messung].append(value_dict[messung])
-                if not self.curveDict[messung] == '':
-                    faktor = self.skalFak_dict[messung]
-                    y = [a * faktor for a in self.listDict[messung]]
-                    self.curveDict[messung].setData(x_value, y)
-            elif 'Status' in messung:
-                logger.debug(f'{self.device_name} - {self.Log_Status_Int[self.sprache]} ({messung}): {value_dict[messung]}')
+        self.data.update({'Time' : x_value})
+        self.data.update(value_dict)
 
         # Grenz-Kurven:
         ## Update Grenzwert-Dictionary:
@@ -1273,11 +1098,29 @@ class NemoAchseLinWidget(QWidget):
         self.grenzValueDict['uGs']      = value_dict['uGs']     * self.skalFak['Pos']
         self.grenzValueDict['oGPID']    = self.oGx              * self.skalFak['PIDA']
         self.grenzValueDict['uGPID']    = self.uGx              * self.skalFak['PIDA']
-        ## Update-Kurven:
+        ## Kurven-Speicher (neuer Punkt für alle Messgrößen und Grenzen):
+        self.plot_daten.anhaengen(x_value, self.grenzValueDict, value_dict)
+
+    def update_GUI(self, value_dict, x_value):
+        ''' Update der GUI, Plot und Label (mit dem letzten Wert pro Bild)!
+
+        Args:
+            value_dict (dict):  Dictionary mit den aktuellen Werten!
+            x_value (float):    Zeitpunkt für die x-Achse
+        '''
+               
+        ## Label:
+        for messung in value_dict:
+            if not 'Gs' in messung and not 'Gv'in messung and not 'Status' in messung:
+                if not 'SWs' in messung:
+                    text_setzen(self.labelDict[messung], f'{value_dict[messung]} {self.labelUnitDict[messung]}')
+            elif 'Status' in messung:
+                logger.debug(f'{self.device_name} - {self.Log_Status_Int[self.sprache]} ({messung}): {value_dict[messung]}')
+
+        # Kurven (sichtbarer Bereich, reduziert):
         for kurve in self.kurven_dict:
-            if kurve in self.grenzListDict:
-                self.grenzListDict[kurve].append(float(self.grenzValueDict[kurve]))
-                self.kurven_dict[kurve].setData(x_value, self.grenzListDict[kurve])
+            if kurve in self.plot_daten:
+                self.typ_widget.plot.kurve_setzen(self.kurven_dict[kurve], self.plot_daten, kurve)
 
         # Status:
         ## Listen:
@@ -1302,7 +1145,7 @@ class NemoAchseLinWidget(QWidget):
             status_2_Wert = value_dict['Status_2']
             new_string = self.Status_Bund(status_2, status_2_Wert, new_string, False)
 
-        self.La_Status.setText(f'{self.status_3_str[self.sprache]} {new_string}')
+        text_setzen(self.La_Status, f'{self.status_3_str[self.sprache]} {new_string}')
 
         # Status-Meldung-2 Eilgang:
         if self.Anlage == 2:
@@ -1311,7 +1154,7 @@ class NemoAchseLinWidget(QWidget):
             #new_string = new_string + ', '
             status_Eil_2_Wert = value_dict['StatusEil_2']
             new_string = self.Status_Bund(status_Eil_2, status_Eil_2_Wert, new_string, False)
-            self.La_Status_Eil.setText(f'{self.status_3_Eil_str[self.sprache]} {new_string}')
+            text_setzen(self.La_Status_Eil, f'{self.status_3_Eil_str[self.sprache]} {new_string}')
 
     def Status_Bund(self, status_Liste, wert, string, Teil_1 = True):
         ''' String für den Status des Gerätes zusammensetzen und in die GUI einsetzen.
@@ -1433,9 +1276,8 @@ class NemoAchseLinWidget(QWidget):
         # Yaml erneut laden:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         try:
-            with open(self.config_dat, encoding="utf-8") as f: 
-                config = yaml.safe_load(f)
-                logger.info(f"{self.device_name} - {self.Log_Text_205_str[self.sprache]} {config}")
+            config = config_pruefen(lade_yaml(self.config_dat)).geprueft('devices', self.device_name)
+            logger.info(f"{self.device_name} - {self.Log_Text_205_str[self.sprache]} {config}")
             skippen = 0
         except Exception as e:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4_1[self.sprache]}')         
@@ -1448,66 +1290,21 @@ class NemoAchseLinWidget(QWidget):
             # Konfiguration prüfen:
             #~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             ### Geschwindigkeits-Limit:
-            try: self.oGv = config['devices'][self.device_name]["limits"]['maxSpeed']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxSpeed {self.Log_Pfad_conf_5[self.sprache]} 1')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.oGv = 1
-            #//////////////////////////////////////////////////////////////////////
-            if not type(self.oGv) in [float, int] or not self.oGv > 0:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxSpeed - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGv)}')
-                self.oGv = 1
+            self.oGv = config["limits"]['maxSpeed']
             self.uGv = self.oGv * -1
             logger.info(f'{self.device_name} - {self.Log_Pfad_Conf_Neu[self.sprache]} {self.uGv}')
             #//////////////////////////////////////////////////////////////////////
             ### Positions-Limit:
-            try: self.oGs = config['devices'][self.device_name]["limits"]['maxPos']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxPos {self.Log_Pfad_conf_5[self.sprache]} 1')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.oGs = 1
-            #//////////////////////////////////////////////////////////////////////
-            try: self.uGs = config['devices'][self.device_name]["limits"]['minPos']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minPos {self.Log_Pfad_conf_5[self.sprache]} 0')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.uGs = 0
-            #//////////////////////////////////////////////////////////////////////
-            if not type(self.oGs) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxPos - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 180 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGs)}')
-                self.oGs = 180
-            if not type(self.uGs) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minPos - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGs)}')
-                self.uGs = 0
+            self.oGs = config["limits"]['maxPos']
+            self.uGs = config["limits"]['minPos']
             if self.oGs <= self.uGs:
                 logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_13[self.sprache]})')
                 self.uGs = 0
                 self.oGs = 1
             #//////////////////////////////////////////////////////////////////////
             ### PID-Limit:
-            try: self.oGx = config['devices'][self.device_name]['PID']['Input_Limit_max']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.oGx = 1
-            #//////////////////////////////////////////////////////////////////////
-            try: self.uGx = self.uGx = config['devices'][self.device_name]['PID']['Input_Limit_min']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.uGx = 0
-            #//////////////////////////////////////////////////////////////////////
-            if not type(self.oGx) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_max - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGx)}')
-                self.oGx = 1
-            if not type(self.uGx) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_min - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGx)}')
-                self.uGx = 0
+            self.oGx = config['PID']['Input_Limit_max']
+            self.uGx = config['PID']['Input_Limit_min']
             if self.oGx <= self.uGx:
                 logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
                 self.uGx = 0
@@ -1567,8 +1364,13 @@ class NemoAchseLinWidget(QWidget):
     ##########################################
     # Reaktion auf Rezepte:
     ##########################################
-    def RezStart(self, execute = 1):
-        ''' Rezept wurde gestartet '''
+    def RezStart(self, execute = 1, start = None):
+        ''' Rezept wurde gestartet 
+
+        Args:
+            execute (int):      Auslöser (1 - Knopf, 2 - Synchron-Start)
+            start (float):      Startzeit des Rezeptes (time.perf_counter, None - jetzt)
+        '''
         if self.init:
             if not self.Rezept_Aktiv:
                 if execute == 1: self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_87_str[self.sprache]}')
@@ -1639,7 +1441,8 @@ class NemoAchseLinWidget(QWidget):
                     self.PID_cb.setEnabled(False)
 
                     # Timer Starten:
-                    self.RezTimer.setInterval(int(abs(self.time_list[self.step]*1000)))
+                    self.rez_start = time.perf_counter() if start == None else start           # Monotone Startzeit (Schritte werden gegen diese Zeit geplant)
+                    self.RezTimer.setInterval(self.zeitplan.intervall(self.step, time.perf_counter() - self.rez_start))
                     self.RezTimer.start()
                     self.Fehler_Output(0, self.La_error_1)
                 else:
@@ -1693,7 +1496,7 @@ class NemoAchseLinWidget(QWidget):
         if self.step > len(self.time_list) - 1:
             self.Stopp(2)
         else:
-            self.RezTimer.setInterval(int(abs(self.time_list[self.step]*1000)))
+            self.RezTimer.setInterval(self.zeitplan.intervall(self.step, time.perf_counter() - self.rez_start))
 
             # Nächstes Element senden:
             ## PID-Modus oder Normaler-Modus:
@@ -1773,8 +1576,8 @@ class NemoAchseLinWidget(QWidget):
         rezept = self.cb_Rezept.currentText()
         pos_list = [] 
         try:
-            if self.control_pos_choise == 'REAL':   start_pos = self.posListOr[-1] 
-            else:                                   start_pos = self.posList[-1]
+            if self.control_pos_choise == 'REAL':   start_pos = self.plot_daten.roh_werte('IWsd')[-1]
+            else:                                   start_pos = self.plot_daten.roh_werte('IWs')[-1]
         except:
             error = True 
 
@@ -1783,8 +1586,7 @@ class NemoAchseLinWidget(QWidget):
             ak_rezept = self.rezept_config[rezept]
             if 'dat' in ak_rezept:
                 try:
-                    with open(f'vifcon/rezepte/{ak_rezept["dat"]}', encoding="utf-8") as f:
-                        rez_dat = yaml.safe_load(f)
+                    rez_dat = lade_yaml(f'vifcon/rezepte/{ak_rezept["dat"]}')
                     self.rezept_datei = f'({ak_rezept["dat"]})'
                 except:
                     self.Fehler_Output(1, self.La_error_1, self.err_10_str[self.sprache])
@@ -1834,18 +1636,11 @@ class NemoAchseLinWidget(QWidget):
                 ### Rampe:
                 if werte[2].strip() == 'r':                         
                     rampen_config_step = float(werte[3])                # Zeitabstand für den Rampensprung (x-Achse)
-                    rampen_bereich = value - self.value_list[-1]        # Bereich in dem die Rampe wirkt: Aktueller Wert - Letzten Eintrag (Rezept Stufe)
-                    rampen_value = int(time/rampen_config_step)         # Anzahl der Rampensprünge
-                    rampen_step = rampen_bereich/rampen_value           # Höhe des Sprungs je Rampensprung (y-Achse)
+                    zeiten, rampen_werte = rampe(self.value_list[-1], value, time, rampen_config_step)      # Rampe in Schritte zerlegen (Rezept-Compiler)
                     #### Berechnung der Listen Elemente:
-                    for rampen_n in range(1,rampen_value+1):
-                        if not rampen_n == rampen_value:
-                            ak_ramp = self.value_list[-1] + rampen_step
-                            self.value_list.append(round(ak_ramp,3))    # Runden: Eurotherm könnte bis 6 Nachkommerstellen, Display nur 2
-                            self.time_list.append(rampen_config_step)
-                        else: # Letzter Wert!
-                            self.value_list.append(value)
-                            self.time_list.append(rampen_config_step)   # 0 
+                    for rampen_n in range(len(zeiten)):
+                        self.value_list.append(rampen_werte[rampen_n])
+                        self.time_list.append(zeiten[rampen_n])
                         if self.PID_cb.isChecked(): self.move_list.append(werte[4].upper().strip())
                 ### Sprung:
                 elif werte[2].strip() == 's':                                               
@@ -1906,7 +1701,9 @@ class NemoAchseLinWidget(QWidget):
         ak_time = round((ak_time_1 - self.typ_widget.start_zeit).total_seconds(), 3)         # Aktuelle Zeit Relativ
 
         # Fehler-Kontrolle:
-        try: error = self.Rezept_lesen_controll()
+        try: 
+            error = self.Rezept_lesen_controll()
+            if not error: self.zeitplan = Rezept_Zeitplan(self.time_list, self.value_list)     # Zeitplan für die Ausführung (Rezept-Compiler)
         except Exception as e:
             error = True
             logger.exception(f'{self.device_name} - {self.Log_Text_Ex1_str[self.sprache]}')
@@ -1956,25 +1753,17 @@ class NemoAchseLinWidget(QWidget):
 
             # Config einlesen für das Gerät:
             try:
-                # Yaml erneut laden:
-                yaml_error = 1
-                with open(self.config_dat, encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
-
-                yaml_error = 2
-                self.rezept_config = config['devices'][self.device_name]['rezepte']
+                # Yaml erneut laden (geprüft):
+                config = config_pruefen(lade_yaml(self.config_dat)).geprueft('devices', self.device_name)
+                self.rezept_config = config['rezepte']
             except Exception as e: 
                 self.rezept_config = {'rezept_Default':  {'n1': '10 ; 0 ; s'}}
                 self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_Update_2[self.sprache]}')
                 self.Fehler_Output(1, self.La_error_1, self.err_RezDef_str[self.sprache])
                 error = True
-                if yaml_error == 1:
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4_1[self.sprache]} {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                elif yaml_error == 2:
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} rezepte {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                    logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4_1[self.sprache]} {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
+                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
+                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
             
             # Combo-Box neu beschreiben:
             self.cb_Rezept.addItem('------------')
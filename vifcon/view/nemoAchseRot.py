@@ -42,7 +42,14 @@ import pyqtgraph as pg
 ## Allgemein:
 import logging
 import datetime
-import yaml
+import time
+
+## Eigene:
+from ..config_cache import lade_yaml
+from ..config_schema import config_pruefen
+from ..rezept import rampe, Rezept_Zeitplan
+from .plot_daten import Plot_Daten
+from .base_classes import text_setzen
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -101,9 +108,10 @@ class NemoAchseRotWidget(QWidget):
         #---------------------------------------------------------
         # Konfigurationskontrolle und Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
+        ''' Die Schlüssel aus config_schema.py kommen geprüft vom Controller (Default bei Fehler).
+        Hier wird nur noch folgendes kontrolliert:
+        1. Schlüssel außerhalb des Schemas mit Default-Vergabe!
+        2. Abhängigkeiten zwischen den Werten (z.B. Grenzen)!
         '''
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Einstellung für Log:
@@ -131,90 +139,28 @@ class NemoAchseRotWidget(QWidget):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Übergeordnet:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.Anlage = self.config['nemo-Version']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} nemo-Version {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.Anlage = 1
+        self.Anlage = self.config['nemo-Version']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Zum Start:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.init = self.config['start']['init']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|init {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.init = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.v_invert       = self.config['start']['invert']                          # Invertierung bei True der Geschwindigkeit
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|invert {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.v_invert = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.kont_Rot = self.config['start']['kont_rot']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} start|kont_rot {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.kont_Rot = False
-        #//////////////////////////////////////////////////////////////////////
-        try: self.startSpeed = float(str(self.config["defaults"]['startSpeed']).replace(',','.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} defaults|startSpeed {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.startSpeed = 1
+        self.init = self.config['start']['init']
+        self.v_invert       = self.config['start']['invert']                          # Invertierung bei True der Geschwindigkeit
+        self.kont_Rot = self.config['start']['kont_rot']
+        self.startSpeed = float(self.config["defaults"]['startSpeed'])
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Limits:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.oGv = self.config["limits"]['maxSpeed']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxSpeed {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGv = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.oGw = self.config["limits"]['maxWinkel']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxWinkel {self.Log_Pfad_conf_5[self.sprache]} 180')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGw = 180
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGw = self.config["limits"]['minWinkel']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minWinkel {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGw = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: self.oGx = self.config['PID']['Input_Limit_max']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.oGx = 1
-        #//////////////////////////////////////////////////////////////////////
-        try: self.uGx = self.config['PID']['Input_Limit_min']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.uGx = 0
+        self.oGv = self.config["limits"]['maxSpeed']
+        self.oGw = self.config["limits"]['maxWinkel']
+        self.uGw = self.config["limits"]['minWinkel']
+        self.oGx = self.config['PID']['Input_Limit_max']
+        self.uGx = self.config['PID']['Input_Limit_min']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## GUI:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: 
-            self.legenden_inhalt = self.config['GUI']['legend'].split(';')
-            self.legenden_inhalt = [a.strip() for a in self.legenden_inhalt]    # sollten Unnötige Leerzeichen vorhanden sein, so werden diese entfernt!
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} GUI|legend {self.Log_Pfad_conf_5[self.sprache]} [IWv, IWw]')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.legenden_inhalt = ['IWv', 'IWw']
-        #//////////////////////////////////////////////////////////////////////
-        try: self.BTN_BW_grün     = self.config['GUI']['knopf_anzeige']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} GUI|knopf_anzeige {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.BTN_BW_grün = False
+        self.legenden_inhalt = self.config['GUI']['legend'].split(';')
+        self.legenden_inhalt = [a.strip() for a in self.legenden_inhalt]    # sollten Unnötige Leerzeichen vorhanden sein, so werden diese entfernt!
+        self.BTN_BW_grün     = self.config['GUI']['knopf_anzeige']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Gamepad:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -227,18 +173,8 @@ class NemoAchseRotWidget(QWidget):
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Rezepte:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        try: self.rezept_config = self.config["rezepte"]
-        except Exception as e: 
-            self.rezept_config = {'rezept_Default':  {'n1': '10 ; 0 ; s'}}
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} rezepte {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-        #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-        try: self.rezept_Loop = self.config['rezept_Loop']
-        except Exception as e:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} rezept_Loop {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.rezept_Loop = 0
+        self.rezept_config = self.config["rezepte"]
+        self.rezept_Loop = self.config['rezept_Loop']
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## PID-Modus:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -248,124 +184,38 @@ class NemoAchseRotWidget(QWidget):
             logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
             self.unit_PIDIn = 'mm'
         #//////////////////////////////////////////////////////////////////////
-        try: self.origin    = self.config['PID']['Value_Origin'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Value_Origin {self.Log_Pfad_conf_5[self.sprache]} VV')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.origin = 'VV'    
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Mode_Switch_Value = float(str(self.config['PID']['umstell_wert']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|umstell_wert {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Mode_Switch_Value = 0         
-        #//////////////////////////////////////////////////////////////////////
-        try: self.PID_Aktiv = self.config['PID']['PID_Aktiv']
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|PID_Aktiv {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.PID_Aktiv = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: kp_conf                 = float(str(self.config['PID']['kp']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|kp {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            kp_conf = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: ki_conf                 = float(str(self.config['PID']['ki']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|ki {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            ki_conf = 0
-        #//////////////////////////////////////////////////////////////////////
-        try: kd_conf                 = float(str(self.config['PID']['kd']).replace(',', '.'))
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|kd {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            kd_conf = 0 
+        self.origin    = self.config['PID']['Value_Origin']
+        self.PID_Mode_Switch_Value = float(self.config['PID']['umstell_wert'])
+        self.PID_Aktiv = self.config['PID']['PID_Aktiv']
+        kp_conf                 = float(self.config['PID']['kp'])
+        ki_conf                 = float(self.config['PID']['ki'])
+        kd_conf                 = float(self.config['PID']['kd'])
 
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         ## Config-Fehler und Defaults:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ### Knopf-Anzeige:
-        if not type(self.BTN_BW_grün) == bool and not self.BTN_BW_grün in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} knopf_anzeige - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.BTN_BW_grün}')
-            self.BTN_BW_grün = 0
-        ### Anlagen-Version:
-        if not self.Anlage in [1, 2]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} nemo-Version - {self.Log_Pfad_conf_2[self.sprache]} [1, 2] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8[self.sprache]} {self.Anlage}')
-            self.Anlage = 1
         ### Gamepad-Button:
         if not self.Button_Link in ['RotS', 'RotT']:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} gamepad_Button - {self.Log_Pfad_conf_2[self.sprache]} [RotS, RotT] - {self.Log_Pfad_conf_5_4[self.sprache].replace("; ","")} - {self.Log_Pfad_conf_8[self.sprache]} {self.Button_Link}')
             self.Button_Link = 'RotS'
             self.gamepad_aktiv = False
-        ### Init:
-        if not type(self.init) == bool and not self.init in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} init - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.init}')
-            self.init = 0
-        ### Kontinuierlich Rotieren:
-        if not type(self.kont_Rot) == bool and not self.kont_Rot in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} kont_rot - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.kont_Rot}')
-            self.kont_Rot = 0
         ### PID-Limit:
-        if not type(self.oGx) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_max - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGx)}')
-            self.oGx = 1
-        if not type(self.uGx) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_min - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGx)}')
-            self.uGx = 0
         if self.oGx <= self.uGx:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
             self.uGx = 0
             self.oGx = 1
         ### Geschwindigkeits-Limit:
-        if not type(self.oGv) in [float, int] or not self.oGv > 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxSpeed - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGv)}')
-            self.oGv = 1
         self.uGv = self.oGv * -1
         logger.info(f'{self.device_name} - {self.Log_Pfad_Conf_Neu[self.sprache]} {self.uGv}')
         ### Winkel-Limit:
-        if not type(self.oGw) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxWinkel - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 180 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGw)}')
-            self.oGw = 180
-        if not type(self.uGw) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minWinkel - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGw)}')
-            self.uGw = 0
         if self.oGw <= self.uGw:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 180 ({self.Log_Pfad_conf_13[self.sprache]})')
             self.uGw = 0
             self.oGw = 180
-        ### Start-Geschwindigkeit:
-        if not type(self.startSpeed) in [float, int]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} startSpeed - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.startSpeed)}')
-            self.startSpeed = 1
         ### PID-Herkunft:
-        if not type(self.origin) == str or not self.origin in ['MM', 'MV', 'VV', 'VM']:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Value_Origin - {self.Log_Pfad_conf_2[self.sprache]} [VV, MM, VM, MV] - {self.Log_Pfad_conf_3[self.sprache]} VV - {self.Log_Pfad_conf_8[self.sprache]} {self.origin}')
-            self.origin = 'VV'
         if not self.multilog_OnOff and self.origin in ['MM', 'MV', 'VM']:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_14[self.sprache]}')
             self.origin = 'VV'
-        ### PID-Umschaltwert:
-        if not type(self.PID_Mode_Switch_Value) in [float, int] or not self.PID_Mode_Switch_Value >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} umstell_wert - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.PID_Mode_Switch_Value)}')
-            self.PID_Mode_Switch_Value = 0
-        ### PID-Aktiv:
-        if not type(self.PID_Aktiv) == bool and not self.PID_Aktiv in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} PID_Aktiv - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.PID_Aktiv}')
-            self.PID_Aktiv = 0  
-        ### Achsen-Invert:
-        if not type(self.v_invert) == bool and not self.v_invert in [0,1]: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} invert - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.v_invert}')
-            self.v_invert = 0
-        ### Rezept Loop Anzahl:
-        if not type(self.rezept_Loop) in [int] or not self.rezept_Loop >= 0:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} rezept_Loop - {self.Log_Pfad_conf_2_1[self.sprache]} [int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.rezept_Loop)}')
-            self.rezept_Loop = 0
          
         #--------------------------------------- 
         # Sprach-Einstellung:
@@ -577,15 +427,7 @@ class NemoAchseRotWidget(QWidget):
         #---------------------------------------
         # Konfigurationen Check:
         #---------------------------------------
-        try: self.write_value['PID-Sollwert'] = self.config['PID']['start_soll'] 
-        except Exception as e: 
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|start_soll {self.Log_Pfad_conf_5[self.sprache]} 0')
-            logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-            self.write_value['PID-Sollwert'] = 0
-        #//////////////////////////////////////////////////////////////////////
-        if not type(self.write_value['PID-Sollwert']) in [int, float]:
-            logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} start_soll - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.write_value["PID-Sollwert"])}')
-            self.write_value['PID-Sollwert'] = 0
+        self.write_value['PID-Sollwert'] = self.config['PID']['start_soll']
 
         #---------------------------------------
         # Nachrichten im Log-File:
@@ -920,23 +762,6 @@ class NemoAchseRotWidget(QWidget):
                     self.typ_widget.legend_achsen_Links_widget.layout.addWidget(widget)
                 self.kurven_side_legend.update({side_checkbox: kurve})
 
-        ## Kurven-Daten-Listen:
-        ### Messgrößen:
-        self.winList        = []  
-        self.winList_d      = [] 
-        self.winList_U      = []      
-        self.speedList      = []   
-        self.sollspeedList  = []  
-        self.sollxPID       = []
-        self.istxPID        = []
-        ### Grenzen:
-        self.VoGList        = []
-        self.VuGList        = []
-        self.WoGList        = []
-        self.WuGList        = []
-        self.XoGList        = []
-        self.XuGList        = []
-
         #---------------------------------------
         # Dictionarys:
         #---------------------------------------
@@ -945,14 +770,14 @@ class NemoAchseRotWidget(QWidget):
             self.curveDict[kurve] = self.kurven_dict[kurve]
         self.labelDict      = {'IWv': self.La_IstSpeed_wert,                'SWv': self.La_SollSpeed_wert,              'IWw':self.La_IstWin_wert,                  'SWxPID': self.La_SollPID_wert,                     'IWxPID': self.La_IstPID_wert}                          # Label
         self.labelUnitDict  = {'IWv': self.einheit_v_einzel[self.sprache],  'SWv': self.einheit_v_einzel[self.sprache], 'IWw':self.einheit_w_einzel[self.sprache],  'SWxPID': self.einheit_x_einzel[self.sprache],      'IWxPID': self.einheit_x_einzel[self.sprache]}          # Einheit
-        self.listDict       = {'IWv': self.speedList,                       'SWv':self.sollspeedList,                   'IWw':self.winList,                         'SWxPID': self.sollxPID,                            'IWxPID': self.istxPID}                                 # Werteliste
-        self.grenzListDict  = {'oGv': self.VoGList,                         'uGv': self.VuGList,                        'oGw': self.WoGList,                        'uGw': self.WuGList,                                'oGPID': self.XoGList, 'uGPID': self.XuGList}
+        self.messListe      = ['IWv', 'SWv', 'IWw', 'SWxPID', 'IWxPID']                          # Messgrößen im Kurven-Speicher
+        self.grenzListe     = ['oGv', 'uGv', 'oGw', 'uGw', 'oGPID', 'uGPID']                          # Grenzen im Kurven-Speicher
         self.grenzValueDict = {'oGv': self.oGv,                             'uGv': self.uGv,                            'oGw': self.oGw,                            'uGw': self.uGw,                                    'oGPID': self.oGx,     'uGPID': self.uGx}
 
         if self.Anlage == 2:
             self.labelDict.update({'IWwd':self.La_IstWinOr_wert, 'IWwU':self.La_IstWinU_wert})
             self.labelUnitDict.update({'IWwd':self.einheit_w_einzel[self.sprache], 'IWwU':self.einheit_w_einzel_2[self.sprache]})
-            self.listDict.update({'IWwd':self.winList_d, 'IWwU':self.winList_U})
+            self.messListe.extend(['IWwd', 'IWwU'])
 
         ## Plot-Skalierungsfaktoren:
         self.skalFak_dict = {}
@@ -964,11 +789,17 @@ class NemoAchseRotWidget(QWidget):
             if 'Wx' in size:
                 self.skalFak_dict.update({size: self.skalFak['PIDA']})
 
+        ## Kurven-Daten (gemeinsame Zeitachse, NumPy-Puffer):
+        self.plot_daten = Plot_Daten(self.typ_widget.plot_max_punkte)
+        for messung in self.messListe:   self.plot_daten.kurve_hinzufuegen(messung, self.skalFak_dict.get(messung, 1))
+        for grenze in self.grenzListe:   self.plot_daten.kurve_hinzufuegen(grenze, stufen=True)                          # Grenzwerte werden bereits skaliert übergeben
+
         #---------------------------------------
         # Timer:
         #---------------------------------------
         ## Rezept-Timer
         self.RezTimer = QTimer()                                                                
+        self.RezTimer.setTimerType(Qt.PreciseTimer)
         self.RezTimer.timeout.connect(self.Rezept)  
 
         #---------------------------------------
@@ -1242,49 +1073,52 @@ class NemoAchseRotWidget(QWidget):
     ##########################################
     # Betrachtung der Labels und Plots:
     ##########################################
+    def update_Daten(self, value_dict, x_value):
+        ''' Übernahme der Messwerte in die Daten und den Kurven-Speicher (jede Messung)!
+
+        Args:
+            value_dict (dict):  Dictionary mit den aktuellen Werten!
+            x_value (float):    Zeitpunkt für die x-Achse
+        '''
+        self.data.update({'Time' : x_value})
+        self.data.update(value_dict)
+
+        # Grenz-Kurven:
+        ## Update Grenzwert-Dictionary:
+        self.grenzValueDict['oGv']      = self.oGv  * self.skalFak['WinSpeed']
+        self.grenzValueDict['uGv']      = self.uGv  * self.skalFak['WinSpeed']
+        self.grenzValueDict['oGw']      = self.oGw  * self.skalFak['Win']
+        self.grenzValueDict['uGw']      = self.uGw  * self.skalFak['Win']
+        self.grenzValueDict['oGPID']    = self.oGx  * self.skalFak['PIDA']
+        self.grenzValueDict['uGPID']    = self.uGx  * self.skalFak['PIDA']
+        ## Kurven-Speicher (neuer Punkt für alle Messgrößen und Grenzen):
+        self.plot_daten.anhaengen(x_value, self.grenzValueDict, value_dict)
+
     def update_GUI(self, value_dict, x_value):
-        ''' Update der GUI, Plot und Label!
+        ''' Update der GUI, Plot und Label (mit dem letzten Wert pro Bild)!
 
         Args:
             value_dict (dict):  Dictionary mit den aktuellen Werten!
-            x_value (list):     Werte für die x-Achse
+            x_value (float):    Zeitpunkt für die x-Achse
         '''
                 
-        ### Kurven Update:
-        self.data.update({'Time' : x_value[-1]})                  
-        self.data.update(value_dict)   
-
+        ### Label:
         for messung in value_dict:
             if not 'Status' in messung and not 'IWwU' in messung:
                 Leerzeichen = ''
                 if 'SWv' in messung or 'IWv' in messung or 'SWx' in messung or 'IWx' in messung:
                     Leerzeichen = ' '
                 # Label Veränderung im PID-Modus!
-                self.labelDict[messung].setText(f'{value_dict[messung]}{Leerzeichen}{self.labelUnitDict[messung]}')
-                self.listDict[messung].append(value_dict[messung])
-                if not self.curveDict[messung] == '':
-                    faktor = self.skalFak_dict[messung]
-                    y = [a * faktor for a in self.listDict[messung]]
-                    self.curveDict[messung].setData(x_value, y)   
+                text_setzen(self.labelDict[messung], f'{value_dict[messung]}{Leerzeichen}{self.labelUnitDict[messung]}')
             elif 'Status' in messung:
                 logger.debug(f'{self.device_name} - {self.Log_Status_Int[self.sprache]} ({messung}): {value_dict[messung]}')
             elif 'IWwU' in messung:
-                self.labelDict[messung].setText(f'{value_dict[messung]} {self.labelUnitDict[messung]}')
-                self.listDict[messung].append(value_dict[messung])
+                text_setzen(self.labelDict[messung], f'{value_dict[messung]} {self.labelUnitDict[messung]}')
 
-        # Grenz-Kurven:
-        ## Update Grenzwert-Dictionary:
-        self.grenzValueDict['oGv']      = self.oGv  * self.skalFak['WinSpeed']
-        self.grenzValueDict['uGv']      = self.uGv  * self.skalFak['WinSpeed']
-        self.grenzValueDict['oGw']      = self.oGw  * self.skalFak['Win']
-        self.grenzValueDict['uGw']      = self.uGw  * self.skalFak['Win']
-        self.grenzValueDict['oGPID']    = self.oGx  * self.skalFak['PIDA']
-        self.grenzValueDict['uGPID']    = self.uGx  * self.skalFak['PIDA']
-        ## Update-Kurven:
+        # Kurven (sichtbarer Bereich, reduziert):
         for kurve in self.kurven_dict:
-            if kurve in self.grenzListDict:
-                self.grenzListDict[kurve].append(float(self.grenzValueDict[kurve]))
-                self.kurven_dict[kurve].setData(x_value, self.grenzListDict[kurve]) 
+            if kurve in self.plot_daten:
+                self.typ_widget.plot.kurve_setzen(self.kurven_dict[kurve], self.plot_daten, kurve)
 
         # Status-Meldung
         status_1 = value_dict['Status']                     
@@ -1306,7 +1140,7 @@ class NemoAchseRotWidget(QWidget):
             label_s1 = self.status_2_str[self.sprache]
         else:
             label_s1 = label_s1[:-2]
-        self.La_Status.setText(f'{self.status_3_str[self.sprache]} {label_s1}')
+        text_setzen(self.La_Status, f'{self.status_3_str[self.sprache]} {label_s1}')
 
         if self.Anlage == 2:
             if self.Stat_N2_Bit10[self.sprache] in label_s1:
@@ -1411,9 +1245,8 @@ class NemoAchseRotWidget(QWidget):
         # Yaml erneut laden:
         #~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         try:
-            with open(self.config_dat, encoding="utf-8") as f: 
-                config = yaml.safe_load(f)
-                logger.info(f"{self.device_name} - {self.Log_Text_205_str[self.sprache]} {config}")
+            config = config_pruefen(lade_yaml(self.config_dat)).geprueft('devices', self.device_name)
+            logger.info(f"{self.device_name} - {self.Log_Text_205_str[self.sprache]} {config}")
             skippen = 0
         except Exception as e:
             logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4_1[self.sprache]}')         
@@ -1426,66 +1259,21 @@ class NemoAchseRotWidget(QWidget):
             # Konfiguration prüfen:
             #~~~~~~~~~~~~~~~~~~~~~~~~~~~~
             ### Geschwindigkeits-Limit:
-            try: self.oGv = config['devices'][self.device_name]["limits"]['maxSpeed']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxSpeed {self.Log_Pfad_conf_5[self.sprache]} 1')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.oGv = 1
-            #//////////////////////////////////////////////////////////////////////
-            if not type(self.oGv) in [float, int] or not self.oGv > 0:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxSpeed - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] (Positiv)- {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGv)}')
-                self.oGv = 1
+            self.oGv = config["limits"]['maxSpeed']
             self.uGv = self.oGv * -1
             logger.info(f'{self.device_name} - {self.Log_Pfad_Conf_Neu[self.sprache]} {self.uGv}')  
             #//////////////////////////////////////////////////////////////////////
             ### Winkel-Limit:
-            try: self.oGw = config['devices'][self.device_name]["limits"]['maxWinkel']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|maxWinkel {self.Log_Pfad_conf_5[self.sprache]} 180')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.oGw = 180
-            #//////////////////////////////////////////////////////////////////////
-            try: self.uGw = config['devices'][self.device_name]["limits"]['minWinkel']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} limits|minWinkel {self.Log_Pfad_conf_5[self.sprache]} 0')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.uGw = 0
-            #//////////////////////////////////////////////////////////////////////
-            if not type(self.oGw) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} maxWinkel - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 180 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGw)}')
-                self.oGw = 180
-            if not type(self.uGw) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} minWinkel - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGw)}')
-                self.uGw = 0
+            self.oGw = config["limits"]['maxWinkel']
+            self.uGw = config["limits"]['minWinkel']
             if self.oGw <= self.uGw:
                 logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 180 ({self.Log_Pfad_conf_13[self.sprache]})')
                 self.uGw = 0
                 self.oGw = 180
             #//////////////////////////////////////////////////////////////////////
             ### PID-Limit:
-            try: self.oGx = config['devices'][self.device_name]['PID']['Input_Limit_max']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_max {self.Log_Pfad_conf_5[self.sprache]} 1')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.oGx = 1
-            #//////////////////////////////////////////////////////////////////////
-            try: self.uGx = self.uGx = config['devices'][self.device_name]['PID']['Input_Limit_min']
-            except Exception as e: 
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} PID|Input_Limit_min {self.Log_Pfad_conf_5[self.sprache]} 0')
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.uGx = 0
-            #//////////////////////////////////////////////////////////////////////
-            if not type(self.oGx) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_max - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.oGx)}')
-                self.oGx = 1
-            if not type(self.uGx) in [float, int]:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} Input_limit_min - {self.Log_Pfad_conf_2_1[self.sprache]} [float, int] - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.uGx)}')
-                self.uGx = 0
+            self.oGx = config['PID']['Input_Limit_max']
+            self.uGx = config['PID']['Input_Limit_min']
             if self.oGx <= self.uGx:
                 logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_9[self.sprache]} 0 {self.Log_Pfad_conf_10[self.sprache]} 1 ({self.Log_Pfad_conf_12[self.sprache]})')
                 self.uGx = 0
@@ -1545,8 +1333,13 @@ class NemoAchseRotWidget(QWidget):
     ##########################################
     # Reaktion auf Rezepte:
     ##########################################
-    def RezStart(self, execute = 1):
-        ''' Rezept wurde gestartet '''
+    def RezStart(self, execute = 1, start = None):
+        ''' Rezept wurde gestartet 
+
+        Args:
+            execute (int):      Auslöser (1 - Knopf, 2 - Synchron-Start)
+            start (float):      Startzeit des Rezeptes (time.perf_counter, None - jetzt)
+        '''
         if self.init:
             if not self.Rezept_Aktiv:
                 if execute == 1: self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_87_str[self.sprache]}')
@@ -1624,7 +1417,8 @@ class NemoAchseRotWidget(QWidget):
                     self.RZLoop_cb.setEnabled(False)
 
                     # Timer Starten:
-                    self.RezTimer.setInterval(int(abs(self.time_list[self.step]*1000)))
+                    self.rez_start = time.perf_counter() if start == None else start           # Monotone Startzeit (Schritte werden gegen diese Zeit geplant)
+                    self.RezTimer.setInterval(self.zeitplan.intervall(self.step, time.perf_counter() - self.rez_start))
                     self.RezTimer.start()
                     self.Fehler_Output(0, self.La_error_1)
                 else:
@@ -1682,7 +1476,7 @@ class NemoAchseRotWidget(QWidget):
             self.Stopp(2)
         else:
             # Timer Intervall updaten:
-            self.RezTimer.setInterval(int(abs(self.time_list[self.step]*1000)))
+            self.RezTimer.setInterval(self.zeitplan.intervall(self.step, time.perf_counter() - self.rez_start))
             # Nächstes Element senden:
             ## PID-Modus oder Normaler-Modus:
             if self.PID_cb.isChecked():
@@ -1761,7 +1555,7 @@ class NemoAchseRotWidget(QWidget):
         rezept = self.cb_Rezept.currentText() 
         pos_list = [] 
         try:
-            start_pos = self.winList[-1]
+            start_pos = self.plot_daten.roh_werte('IWw')[-1]
         except:
             error = True
 
@@ -1770,8 +1564,7 @@ class NemoAchseRotWidget(QWidget):
             ak_rezept = self.rezept_config[rezept]
             if 'dat' in ak_rezept:
                 try:
-                    with open(f'vifcon/rezepte/{ak_rezept["dat"]}', encoding="utf-8") as f:
-                        rez_dat = yaml.safe_load(f)
+                    rez_dat = lade_yaml(f'vifcon/rezepte/{ak_rezept["dat"]}')
                     self.rezept_datei = f'({ak_rezept["dat"]})'
                 except:
                     self.Fehler_Output(1, self.La_error_1, self.err_10_str[self.sprache])
@@ -1821,18 +1614,11 @@ class NemoAchseRotWidget(QWidget):
                 ### Rampe:
                 if werte[2].strip() == 'r':                         
                     rampen_config_step = float(werte[3])                # Zeitabstand für den Rampensprung (x-Achse)
-                    rampen_bereich = value - self.value_list[-1]        # Bereich in dem die Rampe wirkt: Aktueller Wert - Letzten Eintrag (Rezept Stufe)
-                    rampen_value = int(time/rampen_config_step)         # Anzahl der Rampensprünge
-                    rampen_step = rampen_bereich/rampen_value           # Höhe des Sprungs je Rampensprung (y-Achse)
+                    zeiten, rampen_werte = rampe(self.value_list[-1], value, time, rampen_config_step)      # Rampe in Schritte zerlegen (Rezept-Compiler)
                     #### Berechnung der Listen Elemente:
-                    for rampen_n in range(1,rampen_value+1):
-                        if not rampen_n == rampen_value:
-                            ak_ramp = self.value_list[-1] + rampen_step
-                            self.value_list.append(round(ak_ramp,3))    # Runden: Eurotherm könnte bis 6 Nachkommerstellen, Display nur 2
-                            self.time_list.append(rampen_config_step)
-                        else: # Letzter Wert!
-                            self.value_list.append(value)
-                            self.time_list.append(rampen_config_step)   # 0 
+                    for rampen_n in range(len(zeiten)):
+                        self.value_list.append(rampen_werte[rampen_n])
+                        self.time_list.append(zeiten[rampen_n])
                         if self.PID_cb.isChecked(): self.move_list.append(werte[4].upper().strip())
                 ### Sprung:
                 elif werte[2].strip() == 's':                                               
@@ -1907,7 +1693,9 @@ class NemoAchseRotWidget(QWidget):
         ak_time = round((ak_time_1 - self.typ_widget.start_zeit).total_seconds(), 3)         # Aktuelle Zeit Relativ
 
         # Fehler-Kontrolle:
-        try: error = self.Rezept_lesen_controll()
+        try: 
+            error = self.Rezept_lesen_controll()
+            if not error: self.zeitplan = Rezept_Zeitplan(self.time_list, self.value_list)     # Zeitplan für die Ausführung (Rezept-Compiler)
         except Exception as e:
             error = True
             logger.exception(f'{self.device_name} - {self.Log_Text_Ex1_str[self.sprache]}')
@@ -1956,35 +1744,20 @@ class NemoAchseRotWidget(QWidget):
 
             # Config einlesen für das Gerät:
             try:
-                # Yaml erneut laden:
-                yaml_error = 1
-                with open(self.config_dat, encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
-
-                yaml_error = 2
-                self.rezept_config = config['devices'][self.device_name]['rezepte']
+                # Yaml erneut laden (geprüft):
+                config = config_pruefen(lade_yaml(self.config_dat)).geprueft('devices', self.device_name)
+                self.rezept_config = config['rezepte']
+                self.rezept_Loop = config['rezept_Loop']
             except Exception as e: 
                 self.rezept_config = {'rezept_Default':  {'n1': '10 ; 0 ; s'}}
                 self.add_Text_To_Ablauf_Datei(f'{self.device_name} - {self.Text_Update_2[self.sprache]}')
                 self.Fehler_Output(1, self.La_error_1, self.err_RezDef_str[self.sprache])
                 error = True
-                if yaml_error == 1:
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4_1[self.sprache]} {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                elif yaml_error == 2:
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} rezepte {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
-                    logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
-                    logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-
-            # Kontrolle Rezept-Loop:
-            try: self.rezept_Loop = config['devices'][self.device_name]['rezept_Loop']
-            except Exception as e:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4[self.sprache]} rezept_Loop {self.Log_Pfad_conf_5[self.sprache]} 0')
-                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
-                self.rezept_Loop = 0
-            if not type(self.rezept_Loop) in [int] or not self.rezept_Loop >= 0:
-                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_1[self.sprache]} rezept_Loop - {self.Log_Pfad_conf_2_1[self.sprache]} [int] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8_1[self.sprache]} {type(self.rezept_Loop)}')
                 self.rezept_Loop = 0
+                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_4_1[self.sprache]} {self.Log_Pfad_conf_5[self.sprache]} {self.rezept_config}')
+                logger.warning(f'{self.device_name} - {self.Log_Pfad_conf_7[self.sprache]}')
+                logger.exception(f'{self.device_name} - {self.Log_Pfad_conf_6[self.sprache]}')
+
             self.RZLoop_cb.setToolTip(f'{self.TTRezeptLoop[self.sprache]} {self.rezept_Loop}')
             
             # Combo-Box neu beschreiben:
@@ -0,0 +1,288 @@
+# ++++++++++++++++++++++++++++
+# Beschreibung:
+# ++++++++++++++++++++++++++++
+'''
+Kurven-Daten-Speicher für die Geräte-Widgets:
+- Eine gemeinsame Zeitachse (x) für alle Kurven eines Gerätes
+- Vorbelegte NumPy-Arrays pro Kurve (Rohwerte und skalierte Werte)
+- Wachsender Puffer (Verdopplung) oder Ringpuffer mit maximaler Punktanzahl
+- Skalierungsfaktor wird beim Anhängen angewendet (Rohwerte bleiben erhalten)
+- Level of Detail (LOD): Min/Max-Blöcke pro Kurve und Stufen-Darstellung für Grenzwert-Kurven
+
+Pro Messung wird nur der neue Punkt geschrieben. An den Plot werden Ansichten (Views) der Arrays übergeben,
+somit entfällt das Neuaufbauen der Python-Listen bei jedem Update.
+
+Für den Plot wird nur der sichtbare x-Bereich, reduziert auf etwa zwei Punkte pro Pixel, übergeben (Min/Max-Hülle, Spitzen bleiben erhalten).
+Bei langen Zeitbereichen wird auf vorberechnete Min/Max-Blöcke (LOD_BLOCK Punkte) zurückgegriffen, somit hängt der Aufwand von der
+Plotbreite und nicht von der Messdauer ab. Grenzwert-Kurven sind meist konstant und werden nur an den Wertwechseln (Stufen) gezeichnet.
+'''
+
+# ++++++++++++++++++++++++++++
+# Bibliotheken:
+# ++++++++++++++++++++++++++++
+## Algemein:
+import logging
+import numpy as np
+
+# ++++++++++++++++++++++++++++
+# Programm:
+# ++++++++++++++++++++++++++++
+logger = logging.getLogger(__name__)
+
+# Anzahl der Punkte pro vorberechnetem Min/Max-Block:
+LOD_BLOCK = 64
+
+
+class Plot_Daten:
+    def __init__(self, max_punkte = 0, start_groesse = 1024):
+        ''' Erstellung des Kurven-Daten-Speichers.
+
+        Args:
+            max_punkte (int):       Maximale Anzahl an Punkten pro Kurve (0 - gesamte Messung, sonst Ringpuffer)
+            start_groesse (int):    Anfangsgröße der Arrays beim wachsenden Puffer
+        '''
+        #---------------------------------------
+        # Variablen:
+        #---------------------------------------
+        self.max_punkte = max_punkte
+        ## Beim Ringpuffer wird die doppelte Größe reserviert. Ist der Puffer voll, wird die ältere Hälfte verworfen (amortisiert ein Kopiervorgang pro max_punkte Messungen).
+        if self.max_punkte > 0: self.kapazitaet = 2 * self.max_punkte
+        else:                   self.kapazitaet = start_groesse
+
+        self.anz        = 0                                 # Anzahl der gültigen Punkte
+        self.x          = np.empty(self.kapazitaet)         # Gemeinsame Zeitachse
+        self.roh        = {}                                # Kurve: Rohwerte
+        self.skaliert   = {}                                # Kurve: skalierte Werte (Plot)
+        self.faktor     = {}                                # Kurve: Skalierungsfaktor
+        ## Level of Detail:
+        self.blk_min    = {}                                # Kurve: Minimum pro Block (skaliert)
+        self.blk_max    = {}                                # Kurve: Maximum pro Block (skaliert)
+        self.stufen     = {}                                # Kurve: Darstellung als Stufen (Grenzwerte)
+        self.wechsel    = {}                                # Kurve: Indizes an denen sich der Wert ändert (nur Stufen-Kurven)
+
+    ##########################################
+    # Kurven-Verwaltung:
+    ##########################################
+    def kurve_hinzufuegen(self, name, faktor = 1, stufen = False):
+        ''' Legt eine Kurve an. Bereits vorhandene Zeitpunkte werden mit NaN gefüllt.
+
+        Args:
+            name (str):         Name der Kurve (z.B. IWT, oGT)
+            faktor (float):     Skalierungsfaktor der Kurve
+            stufen (bool):      Kurve ist meist konstant und wird nur an den Wertwechseln gezeichnet (Grenzwerte)
+        '''
+        self.roh[name]      = np.full(self.kapazitaet, np.nan)
+        self.skaliert[name] = np.full(self.kapazitaet, np.nan)
+        self.faktor[name]   = faktor
+        self.stufen[name]   = stufen
+        self.lod_neu(name)
+
+    def __contains__(self, name):
+        return name in self.roh
+
+    ##########################################
+    # Daten:
+    ##########################################
+    def anhaengen(self, x_wert, *werte_dicts):
+        ''' Hängt einen neuen Zeitpunkt an alle Kurven an. Kurven ohne Wert erhalten NaN.
+
+        Args:
+            x_wert (float):         Zeitpunkt (x-Achse)
+            werte_dicts (dict):     Ein oder mehrere Dictionarys mit Kurve: Wert
+        '''
+        if self.anz == self.kapazitaet:
+            self.platz_schaffen()
+        i = self.anz
+        self.x[i] = x_wert
+        for name in self.roh:
+            wert = np.nan
+            for werte in werte_dicts:
+                if name in werte:
+                    wert = self.zahl(werte[name])
+                    break
+            self.roh[name][i]      = wert
+            self.skaliert[name][i] = wert * self.faktor[name]
+            if self.stufen[name] and i > 0 and not self.gleich(self.skaliert[name][i], self.skaliert[name][i-1]):
+                self.wechsel[name].append(i)
+        self.anz += 1
+        ## Block abgeschlossen:
+        if self.anz % LOD_BLOCK == 0:
+            b = self.anz // LOD_BLOCK - 1
+            for name in self.roh:
+                block = self.skaliert[name][self.anz-LOD_BLOCK:self.anz]
+                self.blk_min[name][b] = np.fmin.reduce(block)
+                self.blk_max[name][b] = np.fmax.reduce(block)
+
+    def zahl(self, wert):
+        ''' Wandelt einen Wert in eine Gleitkommazahl um.
+
+        Args:
+            wert:               Messwert
+        Return:
+            wert als float (NaN, wenn keine Umwandlung möglich ist)
+        '''
+        try:                return float(wert)
+        except Exception:   return np.nan
+
+    def gleich(self, a, b):
+        ''' Vergleich zweier Werte, bei dem auch NaN gleich NaN ist. '''
+        return a == b or (a != a and b != b)
+
+    def platz_schaffen(self):
+        ''' Ringpuffer: Verwirft die ältesten Punkte. Wachsender Puffer: Verdoppelt die Größe der Arrays. '''
+        n = self.anz
+        if self.max_punkte > 0:
+            rest = self.max_punkte
+            self.x[:rest] = self.x[n-rest:n]
+            for name in self.roh:
+                self.roh[name][:rest]      = self.roh[name][n-rest:n]
+                self.skaliert[name][:rest] = self.skaliert[name][n-rest:n]
+            self.anz = rest
+        else:
+            self.kapazitaet = 2 * self.kapazitaet
+            self.x = self.vergroessern(self.x, n)
+            for name in self.roh:
+                self.roh[name]      = self.vergroessern(self.roh[name], n)
+                self.skaliert[name] = self.vergroessern(self.skaliert[name], n)
+        ## Die Block- und Wechsel-Indizes passen nicht mehr:
+        for name in self.roh:
+            self.lod_neu(name)
+
+    def vergroessern(self, array, n):
+        ''' Kopiert die gültigen Punkte in ein neues Array mit der aktuellen Kapazität.
+
+        Args:
+            array (np.ndarray): altes Array
+            n (int):            Anzahl der gültigen Punkte
+        Return:
+            neues Array
+        '''
+        neu = np.full(self.kapazitaet, np.nan)
+        neu[:n] = array[:n]
+        return neu
+
+    ##########################################
+    # Plot-Zugriff:
+    ##########################################
+    def bereich(self):
+        ''' Return: Start und Ende der sichtbaren Punkte (Ringpuffer: die letzten max_punkte) '''
+        if self.max_punkte > 0: return max(0, self.anz - self.max_punkte), self.anz
+        else:                   return 0, self.anz
+
+    def x_werte(self):
+        ''' Return: Ansicht der gemeinsamen Zeitachse '''
+        start, ende = self.bereich()
+        return self.x[start:ende]
+
+    def y_werte(self, name):
+        ''' Return: Ansicht der skalierten Werte einer Kurve '''
+        start, ende = self.bereich()
+        return self.skaliert[name][start:ende]
+
+    def roh_werte(self, name):
+        ''' Return: Ansicht der Rohwerte einer Kurve '''
+        start, ende = self.bereich()
+        return self.roh[name][start:ende]
+
+    ##########################################
+    # Level of Detail:
+    ##########################################
+    def lod_neu(self, name):
+        ''' Berechnet die Min/Max-Blöcke und die Wertwechsel einer Kurve vollständig neu (neue Kurve, Faktor, Puffer verschoben/vergrößert).
+
+        Args:
+            name (str):         Name der Kurve
+        '''
+        anz_blk = self.anz // LOD_BLOCK
+        y       = self.skaliert[name]
+        self.blk_min[name] = np.full(self.kapazitaet // LOD_BLOCK + 1, np.nan)
+        self.blk_max[name] = np.full(self.kapazitaet // LOD_BLOCK + 1, np.nan)
+        if anz_blk > 0:
+            bloecke = y[:anz_blk * LOD_BLOCK].reshape(anz_blk, LOD_BLOCK)
+            self.blk_min[name][:anz_blk] = np.fmin.reduce(bloecke, axis=1)
+            self.blk_max[name][:anz_blk] = np.fmax.reduce(bloecke, axis=1)
+        self.wechsel[name] = []
+        if self.stufen[name] and self.anz > 1:
+            alt, neu = y[:self.anz-1], y[1:self.anz]
+            anders = (alt != neu) & ~(np.isnan(alt) & np.isnan(neu))
+            self.wechsel[name] = list(np.flatnonzero(anders) + 1)
+
+    def lod(self, name, x_min, x_max, pixel):
+        ''' Liefert die Punkte einer Kurve für den sichtbaren Bereich.
+
+        Args:
+            name (str):         Name der Kurve
+            x_min (float):      linke Grenze der Ansicht (-inf: gesamte Kurve)
+            x_max (float):      rechte Grenze der Ansicht (inf: gesamte Kurve)
+            pixel (int):        Breite des Plots in Pixel
+        Return:
+            x, y (np.ndarray):  Punkte für setData
+        '''
+        start, ende = self.bereich()
+        x = self.x[start:ende]
+        ## Sichtbarer Bereich plus je ein Nachbarpunkt (Linie läuft bis zum Rand):
+        i0 = start + max(int(np.searchsorted(x, x_min, 'left')) - 1, 0)
+        i1 = start + min(int(np.searchsorted(x, x_max, 'right')) + 1, len(x))
+        if i1 <= i0:
+            return self.x[0:0], self.skaliert[name][0:0]
+
+        if self.stufen[name]:
+            return self.lod_stufen(name, i0, i1)
+
+        anz    = i1 - i0
+        gruppe = anz // max(pixel, 1)
+        if gruppe < 2:
+            return self.x[i0:i1], self.skaliert[name][i0:i1]
+        if gruppe < LOD_BLOCK:
+            return self.huelle(self.x[i0:i1], self.skaliert[name][i0:i1], gruppe)
+
+        ## Vorberechnete Blöcke, Ränder mit den Einzelpunkten:
+        b0 = -(-i0 // LOD_BLOCK)                    # erster vollständiger Block
+        b1 = i1 // LOD_BLOCK                        # Ende der vollständigen Blöcke
+        gruppe_blk = max(gruppe // LOD_BLOCK, 1)
+        idx  = np.arange(b0, b1, gruppe_blk)
+        mins = np.fmin.reduceat(self.blk_min[name][b0:b1], idx - b0)
+        maxs = np.fmax.reduceat(self.blk_max[name][b0:b1], idx - b0)
+        xs   = self.x[idx * LOD_BLOCK]
+        a0, a1 = b0 * LOD_BLOCK, b1 * LOD_BLOCK
+        x_out = np.concatenate((self.x[i0:a0], np.repeat(xs, 2), self.x[a1:i1]))
+        y_out = np.concatenate((self.skaliert[name][i0:a0], np.column_stack((mins, maxs)).ravel(), self.skaliert[name][a1:i1]))
+        return x_out, y_out
+
+    def huelle(self, x, y, gruppe):
+        ''' Min/Max-Hülle über Gruppen von Einzelpunkten (zwei Punkte pro Gruppe).
+
+        Args:
+            x, y (np.ndarray):  Punkte im sichtbaren Bereich
+            gruppe (int):       Punkte pro Gruppe
+        Return:
+            x, y (np.ndarray):  reduzierte Punkte
+        '''
+        idx  = np.arange(0, len(x), gruppe)
+        mins = np.fmin.reduceat(y, idx)
+        maxs = np.fmax.reduceat(y, idx)
+        return np.repeat(x[idx], 2), np.column_stack((mins, maxs)).ravel()
+
+    def lod_stufen(self, name, i0, i1):
+        ''' Stufen-Darstellung: Nur der erste und letzte Punkt sowie die Punkte vor und nach einem Wertwechsel.
+
+        Args:
+            name (str):         Name der Kurve
+            i0, i1 (int):       Indizes des sichtbaren Bereichs
+        Return:
+            x, y (np.ndarray):  reduzierte Punkte
+        '''
+        wechsel = np.asarray(self.wechsel[name], dtype=int)
+        wechsel = wechsel[(wechsel > i0) & (wechsel < i1)]
+        idx = np.unique(np.concatenate(([i0], wechsel - 1, wechsel, [i1 - 1])))
+        return self.x[idx], self.skaliert[name][idx]
+
+##########################################
+# Verworfen:
+##########################################
+## Bereich für alten Code, denn man noch nicht vollkommen löschen will,
+## da dieser später vieleicht wieder ergänzt wird!!
+'''
+
+
+'''
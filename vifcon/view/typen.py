@@ -95,7 +95,7 @@ class PopUpWindow:
 
 class Generator(QWidget, Cursor, PopUpWindow):
     ''' Splitter-GUI für Generator mit Knöpfen und Plot in der ersten Zeile. '''
-    def __init__(self, start_zeit, tab_splitter_widget, add_Ablauf_function, stopp_all_function, menu_dict, legend_ops, Faktoren, sprache, color_On, parent=None):
+    def __init__(self, start_zeit, tab_splitter_widget, add_Ablauf_function, stopp_all_function, menu_dict, legend_ops, Faktoren, sprache, color_On, plot_punkte = 0, parent=None):
         """Generator Widget für Generator und Controller Geräte.
 
         Args:
@@ -108,6 +108,7 @@ class Generator(QWidget, Cursor, PopUpWindow):
             Faktoren (dict):                    Skalierungsfaktoren für den Plot
             sprache (int):                      Sprache der GUI (Listenplatz)
             color_On (bool):                    Einstellung ob die Widget-Werte in Farbe oder Schwarz sind
+            plot_punkte (int):                  Maximale Anzahl an Punkten pro Kurve im Plot (0 - gesamte Messung)
         """
         super().__init__()
 
@@ -122,6 +123,7 @@ class Generator(QWidget, Cursor, PopUpWindow):
         self.Faktor                     = Faktoren
         self.sprache                    = sprache
         self.color_On                   = color_On
+        self.plot_max_punkte            = plot_punkte
 
         #--------------------------------------- 
         # Sprach-Einstellung:
@@ -147,43 +149,11 @@ class Generator(QWidget, Cursor, PopUpWindow):
         self.Log_Text_185_str_2 = ['auf Null gesetzt, keine Anzeige im Plot.',                                                                              'set to zero, not displayed in plot.']
 
         #---------------------------------------------------------
-        # Konfigurationskontrolle und Konfigurationsvariablen:
+        # Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
-        '''
-        #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ## Einstellung für Log:
-        #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                                                      'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                                                         'Possible values:']
-        self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                                                               'The following types are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                                                              'Default is used:']
-        self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                                    'Error reading config during configuration:']
-        self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                                                                                  '; Set to default:']
-        self.Log_Pfad_conf_6    = ['Fehlergrund:',                                                                                                          'Reason for error:']
-        self.Log_Pfad_conf_7    = ['Bitte vor Nutzung Korrigieren und Config Neu Einlesen!',                                                                'Please correct and re-read config before use!']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                                                                  'Incorrect input:']
-        
-        ### Legenden Position:
-        try: self.legend_pos         = self.legend_ops['legend_pos'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} legend|generator|legend_pos ({Typ[self.sprache]}) {self.Log_Pfad_conf_5[self.sprache]} SIDE')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            self.legend_pos = 'SIDE'
-        if not self.legend_pos in ['IN', 'OUT', 'SIDE']:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} legend_pos ({Typ[self.sprache]}) - {self.Log_Pfad_conf_2[self.sprache]} [IN, OUT, SIDE] - {self.Log_Pfad_conf_3[self.sprache]} SIDE - {self.Log_Pfad_conf_8[self.sprache]} {self.legend_pos}')
-            self.legend_pos = 'SIDE'
-        ### Legenden Seite:
-        try: self.Side_Legend_position = self.legend_ops['side'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} legend|generator|side ({Typ[self.sprache]}) {self.Log_Pfad_conf_5[self.sprache]} RL')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            self.Side_Legend_position = 'RL'
-        if not self.Side_Legend_position in ['L', 'R', 'RL']:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} side ({Typ[self.sprache]}) - {self.Log_Pfad_conf_2[self.sprache]} [L, R, RL] - {self.Log_Pfad_conf_3[self.sprache]} RL - {self.Log_Pfad_conf_8[self.sprache]} {self.Side_Legend_position}')
-            self.Side_Legend_position = 'RL'
+        ## Legende (geprüft vom Controller, siehe config_schema.py):
+        self.legend_pos             = self.legend_ops['legend_pos']
+        self.Side_Legend_position   = self.legend_ops['side']
 
         #---------------------------------------
         # Horizontaller Splitter:
@@ -305,7 +275,7 @@ class Generator(QWidget, Cursor, PopUpWindow):
     
 class Antrieb(QWidget, Cursor, PopUpWindow):
     ''' Splitter-GUI für Antriebe mit Knöpfen und Plot in der ersten Zeile. '''
-    def __init__(self, start_zeit, tab_splitter_widget, add_Ablauf_function, stopp_all_function, synchro_function, menu_dict, legend_ops, Faktoren, sprache, color_On, parent=None):
+    def __init__(self, start_zeit, tab_splitter_widget, add_Ablauf_function, stopp_all_function, synchro_function, menu_dict, legend_ops, Faktoren, sprache, color_On, plot_punkte = 0, parent=None):
         """ Generator Widget für Generator und Controller Geräte.
 
         Args:
@@ -319,6 +289,7 @@ class Antrieb(QWidget, Cursor, PopUpWindow):
             Faktoren (dict):                    Skalierungsfaktoren für den Plot
             sprache (int):                      Sprache der GUI (Listenplatz)
             color_On (bool):                    Einstellung ob die Widget-Werte in Farbe oder Schwarz sind
+            plot_punkte (int):                  Maximale Anzahl an Punkten pro Kurve im Plot (0 - gesamte Messung)
         """
         super().__init__()
 
@@ -334,6 +305,7 @@ class Antrieb(QWidget, Cursor, PopUpWindow):
         self.Faktor                     = Faktoren
         self.sprache                    = sprache
         self.color_On                   = color_On
+        self.plot_max_punkte            = plot_punkte
 
         #--------------------------------------- 
         # Sprach-Einstellung:                                                               
@@ -360,43 +332,11 @@ class Antrieb(QWidget, Cursor, PopUpWindow):
         self.Log_Text_185_str_2 = ['auf Null gesetzt, keine Anzeige im Plot.',                                                                              'set to zero, not displayed in plot.']
 
         #---------------------------------------------------------
-        # Konfigurationskontrolle und Konfigurationsvariablen:
+        # Konfigurationsvariablen:
         #---------------------------------------------------------
-        ''' Die Kontrolle beinhaltet folgendes:
-        1. Kontrolle des Schlüssels mit Default-Vergabe!
-        2. Kontrolle der Variable wegen dem Inhalt mit Default-Vergabe!
-        '''
-        #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        ## Einstellung für Log:
-        #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-        self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                                                      'Configuration error in element:']
-        self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                                                         'Possible values:']
-        self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                                                               'The following types are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                                                              'Default is used:']
-        self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                                    'Error reading config during configuration:']
-        self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                                                                                  '; Set to default:']
-        self.Log_Pfad_conf_6    = ['Fehlergrund:',                                                                                                          'Reason for error:']
-        self.Log_Pfad_conf_7    = ['Bitte vor Nutzung Korrigieren und Config Neu Einlesen!',                                                                'Please correct and re-read config before use!']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                                                                  'Incorrect input:']
-        
-        ### Legenden Position:
-        try: self.legend_pos         = self.legend_ops['legend_pos'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} legend|antrieb|legend_pos ({Typ[self.sprache]}) {self.Log_Pfad_conf_5[self.sprache]} SIDE')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            self.legend_pos = 'SIDE'
-        if not self.legend_pos in ['IN', 'OUT', 'SIDE']:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} legend_pos ({Typ[self.sprache]}) - {self.Log_Pfad_conf_2[self.sprache]} [IN, OUT, SIDE] - {self.Log_Pfad_conf_3[self.sprache]} SIDE - {self.Log_Pfad_conf_8[self.sprache]} {self.legend_pos}')
-            self.legend_pos = 'SIDE'
-        ### Legenden Seite:
-        try: self.Side_Legend_position = self.legend_ops['side'].upper()
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} legend|antrieb|side ({Typ[self.sprache]}) {self.Log_Pfad_conf_5[self.sprache]} RL')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            self.Side_Legend_position = 'RL'
-        if not self.Side_Legend_position in ['L', 'R', 'RL']:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} side ({Typ[self.sprache]}) - {self.Log_Pfad_conf_2[self.sprache]} [L, R, RL] - {self.Log_Pfad_conf_3[self.sprache]} RL - {self.Log_Pfad_conf_8[self.sprache]} {self.Side_Legend_position}')
-            self.Side_Legend_position = 'RL'
+        ## Legende (geprüft vom Controller, siehe config_schema.py):
+        self.legend_pos             = self.legend_ops['legend_pos']
+        self.Side_Legend_position   = self.legend_ops['side']
 
         #---------------------------------------
         # Horizontaller Splitter:
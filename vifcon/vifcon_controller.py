@@ -29,20 +29,27 @@ from PyQt5.QtCore import (
     pyqtSignal,
     QMutex, 
     QMutexLocker,
+    QFileSystemWatcher,
 
 )
-import matplotlib
-import randomcolor            
 
 ## Algemein:
 import logging
-import yaml
 import sys
 import os
+import glob
 import datetime
 import time
 import random
 import shutil
+import threading
+
+## Eigene:
+from .config_cache import lade_yaml, CACHE
+from .start_profil import Start_Profil
+from .config_schema import config_pruefen
+from .beenden import Beenden_Koordinator
+from .log_drossel import Log_Drossel, Log_Queue, drossel_anhaengen
 
 # ++++++++++++++++++++++++++++
 # Programm:
@@ -62,7 +69,9 @@ class SignalMetaclass(type(QObject)):
 
     def __new__(cls, name, bases, dct):
         """ Create new class including a pyqtSignal."""
-        dct["signal"] = pyqtSignal(dict, list, str)
+        dct["signal"] = pyqtSignal(dict, float, str)            # Sampler -> GUI (Messwerte, Zeitpunkt, Name)
+        dct["signal_start"] = pyqtSignal(bool, bool, float)     # Scheduler -> Sampler (Lesen, Schreiben, geplante Zeit)
+        dct["signal_fertig"] = pyqtSignal(str, float, float)    # Sampler -> Scheduler (Name, Jitter, Dauer)
         return super().__new__(cls, name, bases, dct)
 
 
@@ -105,14 +114,18 @@ class Sampler(QObject, metaclass=SignalMetaclass):
         ## Verriegelung:
         self.mutex = mutex
 
-        ## Werte Listen:
-        self.xList = []
-
         ## Andere Variablen:
         self.port_error_anz = 5
         self.count_error = 0
         self.exit = False
         self.serial_connect_bruch = False
+        self.end_done = True
+
+        ## Fertig-Meldung für das Beenden (gesetzt, wenn kein Auftrag mehr offen ist):
+        self.fertig_event = threading.Event()
+        self.fertig_event.set()
+        self.auftrag_lock = threading.Lock()
+        self.offene_auftraege = 0
 
         #---------------------------------------
         # Sprache:
@@ -126,152 +139,182 @@ class Sampler(QObject, metaclass=SignalMetaclass):
         self.Log_Text_6_str = ['Der Port ist geschlossen! Code-Ausführung gesperrt!',               'The port is closed! Code execution blocked!']
         self.Log_Text_7_str = ['Anzeige der Port-Fehler-Warnung nur',                               'Port error warning only displayed']
         self.Log_Text_8_str = ['mal! Anzeige erst nach Fehlerfreien Port-Zugang!',                  'times! Display only after error-free port access!']
+        self.Log_Text_9_str = ['Fehler in der Sampler-Funktion! Fehlergrund:',                      'Error in the sampler function! Reason for error:']
         self.Log_Text_1_PID = ['PID-Modus gilt als gesperrt! PID-Parameter nicht richtig!',         'PID mode is locked! PID parameters not correct!']
         self.Log_Text_Neu_1 = ['Nemo-Anlage-',                                                      'Nemo-facility-']
         self.Log_Text_Neu_2 = ['Port wieder Öffnen!',                                               'Open port again!']
 
-    def sample(self):
+    def sample(self, lesen, schreiben, soll_zeit):
         ''' Löse Lese und Schreib Funktionen am Gerät aus.
-        1. Sende Werte an die Geräte (write).
+        1. Sende Werte an die Geräte (write), wenn ein Auftrag offen ist oder der Scheduler es anfordert.
         2. Lese Werte von den Geräten (read) zu bestimmten Zeitabständen. 
+
+        Args:
+            lesen (bool):       Scheduler hat die Messzeit erreicht - Gerät auslesen
+            schreiben (bool):   Scheduler fordert das Schreiben an (PID-Takt, Grenz-Überwachung, Beenden)
+            soll_zeit (float):  Geplante Zeit der Lesung (time.perf_counter) für die Jitter-Bestimmung
         '''
         self.end_done = False
-        logging.debug(f"{self.device_name} - {self.Log_Text_2_str[self.sprache]}")
-
-        #---------------------------------------------------------------
-        # Mehrfach Nutzung einer Schnittstelle blocken - Mutex-Locker:
-        #---------------------------------------------------------------
-        with QMutexLocker(self.mutex):
-            logging.debug(f"{self.device_name} - {self.Log_Text_3_str[self.sprache]} {self.mutex} {self.Log_Text_4_str[self.sprache]}")
-            #---------------------------------------
-            # aktuelle Zeit zum Startzeitpunkt:
-            #---------------------------------------
-            ak_time = datetime.datetime.now(datetime.timezone.utc).astimezone()     # Aktuelle Zeit Absolut
-            time_rel = round((ak_time - self.startTime).total_seconds(), 3)         # Aktuelle Zeit Relativ
-
-            #---------------------------------------
-            # Port Kontrolle:
-            #---------------------------------------
-            ## Überprüfe Port:
-            if not self.test and self.device.init:  port = self.device.serial.is_open
-            else:                                   port = True
-
-            ## Bei Port = False und detektiertem Abbruch -> Teste Verbindung und öffne Port wieder:
-            if 'Nemo' in self.device_name and not port and self.serial_connect_bruch and self.device.init:
-                check3 = self.device.Test_Connection()
-                if check3: 
-                    logger.info(f'{self.Log_Text_Neu_1[self.sprache]}{self.device_widget.Anlage} - {self.device_name} - {self.Log_Text_Neu_2[self.sprache]}')
-                    self.device_widget.add_Text_To_Ablauf_Datei(f'{self.Log_Text_Neu_1[self.sprache]}{self.device_widget.Anlage} - {self.device_name} - {self.Log_Text_Neu_2[self.sprache]}')
-                self.serial_connect_bruch = False
-
-            ## Kontrolliere Port bei Exit (Bei Erfolgreichen Test, Port als offen ansehen!!):
-            if 'Nemo' in self.device_name and not port and self.exit and self.device.init:
-                check1 = self.device.Test_Connection()
-                check2 = self.device.serial.is_open
-                if check1 and check2:   port = True
-                else:                   port = False
-
-            # Ist der Port des Gerätes erreichbar bzw. Offen so kann die Kommunikation stattfinden!
-            if port:
-                self.count_error = 0
-                #---------------------------------------
-                # Initialisierung übergeben:
-                #---------------------------------------
-                if self.device_widget.write_task['Init']:
-                    ## Betriebsmodus:
-                    if not self.test:        self.device.init_device()
-                    ## Test-Modus:
-                    else:               
-                        if self.device.init: self.device.init = False
-                        else:                self.device.init = True
-                    ## GUI Anpassung:
-                    self.device_widget.init_controll(self.device.init, self.btn_Init)
-                    self.device_widget.write_task['Init'] = False 
+        start = time.perf_counter()
+        jitter = -1
+        logging.debug("%s - %s", self.device_name, self.Log_Text_2_str[self.sprache])
 
+        try:
+            #---------------------------------------------------------------
+            # Mehrfach Nutzung einer Schnittstelle blocken - Mutex-Locker:
+            #---------------------------------------------------------------
+            with QMutexLocker(self.mutex):
+                logging.debug("%s - %s %s %s", self.device_name, self.Log_Text_3_str[self.sprache], self.mutex, self.Log_Text_4_str[self.sprache])
                 #---------------------------------------
-                # Schreibe Werte:
-                #---------------------------------------
-                if not 'Nemo-Gase' in self.device_name and not 'Educrys-Monitoring' in self.device_name:
-                    if self.device.PID.PID_speere and self.device_widget.write_task['PID']:
-                        self.device_widget.PID_cb.setChecked(False)
-                        self.device_widget.PID_ON_OFF()
-                        if 'Achse' in self.device_name:  self.device_widget.Fehler_Output(1, self.device_widget.La_error_1, self.Log_Text_1_PID[self.sprache])
-                        else:                            self.device_widget.Fehler_Output(1, self.Log_Text_1_PID[self.sprache])
-                #if self.device_widget.send_betätigt:                                               # Ruft nun immer die write Funktion auf!
-                if not self.test and not 'Nemo-Gase' in self.device_name and not 'Educrys-Monitoring' in self.device_name:
-                    self.device.write(self.device_widget.write_task, self.device_widget.write_value)    
-                #    self.device_widget.send_betätigt = False
-                
-                #---------------------------------------
-                # Kontrolle/ Geräte spezielle Aufagben:
+                # aktuelle Zeit zum Startzeitpunkt:
                 #---------------------------------------
-                if 'PI-Achse' in self.device_name and self.device.init:
-                    # Wenn das Gerät initialisiert wurde, soll die aktuelle Position immer an die GUI gesendet werden:
-                    self.device_widget.akPos = self.device.akPos
-                    # Wenn Modus 2 ausgewählt, werden die Knöpfe der GUI bei der Achse bei 0 mm/s entriegelt!
-                    if self.device_widget.mode == 2 and self.device_widget.losgefahren:
-                        self.device_widget.check_verriegelung(self.device.read_TX('TV', 'V:'))
-                if 'Eurotherm' in self.device_name and self.device.Safety == True:
-                    # So bald sich im Gerät der HO ändert und die Leistung ausgewählt wurde oder der Menü-Knopf gedrückt wird, wird auch im Widget die Leistung geändert!
-                    self.device_widget.oGOp = self.device.oGOp
-                    TT_Pow = f'{self.device_widget.TTLimit[self.device_widget.sprache]}{self.device_widget.TTSize_OP[self.device_widget.sprache]} {self.device_widget.uGOp} ... {self.device_widget.oGOp} {self.device_widget.P_unit_einzel[self.device_widget.sprache]}'
-                    self.device_widget.LE_Pow.setToolTip(TT_Pow)
-                if ('Nemo-Achse' in self.device_name or 'PI-Achse' in self.device_name or 'Educrys-Achse' in self.device_name) and self.device.Limit_stop:
-                    self.device_widget.BTN_Back(self.device.Limit_Stop_Text)
-                    self.device.Limit_stop      = False
-                    self.device.Limit_Stop_Text = -1
-                elif ('Nemo-Achse' in self.device_name or 'Educrys-Achse' in self.device_name) and self.device.Limit_Stop_Text == 5:
-                    self.device_widget.BTN_Back(self.device.Limit_Stop_Text)
-                    self.device.Limit_Stop_Text = -1
-                if ('TruHeat' in self.device_name or 'Eurotherm' in self.device_name or 'Nemo-Generator' in self.device_name) and self.device_widget.start_later:
-                    self.device_widget.signal_Pop_up.emit()
+                ak_time = datetime.datetime.now(datetime.timezone.utc).astimezone()     # Aktuelle Zeit Absolut
+                time_rel = round((ak_time - self.startTime).total_seconds(), 3)         # Aktuelle Zeit Relativ
 
                 #---------------------------------------
-                # Lese Werte:
+                # Port Kontrolle:
                 #---------------------------------------
-                ## Bestimme Zeitdifferenz für das Auslesen:
-                timediff = (
-                    datetime.datetime.now(datetime.timezone.utc).astimezone() - self.time
-                ).total_seconds()                                                       
-
-                ## Lese, wenn die Messzeit überschritten wurde oder identisch ist:
-                if timediff >= self.messTime and self.messTime != 0 and self.device_widget.init:
-                    self.time = datetime.datetime.now(datetime.timezone.utc).astimezone()
-                    self.xList.append(time_rel)
-                    if not self.test:
-                        sample_values = self.device.read()
-                        self.device.update_output(sample_values, ak_time, time_rel)
-                    else:
-                        sample_values = self.device.value_name
-                        for key in sample_values:
-                            sample_values[key] = round(random.uniform(0, 10), 3)
-                            if 'Status' in key:
-                                if not 'Nemo-Achse-Linear' in self.device_name:  
-                                    sample_values[key] =  128           # Bit 15 gesetzt - 0 bis 15 - Test-Modus
-                                else:
-                                    if self.device.Anlage == 2:         # Nemo-2 hat zwei Status-Listen (Bit 15 ist bei Liste 1 besetzt!!)
-                                        if key == 'Status_2':     sample_values[key] = 128
-                                        elif key == 'Status':     sample_values[key] = 0
-                                        if key == 'StatusEil_2':  sample_values[key] = 128
-                                        elif key == 'StatusEil':  sample_values[key] = 0
-                                    else:                               # Nemo-1 hat nur eine Liste und brauch Status_2 nicht!
-                                        if key == 'Status':       sample_values[key] = 128
-                                        elif key == 'Status_2':   sample_values[key] = 0
-
-                    self.device_widget.ak_value = sample_values
-                    self.signal.emit(sample_values, self.xList, self.device_name)
-            else:
-                ## Fehlschlag - Port geschlossen:
-                if self.count_error == 0:   
-                    self.device_widget.add_Text_To_Ablauf_Datei(f"{self.device_name} - {self.Log_Text_6_str[self.sprache]} ")
-                if self.count_error < self.port_error_anz:
-                    logging.warning(f"{self.device_name} - {self.Log_Text_6_str[self.sprache]} ")
-                    self.count_error += 1
-                    if self.count_error == self.port_error_anz:
-                        logging.warning(f"{self.Log_Text_7_str[self.sprache]} {self.port_error_anz} {self.Log_Text_8_str[self.sprache]}")
-                self.serial_connect_bruch = True
-        logging.debug(f"{self.device_name} - {self.Log_Text_5_str[self.sprache]}")
-        self.end_done = True
+                ## Überprüfe Port:
+                if not self.test and self.device.init:  port = self.device.serial.is_open
+                else:                                   port = True
+
+                ## Bei Port = False und detektiertem Abbruch -> Teste Verbindung und öffne Port wieder:
+                ## (Nemo: Der Neuaufbau läuft im Verbindungs-Pool im Hintergrund, der Test wartet nicht und die Meldungen kommen vom Pool)
+                if 'Nemo' in self.device_name and not port and self.serial_connect_bruch and self.device.init:
+                    check3 = self.device.Test_Connection(False)
+                    if check3: 
+                        logger.info(f'{self.Log_Text_Neu_1[self.sprache]}{self.device_widget.Anlage} - {self.device_name} - {self.Log_Text_Neu_2[self.sprache]}')
+                        self.device_widget.add_Text_To_Ablauf_Datei(f'{self.Log_Text_Neu_1[self.sprache]}{self.device_widget.Anlage} - {self.device_name} - {self.Log_Text_Neu_2[self.sprache]}')
+                    self.serial_connect_bruch = False
+
+                ## Kontrolliere Port bei Exit (Bei Erfolgreichen Test, Port als offen ansehen!!):
+                if 'Nemo' in self.device_name and not port and self.exit and self.device.init:
+                    check1 = self.device.Test_Connection()
+                    check2 = self.device.serial.is_open
+                    if check1 and check2:   port = True
+                    else:                   port = False
+
+                # Ist der Port des Gerätes erreichbar bzw. Offen so kann die Kommunikation stattfinden!
+                if port:
+                    self.count_error = 0
+                    ## Verbindung wurde im Hintergrund wieder aufgebaut (Nemo, Verbindungs-Pool):
+                    if 'Nemo' in self.device_name and self.serial_connect_bruch:
+                        logger.info(f'{self.Log_Text_Neu_1[self.sprache]}{self.device_widget.Anlage} - {self.device_name} - {self.Log_Text_Neu_2[self.sprache]}')
+                        self.device_widget.add_Text_To_Ablauf_Datei(f'{self.Log_Text_Neu_1[self.sprache]}{self.device_widget.Anlage} - {self.device_name} - {self.Log_Text_Neu_2[self.sprache]}')
+                        self.serial_connect_bruch = False
+                    #---------------------------------------
+                    # Initialisierung übergeben:
+                    #---------------------------------------
+                    if self.device_widget.write_task['Init']:
+                        ## Betriebsmodus:
+                        if not self.test:        self.device.init_device()
+                        ## Test-Modus:
+                        else:               
+                            if self.device.init: self.device.init = False
+                            else:                self.device.init = True
+                        ## GUI Anpassung:
+                        self.device_widget.init_controll(self.device.init, self.btn_Init)
+                        self.device_widget.write_task['Init'] = False 
+
+                    #---------------------------------------
+                    # Schreibe Werte:
+                    #---------------------------------------
+                    if not 'Nemo-Gase' in self.device_name and not 'Educrys-Monitoring' in self.device_name:
+                        if self.device.PID.PID_speere and self.device_widget.write_task['PID']:
+                            self.device_widget.PID_cb.setChecked(False)
+                            self.device_widget.PID_ON_OFF()
+                            if 'Achse' in self.device_name:  self.device_widget.Fehler_Output(1, self.device_widget.La_error_1, self.Log_Text_1_PID[self.sprache])
+                            else:                            self.device_widget.Fehler_Output(1, self.Log_Text_1_PID[self.sprache])
+                    #if self.device_widget.send_betätigt:                                               # Ruft nun immer die write Funktion auf!
+                    ## Befehls-Liste ruft die write-Funktion nur bei offenen Aufträgen oder auf Anforderung des Schedulers auf:
+                    if not self.test and not 'Nemo-Gase' in self.device_name and not 'Educrys-Monitoring' in self.device_name:
+                        self.device_widget.write_task.ausfuehren(self.device.write, self.device_widget.write_value, schreiben)
+                    #    self.device_widget.send_betätigt = False
+                
+                    #---------------------------------------
+                    # Kontrolle/ Geräte spezielle Aufagben:
+                    #---------------------------------------
+                    if 'PI-Achse' in self.device_name and self.device.init:
+                        # Wenn das Gerät initialisiert wurde, soll die aktuelle Position immer an die GUI gesendet werden:
+                        self.device_widget.akPos = self.device.akPos
+                        # Wenn Modus 2 ausgewählt, werden die Knöpfe der GUI bei der Achse bei 0 mm/s entriegelt!
+                        if self.device_widget.mode == 2 and self.device_widget.losgefahren:
+                            self.device_widget.check_verriegelung(self.device.read_TX('TV', 'V:'))
+                    if 'Eurotherm' in self.device_name and self.device.Safety == True:
+                        # So bald sich im Gerät der HO ändert und die Leistung ausgewählt wurde oder der Menü-Knopf gedrückt wird, wird auch im Widget die Leistung geändert!
+                        self.device_widget.oGOp = self.device.oGOp
+                        TT_Pow = f'{self.device_widget.TTLimit[self.device_widget.sprache]}{self.device_widget.TTSize_OP[self.device_widget.sprache]} {self.device_widget.uGOp} ... {self.device_widget.oGOp} {self.device_widget.P_unit_einzel[self.device_widget.sprache]}'
+                        self.device_widget.LE_Pow.setToolTip(TT_Pow)
+                    if ('Nemo-Achse' in self.device_name or 'PI-Achse' in self.device_name or 'Educrys-Achse' in self.device_name) and self.device.Limit_stop:
+                        self.device_widget.BTN_Back(self.device.Limit_Stop_Text)
+                        self.device.Limit_stop      = False
+                        self.device.Limit_Stop_Text = -1
+                    elif ('Nemo-Achse' in self.device_name or 'Educrys-Achse' in self.device_name) and self.device.Limit_Stop_Text == 5:
+                        self.device_widget.BTN_Back(self.device.Limit_Stop_Text)
+                        self.device.Limit_Stop_Text = -1
+                    if ('TruHeat' in self.device_name or 'Eurotherm' in self.device_name or 'Nemo-Generator' in self.device_name) and self.device_widget.start_later:
+                        self.device_widget.signal_Pop_up.emit()
+
+                    #---------------------------------------
+                    # Lese Werte:
+                    #---------------------------------------
+                    ## Lese, wenn der Scheduler die Messzeit als erreicht meldet:
+                    if lesen and self.messTime != 0 and self.device_widget.init:
+                        self.time = datetime.datetime.now(datetime.timezone.utc).astimezone()
+                        jitter = time.perf_counter() - soll_zeit
+                        if not self.test:
+                            sample_values = self.device.read()
+                            self.device.update_output(sample_values, ak_time, time_rel)
+                        else:
+                            sample_values = self.device.value_name
+                            for key in sample_values:
+                                sample_values[key] = round(random.uniform(0, 10), 3)
+                                if 'Status' in key:
+                                    if not 'Nemo-Achse-Linear' in self.device_name:  
+                                        sample_values[key] =  128           # Bit 15 gesetzt - 0 bis 15 - Test-Modus
+                                    else:
+                                        if self.device.Anlage == 2:         # Nemo-2 hat zwei Status-Listen (Bit 15 ist bei Liste 1 besetzt!!)
+                                            if key == 'Status_2':     sample_values[key] = 128
+                                            elif key == 'Status':     sample_values[key] = 0
+                                            if key == 'StatusEil_2':  sample_values[key] = 128
+                                            elif key == 'StatusEil':  sample_values[key] = 0
+                                        else:                               # Nemo-1 hat nur eine Liste und brauch Status_2 nicht!
+                                            if key == 'Status':       sample_values[key] = 128
+                                            elif key == 'Status_2':   sample_values[key] = 0
+
+                        self.device_widget.ak_value = sample_values
+                        self.signal.emit(sample_values, float(time_rel), self.device_name)
+                else:
+                    ## Fehlschlag - Port geschlossen:
+                    if self.count_error == 0:   
+                        self.device_widget.add_Text_To_Ablauf_Datei(f"{self.device_name} - {self.Log_Text_6_str[self.sprache]} ")
+                    if self.count_error < self.port_error_anz:
+                        logging.warning(f"{self.device_name} - {self.Log_Text_6_str[self.sprache]} ")
+                        self.count_error += 1
+                        if self.count_error == self.port_error_anz:
+                            logging.warning(f"{self.Log_Text_7_str[self.sprache]} {self.port_error_anz} {self.Log_Text_8_str[self.sprache]}")
+                    self.serial_connect_bruch = True
+        except Exception as e:
+            logger.exception(f"{self.device_name} - {self.Log_Text_9_str[self.sprache]}")
+        finally:
+            ## Sampler immer freigeben (Scheduler) und den Auftrag als erledigt melden (Beenden):
+            logging.debug("%s - %s", self.device_name, self.Log_Text_5_str[self.sprache])
+            self.signal_fertig.emit(self.device_name, jitter, time.perf_counter() - start)
+            self.end_done = True
+            self.erledigt()
+
+    def auftrag(self):
+        ''' Meldet einen neuen Auftrag an (GUI-Thread, vor dem Start-Signal). Auch ein Auftrag, der noch nicht gestartet ist, gilt somit als offen. '''
+        with self.auftrag_lock:
+            self.offene_auftraege += 1
+            self.fertig_event.clear()
+
+    def erledigt(self):
+        ''' Meldet das Ende eines Auftrags (Sampler-Thread). '''
+        with self.auftrag_lock:
+            self.offene_auftraege = max(0, self.offene_auftraege - 1)
+            if self.offene_auftraege == 0:
+                self.fertig_event.set()
 
 
 class MyFilter(object):
@@ -307,20 +350,23 @@ class Controller(QObject):
     # Controller der die Kommunikationn zwischen GUI und Gerät ermöglicht
 
     # Signale:
-    signal_sample_main  = pyqtSignal()
     signal_Multilog     = pyqtSignal()
     signal_gamepad      = pyqtSignal()
 
-    def __init__(self, config, output_dir, test_mode, neustart) -> None:
+    def __init__(self, config, output_dir, test_mode, neustart, start = None) -> None:
         """Initialize and run vifcon.
 
         Args:
             config (str):       File Pfad vom Configurations File.
             output_dir (str):   Verzeichnis, wo die Outputs hingelegt werden sollen.
             test_mode (bool):   Test Mode Aktiv.
+            start (float):      Startzeitpunkt von vifcon_main.py (time.perf_counter) für das Start-Profil.
         """
         super().__init__()
 
+        ## Messung des Programmstarts:
+        self.start_profil   = Start_Profil(start)
+
         self.test_mode      = test_mode
         self.config_pfad    = config
         self.neustart       = neustart
@@ -330,8 +376,7 @@ class Controller(QObject):
         #--------------------------------------------------------------------------
         ## Yaml:
         try:
-            with open(config, encoding="utf-8") as f:
-                self.config = yaml.safe_load(f)
+            self.config = lade_yaml(config)
         except Exception as e:
             logger.warning('There is a problem with the config file (YAML). The program will be closed!\n')
             logger.warning('Error:')
@@ -341,22 +386,14 @@ class Controller(QObject):
         #---------------------------------------------------------------------------
         # Sprachvariablen:
         #--------------------------------------------------------------------------
+        ## Config-Prüfung (Schema, ein Durchlauf - Meldungen werden nach dem Aufbau des Loggings geschrieben):
+        self.config_pruefung = config_pruefen(self.config)
         ## Konfiguriere Sprache:
-        try:
-            if self.config['GUI']['language'].upper() == 'DE':
-                logger.info('Sprache der GUI ist Deutsch!')
-                self.sprache = 0
-            elif self.config['GUI']['language'].upper() == 'EN':
-                logger.info('The language of the GUI is English!')
-                self.sprache = 1
-            else:
-                logger.warning('The language is not defined. Only German and English are defined in this program. Set language to English!')
-                #print('Warning: The language is not defined. Only German and English are defined in this program. Set language to English!')
-                self.sprache = 1
-        except Exception as e:
-            logger.warning('The language is not defined. Only German and English are defined in this program. Set language to English!')
-            #print('Warning: The language is not defined. Only German and English are defined in this program. Set language to English!')
-            logger.exception('Error reason:')
+        if self.config_pruefung.wert('GUI', 'language') == 'DE':
+            logger.info('Sprache der GUI ist Deutsch!')
+            self.sprache = 0
+        else:
+            logger.info('The language of the GUI is English!')
             self.sprache = 1
         
         ## Variablen: ##################################################################################################################################################################################################################################################################################
@@ -374,8 +411,6 @@ class Controller(QObject):
         self.Log_Text_12_str    = ["Bereite Threads vor",                                                                                                                                   "Prepare threads"]
         self.Log_Text_13_str    = ['in Thread',                                                                                                                                             'in thread']
         self.Log_Text_14_str    = ['Start des Sampling-Timers',                                                                                                                             'Start of the sampling timer']
-        self.Log_Text_15_str    = ['Update GUI von',                                                                                                                                        'Update GUI from']
-        self.Log_Text_16_str    = ['Fehler beim Updaten der GUI im Gerät',                                                                                                                  'Error updating the GUI in the device']
         self.Log_Text_17_str    = ["Aufruf der Threads!",                                                                                                                                   "Calling the Threads!"]
         self.Log_Text_18_str    = ['Beende Thread',                                                                                                                                         'Quitting thread']
         self.Log_Text_19_str    = ['Schließe Port am Gerät',                                                                                                                                'Close port on device']
@@ -410,6 +445,8 @@ class Controller(QObject):
         self.Log_Device_4       = ['gehört nicht zum Geräte-Typ Monitoring!',                                                                                                               'does not belong to the monitoring device type!']
         self.Log_Yaml_Error     = ['Mit der Config-Datei (Yaml) gibt es ein Problem.',                                                                                                      'There is a problem with the config file (YAML).']
         self.Log_Yaml_Reason    = ['Fehlergrund:',                                                                                                                                          'Reason for the error']
+        self.Log_Yaml_Reload    = ['Datei geändert - Neu in den Config-Cache geladen:',                                                                                                     'File changed - Reloaded into the config cache:']
+        self.Log_Yaml_Reload_2  = ['Datei geändert - Laden in den Config-Cache fehlgeschlagen (erneuter Versuch beim nächsten Zugriff):',                                                          'File changed - Loading into the config cache failed (retry on next access):']
         ## Error: ######################################################################################################################################################################################################################################################################################
         self.err_Text_1         = ['Zu hohe Verzeichnisanzahl.',                                                                                                                            "Too high directory count."]
         self.err_Text_2         = ['Synchron Modus benötigt\nAbsolute Positionierung (PI-Achse)!!',                                                                                         'Synchronous mode requires\nabsolute positioning (PI axis)!!']
@@ -428,21 +465,13 @@ class Controller(QObject):
         EuPIDS_Menu_str         = ['PID-Parameter &schreiben',                                                                                                                              '&Write PID parameters']
         EuPIDR_Menu_str         = ['PID-Paramete&r lesen',                                                                                                                                  '&Read PID parameters']
         ## Config-Kontrolle: ###########################################################################################################################################################################################################################################################################
-        self.Log_Pfad_conf_1    = ['Konfigurationsfehler im Element:',                                                                                                                      'Configuration error in element:']
         self.Log_Pfad_conf_2    = ['Möglich sind:',                                                                                                                                         'Possible values:']
-        self.Log_Pfad_conf_2_1  = ['Möglich sind die Typen:',                                                                                                                               'The following types are possible:']
-        self.Log_Pfad_conf_2_2  = ['Möglich sind die Schlüssel:',                                                                                                                           'The following keys are possible:']
-        self.Log_Pfad_conf_3    = ['Default wird eingesetzt:',                                                                                                                              'Default is used:']
-        self.Log_Pfad_conf_3_1  = ['Default wird eingesetzt: Alle auf 1!',                                                                                                                  'Default is used: All on 1!']
         self.Log_Pfad_conf_4    = ['Fehler beim Auslesen der Config bei Konfiguration:',                                                                                                    'Error reading config during configuration:']
         self.Log_Pfad_conf_5    = ['; Setze auf Default:',                                                                                                                                  '; Set to default:']
         self.Log_Pfad_conf_5_1  = ['; Keine Geräte konfigurieren!! Exit!',                                                                                                                  '; Do not configure any devices!! Exit!']
         self.Log_Pfad_conf_5_2  = ['; Keine Geräte konfigurieren!! Multilog-Link wird nicht erstellt!',                                                                                     '; Do not configure any devices!! Multilog link is not created!']
         self.Log_Pfad_conf_6    = ['Fehlergrund:',                                                                                                                                          'Reason for error:']
-        self.Log_Pfad_conf_8    = ['Fehlerhafte Eingabe:',                                                                                                                                  'Incorrect input:']
         self.Log_Pfad_conf_8_1  = ['Fehlerhafte Typ:',                                                                                                                                      'Incorrect type:']
-        self.Log_Pfad_conf_8_2  = ['Fehlerhafte Schlüssel:',                                                                                                                                'Incorrect Key:']
-        self.Log_Pfad_conf_9    = ['Folgende Größe wurde nicht in Konfiguration definiert, setze Skalierung auf Null:',                                                                     'The following size was not defined in configuration, set scaling to zero:']
 
         #--------------------------------------------------------------------------
         # Logging-Datei erstellen:
@@ -471,60 +500,55 @@ class Controller(QObject):
         ### Erzeugung eines weiteren Handlers für das Logging:
         consoleHandler = logging.StreamHandler()
         consoleHandler.setLevel(logging.DEBUG)                                   # Das Level muss hier Info sein!
-        try: consolFormat = logging.Formatter(self.config['consol_Logging']['format'])
-        except Exception as e: 
-            consolFormat = logging.Formatter('%(asctime)s %(levelname)s %(name)s - %(message)s')
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} consol_Logging|format {self.Log_Pfad_conf_5[self.sprache]} %(asctime)s %(levelname)s %(name)s - %(message)s')
-            print(f'{self.Log_Pfad_conf_4[self.sprache]} consol_Logging|format {self.Log_Pfad_conf_5[self.sprache]} %(asctime)s %(levelname)s %(name)s - %(message)s')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
+        consolFormat = logging.Formatter(self.config_pruefung.wert('consol_Logging', 'format'))
         consoleHandler.setFormatter(consolFormat)
         ### Füge an bestehenden Handler:
         logger.addHandler(consoleHandler)
         ### Filter für den neuen Handler:
-        try: ak_Level_Consol_Log = self.config['consol_Logging']['level']
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} consol_Logging|level {self.Log_Pfad_conf_5[self.sprache]} 30')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            ak_Level_Consol_Log = 30
-        if not ak_Level_Consol_Log in [10, 20, 30, 40]:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} level - {self.Log_Pfad_conf_2[self.sprache]} [10, 20, 30, 40] - {self.Log_Pfad_conf_3[self.sprache]} 30 - {self.Log_Pfad_conf_8[self.sprache]} {ak_Level_Consol_Log}')
-            ak_Level_Consol_Log = 30
+        ak_Level_Consol_Log = self.config_pruefung.wert('consol_Logging', 'level')
         level_Log = {10: logging.DEBUG, 20: logging.INFO, 30: logging.WARNING, 40: logging.ERROR}
         #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-        try: ak_Anzeige_Level = self.config['consol_Logging']['print']
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} consol_Logging|print {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            ak_Anzeige_Level = 1
-        if not ak_Anzeige_Level in [1, 2, 3]:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} print - {self.Log_Pfad_conf_2[self.sprache]} [1, 2, 3] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8[self.sprache]} {ak_Anzeige_Level}')
-            ak_Anzeige_Level = 1
+        ak_Anzeige_Level = self.config_pruefung.wert('consol_Logging', 'print')
         #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
         try:
             consoleHandler.addFilter(MyFilter(level_Log[ak_Level_Consol_Log], ak_Anzeige_Level))
+            ### Meldungen unter dem kleinsten gefilterten Level erreichen den Filter nicht:
+            if not ak_Anzeige_Level == 2:
+                consoleHandler.setLevel(level_Log[ak_Level_Consol_Log])
         except:
             consoleHandler.addFilter(MyFilter(logging.WARNING, 1))
+            consoleHandler.setLevel(logging.WARNING)
             logger.warning(self.Log_Text_9_str[self.sprache])
+        ## Drosselung gleicher Meldungen und Queue-Handler (Log-Ausgabe in eigenem Thread):
+        self.log_drossel = None
+        self.log_queue   = None
+        if self.config_pruefung.wert('Logging_extra', 'rate_limit'):
+            self.log_drossel = Log_Drossel(self.sprache, self.config_pruefung.wert('Logging_extra', 'rate_time'), self.config_pruefung.wert('Logging_extra', 'rate_count'))
+        if self.config_pruefung.wert('Logging_extra', 'queue'):
+            self.log_queue = Log_Queue(self.log_drossel)
+        elif not self.log_drossel == None:
+            drossel_anhaengen(self.log_drossel)
+        ## Meldungen der Config-Prüfung:
+        self.config_pruefung.loggen(self.sprache)
 
         ## Ordnerpfad einlesen:
         self.output_dir = output_dir   
+        self.start_profil.phase('Config + Logging')
         
         #---------------------------------------------------------------------------
         # Bibliotheken GUI und Geräte - Eigene:
         #--------------------------------------------------------------------------
         ## Geräte:
-        from .devices.eurotherm import Eurotherm
-        from .devices.piAchse import PIAchse
-        from .devices.truHeat import TruHeat
-        from .devices.nemoAchseLin import NemoAchseLin
-        from .devices.nemoAchseRot import NemoAchseRot
-        from .devices.nemoGase import NemoGase
-        from .devices.nemoGenerator import NemoGenerator
-        from .devices.educrysMonitoring import EducrysMon
-        from .devices.educrysAntriebe import EducrysAntrieb
-        from .devices.educrysHeizer import EducrysHeizer
-        from .devices.multilog import Multilog
-        from .devices.gamepad import Gamepad_1
+        ### Die Geräte-Module (Schnittstelle und Widget), Multilog, Gamepad, Nemo-Register und Educrys-Frame werden erst bei ihrer Erstellung importiert (nur konfigurierte Teile)!
+        from .devices.messdaten import Messdaten_Writer
+        from .devices.ablauf_journal import Ablauf_Journal
+        from .devices.pid_takt import PID_Takt
+
+        ## Sampling:
+        from .scheduler import Scheduler
+        from .befehle import Befehls_Liste
+        from .rezept import aufloesung_setzen
+        from .gui_update import GUI_Update
 
         ## GUI:
         ### Hauptteile:
@@ -532,35 +556,23 @@ class Controller(QObject):
         from .view.base_classes import Splitter
         from .view.typen import Generator, Antrieb
 
-        ### Geräte-GUI-Teile:
-        from .view.eurotherm import EurothermWidget
-        from .view.piAchse import PIAchseWidget
-        from .view.truHeat import TruHeatWidget
-        from .view.nemoAchseLin import NemoAchseLinWidget
-        from .view.nemoAchseRot import NemoAchseRotWidget
-        from .view.nemoGase import NemoGaseWidget
-        from .view.nemoGenerator import NemoGeneratortWidget
-        from .view.educrysMonitoring import EducrysMonWidget
-        from .view.educrysAntriebe import EducrysAntriebWidget
-        from .view.educrysHeizer import EducrysHeizerWidget
+        self.start_profil.phase('Module')
 
         #---------------------------------------------------------------------------
         # Vorbereitung:
         #--------------------------------------------------------------------------
         ## Reaktionstimer:
-        self.timer_check_device = QTimer()                                              # Reaktionszeittimer (ruft die Geräte auf, liest aber nur unter bestimmten Bedingungen!)
+        self.timer_check_device = QTimer()                                              # Reaktionszeittimer (Takt des Schedulers, der nur die fälligen Geräte aufruft!)
         ### Konfigurationscheck Reaktionszeit:
-        try: reaktion_time = self.config["time"]["dt-main"]
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} time|dt-main {self.Log_Pfad_conf_5[self.sprache]} 150')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            reaktion_time = 150
-        if not type(reaktion_time) in [int] or not reaktion_time >= 0:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} dt-main - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 150 - {self.Log_Pfad_conf_8[self.sprache]} {reaktion_time}')
-            reaktion_time = 150 
+        reaktion_time = self.config_pruefung.wert('time', 'dt-main')
         ### Timer setzen:
         self.timer_check_device.setInterval(reaktion_time)
+        ## Rezepte - Auflösung der Rampen:
+        rezept_aufloesung = self.config_pruefung.wert('time', 'rezept_aufloesung')
+        aufloesung_setzen(rezept_aufloesung)
         self.timer_check_device.timeout.connect(self.ckeck_device)
+        ## Scheduler:
+        self.scheduler = Scheduler(self.sprache)
 
         ## Zeiten:
         self.start_time = datetime.datetime.now(datetime.timezone.utc).astimezone()
@@ -573,125 +585,97 @@ class Controller(QObject):
         
         ## Konfigurationen prüfen:
         ### Gamapad Aktivierung:
-        try: gamepad_Link = self.config['Function_Skip']['Generell_GamePad']
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} Function_Skip|Generell_GamePad {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            gamepad_Link = False
-        if not type(gamepad_Link) == bool and not gamepad_Link in [0,1]: 
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} Generell_GamePad - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {gamepad_Link}')
-            gamepad_Link = 0
+        gamepad_Link = self.config_pruefung.wert('Function_Skip', 'Generell_GamePad')
         #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
         ### Read und Write Funktion Dauer Loggen:
-        try: WriteReadTime = self.config['Function_Skip']['writereadTime']
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} Function_Skip|writereadTime {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            WriteReadTime = False
-        if not type(WriteReadTime) == bool and not WriteReadTime in [0,1]: 
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} writereadTime - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {WriteReadTime}')
-            WriteReadTime = 0
+        WriteReadTime = self.config_pruefung.wert('Function_Skip', 'writereadTime')
         #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
         ### GUI Rahmen:
-        try: Frame_Anzeige = self.config['GUI']['GUI_Frame'] 
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} GUI|GUI_Frame {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            Frame_Anzeige = False
-        if not type(Frame_Anzeige) == bool and not Frame_Anzeige in [0,1]: 
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} GUI_Frame - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {Frame_Anzeige}')
-            Frame_Anzeige = 0
+        Frame_Anzeige = self.config_pruefung.wert('GUI', 'GUI_Frame')
         #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
         ### GUI Farben:
-        try: Color_Anzeige = self.config['GUI']['GUI_color_Widget'] 
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} GUI|GUI_color_Widget {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            Color_Anzeige = False 
-        if not type(Color_Anzeige) == bool and not Color_Anzeige in [0,1]: 
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} GUI_color_Widget - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {Color_Anzeige}')
-            Color_Anzeige = 0 
+        Color_Anzeige = self.config_pruefung.wert('GUI', 'GUI_color_Widget')
+        #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
+        ### GUI Plot - maximale Punktanzahl pro Kurve:
+        plot_max_punkte = self.config_pruefung.wert('GUI', 'plot_max_points')
+        #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
+        ### GUI - maximale Bildrate:
+        max_fps = self.config_pruefung.wert('GUI', 'max_fps')
         #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
         ### Multilog Übergeordnet - timeout:
-        try: multilog_timeout = self.config['Multilog_extra']['timeout'] 
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} Multilog_extra|timeout {self.Log_Pfad_conf_5[self.sprache]} 10')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            multilog_timeout = 10 
-        if not type(multilog_timeout) == int: 
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} timeout - {self.Log_Pfad_conf_2_1[self.sprache]} {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 10 - {self.Log_Pfad_conf_8[self.sprache]} {multilog_timeout}')
-            multilog_timeout = 10 
+        multilog_timeout = self.config_pruefung.wert('Multilog_extra', 'timeout')
         ### Multilog Übergeordnet - Fehler-Situation:
-        try: multilog_CEC = self.config['Multilog_extra']['connection_error_case'] 
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} Multilog_extra|connection_error_case {self.Log_Pfad_conf_5[self.sprache]} 1')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            multilog_CEC = 1 
-        if not type(multilog_CEC) == int and not multilog_CEC in [1,2]: 
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} connection_error_case - {self.Log_Pfad_conf_2[self.sprache]} [1, 2] - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8[self.sprache]} {multilog_CEC}')
-            multilog_CEC = 1 
+        multilog_CEC = self.config_pruefung.wert('Multilog_extra', 'connection_error_case')
+        ### Multilog Übergeordnet - Rahmen und Nutzlast (Senden an Multilog):
+        multilog_rahmen = self.config_pruefung.wert('Multilog_extra', 'framing')
+        multilog_nutzlast = self.config_pruefung.wert('Multilog_extra', 'payload')
+        #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
+        ### Nemo Übergeordnet - Register-Karte (gemeinsames Lesen der Input-Register):
+        nemo_karte = self.config_pruefung.wert('Nemo_extra', 'register_map')
+        ### Nemo Übergeordnet - Register-Lücke:
+        nemo_luecke = self.config_pruefung.wert('Nemo_extra', 'register_gap')
+        ### Nemo Übergeordnet - Maximales Alter der gelesenen Register:
+        nemo_alter = self.config_pruefung.wert('Nemo_extra', 'register_age')
+        #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
+        ### Educrys Übergeordnet - Frame-Poller (ein Frame für alle Educrys-Geräte am Arduino):
+        educrys_frame = self.config_pruefung.wert('Educrys_extra', 'frame_share')
+        ### Educrys Übergeordnet - Maximales Alter des Frames:
+        educrys_alter = self.config_pruefung.wert('Educrys_extra', 'frame_age')
+        self.start_profil.phase('Vorbereitung')
+
+        ## Konfigurationscheck - Geräte:
+        devices_dict_conf = self.config_pruefung.wert('devices')
+        if devices_dict_conf == None:
+            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} devices {self.Log_Pfad_conf_5_1[self.sprache]}')
+            exit()
         
+        ## Genutzte Geräte-Typen (nur deren Teile der GUI werden erstellt):
+        typen_genutzt = []
+        for device_name in devices_dict_conf:
+            if not self.config_pruefung.wert('devices', device_name, 'skip'):
+                typen_genutzt.append(self.config_pruefung.wert('devices', device_name, 'typ'))
+        if typen_genutzt == []:
+            typen_genutzt = ['Generator', 'Antrieb', 'Monitoring']
+
         ## Hauptfenster:
         self.main_window = MainWindow(self.exit, self.sync_rezept, self.sync_end_rezept, self.rezept_einlesen, self.sprache, gamepad_Link)                                    
+        ## Überwachung der Config und der Rezept-Dateien (Config-Cache lädt geänderte Dateien neu):
+        self.datei_watcher = QFileSystemWatcher([self.config_pfad] + glob.glob('vifcon/rezepte/*.yml') + glob.glob('vifcon/rezepte/*.yaml'))
+        self.datei_watcher.fileChanged.connect(self.datei_geaendert)
 
         ## Hauttabs erstellen:
+        self.tab_Teile = {}
         ### Haupttab Steuerung:
         self.tab_GenAnt = Splitter('H', True)
-        self.main_window.add_tab(self.tab_GenAnt.splitter, main_window_tab_1_str[self.sprache])
+        if 'Generator' in typen_genutzt or 'Antrieb' in typen_genutzt:
+            self.main_window.add_tab(self.tab_GenAnt.splitter, main_window_tab_1_str[self.sprache])
 
         #### Konfigurationscheck Skalierungsfaktoren:
-        default_scale = {'Pos': 1, 'Win': 1, 'Speed_1': 1, 'Speed_2': 1, 'WinSpeed': 1, 'Temp': 1, 'Op': 1, 
-                         'Current': 1, 'Voltage': 1, 'Pow': 1, 'Freq': 1, 'Freq_2': 1, 'PIDA': 1, 'PIDG': 1} 
-        try: scale = self.config['skalFak']
-        except Exception as e:
-            scale = default_scale
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} skalFak {self.Log_Pfad_conf_5[self.sprache]} {scale}')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-        size_List = ['Pos', 'Win', 'Speed_1', 'Speed_2', 'WinSpeed', 'Temp', 'Op', 'Current', 'Voltage', 'Pow', 'Freq', 'Freq_2', 'PIDA', 'PIDG']
-        list_drin = []
-        for size in scale:
-            if not size in size_List:
-                logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} skalFak - {self.Log_Pfad_conf_2_2[self.sprache]} {size_List} - {self.Log_Pfad_conf_3_1[self.sprache]} - {self.Log_Pfad_conf_8_2[self.sprache]} {size}')
-                scale = default_scale
-                break
-            else:
-                list_drin.append(size)
-            if not type(scale[size]) in [float, int] or not scale[size] >= 0:
-                logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} skalFak|{size} - {self.Log_Pfad_conf_2_1[self.sprache]} [Float, Integer] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 1 - {self.Log_Pfad_conf_8[self.sprache]} {scale[size]}')
-                scale[size] = 1
-        if not scale == default_scale:
-            for size in size_List:
-                if not size in list_drin:
-                    logger.warning(f'{self.Log_Pfad_conf_9[self.sprache]} {size}')
-                    scale.update({size: 0})
+        scale = self.config_pruefung.wert('skalFak')
 
         #### Konfigurationscheck Legendentyp:
-        try: legend_generator = self.config["legend"]["generator"]
-        except Exception as e:
-            legend_generator = {'legend_pos': 'Side', 'legend_anz': 2, 'side': 'rl'} 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} legend|generator {self.Log_Pfad_conf_5[self.sprache]} {legend_generator}')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-        try: legend_antriebe = self.config["legend"]["antrieb"]
-        except Exception as e:
-            legend_antriebe = {'legend_pos': 'Side', 'legend_anz': 2, 'side': 'rl'} 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} legend|generator {self.Log_Pfad_conf_5[self.sprache]} {legend_generator}')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-
-        self.generator = Generator(self.start_time, self.tab_GenAnt.splitter, self.add_Ablauf, self.stopp_all, self.main_window.menu_dict, legend_generator, scale, self.sprache, Color_Anzeige)
-        self.antrieb = Antrieb(self.start_time, self.tab_GenAnt.splitter, self.add_Ablauf, self.stopp_all, self.synchro_achse, self.main_window.menu_dict, legend_antriebe, scale, self.sprache, Color_Anzeige)
-
-        if self.generator.legend_pos == 'SIDE':
-            self.generator.btn_LCA.clicked.connect(lambda: self.Legend_Check('Generator'))
-            self.generator.btn_LUCA.clicked.connect(lambda: self.Legend_Uncheck('Generator'))
-        if self.antrieb.legend_pos == 'SIDE':
-            self.antrieb.btn_LCA.clicked.connect(lambda: self.Legend_Check('Antrieb'))
-            self.antrieb.btn_LUCA.clicked.connect(lambda: self.Legend_Uncheck('Antrieb'))
+        legend_generator = self.config_pruefung.geprueft('legend', 'generator')
+        legend_antriebe = self.config_pruefung.geprueft('legend', 'antrieb')
+
+        if 'Generator' in typen_genutzt:
+            self.generator = Generator(self.start_time, self.tab_GenAnt.splitter, self.add_Ablauf, self.stopp_all, self.main_window.menu_dict, legend_generator, scale, self.sprache, Color_Anzeige, plot_max_punkte)
+            if self.generator.legend_pos == 'SIDE':
+                self.generator.btn_LCA.clicked.connect(lambda: self.Legend_Check('Generator'))
+                self.generator.btn_LUCA.clicked.connect(lambda: self.Legend_Uncheck('Generator'))
+            self.tab_Teile['Generator'] = self.generator
+        if 'Antrieb' in typen_genutzt:
+            self.antrieb = Antrieb(self.start_time, self.tab_GenAnt.splitter, self.add_Ablauf, self.stopp_all, self.synchro_achse, self.main_window.menu_dict, legend_antriebe, scale, self.sprache, Color_Anzeige, plot_max_punkte)
+            if self.antrieb.legend_pos == 'SIDE':
+                self.antrieb.btn_LCA.clicked.connect(lambda: self.Legend_Check('Antrieb'))
+                self.antrieb.btn_LUCA.clicked.connect(lambda: self.Legend_Uncheck('Antrieb'))
+            self.tab_Teile['Antrieb'] = self.antrieb
 
         ### Haupttab Monitoring:
-        self.tab_Mon = Splitter('H', True)
-        self.main_window.add_tab(self.tab_Mon.splitter, main_window_tab_2_str[self.sprache])
-
-        self.tab_Teile = {'Generator':self.generator, 'Antrieb':self.antrieb, 'Monitoring': self.tab_Mon}
+        if 'Monitoring' in typen_genutzt:
+            self.tab_Mon = Splitter('H', True)
+            self.main_window.add_tab(self.tab_Mon.splitter, main_window_tab_2_str[self.sprache])
+            self.tab_Teile['Monitoring'] = self.tab_Mon
+        self.start_profil.phase('GUI')
 
         #---------------------------------------------------------------------------
         # Geräte und ihre GUI-Teile erstellen:
@@ -723,12 +707,8 @@ class Controller(QObject):
             "darkred"
         ] # 23 Farben - https://matplotlib.org/stable/gallery/color/named_colors.html 
 
-        ## Farb-Liste:
+        ## Farb-Liste (wird erst beim Überlauf der Farben erstellt):
         used_Color_list = []
-        for n in COLORS:
-            used_Color_list.append(matplotlib.colors.cnames[n])
-        used_Color_list.append(matplotlib.colors.cnames['red'])
-        used_Color_list.append(matplotlib.colors.cnames['black'])
 
         ## Geräte und ihre Tabs erstellen:
         ### Farbe:
@@ -752,48 +732,22 @@ class Controller(QObject):
         self.PadAchsenList          = []                                                  # Verbundene Achsen mit dem Controller
         self.hardware_controller    = False                                               # Controller soll erstellt werden
 
-        ## Konfigurationscheck - Geräte:
-        try: devices_dict_conf = self.config['devices']
-        except Exception as e:
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} devices {self.Log_Pfad_conf_5_1[self.sprache]}')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            exit()
-        
         ## Konfigurationscheck - Multilog-Link:
-        try: multilog_Link = self.config['Function_Skip']['Multilog_Link']
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} Function_Skip|Multilog_Link {self.Log_Pfad_conf_5[self.sprache]} False')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            multilog_Link = False
-        if not type(multilog_Link) == bool and not multilog_Link in [0,1]: 
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} Multilog_Link - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {gamepad_Link}')
-            multilog_Link = 0
+        multilog_Link = self.config_pruefung.wert('Function_Skip', 'Multilog_Link')
 
         ## Geräte Erstellung:
         for device_name in devices_dict_conf:
             jump = False
-            try: skip = self.config['devices'][device_name]['skip']
-            except Exception as e: 
-                logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} {device_name}|skip {self.Log_Pfad_conf_5[self.sprache]} True')
-                logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                skip = 1
-            if not type(skip) == bool and not skip in [0,1]: 
-                logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} skip ({device_name}) - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} True - {self.Log_Pfad_conf_8[self.sprache]} {skip}')
-                skip = 1 
+            skip = self.config_pruefung.wert('devices', device_name, 'skip')
 
             if not skip:                                                                  # Wenn skip == True, dann überspringe die Erstellung
+                self.start_profil.geraet_start()
                 ### Auswahl Farbe und Geräte-Typ:
                 ak_color = []                                                             # zu übergebene Liste mit Farben
                 color = 0                                                                 # Start-Listenwert 
-                try: device_typ = self.config['devices'][device_name]['typ']              # Geräte-Typ
-                except Exception as e: 
-                    logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} {device_name}|typ {self.Log_Pfad_conf_5[self.sprache]} Generator')
-                    logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                    device_typ = 'Generator'
-                if not device_typ in ['Generator', 'Antrieb', 'Monitoring']:
-                    logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} typ ({device_name}) - {self.Log_Pfad_conf_2[self.sprache]} [Generator, Antrieb, Monitoring] - {self.Log_Pfad_conf_3[self.sprache]} Generator - {self.Log_Pfad_conf_8[self.sprache]} {device_typ}')
-                    device_typ = 'Generator' 
+                device_typ = self.config_pruefung.wert('devices', device_name, 'typ')                       # Geräte-Typ
                 device_typ_widget = self.tab_Teile[device_typ]                            # Geräte-Widget, an das das Gerät geaddet werden soll
+                device_config = self.config_pruefung.geprueft('devices', device_name)     # Config des Gerätes mit den geprüften Werten
 
                 if device_typ == 'Generator':
                     color = color_Gen_n
@@ -804,6 +758,11 @@ class Controller(QObject):
                         ak_color.append(COLORS[n])
                     except Exception as e:
                         # Wenn ein Überlauf der 23 Farben geschieht, werden zufällige Farben ausgewählt!
+                        if used_Color_list == []:
+                            import matplotlib.colors
+                            import randomcolor
+                            for name in COLORS + ['red', 'black']:
+                                used_Color_list.append(matplotlib.colors.cnames[name])
                         if not überlaufG and device_typ == 'Generator':
                             logger.warning(f'{self.Log_Text_Color[self.sprache]} ({TypG[self.sprache]})')
                             überlaufG = True
@@ -822,8 +781,13 @@ class Controller(QObject):
                 if device_typ == 'Generator':
                     if 'Eurotherm' in device_name:
                         #### Objekte erstellen:
-                        device = Eurotherm(self.sprache, self.config['devices'][device_name], self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name)
-                        widget = EurothermWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, self.config["devices"][device_name], config, self.neustart, multilog_Link, self.add_Ablauf, device_name)
+                        from .devices.eurotherm import Eurotherm
+                        from .view.eurotherm import EurothermWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = Eurotherm(self.sprache, device_config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name)
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = EurothermWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, device_config, config, self.neustart, multilog_Link, self.add_Ablauf, device_name)
+                        self.start_profil.geraet(device_name, 'Widget')
                         #### Menü-Sonder-Knöpfe:
                         ##### Lese HO:
                         menu_HO_Button = QAction(f'{device_name} - {EuHO_Menu_str[self.sprache]}', self)
@@ -841,20 +805,35 @@ class Controller(QObject):
                         color_Gen_n = color_Gen_n + 7
                     elif 'TruHeat' in device_name:
                         #### Objekte erstellen:
-                        device = TruHeat(self.sprache, self.config['devices'][device_name], self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name) 
-                        widget = TruHeatWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, self.config["devices"][device_name], config, self.neustart, multilog_Link, self.add_Ablauf, device_name)
+                        from .devices.truHeat import TruHeat
+                        from .view.truHeat import TruHeatWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = TruHeat(self.sprache, device_config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name) 
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = TruHeatWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, device_config, config, self.neustart, multilog_Link, self.add_Ablauf, device_name)
+                        self.start_profil.geraet(device_name, 'Widget')
                         #### Farben-Option:
                         color_Gen_n = color_Gen_n + 13
                     elif 'Nemo-Generator' in device_name:
                         #### Objekte erstellen:
-                        device = NemoGenerator(self.sprache, self.config['devices'][device_name], self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name) 
-                        widget = NemoGeneratortWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, self.config["devices"][device_name], config, self.neustart, multilog_Link, self.add_Ablauf, device_name)
+                        from .devices.nemoGenerator import NemoGenerator
+                        from .view.nemoGenerator import NemoGeneratortWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = NemoGenerator(self.sprache, device_config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name) 
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = NemoGeneratortWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, device_config, config, self.neustart, multilog_Link, self.add_Ablauf, device_name)
+                        self.start_profil.geraet(device_name, 'Widget')
                         #### Farben-Option:
                         color_Gen_n = color_Gen_n + 13
                     elif 'Educrys-Heizer' in device_name:
                         #### Objekte erstellen:
-                        device = EducrysHeizer(self.sprache, self.config['devices'][device_name], self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name) 
-                        widget = EducrysHeizerWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, self.config["devices"][device_name], config, self.neustart, multilog_Link, self.add_Ablauf, device_name)
+                        from .devices.educrysHeizer import EducrysHeizer
+                        from .view.educrysHeizer import EducrysHeizerWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = EducrysHeizer(self.sprache, device_config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name) 
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = EducrysHeizerWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, device_config, config, self.neustart, multilog_Link, self.add_Ablauf, device_name)
+                        self.start_profil.geraet(device_name, 'Widget')
                         ##### Schreibe PID:
                         menu_PIDS_Button = QAction(f'{device_name} - {EuPIDS_Menu_str[self.sprache]}', self)
                         menu_PIDS_Button.triggered.connect(widget.Write_PID)
@@ -867,30 +846,50 @@ class Controller(QObject):
                 elif device_typ == 'Antrieb':
                     if 'PI-Achse' in device_name:
                         #### Objekte erstellen:
-                        device = PIAchse(self.sprache, self.config['devices'][device_name], self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name)
+                        from .devices.piAchse import PIAchse
+                        from .view.piAchse import PIAchseWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = PIAchse(self.sprache, device_config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name)
                         if device.init and not self.test_mode:
                             start_werte = device.read() 
                         else:
                             start_werte = {'IWv': '?', 'IWs': '?'}
-                        widget = PIAchseWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, self.config["devices"][device_name], config, start_werte, self.neustart, multilog_Link, self.add_Ablauf, device_name, gamepad_Link)
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = PIAchseWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, device_config, config, start_werte, self.neustart, multilog_Link, self.add_Ablauf, device_name, gamepad_Link)
+                        self.start_profil.geraet(device_name, 'Widget')
                         #### Farben-Option:
                         color_Ant_n = color_Ant_n + 7
                     elif 'Nemo-Achse-Linear' in device_name:
                         #### Objekte erstellen:
-                        device = NemoAchseLin(self.sprache, self.config['devices'][device_name], config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf,  device_name) 
-                        widget = NemoAchseLinWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, self.config["devices"][device_name], config, self.neustart, multilog_Link, self.add_Ablauf, device_name, gamepad_Link)
+                        from .devices.nemoAchseLin import NemoAchseLin
+                        from .view.nemoAchseLin import NemoAchseLinWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = NemoAchseLin(self.sprache, device_config, config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf,  device_name) 
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = NemoAchseLinWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, device_config, config, self.neustart, multilog_Link, self.add_Ablauf, device_name, gamepad_Link)
+                        self.start_profil.geraet(device_name, 'Widget')
                         #### Farben-Option:
                         color_Ant_n = color_Ant_n + 9
                     elif 'Nemo-Achse-Rotation' in device_name:
                         #### Objekte erstellen:
-                        device = NemoAchseRot(self.sprache, self.config['devices'][device_name], config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name) 
-                        widget = NemoAchseRotWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, self.config["devices"][device_name], config, self.neustart, multilog_Link, self.add_Ablauf, device_name, gamepad_Link)
+                        from .devices.nemoAchseRot import NemoAchseRot
+                        from .view.nemoAchseRot import NemoAchseRotWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = NemoAchseRot(self.sprache, device_config, config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf, device_name) 
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = NemoAchseRotWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, device_config, config, self.neustart, multilog_Link, self.add_Ablauf, device_name, gamepad_Link)
+                        self.start_profil.geraet(device_name, 'Widget')
                         #### Farben-Option:
                         color_Ant_n = color_Ant_n + 8
                     elif 'Educrys-Antrieb' in device_name:
                         #### Objekte erstellen:
-                        device = EducrysAntrieb(self.sprache, self.config['devices'][device_name], config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf,  device_name) 
-                        widget = EducrysAntriebWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, self.config["devices"][device_name], config, self.neustart, multilog_Link, self.add_Ablauf, device_name, gamepad_Link)
+                        from .devices.educrysAntriebe import EducrysAntrieb
+                        from .view.educrysAntriebe import EducrysAntriebWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = EducrysAntrieb(self.sprache, device_config, config, self.com_sammlung, self.test_mode, self.neustart, multilog_Link, WriteReadTime, self.add_Ablauf,  device_name) 
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = EducrysAntriebWidget(self.sprache, Frame_Anzeige, device_typ_widget, ak_color, device_config, config, self.neustart, multilog_Link, self.add_Ablauf, device_name, gamepad_Link)
+                        self.start_profil.geraet(device_name, 'Widget')
                         #### Farben-Option:
                         color_Ant_n = color_Ant_n + 6
                     else:
@@ -900,12 +899,22 @@ class Controller(QObject):
                 elif device_typ == 'Monitoring':
                     if 'Nemo-Gase' in device_name:
                         #### Objekte erstellen:
-                        device = NemoGase(self.sprache, self.config['devices'][device_name], self.com_sammlung, self.test_mode, WriteReadTime, self.add_Ablauf, device_name)
-                        widget = NemoGaseWidget(self.sprache, Frame_Anzeige, device_typ_widget, self.config['devices'][device_name], config, self.add_Ablauf, device_name)
+                        from .devices.nemoGase import NemoGase
+                        from .view.nemoGase import NemoGaseWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = NemoGase(self.sprache, device_config, self.com_sammlung, self.test_mode, WriteReadTime, self.add_Ablauf, device_name)
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = NemoGaseWidget(self.sprache, Frame_Anzeige, device_typ_widget, device_config, config, self.add_Ablauf, device_name)
+                        self.start_profil.geraet(device_name, 'Widget')
                     elif 'Educrys-Monitoring' in device_name:
                         #### Objekte erstellen:
-                        device = EducrysMon(self.sprache, self.config['devices'][device_name], self.com_sammlung, self.test_mode, WriteReadTime, self.add_Ablauf, device_name)
-                        widget = EducrysMonWidget(self.sprache, Frame_Anzeige, device_typ_widget, self.config['devices'][device_name], config, self.add_Ablauf, device_name)
+                        from .devices.educrysMonitoring import EducrysMon
+                        from .view.educrysMonitoring import EducrysMonWidget
+                        self.start_profil.geraet(device_name, 'Import')
+                        device = EducrysMon(self.sprache, device_config, self.com_sammlung, self.test_mode, WriteReadTime, self.add_Ablauf, device_name)
+                        self.start_profil.geraet(device_name, 'Gerät')
+                        widget = EducrysMonWidget(self.sprache, Frame_Anzeige, device_typ_widget, device_config, config, self.add_Ablauf, device_name)
+                        self.start_profil.geraet(device_name, 'Widget')
                     else:
                         logger.warning(f'{self.Log_Device_1[self.sprache]} {device_name} {self.Log_Device_4[self.sprache]}')
                         jump = True
@@ -931,6 +940,8 @@ class Controller(QObject):
                             self.main_window.add_menu('VIFCON-PID', device_name, device.PID.update_VPID_Para, widget.init)
                             device.PID.config_dat = config
                             device.PID.widget = widget
+                            if any(self.config_pruefung.fehlerhaft('devices', device_name, 'PID', parameter) for parameter in ['kp', 'ki', 'kd']):
+                                device.PID.sperren()
                             self.main_window.add_menu('Reset-PID', device_name, widget.PID_Reset, widget.init)
                         except Exception as e:
                             logger.exception(f'{device_name} - {self.Log_Text_204_str[self.sprache]}')
@@ -939,51 +950,19 @@ class Controller(QObject):
                     self.devices.update({device_name: device})
                     self.widgets.update({device_name: widget})
                     #### Ist der Port Null, wird keine Verbindung hergestellt:
-                    ##### Konfigurations Check:
-                    try: write_port = self.config["devices"][device_name]['multilog']['write_port']
-                    except Exception as e:
-                        logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} multilog|write_port ({device_name}) {self.Log_Pfad_conf_5_2[self.sprache]}')
-                        logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                        write_port = 0
-                    if not type(write_port) == int or not write_port >= 0:
-                        logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} write_port ({device_name}) - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {write_port}')
-                        write_port = 0 
-                    #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-                    try: write_trigger = self.config['devices'][device_name]['multilog']['write_trigger']
-                    except Exception as e:
-                        logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} multilog|write_trigger ({device_name}) {self.Log_Pfad_conf_5_2[self.sprache]}')
-                        logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
+                    ##### Konfiguration (geprüft - ohne Trigger keine Verbindung):
+                    write_port      = self.config_pruefung.wert('devices', device_name, 'multilog', 'write_port')
+                    write_trigger   = self.config_pruefung.wert('devices', device_name, 'multilog', 'write_trigger')
+                    if write_trigger == None:
                         write_port = 0
                     if not 'Nemo-Gase' in device_name and not 'Educrys-Monitoring' in device_name:
-                        #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-                        try: read_port_ist = self.config["devices"][device_name]['multilog']['read_port_ist']
-                        except Exception as e:
-                            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} multilog|read_port_ist ({device_name}) {self.Log_Pfad_conf_5_2[self.sprache]}')
-                            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                            read_port_ist = 0
-                        if not type(read_port_ist) == int or not read_port_ist >= 0:
-                            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} read_port_ist ({device_name}) - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {read_port_ist}')
-                            read_port_ist = 0 
-                        #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-                        try: read_trigger_ist = self.config['devices'][device_name]['multilog']['read_trigger_ist']
-                        except Exception as e:
-                            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_ist ({device_name}) {self.Log_Pfad_conf_5_2[self.sprache]}')
-                            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
+                        read_port_ist       = self.config_pruefung.wert('devices', device_name, 'multilog', 'read_port_ist')
+                        read_trigger_ist    = self.config_pruefung.wert('devices', device_name, 'multilog', 'read_trigger_ist')
+                        read_port_soll      = self.config_pruefung.wert('devices', device_name, 'multilog', 'read_port_soll')
+                        read_trigger_soll   = self.config_pruefung.wert('devices', device_name, 'multilog', 'read_trigger_soll')
+                        if read_trigger_ist == None:
                             read_port_ist = 0
-                        #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-                        try: read_port_soll = self.config["devices"][device_name]['multilog']['read_port_soll']
-                        except Exception as e:
-                            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} multilog|read_port_soll ({device_name}) {self.Log_Pfad_conf_5_2[self.sprache]}')
-                            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                            read_port_soll = 0
-                        if not type(read_port_soll) == int or not read_port_soll >= 0:
-                            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} read_port_soll ({device_name}) - {self.Log_Pfad_conf_2_1[self.sprache]} Integer (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 0 - {self.Log_Pfad_conf_8[self.sprache]} {read_port_soll}')
-                            read_port_soll = 0 
-                        #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-                        try: read_trigger_soll = self.config['devices'][device_name]['multilog']['read_trigger_soll']
-                        except Exception as e:
-                            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} multilog|read_trigger_soll ({device_name}) {self.Log_Pfad_conf_5_2[self.sprache]}')
-                            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
+                        if read_trigger_soll == None:
                             read_port_soll = 0
                     
                     ##### Ports setzen:
@@ -999,14 +978,70 @@ class Controller(QObject):
                             self.trigger_read.update({read_port_soll: [read_trigger_soll, device_name]})
         
         logger.debug(f"{self.mutexs}")
+        self.start_profil.phase('Geräte')
+
+        #---------------------------------------------------------------------------
+        # Nemo-Register-Karten erstellen:
+        #--------------------------------------------------------------------------
+        ## Alle Nemo-Geräte an einer SPS lesen ihre Input-Register gemeinsam (gleicher Schlüssel wie modbus_pool.verbindung - Host und Port):
+        self.register_karten = {}
+        if nemo_karte and not self.test_mode:
+            from .devices.nemo_register import Nemo_Register
+            for device_name in self.devices:
+                if not 'Nemo' in device_name:
+                    continue
+                schnittstelle = self.config['devices'][device_name]['serial-interface']
+                ak_sps = (schnittstelle.get('host', 'localhost'), schnittstelle.get('port', 502))
+                if not ak_sps in self.register_karten:
+                    self.register_karten[ak_sps] = Nemo_Register(self.sprache, self.devices[device_name].serial, f'{ak_sps[0]}:{ak_sps[1]}', nemo_luecke, nemo_alter)
+                self.register_karten[ak_sps].anmelden(device_name, self.devices[device_name].lese_Bereiche)
+                self.devices[device_name].register_karte = self.register_karten[ak_sps]
+            for ak_sps in self.register_karten:
+                self.register_karten[ak_sps].karte_erstellen()
+        #---------------------------------------------------------------------------
+        # Educrys-Frame-Poller erstellen:
+        #--------------------------------------------------------------------------
+        ## Alle Educrys-Geräte an einer Schnittstelle teilen sich den Frame des Arduinos (ein Mutex pro Port):
+        self.frame_poller_dict = {}
+        if educrys_frame and not self.test_mode:
+            from .devices.educrys_frame import Educrys_Frame
+            for device_name in self.devices:
+                if not 'Educrys' in device_name:
+                    continue
+                ak_com = self.config['devices'][device_name]['serial-interface']['port']
+                if not ak_com in self.frame_poller_dict:
+                    self.frame_poller_dict[ak_com] = Educrys_Frame(self.sprache, ak_com, educrys_alter)
+                self.devices[device_name].frame_poller = self.frame_poller_dict[ak_com]
+        ## Gemeinsame Modbus-Verbindungen der Nemo-Geräte (Verbindungs-Pool, pro Host und Port):
+        self.modbus_verbindungen = []
+        if any(['Nemo' in device_name for device_name in self.devices]):
+            from .devices import modbus_pool
+            self.modbus_verbindungen = list(modbus_pool.VERBINDUNGEN.values())
+        ## Lese-Schichten der seriellen Geräte (eine pro Port, Antwortzeiten pro Befehl):
+        self.transaktionen = []
+        for device_name in self.devices:
+            transaktion = getattr(self.devices[device_name], 'transaktion', None)
+            if not transaktion == None and not transaktion in self.transaktionen:
+                self.transaktionen.append(transaktion)
+
+        #---------------------------------------------------------------------------
+        # PID-Takt erstellen:
+        #--------------------------------------------------------------------------
+        ## Alle aktiven PID-Regler werden in einem Thread mit der monotonen Uhr und gemeinsam in der PID-Bank berechnet (nicht im GUI-Thread):
+        self.pid_takt = PID_Takt(self.sprache)
+        for device_name in self.devices:
+            if getattr(self.devices[device_name], 'PID_Aktiv', False):
+                self.pid_takt.anmelden(device_name, self.devices[device_name].PID, self.devices[device_name].PID_Eingang, self.devices[device_name].PID_Ausgang)
+        self.pid_takt.start()
 
         #---------------------------------------------------------------------------
         # Multilog Trigger Thread erstellen:
         #--------------------------------------------------------------------------
         self.Multilog_Nutzung = multilog_Link
         if self.Multilog_Nutzung:
+            from .devices.multilog import Multilog
             self.LinkMultilogThread = QThread()
-            self.MultiLink = Multilog(self.sprache, self.port_List_send, self.port_List_read, self.add_Ablauf, self.widgets, self.devices, self.trigger_send, self.trigger_read, multilog_timeout, multilog_CEC)
+            self.MultiLink = Multilog(self.sprache, self.port_List_send, self.port_List_read, self.add_Ablauf, self.widgets, self.devices, self.trigger_send, self.trigger_read, multilog_timeout, multilog_CEC, multilog_rahmen, multilog_nutzlast)
             self.MultiLink.moveToThread(self.LinkMultilogThread)
             self.LinkMultilogThread.start()
             self.signal_Multilog.connect(self.MultiLink.event_Loop)
@@ -1019,6 +1054,7 @@ class Controller(QObject):
         if self.Gamepad_Nutzung:
             self.PadThread = QThread()
             try:
+                from .devices.gamepad import Gamepad_1
                 self.gamepad = Gamepad_1(self.sprache, self.PadAchsenList, self.add_Ablauf)
                 logger.debug(f"{self.gamepad.name} {self.Log_Text_13_str[self.sprache]} {self.PadThread}") 
                 self.gamepad.moveToThread(self.PadThread)
@@ -1030,22 +1066,36 @@ class Controller(QObject):
                 logger.warning(f'{self.Log_Text_222_str[self.sprache]}')
                 self.Gamepad_Nutzung = False
 
+        self.start_profil.phase('Register, PID, Multilog, Gamepad')
+
         #---------------------------------------------------------------------------
         # Threads erstellen:
         #--------------------------------------------------------------------------
         logger.debug(self.Log_Text_12_str[self.sprache])
         self.samplers = []  
         self.threads = []
+        self.befehls_listen = []
+        self.port_sampler = {}                                                                                                                                      # Port: Sampler (Beenden pro Port)
         for device in self.devices:
+            ## Aufträge der Widgets über die Befehls-Liste (nur offene Aufträge werden an das Gerät gesendet):
+            self.widgets[device].write_task = Befehls_Liste(self.sprache, device, self.widgets[device].write_task)
+            self.befehls_listen.append(self.widgets[device].write_task)
             thread = QThread()   
             logger.debug(f"{device} {self.Log_Text_13_str[self.sprache]} {thread}")                                                                                                            # Erstelle Thread
-            dev_mutex = self.mutexs[self.config['devices'][device]['serial-interface']['port']]
+            dev_port = self.config['devices'][device]['serial-interface']['port']
+            dev_mutex = self.mutexs[dev_port]
             sampler = Sampler(self.devices[device], device, self.widgets[device], self.main_window.device_action[device], self.start_time, test_mode, dev_mutex)    # Erstelle Sampler-Objekt
             sampler.moveToThread(thread)                                                                                                                            # Verknüpfe Sampler-Objekt mit dem Thread
             sampler.signal.connect(self.update_view)                                                                                                                # Verknüpfe Sampler_Signal mit update_view Funtkion
-            self.signal_sample_main.connect(sampler.sample)                                                                                                         # Verknüpfe Signal mit sampler-Funktion des Sampler-Objektes    
+            sampler.signal_start.connect(sampler.sample)                                                                                                            # Verknüpfe Scheduler-Signal mit sampler-Funktion des Sampler-Objektes    
+            self.scheduler.add_sampler(sampler)                                                                                                                     # Messzeit und PID-Takt in die Planung aufnehmen
             self.samplers.append(sampler)
             self.threads.append(thread) 
+            self.port_sampler.setdefault(dev_port, []).append(sampler)
+
+        ## GUI-Update (Messungen sofort übernehmen, Label und Plot mit begrenzter Bildrate zeichnen):
+        self.gui_update = GUI_Update(self.sprache, self.widgets, max_fps)
+        self.start_profil.phase('Threads')
 
         #---------------------------------------------------------------------------
         # Datein erstellen:
@@ -1066,47 +1116,26 @@ class Controller(QObject):
             with open(self.txtDat_btn,'w', encoding="utf-8") as f:
                 f.write(f'{self.Text_2_str[self.sprache]}\n')
                 f.write(f'{self.Text_3_str[self.sprache]}\n\n')
+            ### Einträge aus allen Threads werden gesammelt geschrieben (Ablauf-Journal):
+            self.ablauf_journal = Ablauf_Journal(self.sprache, self.txtDat_btn, self.config_pruefung.wert('save', 'journal_flush_rows'), self.config_pruefung.wert('save', 'journal_flush_time'), self.config_pruefung.wert('save', 'journal_jsonl'), list(self.devices))
+
+            ## Messdaten-Schreiber:
+            flush_zeilen   = self.config_pruefung.wert('save', 'data_flush_rows')
+            flush_zeit     = self.config_pruefung.wert('save', 'data_flush_time')
+            fsync_zeit     = self.config_pruefung.wert('save', 'data_fsync_time')
+            spalten_format = self.config_pruefung.wert('save', 'data_columnar')
+            skalierung     = self.config_pruefung.wert('skalFak')
+            self.messdaten_writer = Messdaten_Writer(self.sprache, flush_zeilen, flush_zeit, fsync_zeit, spalten_format, skalierung)
 
             ## Messdaten-Datein:
             for device in self.devices:
-                self.devices[device].messdaten_output(self.directory)
+                self.devices[device].messdaten_output(self.directory, self.messdaten_writer)
 
             ## Config und Log speichern:
-            try: self.save_config    = self.config['save']['config_save']
-            except Exception as e: 
-                logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} save|config_save {self.Log_Pfad_conf_5[self.sprache]} True')
-                logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                self.save_config = True 
-            if not type(self.save_config) == bool and not self.save_config in [0,1]: 
-                logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} config_save - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} True - {self.Log_Pfad_conf_8[self.sprache]} {self.save_config}')
-                self.save_config = 1
-            #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-            try: self.save_log       = self.config['save']['log_save']
-            except Exception as e: 
-                logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} save|log_save {self.Log_Pfad_conf_5[self.sprache]} True')
-                logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                self.save_log = True 
-            if not type(self.save_log) == bool and not self.save_log in [0,1]: 
-                logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} log_save - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} True - {self.Log_Pfad_conf_8[self.sprache]} {self.save_log}')
-                self.save_log = 1
-            #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-            try: self.save_plot      = self.config['save']['plot_save']
-            except Exception as e: 
-                logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} save|plot_save {self.Log_Pfad_conf_5[self.sprache]} True')
-                logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                self.save_plot = True 
-            if not type(self.save_plot) == bool and not self.save_plot in [0,1]: 
-                logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} plot_save - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} True - {self.Log_Pfad_conf_8[self.sprache]} {self.save_plot}')
-                self.save_plot = 1
-            #\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\
-            try: self.save_GUI       = self.config['save']['GUI_save']
-            except Exception as e: 
-                logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} save|GUI_save {self.Log_Pfad_conf_5[self.sprache]} False')
-                logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                self.save_GUI = False 
-            if not type(self.save_GUI) == bool and not self.save_GUI in [0,1]: 
-                logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} GUI_save - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} False - {self.Log_Pfad_conf_8[self.sprache]} {self.save_GUI}')
-                self.save_GUI = 0
+            self.save_config    = self.config_pruefung.wert('save', 'config_save')
+            self.save_log       = self.config_pruefung.wert('save', 'log_save')
+            self.save_plot      = self.config_pruefung.wert('save', 'plot_save')
+            self.save_GUI       = self.config_pruefung.wert('save', 'GUI_save')
         else:
             self.save_config    = False
             self.save_log       = False
@@ -1117,6 +1146,7 @@ class Controller(QObject):
         # Extra Variablen:
         #---------------------------------------------------------------------------
         self.anzExcecute = 0    # Zähle wie oft die Thread-Signale aufgerufen werden
+        self.start_profil.phase('Dateien')
 
         #---------------------------------------------------------------------------
         # Starte Timer und Thread:
@@ -1130,6 +1160,9 @@ class Controller(QObject):
         # Starte die Anwendung und zeige die GUI:
         #---------------------------------------------------------------------------
         self.main_window.show()
+        self.start_profil.phase('Anzeige')
+        ## Start-Profil nach dem ersten Durchlauf der Event-Loop (Fenster gezeichnet) schreiben:
+        QTimer.singleShot(0, lambda: self.start_profil.bericht(self.sprache))
         logger.info(f'{self.Log_Text_251_str[self.sprache]} - {self.main_window.geometry()}')
         for widget in self.widgets:
             if not 'Nemo-Gase' in widget and not 'Educrys-Monitoring' in widget:
@@ -1145,128 +1178,108 @@ class Controller(QObject):
         - https://github.com/pyqtgraph/pyqtgraph/issues/1398
         - https://stackoverflow.com/questions/64307813/pyqtgraph-stops-updating-and-freezes-when-grapahing-live-sensor-data/64520032#64520032
 
+        Die Messung wird sofort in die Daten des Widgets übernommen, gezeichnet wird mit der begrenzten Bildrate (GUI_Update).
+
         Args:
             y_values (dict):    Alle Messgrößen
-            x_value (list):     Alle Zeiten zun den Messgrößen
+            x_value (float):    Zeitpunkt der Messgrößen (Die Widgets führen die Zeitachse selbst)
             name (str):         Geräte-Name
         '''
-        try:
-            logger.debug(f"{self.Log_Text_15_str[self.sprache]} {name}")
-            self.widgets[name].update_GUI(y_values, x_value) 
-        except Exception as e:
-            logger.exception(f"{self.Log_Text_16_str[self.sprache]} {name}.")
+        self.gui_update.neu(name, y_values, x_value)
 
     ##########################################
     # Aufruf der Threads:
     ##########################################
     def ckeck_device(self):
-        ''' Ruft die Geräte auf über einen Timer auf. Durch die Verbindung des Signals mit allen sample-Funktionen der Sampler-Objekte, werden
-        all diese aufgerufen. Durch die Verbindung des Objektes mit dem Thread, wird diese Funktion im Thread aufgerufen. '''
+        ''' Ruft die Geräte über einen Timer auf. Der Scheduler entscheidet bei jedem Takt, welche Sampler fällig sind (Messzeit, PID-Takt, 
+        Schreib-Aufträge), und sendet nur diesen das Start-Signal. Durch die Verbindung des Objektes mit dem Thread, wird die sample-Funktion im Thread aufgerufen. '''
         logging.debug(self.Log_Text_17_str[self.sprache])
         self.anzExcecute += 1
-        self.signal_sample_main.emit()
+        self.scheduler.takt()
 
     ############################################################################
     # Reaktion auf Buttons aus typen.py oder main_window.py:
     ############################################################################
     def exit(self):
-        ''' Wird beim schließen der Anwendung aufgerufen und beendet die Threads. '''
+        ''' Wird beim schließen der Anwendung aufgerufen und beendet die Threads. 
+        Der Beenden-Koordinator wartet auf die Sampler und Threads (Events, QThread.wait) mit einer Frist pro Gerät, statt fester Verzögerungen. '''
         #////////////////////////////////////////////////////////////
         # Informationen zum Exit - Teil 1:
         #////////////////////////////////////////////////////////////
         time1 = datetime.datetime.now(datetime.timezone.utc).astimezone()   # Messung der Zeit für das Beenden der Anwednung
+        timeout = self.config_pruefung.wert('time', 'timeout_exit')    # Sekunden (Frist pro Gerät)
+        koordinator = Beenden_Koordinator(self.sprache, timeout)
         ## Notizen in Datein:
         self.add_Ablauf(self.Text_4_str[self.sprache])
         logging.debug(self.Log_Text_End_str[self.sprache])
         #////////////////////////////////////////////////////////////
         # Beende Sample-Timer für Geräte-Threads:
         #////////////////////////////////////////////////////////////
+        ## Laufende Aufträge werden nicht abgewartet, die Aufträge für den Endzustand werden danach eingereiht (Mutex und Auftrags-Zähler):
         self.timer_check_device.stop()
-        time.sleep(1)                                                       # Verzögerung um die sampling Aufträge zu beenden (in Threads)
+        koordinator.phase('Timer')
         #////////////////////////////////////////////////////////////
         # Beennde PID:
         #////////////////////////////////////////////////////////////
         for device in self.widgets:
             if not 'Nemo-Gase' in device and not 'Educrys-Monitoring' in device:
                 self.widgets[device].write_task['PID'] = False 
-                if self.devices[device].PID_Aktiv:
-                    self.devices[device].PIDThread.quit()
-                    self.devices[device].timer_PID.stop()
+        if not self.pid_takt.ende(timeout):
+            koordinator.verspaetet.append('PID_Takt')
+        koordinator.phase('PID')
         #////////////////////////////////////////////////////////////
         # Sicheren Endzustand herstellen:
         #////////////////////////////////////////////////////////////
-        ## Rufe Stopp-Befehle und setze End-Variable auf und sende Threads ein letztes Mal:
+        ## Lesen von Werten abschalten und Exit melden (Port-Kontrolle der Nemo-Geräte beim letzten Auftrag):
+        for sampler in self.samplers:
+            sampler.messTime = 0
+            sampler.exit = True
+        ## Rufe Stopp-Befehle und setze End-Variable auf und sende die Threads eines Ports sofort ein letztes Mal:
         ### Stopp - Beendigung von Teilen im Programm
         ### End-Variable - Sicheres Auslösen bzw. Setzen der nötigen Aufgaben
-        for device in self.widgets:
-            if not 'Nemo-Gase' in device and not 'Educrys-Monitoring' in device:
-                #### Konfigurationscheck:
-                try: save_ende = self.config['devices'][device]['ende']
-                except Exception as e:
-                    logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} {device}|ende {self.Log_Pfad_conf_5[self.sprache]} True')
-                    logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-                    save_ende = True 
-                if not type(save_ende) == bool and not save_ende in [0,1]: 
-                    logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} ende ({device}) - {self.Log_Pfad_conf_2[self.sprache]} [True, False] - {self.Log_Pfad_conf_3[self.sprache]} True - {self.Log_Pfad_conf_8[self.sprache]} {save_ende}')
-                    save_ende = 1
-                #### Ausführung:
-                if save_ende:
-                    self.devices[device].Save_End_State = True
-                    self.widgets[device].Stopp(n=5)
-        self.ckeck_device()
-        time.sleep(1)                                                   # Verzögerung um die sampling Aufträge zu beenden bzw. überhaupt zu starten (in Threads)              
+        ### Die Ports arbeiten in ihren Threads parallel, während die Stopp-Befehle des nächsten Ports vorbereitet werden!
+        for port in self.port_sampler:
+            namen = [sampler.device_name for sampler in self.port_sampler[port]]
+            for device in namen:
+                if not 'Nemo-Gase' in device and not 'Educrys-Monitoring' in device:
+                    #### Konfiguration (geprüft):
+                    save_ende = self.config_pruefung.wert('devices', device, 'ende')
+                    #### Ausführung:
+                    if save_ende:
+                        self.devices[device].Save_End_State = True
+                        self.widgets[device].Stopp(n=5)
+            self.scheduler.alle_ausloesen(namen)
+        self.anzExcecute += 1
+        koordinator.phase('Stopp')
         #////////////////////////////////////////////////////////////
         # Beende die Threads - Teil 1:
         #////////////////////////////////////////////////////////////
+        neben_threads = []
         if self.Multilog_Nutzung:
             logger.debug(f"{self.Log_Text_208_str[self.sprache]} {self.LinkMultilogThread}")
-            self.LinkMultilogThread.quit()
             if not self.MultiLink.done:
                 self.MultiLink.ende()
+            neben_threads.append(self.LinkMultilogThread)
         if self.Gamepad_Nutzung:
-            self.PadThread.quit()
             self.gamepad.ende()
+            neben_threads.append(self.PadThread)
         #////////////////////////////////////////////////////////////
         # Schaue ob alle Sample-Aufträge tatsächlich zu Ende sind:
         #////////////////////////////////////////////////////////////
-        ## Lesen von Werten abschalten:
-        for sampler in self.samplers:
-            sampler.messTime = 0
-            sampler.exit = True
-        ## Thread abschließen:
-        ''' Info: Durch das Gamepad (pygame) kann es zu Verzögerungen kommen! Noch überarbeiten!'''
-        ### Timeout setzen:
-        try:    timeout = float(str(self.config["time"]["timeout_exit"]).replace(',','.')) 
-        except Exception as e: 
-            logger.warning(f'{self.Log_Pfad_conf_4[self.sprache]} time|timeout_exit {self.Log_Pfad_conf_5[self.sprache]} 10')
-            logger.exception(f'{self.Log_Pfad_conf_6[self.sprache]}')
-            timeout = 10    # Sekunden  
-        if not type(timeout) in [float,int] or not timeout >= 0:
-            logger.warning(f'{self.Log_Pfad_conf_1[self.sprache]} timeout_exit - {self.Log_Pfad_conf_2_1[self.sprache]} [Float, Integer] (Positiv) - {self.Log_Pfad_conf_3[self.sprache]} 10 - {self.Log_Pfad_conf_8[self.sprache]} {timeout}')
-            timeout = 10
-        ak_time = datetime.datetime.now(datetime.timezone.utc).astimezone()
-        ### While-Schleife um die Threads sicher abzuarbeiten:
-        while 1: 
-            not_done = False
-            for sampler in self.samplers:
-                if not sampler.end_done:
-                    not_done = True
-            if not not_done:
-                break
-            #### Timeout:
-            self.time = datetime.datetime.now(datetime.timezone.utc).astimezone()
-            timediff = (self.time - ak_time).total_seconds()                                                       
-            if timediff >= timeout:
-                logger.warning(self.Log_Text_Exit_str[self.sprache])
-                for sampler in self.samplers:
-                    sampler.port = False
-                break
+        ## Warten auf die Fertig-Meldung der Sampler (Frist pro Gerät, Ports parallel):
+        zu_spaet = koordinator.sampler_warten(self.port_sampler)
+        if not zu_spaet == []:
+            logger.warning(self.Log_Text_Exit_str[self.sprache])
+            for sampler in zu_spaet:
+                sampler.port = False
+        koordinator.phase('Sicherer Endzustand')
         #////////////////////////////////////////////////////////////
         # Beende die Threads - Teil 2:
         #////////////////////////////////////////////////////////////
-        for thread in self.threads:
+        for thread in self.threads + neben_threads:
             logger.debug(f"{self.Log_Text_18_str[self.sprache]} {thread}")
-            thread.quit()
+        koordinator.threads_beenden(self.threads + neben_threads)
+        koordinator.phase('Threads')
         #////////////////////////////////////////////////////////////
         # Schließe Ports, wenn offen:
         #////////////////////////////////////////////////////////////
@@ -1275,9 +1288,49 @@ class Controller(QObject):
                 if self.devices[device].serial.is_open:
                     logger.debug(f"{self.Log_Text_19_str[self.sprache]} {device}")
                     self.devices[device].serial.close()
+            ## Gemeinsame Modbus-Verbindungen (Neuaufbau beenden und Statistik):
+            for verbindung in self.modbus_verbindungen:
+                verbindung.close()
+                verbindung.log_statistik()
+        koordinator.phase('Ports')
+        #////////////////////////////////////////////////////////////
+        # Messdaten-Puffer schreiben und Dateien schließen:
+        #////////////////////////////////////////////////////////////
+        if not self.test_mode:
+            self.messdaten_writer.ende()
+            self.ablauf_journal.ende()
+        ## Letzte Messungen zeichnen (Plot und GUI werden danach gespeichert):
+        self.gui_update.ende()
+        ## Statistik der Nemo-Register-Karten:
+        for ak_sps in self.register_karten:
+            self.register_karten[ak_sps].log_statistik()
+        ## Statistik der Educrys-Frame-Poller:
+        for ak_com in self.frame_poller_dict:
+            self.frame_poller_dict[ak_com].log_statistik()
+        ## Statistik der seriellen Transaktionen:
+        for transaktion in self.transaktionen:
+            transaktion.log_statistik()
+        ## Statistik des PID-Taktes:
+        if not self.pid_takt.regler == {}:
+            self.pid_takt.log_statistik()
+        ## Statistik des Config-Caches:
+        CACHE.log_statistik(self.sprache)
+        ## Statistik der Befehls-Listen:
+        if not self.test_mode:
+            for befehls_liste in self.befehls_listen:
+                if befehls_liste.anz_Aufrufe + befehls_liste.anz_Uebersprungen > 0:
+                    befehls_liste.log_statistik()
+        ## Statistik der Log-Drossel und Log-Queue leeren (vor dem Kopieren der Log-Datei):
+        if not self.log_drossel == None:
+            self.log_drossel.log_statistik()
+        if not self.log_queue == None:
+            self.log_queue.ende()
+        koordinator.phase('Messdaten + Statistik')
         #////////////////////////////////////////////////////////////
         # Speichere Datein:
         #////////////////////////////////////////////////////////////
+        ## Config- und Log-Datei werden im Hintergrund kopiert, während Plot und GUI (nur im GUI-Thread möglich) gespeichert werden:
+        kopieren = []
         ## Speicher Config-Datei:
         if not self.test_mode:
             VerschiebePfad = self.directory
@@ -1285,13 +1338,15 @@ class Controller(QObject):
             logger.debug(f"{self.Log_Text_20_str[self.sprache]} {VerschiebePfad}")
             Bild_Pfad = self.config_pfad
             Erg_Bild_Name = '/config.yml'
-            shutil.copyfile(Bild_Pfad, VerschiebePfad + Erg_Bild_Name)
+            kopieren.append(threading.Thread(target=shutil.copyfile, args=(Bild_Pfad, VerschiebePfad + Erg_Bild_Name)))
         ## Speicher Log-Datei:
         if self.save_log:
             logger.debug(f"{self.Log_Text_21_str[self.sprache]} {VerschiebePfad}")
             Bild_Pfad = self.log_Pfad
             Erg_Bild_Name = f'/{self.log_Pfad}'
-            shutil.copyfile(Bild_Pfad, VerschiebePfad + Erg_Bild_Name)
+            kopieren.append(threading.Thread(target=shutil.copyfile, args=(Bild_Pfad, VerschiebePfad + Erg_Bild_Name)))
+        for kopie in kopieren:
+            kopie.start()
         ## Speichere Plot:
         if self.save_plot:
             for typ in self.tab_Teile:
@@ -1305,6 +1360,9 @@ class Controller(QObject):
             logger.debug(f"{self.Log_Text_S_GUI[self.sprache]} {VerschiebePfad}")
             saveGUI = self.main_window.grab()
             saveGUI.save(f'{VerschiebePfad}/GUI.png')
+        for kopie in kopieren:
+            kopie.join()
+        koordinator.phase('Dateien')
         #////////////////////////////////////////////////////////////
         # Informationen zum Exit - Teil 2:
         #////////////////////////////////////////////////////////////
@@ -1314,6 +1372,10 @@ class Controller(QObject):
             ).total_seconds()
         logging.info(f'{self.Log_Text_300_str[self.sprache]} {time1} {self.Log_Text_301_str[self.sprache]} {time2} - {self.Log_Text_302_str[self.sprache]} {timediff} {self.Log_Text_303_str[self.sprache]}')
         logging.info(f'{self.Log_Text_304_str[self.sprache]} {self.anzExcecute}')
+        self.scheduler.log_statistik()
+        koordinator.bericht()
+        if not self.test_mode:
+            self.ablauf_journal.schliessen()
 
     def stopp_all(self, typ):
         ''' Funktion um ein Signal zu schreiben, das dann alle Achsen stopped!
@@ -1375,8 +1437,9 @@ class Controller(QObject):
                         else: # TruHeat, Eurotherm
                             worker.device_widget.Fehler_Output(1, worker.device_widget.err_15_str[worker.device_widget.sprache])
         if not True in error:
+            start = time.perf_counter()                                         # Gemeinsame Startzeit aller Rezepte
             for worker in devices:
-                worker.device_widget.RezStart(execute=2)  
+                worker.device_widget.RezStart(execute=2, start=start)  
     
     def sync_end_rezept(self):
         '''Beendet die ausgewählten Rezepte synchron'''
@@ -1393,6 +1456,26 @@ class Controller(QObject):
             else:
                 worker.device_widget.RezEnde(excecute=4) 
 
+    def datei_geaendert(self, pfad):
+        '''Eine überwachte Datei (Config, Rezept) wurde geändert und wird neu in den Config-Cache geladen
+        
+        Args:
+            pfad (str): Pfad der Datei
+        '''
+        CACHE.geaendert(pfad)
+        ## Viele Editoren ersetzen die Datei beim Speichern, wodurch die Überwachung endet:
+        if os.path.exists(pfad) and not pfad in self.datei_watcher.files():
+            self.datei_watcher.addPath(pfad)
+        try:
+            daten = lade_yaml(pfad)
+            logger.info(f'{self.Log_Yaml_Reload[self.sprache]} {pfad}')
+            ## Geänderte Config prüfen (Meldungen vor dem nächsten Neustart):
+            if os.path.abspath(pfad) == os.path.abspath(self.config_pfad):
+                config_pruefen(daten).loggen(self.sprache)
+        except Exception as e:
+            logger.warning(f'{self.Log_Yaml_Reload_2[self.sprache]} {pfad}')
+            logger.exception(f'{self.Log_Yaml_Reason[self.sprache]}')
+
     def rezept_einlesen(self):
         '''Liest die Config-datei wegen der Rezepte neu aus'''
         self.add_Ablauf(self.Text_9_str[self.sprache])
@@ -1402,8 +1485,7 @@ class Controller(QObject):
 
         # Aktuelle Config-Datei notieren:
         try:
-            with open(self.config_pfad, encoding="utf-8") as f:
-                logger.info(f"{self.Log_Text_27_str[self.sprache]} {yaml.safe_load(f)}")  
+            logger.info(f"{self.Log_Text_27_str[self.sprache]} {lade_yaml(self.config_pfad)}")  
         except Exception as e: 
             logger.warning(f'{self.Log_Yaml_Error[self.sprache]}')
             logger.exception(f'{self.Log_Yaml_Reason[self.sprache]}')
@@ -1436,19 +1518,18 @@ class Controller(QObject):
             text (str):     Was zum Zeitpunkt passiert bzw. betätigt wurde. 
         '''
         if not self.test_mode:
-            timestamp = datetime.datetime.now(datetime.timezone.utc).astimezone().isoformat(timespec='milliseconds').replace('T', ' ')
-            with open(self.txtDat_btn,'a', encoding="utf-8") as f:
-                f.write(f'{timestamp} - {text}\n')
+            self.ablauf_journal.eintragen(text)
         
-def main(config, output_dir, test_mode, neustart):
+def main(config, output_dir, test_mode, neustart, start = None):
     """ Um Vifcon zu starten, diese Funktion ausführen.
 
     Args:
         config (str):       File Pfad vom Configurations File.
         output_dir (str):   Verzeichnis, wo die Outputs hingelegt werden sollen.
         test_mode (bool):   Test Mode Aktiv.
+        start (float):      Startzeitpunkt von vifcon_main.py (time.perf_counter).
     """
-    ctrl = Controller(config, output_dir, test_mode, neustart)
+    ctrl = Controller(config, output_dir, test_mode, neustart, start)
 
 ##########################################
 # Verworfen:
@@ -12,15 +12,40 @@ Die Grundstruktur von VIFCON beruht auf Multilog und dem Model View Controller (
 # Bibliotheken:
 # ++++++++++++++++++++++++++++
 ## Algemein:
-from argparse import ArgumentParser
+import time
+START = time.perf_counter()                     # Startzeitpunkt für das Start-Profil (vor allen Importen)
+import sys
+from argparse import ArgumentParser, Action
 
 ## Eigene:
-from vifcon.vifcon_controller import main
-from vifcon import __version__
+### Der Controller (PyQt5) wird erst beim Start der GUI importiert - die Config-Prüfung benötigt kein Qt!
 
 # ++++++++++++++++++++++++++++
 # Programm:
 # ++++++++++++++++++++++++++++
+class Version_Action(Action):
+    ''' Gibt die Version aus - die Version (git) wird nur bei Aufruf von -v ermittelt und nicht bei jedem Start. '''
+    def __call__(self, parser, namespace, values, option_string = None):
+        from vifcon import __version__
+        parser.exit(message = f"{parser.prog} version {__version__}\n")
+
+def config_check(config):
+    ''' Prüft die Config-Datei (Schema, Grenzen, Rezepte) ohne Start der GUI.
+
+    Args:
+        config (str):   Pfad der Config-Datei
+    Return:
+        Exit-Code (0 - keine Fehler, 1 - Fehler gefunden)
+    '''
+    from vifcon.config_cache import lade_yaml
+    from vifcon.config_schema import config_pruefen
+    pruefung = config_pruefen(lade_yaml(config))
+    sprache  = 0 if pruefung.wert('GUI', 'language').upper() == 'DE' else 1
+    for art, text in pruefung.texte(sprache):
+        print(f'{pruefung.Art_Text[art][sprache]}: {text}')
+    print(f'{pruefung.Log_Text_CS_7[sprache]} {len(pruefung.meldungen)} {pruefung.Log_Text_CS_8[sprache]}')
+    return 1 if pruefung.fehler() > 0 else 0
+
 if __name__ == "__main__":
     # Argparser Starten und Argumente definieren:
     parser = ArgumentParser(
@@ -54,11 +79,20 @@ if __name__ == "__main__":
     parser.add_argument(
         "-v",
         "--version",
-        action="version",
-        version=f"{parser.prog} version {__version__}",
+        help="show program's version number and exit",
+        action=Version_Action,
+        nargs=0,
+    )
+    parser.add_argument(
+        "--check-config",
+        help="check the configuration file and exit (exit code 1 on errors)",
+        action = 'store_true'
     )
     args = parser.parse_args()
-    main(args.config, args.out_dir, args.test, args.neustart)
+    if args.check_config:
+        sys.exit(config_check(args.config))
+    from vifcon.vifcon_controller import main
+    main(args.config, args.out_dir, args.test, args.neustart, START)
 
 ##########################################
 # Verworfen: